@@ -0,0 +1,67 @@
+import re
+import sys
+
+import pyperf
+
+from .compare import add_threshold_args, parse_thresholds, report
+from .suite import build_suite
+
+
+def _worker_args(cmd: list[str], args):
+    # Workers must select the same benchmarks as the parent, so benchmark indices match
+    if args.filter:
+        cmd.extend(("--filter", args.filter))
+
+
+def _noop():
+    pass
+
+
+def main() -> int:
+    """
+    Runs the benchmark suite with pyperf.  All pyperf options are supported, like ``-o results.json`` to save
+    the results, and ``--fast`` for quicker, less accurate runs.
+    """
+    runner = pyperf.Runner(program_args=("-m", "benchmarks"), add_cmdline_args=_worker_args)
+    runner.argparser.add_argument(
+        "--filter", default=None, help="Only run benchmarks with names matching the regex"
+    )
+    runner.argparser.add_argument(
+        "--list", action="store_true", help="List the benchmark names, and exit"
+    )
+    runner.argparser.add_argument(
+        "--baseline", default=None, help="pyperf JSON file to compare the results against"
+    )
+    add_threshold_args(runner.argparser)
+    args = runner.parse_args()
+
+    suite = build_suite()
+    if args.filter:
+        suite = {name: setup for name, setup in suite.items() if re.search(args.filter, name)}
+
+    if args.list:
+        print("\n".join(suite))
+        return 0
+
+    benchmarks = []
+    for task_index, (name, setup) in enumerate(suite.items()):
+        # Each worker process only runs one benchmark, so only that benchmark is set up
+        bench_func = setup() if args.worker and task_index == args.worker_task else _noop
+        benchmark = runner.bench_func(name, bench_func)
+        if benchmark is not None:
+            benchmarks.append(benchmark)
+
+    if args.worker or args.baseline is None or not benchmarks:
+        return 0
+
+    regressions = report(
+        pyperf.BenchmarkSuite.load(args.baseline),
+        pyperf.BenchmarkSuite(benchmarks),
+        args.threshold,
+        parse_thresholds(args.threshold_for),
+    )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
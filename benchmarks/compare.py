@@ -0,0 +1,149 @@
+import argparse
+import sys
+from dataclasses import dataclass
+from typing import Sequence
+
+import pyperf
+
+DEFAULT_THRESHOLD = 0.10
+
+
+@dataclass(slots=True)
+class BenchmarkComparison:
+    """Mean timings of a benchmark in the baseline and current suites"""
+
+    name: str
+    baseline_mean: float
+    current_mean: float
+    threshold: float  # Maximum slowdown allowed, as a fraction of the baseline mean
+
+    @property
+    def ratio(self) -> float:
+        """Current mean divided by the baseline mean.  Ratios above 1 are slower than the baseline"""
+        return self.current_mean / self.baseline_mean
+
+    @property
+    def regressed(self) -> bool:
+        """True if the benchmark is slower than the baseline by more than the threshold"""
+        return self.ratio > 1 + self.threshold
+
+
+def parse_thresholds(threshold_args: Sequence[str]) -> dict[str, float]:
+    """
+    Parses ``NAME=THRESHOLD`` arguments into per-benchmark regression thresholds
+
+    :param threshold_args: List of ``NAME=THRESHOLD`` strings, like ``dispatcher-add-abis-10k=0.25``
+    """
+    thresholds = {}
+    for threshold_arg in threshold_args:
+        name, _, threshold = threshold_arg.partition("=")
+        if not name or not threshold:
+            raise ValueError(f"Thresholds must be formatted as NAME=THRESHOLD, got {threshold_arg}")
+        thresholds[name] = float(threshold)
+    return thresholds
+
+
+def compare_suites(
+    baseline: pyperf.BenchmarkSuite,
+    current: pyperf.BenchmarkSuite,
+    threshold: float = DEFAULT_THRESHOLD,
+    thresholds: dict[str, float] | None = None,
+) -> list[BenchmarkComparison]:
+    """
+    Compares the benchmarks present in both suites, in the order of the current suite
+
+    :param baseline: Stored baseline suite
+    :param current: Suite of the current run
+    :param threshold: Default maximum slowdown, as a fraction of the baseline mean
+    :param thresholds: Per-benchmark thresholds, overriding the default threshold
+    """
+    thresholds = thresholds or {}
+    baseline_names = set(baseline.get_benchmark_names())
+
+    return [
+        BenchmarkComparison(
+            name=name,
+            baseline_mean=baseline.get_benchmark(name).mean(),
+            current_mean=current.get_benchmark(name).mean(),
+            threshold=thresholds.get(name, threshold),
+        )
+        for name in current.get_benchmark_names()
+        if name in baseline_names
+    ]
+
+
+def format_comparisons(comparisons: Sequence[BenchmarkComparison]) -> str:
+    """Formats comparisons as a markdown table"""
+    lines = [
+        "| Benchmark | Baseline | Current | Change | Threshold | Status |",
+        "|-----------|---------:|--------:|-------:|----------:|--------|",
+    ]
+    for comparison in comparisons:
+        if comparison.regressed:
+            status = "REGRESSION"
+        elif comparison.ratio < 1 - comparison.threshold:
+            status = "faster"
+        else:
+            status = "ok"
+        lines.append(
+            f"| {comparison.name} | {comparison.baseline_mean * 1e6:.2f} us "
+            f"| {comparison.current_mean * 1e6:.2f} us | {comparison.ratio - 1:+.1%} "
+            f"| {comparison.threshold:.0%} | {status} |"
+        )
+    return "\n".join(lines)
+
+
+def report(
+    baseline: pyperf.BenchmarkSuite,
+    current: pyperf.BenchmarkSuite,
+    threshold: float = DEFAULT_THRESHOLD,
+    thresholds: dict[str, float] | None = None,
+) -> int:
+    """
+    Prints the comparison table of two suites, and returns the number of regressed benchmarks
+    """
+    comparisons = compare_suites(baseline, current, threshold, thresholds)
+    print(format_comparisons(comparisons))
+
+    regressions = [comparison.name for comparison in comparisons if comparison.regressed]
+    if regressions:
+        print(f"\n{len(regressions)} benchmarks regressed: {', '.join(regressions)}")
+    return len(regressions)
+
+
+def add_threshold_args(parser: argparse.ArgumentParser):
+    """Adds the --threshold and --threshold-for arguments to a parser"""
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Maximum slowdown of each benchmark against the baseline, as a fraction.  Defaults to 0.10",
+    )
+    parser.add_argument(
+        "--threshold-for",
+        action="append",
+        default=[],
+        metavar="NAME=THRESHOLD",
+        help="Threshold of a single benchmark, overriding --threshold.  Can be repeated",
+    )
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Compares two saved pyperf JSON files, exiting with status 1 if any benchmark regressed"""
+    parser = argparse.ArgumentParser(description="Compare benchmark results against a baseline")
+    parser.add_argument("baseline", help="pyperf JSON file of the baseline")
+    parser.add_argument("current", help="pyperf JSON file of the current run")
+    add_threshold_args(parser)
+    args = parser.parse_args(argv)
+
+    regressions = report(
+        pyperf.BenchmarkSuite.load(args.baseline),
+        pyperf.BenchmarkSuite.load(args.current),
+        args.threshold,
+        parse_thresholds(args.threshold_for),
+    )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
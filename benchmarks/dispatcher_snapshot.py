@@ -0,0 +1,43 @@
+import json
+import pickle
+
+from nethermind.starknet_abi.core import StarknetAbi
+from nethermind.starknet_abi.dispatch import DecodingDispatcher
+from nethermind.starknet_abi.snapshot import dumps_dispatcher, loads_dispatcher
+
+from .abi import AVNU_ABI_JSON, STARKNET_ETH_ABI_JSON
+
+CLASS_COUNT = 2_000
+
+
+def _build_dispatcher() -> DecodingDispatcher:
+    dispatcher = DecodingDispatcher()
+    abi_jsons = [json.loads(STARKNET_ETH_ABI_JSON), json.loads(AVNU_ABI_JSON)]
+
+    for class_index in range(CLASS_COUNT):
+        parsed_abi = StarknetAbi.from_json(
+            abi_jsons[class_index % 2],
+            class_hash=class_index.to_bytes(32, "big"),
+            abi_name=f"abi_{class_index % 50}",
+        )
+        dispatcher.add_abi(parsed_abi)
+
+    return dispatcher
+
+
+def bench_pickle_load():
+    pickled = pickle.dumps(_build_dispatcher())
+
+    def _run_bench():
+        loaded = pickle.loads(pickled)
+
+    return _run_bench
+
+
+def bench_snapshot_load():
+    snapshot = dumps_dispatcher(_build_dispatcher())
+
+    def _run_bench():
+        loaded = loads_dispatcher(snapshot)
+
+    return _run_bench
@@ -0,0 +1,357 @@
+import json
+from pathlib import Path
+from typing import Any, Callable
+
+from nethermind.starknet_abi.abi_types import (
+    AbiParameter,
+    StarknetArray,
+    StarknetCoreType,
+    StarknetEnum,
+    StarknetOption,
+    StarknetStruct,
+)
+from nethermind.starknet_abi.core import AbiParseCache, StarknetAbi
+from nethermind.starknet_abi.decoding_types import AbiFunction
+from nethermind.starknet_abi.dispatch import DecodingDispatcher
+from nethermind.starknet_abi.encode import encode_from_params
+from nethermind.starknet_abi.exceptions import InvalidCalldataError, TypeEncodeError
+from nethermind.starknet_abi.snapshot import dumps_dispatcher, loads_dispatcher
+
+from . import dispatcher_snapshot, starknet_abi_base, vectorized
+
+ABI_DIR = Path(__file__).parent.parent / "tests" / "abis"
+
+DISPATCHER_SIZES = {"1k": 1_000, "10k": 10_000}
+
+# Benchmark name -> setup function returning the function timed by pyperf
+BenchmarkSetup = Callable[[], Callable[[], Any]]
+
+
+def _load_abi_files() -> dict[str, Any]:
+    return {
+        f"{abi_path.parent.name}-{abi_path.stem}": json.loads(abi_path.read_text())
+        for abi_path in sorted(ABI_DIR.glob("v*/*.json"))
+    }
+
+
+ABI_FILES = _load_abi_files()
+
+_U256 = StarknetCoreType.U256
+_FELT = StarknetCoreType.Felt
+_ADDRESS = StarknetCoreType.ContractAddress
+
+_ROUTE = StarknetStruct(
+    name="Route",
+    members=[
+        AbiParameter("token_from", _ADDRESS),
+        AbiParameter("token_to", _ADDRESS),
+        AbiParameter("exchange", _ADDRESS),
+        AbiParameter("percent", StarknetCoreType.U128),
+        AbiParameter("extra", StarknetArray(_FELT)),
+    ],
+)
+_SWAP = StarknetStruct(
+    name="Swap",
+    members=[
+        AbiParameter("amount_in", _U256),
+        AbiParameter("min_amount_out", _U256),
+        AbiParameter("routes", StarknetArray(_ROUTE)),
+    ],
+)
+_ORDER = StarknetEnum(
+    name="Order",
+    variants=[
+        ("Market", StarknetCoreType.NoneType),
+        ("Limit", _U256),
+        ("Swap", _SWAP),
+    ],
+)
+
+_ADDRESS_VALUE = "0x" + "7916596feab669322f03b6df4e71f7b158e291fd8d273c0e53759d5b7240b4a".rjust(
+    64, "0"
+)
+_ROUTE_VALUE = {
+    "token_from": _ADDRESS_VALUE,
+    "token_to": _ADDRESS_VALUE,
+    "exchange": _ADDRESS_VALUE,
+    "percent": 50,
+    "extra": [1, 2, 3],
+}
+_SWAP_VALUE = {"amount_in": 10**20, "min_amount_out": 10**18, "routes": [_ROUTE_VALUE] * 4}
+
+# Type family -> (function parameters, input values)
+TYPE_FAMILIES: dict[str, tuple[list[AbiParameter], dict[str, Any]]] = {
+    "core": (
+        [
+            AbiParameter("recipient", _ADDRESS),
+            AbiParameter("amount", _U256),
+            AbiParameter("nonce", StarknetCoreType.U64),
+            AbiParameter("flag", StarknetCoreType.Bool),
+        ],
+        {"recipient": _ADDRESS_VALUE, "amount": 10**30, "nonce": 12, "flag": True},
+    ),
+    "arrays": (
+        [
+            AbiParameter("felts", StarknetArray(_FELT)),
+            AbiParameter("amounts", StarknetArray(_U256)),
+        ],
+        {"felts": list(range(100)), "amounts": [10**20 + index for index in range(50)]},
+    ),
+    "nested-structs": ([AbiParameter("swap", _SWAP)], {"swap": _SWAP_VALUE}),
+    "enums": (
+        [AbiParameter("orders", StarknetArray(_ORDER))],
+        {"orders": [{"Market": None}, {"Limit": 10**20}, {"Swap": _SWAP_VALUE}] * 4},
+    ),
+    "options": (
+        [AbiParameter("limits", StarknetArray(StarknetOption(_U256)))],
+        {"limits": [None, 10**20] * 25},
+    ),
+}
+
+
+def _family_function(family: str) -> tuple[AbiFunction, list[int]]:
+    params, values = TYPE_FAMILIES[family]
+    function = AbiFunction(name=f"bench_{family}", inputs=params, outputs=[])
+    return function, encode_from_params(params, values)
+
+
+def bench_parse_abi(abi_key: str) -> BenchmarkSetup:
+    def _setup():
+        abi_json = ABI_FILES[abi_key]
+
+        def _run_bench():
+            parsed = StarknetAbi.from_json(abi_json)
+
+        return _run_bench
+
+    return _setup
+
+
+def _parsed_abis(abi_count: int) -> list[StarknetAbi]:
+    # Each test ABI is parsed once, and shared between classes with the parse cache, so the classes cycle through
+    # the same few type trees, and every class after the first len(ABI_FILES) declares duplicate types
+    cache = AbiParseCache()
+    abi_jsons = list(ABI_FILES.values())
+    return [
+        StarknetAbi.from_json(
+            abi_jsons[class_index % len(abi_jsons)],
+            (class_index + 1).to_bytes(32, "big"),
+            f"abi_{class_index}",
+            cache=cache,
+        )
+        for class_index in range(abi_count)
+    ]
+
+
+def bench_dispatcher_add_abis(abi_count: int) -> BenchmarkSetup:
+    def _setup():
+        parsed_abis = _parsed_abis(abi_count)
+
+        def _run_bench():
+            dispatcher = DecodingDispatcher()
+            for abi in parsed_abis:
+                dispatcher.add_abi(abi)
+
+        return _run_bench
+
+    return _setup
+
+
+def bench_dispatcher_snapshot_load(abi_count: int) -> BenchmarkSetup:
+    def _setup():
+        dispatcher = DecodingDispatcher()
+        for abi in _parsed_abis(abi_count):
+            dispatcher.add_abi(abi)
+        snapshot = dumps_dispatcher(dispatcher)
+
+        def _run_bench():
+            loaded = loads_dispatcher(snapshot)
+
+        return _run_bench
+
+    return _setup
+
+
+def bench_decode_family(family: str) -> BenchmarkSetup:
+    def _setup():
+        function, calldata = _family_function(family)
+
+        def _run_bench():
+            decoded = function.decode(calldata)
+
+        return _run_bench
+
+    return _setup
+
+
+def bench_encode_family(family: str) -> BenchmarkSetup:
+    def _setup():
+        function, _ = _family_function(family)
+        values = TYPE_FAMILIES[family][1]
+
+        def _run_bench():
+            encoded = function.encode(values)
+
+        return _run_bench
+
+    return _setup
+
+
+def _bench_dispatcher() -> tuple[DecodingDispatcher, StarknetAbi]:
+    dispatcher = DecodingDispatcher()
+    eth_abi = StarknetAbi.from_json(ABI_FILES["v2-starknet_eth"], b"\x01" * 32, "starknet_eth")
+    dispatcher.add_abi(eth_abi)
+    dispatcher.add_abi(
+        StarknetAbi.from_json(ABI_FILES["v2-erc20_key_events"], b"\x02" * 32, "erc20_key_events")
+    )
+    return dispatcher, eth_abi
+
+
+def bench_dispatcher_decode_function():
+    dispatcher, eth_abi = _bench_dispatcher()
+    transfer = eth_abi.functions["transfer"].signature
+
+    def _run_bench():
+        decoded = dispatcher.decode_function([0x123, 10**18, 0], [1], transfer, b"\x01" * 32)
+
+    return _run_bench
+
+
+def bench_dispatcher_decode_data_event():
+    dispatcher, eth_abi = _bench_dispatcher()
+    transfer_key = int.from_bytes(eth_abi.events["Transfer"].signature, "big")
+
+    def _run_bench():
+        decoded = dispatcher.decode_event([0x123, 0x456, 10**18, 0], [transfer_key], b"\x01" * 32)
+
+    return _run_bench
+
+
+def bench_dispatcher_decode_key_event():
+    dispatcher, eth_abi = _bench_dispatcher()
+    transfer_key = int.from_bytes(eth_abi.events["Transfer"].signature, "big")
+
+    def _run_bench():
+        decoded = dispatcher.decode_event([10**18, 0], [transfer_key, 0x123, 0x456], b"\x02" * 32)
+
+    return _run_bench
+
+
+def bench_dispatcher_decode_batch():
+    dispatcher, eth_abi = _bench_dispatcher()
+    transfer = eth_abi.functions["transfer"].signature
+    batch_size = 1_000
+
+    calldata = [value for row in range(batch_size) for value in (0x123 + row, row, 0)]
+    calldata_offsets = list(range(0, 3 * batch_size + 1, 3))
+    results = [1] * batch_size
+    result_offsets = list(range(batch_size + 1))
+
+    def _run_bench():
+        decoded = dispatcher.decode_functions_batch(
+            calldata,
+            calldata_offsets,
+            results,
+            result_offsets,
+            [transfer] * batch_size,
+            [b"\x01" * 32] * batch_size,
+        )
+
+    return _run_bench
+
+
+def bench_error_truncated_calldata():
+    function, calldata = _family_function("nested-structs")
+    truncated = calldata[: len(calldata) // 2]
+
+    def _run_bench():
+        try:
+            function.decode(truncated)
+        except InvalidCalldataError:
+            pass
+
+    return _run_bench
+
+
+def bench_error_unknown_selector():
+    dispatcher, _ = _bench_dispatcher()
+
+    def _run_bench():
+        try:
+            dispatcher.decode_function([1, 2, 0], [], b"\x09" * 32, b"\x01" * 32)
+        except KeyError:
+            pass
+
+    return _run_bench
+
+
+def bench_error_encode_out_of_range():
+    params = TYPE_FAMILIES["core"][0]
+    values = TYPE_FAMILIES["core"][1] | {"nonce": 2**64}
+
+    def _run_bench():
+        try:
+            encode_from_params(params, values)
+        except TypeEncodeError:
+            pass
+
+    return _run_bench
+
+
+def bench_error_batch():
+    dispatcher, eth_abi = _bench_dispatcher()
+    transfer = eth_abi.functions["transfer"].signature
+    batch_size = 1_000
+
+    # Every call has truncated calldata, so every call returns an exception in place
+    calldata = [value for row in range(batch_size) for value in (0x123 + row, row)]
+
+    def _run_bench():
+        decoded = dispatcher.decode_functions_batch(
+            calldata,
+            list(range(0, 2 * batch_size + 1, 2)),
+            [],
+            [0] * (batch_size + 1),
+            [transfer] * batch_size,
+            [b"\x01" * 32] * batch_size,
+        )
+
+    return _run_bench
+
+
+def build_suite() -> dict[str, BenchmarkSetup]:
+    """
+    Returns every benchmark of the suite, as benchmark name -> setup function.  Setup functions build their inputs
+    and return the function timed by pyperf, so only the benchmarks selected by ``--filter`` are set up
+    """
+    suite: dict[str, BenchmarkSetup] = {}
+
+    for abi_key in ABI_FILES:
+        suite[f"parse-abi-{abi_key}"] = bench_parse_abi(abi_key)
+
+    for size_name, abi_count in DISPATCHER_SIZES.items():
+        suite[f"dispatcher-add-abis-{size_name}"] = bench_dispatcher_add_abis(abi_count)
+        suite[f"dispatcher-snapshot-load-{size_name}"] = bench_dispatcher_snapshot_load(abi_count)
+
+    for family in TYPE_FAMILIES:
+        suite[f"decode-{family}"] = bench_decode_family(family)
+        suite[f"encode-{family}"] = bench_encode_family(family)
+
+    suite.update(
+        {
+            "dispatcher-decode-function": bench_dispatcher_decode_function,
+            "dispatcher-decode-data-event": bench_dispatcher_decode_data_event,
+            "dispatcher-decode-key-event": bench_dispatcher_decode_key_event,
+            "dispatcher-decode-functions-batch-1k": bench_dispatcher_decode_batch,
+            "error-truncated-calldata": bench_error_truncated_calldata,
+            "error-unknown-selector": bench_error_unknown_selector,
+            "error-encode-out-of-range": bench_error_encode_out_of_range,
+            "error-functions-batch-1k": bench_error_batch,
+            # Scenarios of the starknet-py comparison in run_benchmarks.sh
+            "simple-decode": starknet_abi_base.bench_simple_decode,
+            "complex-decode": starknet_abi_base.bench_complex_decode,
+            "dispatcher-pickle-load": dispatcher_snapshot.bench_pickle_load,
+            "vectorized-transfer-decode": vectorized.bench_row_decode,
+        }
+    )
+    return suite
@@ -0,0 +1,33 @@
+import json
+
+from nethermind.starknet_abi.core import StarknetAbi
+from nethermind.starknet_abi.decode import decode_from_params_at
+from nethermind.starknet_abi.vectorized import decode_function_rows
+
+from .abi import STARKNET_ETH_ABI_JSON
+
+ROW_COUNT = 10_000
+
+transfer_function = StarknetAbi.from_json(json.loads(STARKNET_ETH_ABI_JSON)).functions["transfer"]
+transfer_rows = [
+    [
+        0x7916596FEAB669322F03B6DF4E71F7B158E291FD8D273C0E53759D5B7240B4A + row,
+        0x116933EA5369F0 + row,
+        0x0,
+    ]
+    for row in range(ROW_COUNT)
+]
+
+
+def bench_per_call_decode():
+    def _run_bench():
+        decoded = [decode_from_params_at(transfer_function.inputs, row) for row in transfer_rows]
+
+    return _run_bench
+
+
+def bench_row_decode():
+    def _run_bench():
+        decoded = decode_function_rows(transfer_function, transfer_rows)
+
+    return _run_bench
@@ -11,11 +11,25 @@ from nethermind.starknet_abi.core import (
     AbiEvent,
     AbiFunction,
     AbiInterface,
+    AbiParseCache,
     StarknetAbi,
 )
 from nethermind.starknet_abi.decode import (
+    FieldSelection,
+    OutputFormat,
+    compile_decoder,
     decode_core_type,
+    decode_core_type_at,
     decode_from_params,
+    decode_from_params_at,
     decode_from_types,
+    decode_from_types_at,
+    decode_selected_params_at,
+    decode_type_at,
 )
-from nethermind.starknet_abi.decoding_types import DecodedEvent, DecodedFunction
+from nethermind.starknet_abi.decoding_types import (
+    DecodedEvent,
+    DecodedFunction,
+    DecodedUserOperation,
+)
+from nethermind.starknet_abi.intern import TypeInterner
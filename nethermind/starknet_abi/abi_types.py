@@ -1,6 +1,6 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field, fields
 from enum import Enum
-from typing import Literal, Sequence, Union
+from typing import Any, Callable, Literal, Sequence, Union
 
 from nethermind.starknet_abi.utils import STARK_FIELD
 
@@ -19,6 +19,24 @@ AbiMemberType = Literal[
 ]
 
 
+class _CachedType:
+    """
+    Base class for Starknet types and functions that cache derived data, like compiled decoders and id strings, in
+    private dataclass fields.  Types are treated as immutable once parsed, so cached values never need to be
+    invalidated.  Cached fields are not part of the type definition, so they are dropped when pickling, and are
+    lazily rebuilt on first use after unpickling
+    """
+
+    __slots__ = ()
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {f.name: getattr(self, f.name) for f in fields(self) if f.init}  # type: ignore[arg-type]
+
+    def __setstate__(self, state: dict[str, Any]):
+        for f in fields(self):  # type: ignore[arg-type]
+            object.__setattr__(self, f.name, state[f.name] if f.init else f.default)
+
+
 class StarknetAbiEventKind(Enum):
     """Represents kinds of Abi Events"""
 
@@ -139,7 +157,7 @@ class StarknetCoreType(Enum):
         if self.name.startswith(("U", "I")):
             return 2**self.value - 1
 
-        if self.name in ("Felt", "ContractAddress", "ClassHash"):
+        if self.name in ("Felt", "ContractAddress", "ClassHash", "StorageAddress"):
             return STARK_FIELD
 
         if self.name == "EthAddress":
@@ -169,13 +187,21 @@ class StarknetCoreType(Enum):
 
 
 @dataclass(slots=True)
-class StarknetArray:
+class StarknetArray(_CachedType):
     """
     Dataclass representing a Starknet ABI Array.  Both core::array::Array and core::array::Span are mapped to this
     dataclass since their ABI Encoding & Decoding are identical
     """
 
     inner_type: "StarknetType"
+    _decoder: Callable | None = field(default=None, init=False, repr=False, compare=False)
+    _format_decoders: dict[Any, Callable] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _skipper: Callable | None = field(default=None, init=False, repr=False, compare=False)
+    _encoder: Callable | None = field(default=None, init=False, repr=False, compare=False)
+    _layout: Any = field(default=None, init=False, repr=False, compare=False)
+    _id_str: str | None = field(default=None, init=False, repr=False, compare=False)
 
     def id_str(self):
         """
@@ -188,16 +214,26 @@ class StarknetArray:
             '[Felt]'
 
         """
-        return f"[{self.inner_type.id_str()}]"
+        if self._id_str is None:
+            self._id_str = f"[{self.inner_type.id_str()}]"
+        return self._id_str
 
 
 @dataclass(slots=True)
-class StarknetOption:
+class StarknetOption(_CachedType):
     """
     Dataclass Representing a Starknet Option
     """
 
     inner_type: "StarknetType"
+    _decoder: Callable | None = field(default=None, init=False, repr=False, compare=False)
+    _format_decoders: dict[Any, Callable] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _skipper: Callable | None = field(default=None, init=False, repr=False, compare=False)
+    _encoder: Callable | None = field(default=None, init=False, repr=False, compare=False)
+    _layout: Any = field(default=None, init=False, repr=False, compare=False)
+    _id_str: str | None = field(default=None, init=False, repr=False, compare=False)
 
     def id_str(self):
         """
@@ -211,14 +247,24 @@ class StarknetOption:
             'Option[U128]'
 
         """
-        return f"Option[{self.inner_type.id_str()}]"
+        if self._id_str is None:
+            self._id_str = f"Option[{self.inner_type.id_str()}]"
+        return self._id_str
 
 
 @dataclass(slots=True)
-class StarknetNonZero:
+class StarknetNonZero(_CachedType):
     """Dataclass Represent a Starknet NonZero Type"""
 
     inner_type: "StarknetType"
+    _decoder: Callable | None = field(default=None, init=False, repr=False, compare=False)
+    _format_decoders: dict[Any, Callable] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _skipper: Callable | None = field(default=None, init=False, repr=False, compare=False)
+    _encoder: Callable | None = field(default=None, init=False, repr=False, compare=False)
+    _layout: Any = field(default=None, init=False, repr=False, compare=False)
+    _id_str: str | None = field(default=None, init=False, repr=False, compare=False)
 
     def id_str(self):
         """
@@ -232,17 +278,27 @@ class StarknetNonZero:
             'NonZero[U128]'
 
         """
-        return f"NonZero[{self.inner_type.id_str()}]"
+        if self._id_str is None:
+            self._id_str = f"NonZero[{self.inner_type.id_str()}]"
+        return self._id_str
 
 
 @dataclass(slots=True)
-class StarknetEnum:
+class StarknetEnum(_CachedType):
     """
     Represents a StarknetEnum with its name and ordered variants
     """
 
     name: str
     variants: Sequence[tuple[str, "StarknetType"]]  # variant_name  # variant_type
+    _decoder: Callable | None = field(default=None, init=False, repr=False, compare=False)
+    _format_decoders: dict[Any, Callable] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _skipper: Callable | None = field(default=None, init=False, repr=False, compare=False)
+    _encoder: Callable | None = field(default=None, init=False, repr=False, compare=False)
+    _layout: Any = field(default=None, init=False, repr=False, compare=False)
+    _id_str: str | None = field(default=None, init=False, repr=False, compare=False)
 
     def id_str(self):
         """
@@ -271,26 +327,36 @@ class StarknetEnum:
             'Enum[Class:ClassHash,Contract:ContractAddress]'
 
         """
-        variants_str = ",".join(
-            [
-                (
-                    f"{variant_name}:{variant_type.id_str()}"
-                    if variant_type != StarknetCoreType.NoneType
-                    else f"'{variant_name}'"
-                )
-                for variant_name, variant_type in self.variants
-            ]
-        )
-        return f"Enum[{variants_str}]"
+        if self._id_str is None:
+            variants_str = ",".join(
+                [
+                    (
+                        f"{variant_name}:{variant_type.id_str()}"
+                        if variant_type != StarknetCoreType.NoneType
+                        else f"'{variant_name}'"
+                    )
+                    for variant_name, variant_type in self.variants
+                ]
+            )
+            self._id_str = f"Enum[{variants_str}]"
+        return self._id_str
 
 
 @dataclass(slots=True)
-class StarknetTuple:
+class StarknetTuple(_CachedType):
     """
     Dataclass Representing a Tuple, and the Types of the Tuple Members
     """
 
     members: Sequence["StarknetType"]
+    _decoder: Callable | None = field(default=None, init=False, repr=False, compare=False)
+    _format_decoders: dict[Any, Callable] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _skipper: Callable | None = field(default=None, init=False, repr=False, compare=False)
+    _encoder: Callable | None = field(default=None, init=False, repr=False, compare=False)
+    _layout: Any = field(default=None, init=False, repr=False, compare=False)
+    _id_str: str | None = field(default=None, init=False, repr=False, compare=False)
 
     def id_str(self):
         """
@@ -309,18 +375,28 @@ class StarknetTuple:
             '(U256,(U8,U8))'
 
         """
-        members_str = ",".join([member.id_str() for member in self.members])
-        return f"({members_str})"
+        if self._id_str is None:
+            members_str = ",".join([member.id_str() for member in self.members])
+            self._id_str = f"({members_str})"
+        return self._id_str
 
 
 @dataclass(slots=True)
-class StarknetStruct:
+class StarknetStruct(_CachedType):
     """
     Dataclass Representing a Starknet Struct Definition
     """
 
     name: str
     members: Sequence["AbiParameter"]
+    _decoder: Callable | None = field(default=None, init=False, repr=False, compare=False)
+    _format_decoders: dict[Any, Callable] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _skipper: Callable | None = field(default=None, init=False, repr=False, compare=False)
+    _encoder: Callable | None = field(default=None, init=False, repr=False, compare=False)
+    _layout: Any = field(default=None, init=False, repr=False, compare=False)
+    _id_str: str | None = field(default=None, init=False, repr=False, compare=False)
 
     def id_str(self):
         """
@@ -338,8 +414,12 @@ class StarknetStruct:
             '{version_hash:Felt,version:[U8]}'
 
         """
-        members_str = ",".join([f"{member.name}:{member.type.id_str()}" for member in self.members])
-        return "{" + members_str + "}"
+        if self._id_str is None:
+            members_str = ",".join(
+                [f"{member.name}:{member.type.id_str()}" for member in self.members]
+            )
+            self._id_str = "{" + members_str + "}"
+        return self._id_str
 
 
 StarknetType = Union[
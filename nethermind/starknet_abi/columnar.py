@@ -0,0 +1,395 @@
+import json
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, Callable, Iterable, Iterator, Sequence
+
+from nethermind.starknet_abi.abi_types import (
+    StarknetArray,
+    StarknetCoreType,
+    StarknetNonZero,
+    StarknetOption,
+    StarknetStruct,
+    StarknetType,
+)
+from nethermind.starknet_abi.decode import OutputFormat, compile_decoder
+
+try:
+    import pyarrow as pa  # type: ignore
+except ImportError:
+    pa = None  # pylint: disable=invalid-name
+
+ROW_INDEX_COLUMN = "_row_index"
+
+_WIDE_INTEGERS = (
+    StarknetCoreType.U128,
+    StarknetCoreType.U256,
+    StarknetCoreType.U512,
+    StarknetCoreType.I128,
+)
+
+# Types decoded to hex strings, ints or bytes depending on the OutputFormat
+_FELT_TYPES = (
+    StarknetCoreType.Felt,
+    StarknetCoreType.ContractAddress,
+    StarknetCoreType.ClassHash,
+    StarknetCoreType.StorageAddress,
+    StarknetCoreType.EthAddress,
+    StarknetCoreType.Bytes31,
+)
+
+# Converts a decoded value to the representation stored in its Arrow column
+_ArrowConverter = Callable[[Any], Any] | None
+
+ColumnWriter = Callable[[Sequence[int], int], int]
+"""
+Compiled writer for a parameter of a ColumnBuilder.  Takes the calldata sequence and the offset of the first felt
+of the parameter, decodes each leaf value of the parameter straight into its column, and returns the end offset
+"""
+
+
+def _core_arrow_type(
+    core_type: StarknetCoreType, output_format: OutputFormat
+) -> tuple[Any, _ArrowConverter]:
+    if core_type in _WIDE_INTEGERS:
+        return pa.string(), str  # Wider than any Arrow integer, stored as decimal strings
+
+    if core_type in _FELT_TYPES and output_format is not OutputFormat.HEX:
+        if output_format is OutputFormat.BYTES:
+            return pa.binary(), None
+        return pa.string(), str  # Felts decoded to ints are stored as decimal strings
+
+    arrow_type = {
+        StarknetCoreType.U8: pa.uint8,
+        StarknetCoreType.U16: pa.uint16,
+        StarknetCoreType.U32: pa.uint32,
+        StarknetCoreType.U64: pa.uint64,
+        StarknetCoreType.I8: pa.int8,
+        StarknetCoreType.I16: pa.int16,
+        StarknetCoreType.I32: pa.int32,
+        StarknetCoreType.I64: pa.int64,
+        StarknetCoreType.Bool: pa.bool_,
+    }.get(
+        core_type, pa.string
+    )  # Felts and addresses are decoded to hex strings
+    return arrow_type(), None
+
+
+def _arrow_type(  # pylint: disable=too-many-return-statements
+    starknet_type: StarknetType,
+    output_format: OutputFormat,
+) -> tuple[Any, _ArrowConverter]:
+    """Returns the Arrow type of a StarknetType, and the converter applied to decoded values"""
+    if isinstance(starknet_type, StarknetCoreType):
+        return _core_arrow_type(starknet_type, output_format)
+
+    if isinstance(starknet_type, (StarknetOption, StarknetNonZero)):
+        inner_type, inner_converter = _arrow_type(starknet_type.inner_type, output_format)
+        if inner_converter is None:
+            return inner_type, None
+        return inner_type, lambda value: None if value is None else inner_converter(value)
+
+    if isinstance(starknet_type, StarknetArray):
+        inner_type, inner_converter = _arrow_type(starknet_type.inner_type, output_format)
+        if inner_converter is None:
+            return pa.list_(inner_type), None
+        return pa.list_(inner_type), lambda values: [inner_converter(value) for value in values]
+
+    if isinstance(starknet_type, StarknetStruct):
+        members = [
+            (member.name, *_arrow_type(member.type, output_format))
+            for member in starknet_type.members
+        ]
+        if not members:
+            return pa.struct([]), None
+
+        def _convert_struct(value: dict) -> dict:
+            return {
+                name: value[name] if converter is None else converter(value[name])
+                for name, _, converter in members
+            }
+
+        return pa.struct([(name, member_type) for name, member_type, _ in members]), _convert_struct
+
+    # Tuples and Enums do not have a fixed Arrow schema, and are stored as JSON
+    if output_format is OutputFormat.BYTES:
+        return pa.string(), partial(json.dumps, default=bytes.hex)
+    return pa.string(), json.dumps
+
+
+@dataclass(slots=True)
+class _Column:
+    name: str
+    path: tuple[int | str, ...]  # Parameter index, followed by the struct member names
+    starknet_type: StarknetType
+    values: list = field(default_factory=list)
+
+
+def _compile_column_writer(
+    starknet_type: StarknetType, columns: Iterator[_Column], output_format: OutputFormat
+) -> ColumnWriter:
+    """
+    Compiles the writer of a parameter, taking the columns of its leaf values from the columns iterator, in the
+    order the columns were added.  Struct writers run the writer of each member, so structs are never built as
+    dicts, and every other type is decoded with its compiled decoder, and appended to its column
+    """
+    if isinstance(starknet_type, StarknetStruct):
+        member_writers = [
+            _compile_column_writer(member.type, columns, output_format)
+            for member in starknet_type.members
+        ]
+
+        def _write_struct(calldata: Sequence[int], offset: int) -> int:
+            for member_writer in member_writers:
+                offset = member_writer(calldata, offset)
+            return offset
+
+        return _write_struct
+
+    decoder = compile_decoder(starknet_type, output_format)
+    append = next(columns).values.append
+
+    def _write_column(calldata: Sequence[int], offset: int) -> int:
+        value, offset = decoder(calldata, offset)
+        append(value)
+        return offset
+
+    return _write_column
+
+
+class ColumnBuilder:
+    """
+    Accumulates the decoded parameters of a single function or event into columns.  Struct parameters are
+    flattened, with a column for each member, named with the dotted path of the member, like ``route.token_from``.
+    Arrays, Tuples, Enums and Options are stored in a single column.
+
+    Rows are either appended as decoded values with :meth:`append`, or decoded straight from calldata into the
+    columns with the compiled :attr:`writers`, followed by :meth:`end_row`, which does not build struct dicts.
+
+    .. doctest::
+
+        >>> from nethermind.starknet_abi.columnar import ColumnBuilder
+        >>> from nethermind.starknet_abi.abi_types import StarknetCoreType, StarknetStruct, AbiParameter
+        >>> route = StarknetStruct("Route", [AbiParameter("percent", StarknetCoreType.U8)])
+        >>> builder = ColumnBuilder("swap", "swap", [("amount", StarknetCoreType.U32), ("route", route)])
+        >>> builder.append(0, [100, {"percent": 50}])
+        >>> builder.append(3, [200, {"percent": 25}])
+        >>> builder.to_columns()
+        {'_row_index': [0, 3], 'amount': [100, 200], 'route.percent': [50, 25]}
+        >>> amount_writer, route_writer = builder.writers
+        >>> route_writer([300, 75], amount_writer([300, 75], 0))
+        2
+        >>> builder.end_row(5)
+        >>> builder.to_columns()
+        {'_row_index': [0, 3, 5], 'amount': [100, 200, 300], 'route.percent': [50, 25, 75]}
+
+    :param abi_name: abi name of the function or event
+    :param name: name of the function or event
+    :param parameters: name and type of each parameter, in the order parameters are appended
+    :param output_format: OutputFormat the appended values were decoded with.  Sets the Arrow type of felt and
+        address columns
+    """
+
+    __slots__ = (
+        "abi_name",
+        "name",
+        "parameters",
+        "output_format",
+        "row_indices",
+        "_columns",
+        "_writers",
+    )
+
+    def __init__(
+        self,
+        abi_name: str | None,
+        name: str,
+        parameters: Sequence[tuple[str, StarknetType]],
+        output_format: OutputFormat = OutputFormat.HEX,
+    ):
+        self.abi_name = abi_name
+        self.name = name
+        self.output_format = output_format
+        self.parameters = list(parameters)
+        self.row_indices: list[int] = []
+        self._columns: list[_Column] = []
+        self._writers: list[ColumnWriter] | None = None
+
+        for index, (param_name, param_type) in enumerate(parameters):
+            self._add_columns(param_name, (index,), param_type)
+
+    def _add_columns(self, name: str, path: tuple[int | str, ...], starknet_type: StarknetType):
+        if isinstance(starknet_type, StarknetStruct):
+            for member in starknet_type.members:
+                self._add_columns(f"{name}.{member.name}", (*path, member.name), member.type)
+        else:
+            self._columns.append(_Column(name, path, starknet_type))
+
+    def __len__(self) -> int:
+        return len(self.row_indices)
+
+    def append(self, row_index: int, values: Iterable[Any]):
+        """
+        Appends the decoded parameters of a row
+
+        :param row_index: index of the row in the decoded batch
+        :param values: decoded value of each parameter, in parameter order
+        """
+        values = list(values)
+        self.row_indices.append(row_index)
+        for column in self._columns:
+            value = values[column.path[0]]  # type: ignore[index]
+            for member_name in column.path[1:]:
+                value = value[member_name]
+            column.values.append(value)
+
+    @property
+    def writers(self) -> list[ColumnWriter]:
+        """
+        Compiled writer of each parameter, in parameter order.  Each writer decodes a parameter from calldata,
+        and appends its leaf values to their columns.  Once every parameter of a row is written, the row is
+        completed with :meth:`end_row`, or its values are removed with :meth:`discard_row` if decoding failed
+        """
+        if self._writers is None:
+            columns = iter(self._columns)
+            self._writers = [
+                _compile_column_writer(param_type, columns, self.output_format)
+                for _, param_type in self.parameters
+            ]
+        return self._writers
+
+    def end_row(self, row_index: int):
+        """
+        Completes a row written with the :attr:`writers`
+
+        :param row_index: index of the row in the decoded batch
+        """
+        self.row_indices.append(row_index)
+
+    def discard_row(self):
+        """Removes the values written for an incomplete row"""
+        row_count = len(self.row_indices)
+        for column in self._columns:
+            del column.values[row_count:]
+
+    def to_columns(self) -> dict[str, list]:
+        """
+        Returns the columns as lists, including the index of each row in the decoded batch
+
+        :return: mapping of column names to column values
+        """
+        return {
+            ROW_INDEX_COLUMN: self.row_indices,
+            **{column.name: column.values for column in self._columns},
+        }
+
+    def to_arrow(self):
+        """
+        Builds an Arrow RecordBatch from the columns.  Integers wider than 64 bits are stored as decimal strings,
+        and Tuples and Enums are stored as JSON strings.  Felts and addresses decoded to bytes are stored as
+        binary columns.  Requires pyarrow.
+
+        :return: pyarrow.RecordBatch
+        """
+        if pa is None:
+            raise ImportError(
+                "pyarrow is required for Arrow output.  Install with: pip install pyarrow"
+            )
+
+        arrays, fields = [pa.array(self.row_indices, pa.uint64())], [
+            pa.field(ROW_INDEX_COLUMN, pa.uint64(), nullable=False)
+        ]
+        for column in self._columns:
+            arrow_type, converter = _arrow_type(column.starknet_type, self.output_format)
+            values = (
+                column.values
+                if converter is None
+                else [converter(value) for value in column.values]
+            )
+            arrays.append(pa.array(values, arrow_type))
+            fields.append(pa.field(column.name, arrow_type))
+
+        return pa.RecordBatch.from_arrays(arrays, schema=pa.schema(fields))
+
+    def build(self):
+        """
+        Returns an Arrow RecordBatch if pyarrow is installed, or the dict of column lists otherwise
+        """
+        return self.to_columns() if pa is None else self.to_arrow()
+
+
+@dataclass(slots=True)
+class ColumnarDecodeResult:
+    """
+    Result of a columnar batch decode.  Decoded rows are grouped by (abi_name, function or event name), and each
+    group is an Arrow RecordBatch if pyarrow is installed, or a dict of column lists otherwise.  Each group includes
+    a ``_row_index`` column, holding the index of each row in the input batch.
+    """
+
+    tables: dict[tuple[str | None, str], Any] = field(default_factory=dict)
+
+    # Index of each row that failed to decode, and the raised exception
+    errors: dict[int, Exception] = field(default_factory=dict)
+
+    # Index of each row with a class hash that is not present in the dispatcher
+    unknown_classes: list[int] = field(default_factory=list)
+
+
+class ColumnarCollector:
+    """Groups decoded rows into ColumnBuilders while a batch is decoded"""
+
+    __slots__ = ("builders", "result", "output_format", "_types_refs")
+
+    def __init__(self, output_format: OutputFormat = OutputFormat.HEX) -> None:
+        self.output_format = output_format
+        self.builders: dict[tuple[str | None, str], ColumnBuilder] = {}
+        self.result = ColumnarDecodeResult()
+        self._types_refs: dict[tuple[str | None, str], object] = {}
+
+    def builder(
+        self,
+        abi_name: str | None,
+        name: str,
+        types_ref: object,
+        parameters: Callable[[], Sequence[tuple[str, StarknetType]]],
+    ) -> ColumnBuilder:
+        """
+        Returns the ColumnBuilder of a function or event, creating it for the first row of the group.  Raises a
+        ValueError if the group was created with different parameter types or names, as the rows would be stored
+        in columns of another parameter
+
+        :param abi_name: abi name of the function or event
+        :param name: name of the function or event
+        :param types_ref: shared type object of the function or event.  Rows with the same types_ref object are
+            appended without comparing parameters
+        :param parameters: returns the name and type of each parameter.  Only called for new groups, or groups
+            with a different types_ref
+        """
+        group_builder = self.builders.get((abi_name, name))
+        if group_builder is None:
+            group_builder = self.builders[(abi_name, name)] = ColumnBuilder(
+                abi_name, name, parameters(), self.output_format
+            )
+            self._types_refs[(abi_name, name)] = types_ref
+
+        elif self._types_refs[(abi_name, name)] is not types_ref:
+            group_parameters = list(parameters())
+            if [param_type for _, param_type in group_builder.parameters] != [
+                param_type for _, param_type in group_parameters
+            ]:
+                raise ValueError(
+                    f"{name} of ABI {abi_name} is decoded with conflicting types in the batch"
+                )
+            if group_builder.parameters != group_parameters:
+                raise ValueError(
+                    f"{name} of ABI {abi_name} is decoded with conflicting parameter names in the batch.  "
+                    f"{[param for param, _ in group_builder.parameters]} != "
+                    f"{[param for param, _ in group_parameters]}"
+                )
+        return group_builder
+
+    def finish(self) -> ColumnarDecodeResult:
+        """Builds the table of every group.  Groups without a decoded row are skipped"""
+        self.result.tables = {
+            key: builder.build() for key, builder in self.builders.items() if len(builder)
+        }
+        return self.result
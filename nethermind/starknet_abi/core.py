@@ -1,14 +1,24 @@
+import hashlib
+import json
+import os
+import pickle
 import warnings
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from importlib import metadata
+from os import PathLike
+from pathlib import Path
 from typing import Any
 
 from nethermind.starknet_abi.decoding_types import AbiEvent, AbiFunction, AbiInterface
 from nethermind.starknet_abi.exceptions import InvalidAbiError
+from nethermind.starknet_abi.intern import TypeInterner
 from nethermind.starknet_abi.parse import (
     group_abi_by_type,
     parse_abi_event,
     parse_abi_function,
     parse_enums_and_structs,
+    parse_event_selectors,
     topo_sort_type_defs,
 )
 
@@ -30,12 +40,17 @@ class StarknetAbi:
 
     implemented_interfaces: dict[str, AbiInterface]
 
+    # Selector chains of events emitted through nested and flat event enums.  See parse_event_selectors()
+    event_selectors: dict[tuple[bytes, ...], AbiEvent] = field(default_factory=dict)
+
     @classmethod
-    def from_json(
+    def from_json(  # pylint: disable=too-many-locals
         cls,
         abi_json: list[dict[str, Any]],
         class_hash: bytes | None = None,
         abi_name: str | None = None,
+        interner: TypeInterner | None = None,
+        cache: "AbiParseCache | None" = None,
     ) -> "StarknetAbi":
         """
         Parse a StarknetABI From the JSON ABI of the class.
@@ -43,14 +58,27 @@ class StarknetAbi:
         :param abi_json:
         :param class_hash:
         :param abi_name:
+        :param interner: Optional TypeInterner.  Structurally identical types parsed with the same interner are
+            shared between ABIs
+        :param cache: Optional AbiParseCache.  If an identical ABI was already parsed, the parsed functions, events
+            and interfaces are shared with the cached ABI, and only the class_hash and abi_name differ
         """
+        if cache is not None:
+            content_hash = cache.content_hash(abi_json)
+            cached_abi = cache.get(content_hash)
+            if cached_abi is None:
+                cached_abi = cls.from_json(abi_json, interner=interner)
+                cache.put(content_hash, cached_abi)
+
+            return replace(cached_abi, class_hash=class_hash, abi_name=abi_name)
+
         grouped_abi = group_abi_by_type(abi_json)
 
         try:  # ABIs should already be topologically sorted
-            defined_types = parse_enums_and_structs(grouped_abi["type_def"])
+            defined_types = parse_enums_and_structs(grouped_abi["type_def"], interner)
         except InvalidAbiError:
             sorted_defs = topo_sort_type_defs(grouped_abi["type_def"])
-            defined_types = parse_enums_and_structs(sorted_defs)
+            defined_types = parse_enums_and_structs(sorted_defs, interner)
             warnings.warn(
                 "ABI Struct and Enum definitions out of order & required topological sorting"
             )
@@ -59,31 +87,37 @@ class StarknetAbi:
         defined_interfaces = [
             AbiInterface(
                 name=interface["name"],
-                functions=[parse_abi_function(func, defined_types) for func in interface["items"]],
+                functions=[
+                    parse_abi_function(func, defined_types, interner) for func in interface["items"]
+                ],
             )
             for interface in grouped_abi["interface"]
         ]
 
         functions = {
-            function["name"]: parse_abi_function(function, defined_types)
+            function["name"]: parse_abi_function(function, defined_types, interner)
             for function in grouped_abi["function"]
         }
 
         for interface in defined_interfaces:
             functions.update({function.name: function for function in interface.functions})
 
-        parsed_abi_events = [
-            parse_abi_event(event, defined_types) for event in grouped_abi["event"]
-        ]
-        events = {event.name: event for event in parsed_abi_events if event is not None}
+        parsed_abi_events = {
+            event["name"]: parse_abi_event(event, defined_types, interner)
+            for event in grouped_abi["event"]
+        }
+        struct_events = {
+            name: event for name, event in parsed_abi_events.items() if event is not None
+        }
+        events = {event.name: event for event in struct_events.values()}
 
         if len(grouped_abi.get("constructor", [])) == 1:
-            constructor = parse_abi_function(grouped_abi["constructor"][0], defined_types)
+            constructor = parse_abi_function(grouped_abi["constructor"][0], defined_types, interner)
         else:
             constructor = None
 
         if len(grouped_abi.get("l1_handler", [])) == 1:
-            l1_handler = parse_abi_function(grouped_abi["l1_handler"][0], defined_types)
+            l1_handler = parse_abi_function(grouped_abi["l1_handler"][0], defined_types, interner)
         else:
             l1_handler = None
 
@@ -101,4 +135,129 @@ class StarknetAbi:
             constructor=constructor,
             l1_handler=l1_handler,
             implemented_interfaces=implemented_interfaces,
+            event_selectors=parse_event_selectors(grouped_abi["event"], struct_events),
         )
+
+
+def _package_version() -> str:
+    try:
+        return metadata.version("starknet-abi")
+    except metadata.PackageNotFoundError:
+        return "dev"
+
+
+class AbiParseCache:
+    """
+    Cache of parsed ABIs, keyed by the hash of the canonical JSON encoding of the ABI.  Many classes share byte
+    identical ABIs, which only need to be parsed once.
+
+    The in-memory cache is a bounded LRU.  If a directory is provided, parsed ABIs are also pickled to the
+    directory, and reused by later processes.  Persisted ABIs are keyed by the package version, so ABIs pickled by
+    another release are parsed again, rather than unpickled into changed types.  Cached ABIs are shared between
+    every class with an identical ABI, and should not be modified.
+
+    .. doctest::
+
+        >>> from nethermind.starknet_abi.core import AbiParseCache, StarknetAbi
+        >>> abi_json = [{"type": "function", "name": "get_owner", "inputs": [], "outputs": []}]
+        >>> cache = AbiParseCache(max_size=128)
+        >>> first_abi = StarknetAbi.from_json(abi_json, abi_name="first", cache=cache)
+        >>> second_abi = StarknetAbi.from_json(abi_json, abi_name="second", cache=cache)
+        >>> first_abi.functions is second_abi.functions, second_abi.abi_name
+        (True, 'second')
+        >>> cache.hits, cache.misses
+        (1, 1)
+
+    :param max_size: Maximum number of parsed ABIs held in memory
+    :param directory: Optional directory to persist parsed ABIs in
+    """
+
+    def __init__(self, max_size: int = 1024, directory: str | PathLike | None = None):
+        if max_size < 1:
+            raise ValueError("max_size must be a positive integer")
+
+        self.max_size = max_size
+        self.directory = Path(directory) if directory is not None else None
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+
+        self.version = _package_version()
+        self._entries: OrderedDict[bytes, StarknetAbi] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def content_hash(abi_json: list[dict[str, Any]]) -> bytes:
+        """
+        Returns the sha256 hash of the canonical JSON encoding of an ABI.  Keys are sorted and whitespace is removed,
+        so formatting differences between ABI dumps do not change the hash.
+
+        :param abi_json: JSON ABI
+        :return: 32 byte content hash
+        """
+        canonical_json = json.dumps(abi_json, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(canonical_json.encode()).digest()
+
+    def _cache_path(self, content_hash: bytes) -> Path:
+        assert self.directory is not None
+        return self.directory / f"{content_hash.hex()}-{self.version}.abi"
+
+    def get(self, content_hash: bytes) -> StarknetAbi | None:
+        """
+        Returns the cached ABI for a content hash, or None if the ABI has not been parsed.
+
+        :param content_hash: result of :meth:`AbiParseCache.content_hash`
+        """
+        cached_abi = self._entries.get(content_hash)
+        if cached_abi is not None:
+            self._entries.move_to_end(content_hash)
+            self.hits += 1
+            return cached_abi
+
+        if self.directory is not None:
+            try:
+                with open(self._cache_path(content_hash), "rb") as cache_file:
+                    cached_abi = pickle.load(cache_file)
+            except Exception:  # pylint: disable=broad-exception-caught
+                # Unreadable, truncated or incompatible pickles are parsed again, and overwritten
+                cached_abi = None
+
+            if isinstance(cached_abi, StarknetAbi):
+                self._store(content_hash, cached_abi)
+                self.hits += 1
+                return cached_abi
+
+        self.misses += 1
+        return None
+
+    def put(self, content_hash: bytes, abi: StarknetAbi):
+        """
+        Adds a parsed ABI to the cache, and persists it to the cache directory if configured.
+
+        :param content_hash: result of :meth:`AbiParseCache.content_hash`
+        :param abi: parsed ABI
+        """
+        self._store(content_hash, abi)
+
+        if self.directory is not None:
+            cache_path = self._cache_path(content_hash)
+            temp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            with open(temp_path, "wb") as cache_file:
+                pickle.dump(abi, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+            # Rename is atomic, so concurrent processes never read partially written files
+            os.replace(temp_path, cache_path)
+
+    def _store(self, content_hash: bytes, abi: StarknetAbi):
+        self._entries[content_hash] = abi
+        self._entries.move_to_end(content_hash)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Clears the in-memory cache and statistics.  Persisted ABIs are not removed"""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
@@ -1,4 +1,6 @@
-from typing import Any, Sequence
+from enum import Enum
+from functools import partial
+from typing import Any, Callable, Collection, Mapping, Sequence
 
 from nethermind.starknet_abi.abi_types import (
     AbiParameter,
@@ -12,32 +14,58 @@ from nethermind.starknet_abi.abi_types import (
     StarknetType,
 )
 from nethermind.starknet_abi.exceptions import InvalidCalldataError, TypeDecodeError
+from nethermind.starknet_abi.layout import type_layout
 from nethermind.starknet_abi.utils import STARK_FIELD
 
 # Disable linter line breaks to make assert statements more readable
 # fmt: off
 
 
-def decode_core_type(  # pylint: disable=too-many-return-statements
-    decode_type: StarknetCoreType, calldata: list[int]
-) -> str | int | bool:
+class OutputFormat(Enum):
     """
-    Decodes Calldata using Starknet Core Type. Takes in two parameters, a StarknetCoreType, and a mutable reference
-    to a calldata array. When decoding, calldata is popped off the top of the calldata array. This reference to the
-    calldata array is recursively passed between type decoders, so this array is modified during decoding
+    Representation of decoded Felts, ContractAddresses, ClassHashes, StorageAddresses, EthAddresses and Bytes31.
+    Integer and boolean types are always decoded to ints and bools.
+
+    * ``HEX``: 0x prefixed hex strings, padded to the width of the type.  Default output format
+    * ``INT``: ints, skipping hex formatting entirely
+    * ``BYTES``: big-endian bytes, 32 bytes wide for felts and addresses, 20 for EthAddresses and 31 for Bytes31
+    """
+
+    HEX = "hex"
+    INT = "int"
+    BYTES = "bytes"
+
+
+
+def decode_core_type_at(  # pylint: disable=too-many-return-statements,too-many-branches,too-many-locals
+    decode_type: StarknetCoreType,
+    calldata: Sequence[int],
+    offset: int,
+    output_format: OutputFormat = OutputFormat.HEX,
+) -> tuple[str | int | bool | bytes, int]:
+    """
+    Decodes a Starknet Core Type from the calldata, starting at the offset cursor.  The calldata sequence is not
+    modified, and can be a list, tuple, or any other indexable sequence of integers.  Returns the decoded value
+    and the offset of the first felt after the decoded value.
 
     .. doctest::
-        >>> from nethermind.starknet_abi.decode import decode_core_type, StarknetCoreType
-        >>> decode_core_type(StarknetCoreType.Bool, [0])
-        False
-        >>> decode_core_type(StarknetCoreType.U256, [12345, 0])
-        12345
-        >>> decode_core_type(StarknetCoreType.Felt, [256])
-        '0x0100'
+        >>> from nethermind.starknet_abi.decode import decode_core_type_at, OutputFormat, StarknetCoreType
+        >>> decode_core_type_at(StarknetCoreType.U256, (0, 12345, 0), 1)
+        (12345, 3)
+        >>> decode_core_type_at(StarknetCoreType.Bool, [1, 0], 0)
+        (True, 1)
+        >>> decode_core_type_at(StarknetCoreType.ContractAddress, [255], 0, OutputFormat.INT)
+        (255, 1)
 
     :param decode_type:  Starknet Core Type to Decode
-    :param calldata:  Mutable reference to calldata array. **WARN -- Array is Consumed by Method**
+    :param calldata:  Immutable sequence of calldata
+    :param offset:  Index of the first felt of the encoded value
+    :param output_format:  Representation of decoded felts and addresses.  Defaults to hex strings
+    :return: tuple of decoded value and the end offset
     """
+    if output_format is not OutputFormat.HEX:
+        return _CORE_DECODERS[output_format][decode_type](calldata, offset)
+
     try:
         match decode_type:
             case (
@@ -47,10 +75,10 @@ def decode_core_type(  # pylint: disable=too-many-return-statements
                 | StarknetCoreType.U64
                 | StarknetCoreType.U128
             ):
-                value = calldata.pop(0)
+                value = calldata[offset]
 
                 assert 0 <= value <= decode_type.max_value(), f"{value} exceeds {decode_type} Max Range"
-                return value
+                return value, offset + 1
 
             case (
                 StarknetCoreType.I8
@@ -59,29 +87,29 @@ def decode_core_type(  # pylint: disable=too-many-return-statements
                 | StarknetCoreType.I64
                 | StarknetCoreType.I128
             ):
-                value = calldata.pop(0)
+                value = calldata[offset]
 
                 if value > decode_type.max_value():
                     value -= STARK_FIELD
 
                 assert decode_type.min_value() <= value <= decode_type.max_value()
-                return value
+                return value, offset + 1
 
             case StarknetCoreType.U256:  # Separate out U256 and U512.  These are called enough to inline
-                low = calldata.pop(0)
-                high = calldata.pop(0)
+                low = calldata[offset]
+                high = calldata[offset + 1]
 
                 assert 0 <= low < 2 ** 128, "Low Exceeds U128 Range"
                 assert 0 <= high < 2 ** 128, "High Exceeds U128 Range"
                 uint_256 = (high << 128) + low
 
-                return uint_256
+                return uint_256, offset + 2
 
             case StarknetCoreType.U512:
-                word_0 = calldata.pop(0)
-                word_1 = calldata.pop(0)
-                word_2 = calldata.pop(0)
-                word_3 = calldata.pop(0)
+                word_0 = calldata[offset]
+                word_1 = calldata[offset + 1]
+                word_2 = calldata[offset + 2]
+                word_3 = calldata[offset + 3]
 
                 assert 0 <= word_0 < 2 ** 128, "Word 0 Exceeds U128 Range"  # Sloppy, but better than a loop
                 assert 0 <= word_1 < 2 ** 128, "Word 1 Exceeds U128 Range"
@@ -90,41 +118,41 @@ def decode_core_type(  # pylint: disable=too-many-return-statements
 
                 uint_512 = (word_3 << 384) + (word_2 << 256) + (word_1 << 128) + word_0
 
-                return uint_512
+                return uint_512, offset + 4
 
             case StarknetCoreType.Bool:
-                bool_val = calldata.pop(0)
+                bool_val = calldata[offset]
 
                 assert bool_val in (0, 1), "Bool Value must be 0 or 1"
-                return bool_val == 1
+                return bool_val == 1, offset + 1
 
             case StarknetCoreType.Felt:
-                encoded_int = calldata.pop(0)
+                encoded_int = calldata[offset]
 
                 assert 0 <= encoded_int <= decode_type.max_value(), f"{encoded_int} larger than Felt"
                 hexstr = f"{encoded_int:0x}"
-                return f"0x0{hexstr}" if len(hexstr) % 2 else f"0x{hexstr}"
+                return (f"0x0{hexstr}" if len(hexstr) % 2 else f"0x{hexstr}"), offset + 1
 
             case StarknetCoreType.ClassHash | StarknetCoreType.ContractAddress | StarknetCoreType.StorageAddress:
-                encoded_int = calldata.pop(0)
+                encoded_int = calldata[offset]
 
                 assert (
                     0 <= encoded_int <= decode_type.max_value()
                 ), f"{encoded_int} larger than Felt Address"
-                return f"0x{encoded_int:064x}"
+                return f"0x{encoded_int:064x}", offset + 1
 
             case StarknetCoreType.EthAddress:
-                encoded_int = calldata.pop(0)
+                encoded_int = calldata[offset]
                 assert 0 <= encoded_int <= decode_type.max_value(), f"{encoded_int:0x} larger than EthAddress"
-                return f"0x{encoded_int:040x}"
+                return f"0x{encoded_int:040x}", offset + 1
 
             case StarknetCoreType.Bytes31:
-                encoded_int = calldata.pop(0)
+                encoded_int = calldata[offset]
                 assert 0 <= encoded_int <= decode_type.max_value(), f"{encoded_int:0x} larger than Bytes31"
-                return f"0x{encoded_int:062x}"
+                return f"0x{encoded_int:062x}", offset + 1
 
             case StarknetCoreType.NoneType:
-                return ""
+                return "", offset
 
             case _:
                 raise TypeError(f"Unable to decode Starknet Core type:  {decode_type}")
@@ -140,20 +168,691 @@ def decode_core_type(  # pylint: disable=too-many-return-statements
         )
 
 
-def decode_from_types(  # pylint: disable=too-many-branches, too-many-locals
+def decode_core_type(
+    decode_type: StarknetCoreType,
+    calldata: list[int],
+    output_format: OutputFormat = OutputFormat.HEX,
+) -> str | int | bool | bytes:
+    """
+    Decodes Calldata using Starknet Core Type. Takes in two parameters, a StarknetCoreType, and a mutable reference
+    to a calldata array. When decoding, the decoded felts are removed from the top of the calldata array.
+
+    .. doctest::
+        >>> from nethermind.starknet_abi.decode import decode_core_type, OutputFormat, StarknetCoreType
+        >>> decode_core_type(StarknetCoreType.Bool, [0])
+        False
+        >>> decode_core_type(StarknetCoreType.U256, [12345, 0])
+        12345
+        >>> decode_core_type(StarknetCoreType.Felt, [256])
+        '0x0100'
+        >>> decode_core_type(StarknetCoreType.EthAddress, [256], OutputFormat.BYTES).hex()
+        '0000000000000000000000000000000000000100'
+
+    :param decode_type:  Starknet Core Type to Decode
+    :param calldata:  Mutable reference to calldata array. **WARN -- Array is Consumed by Method**
+    :param output_format:  Representation of decoded felts and addresses.  Defaults to hex strings
+    """
+    decoded, end_offset = decode_core_type_at(decode_type, calldata, 0, output_format)
+    del calldata[:end_offset]
+    return decoded
+
+
+TypeDecoder = Callable[[Sequence[int], int], tuple[Any, int]]
+"""
+Compiled decoder for a StarknetType.  Takes the calldata sequence and the offset of the first felt of the
+encoded value, and returns the decoded value and the end offset
+"""
+
+
+def _insufficient_calldata(starknet_type: StarknetType, err: Exception) -> InvalidCalldataError:
+    decode_err = InvalidCalldataError(f"Insufficient Calldata to decode {starknet_type}")
+    if isinstance(err, InvalidCalldataError):  # Recursive decode calls chain the inner error
+        decode_err.__cause__ = err
+    return decode_err
+
+
+def _type_decode_error(starknet_type: StarknetType, err: TypeDecodeError) -> TypeDecodeError:
+    decode_err = TypeDecodeError(f"Could not decode {starknet_type}")
+    decode_err.__cause__ = err
+    return decode_err
+
+
+# Byte width and range error message of the types formatted by the OutputFormat
+_FORMATTED_TYPES: dict[StarknetCoreType, tuple[int, str]] = {
+    StarknetCoreType.Felt: (32, "{} larger than Felt"),
+    StarknetCoreType.ContractAddress: (32, "{} larger than Felt Address"),
+    StarknetCoreType.ClassHash: (32, "{} larger than Felt Address"),
+    StarknetCoreType.StorageAddress: (32, "{} larger than Felt Address"),
+    StarknetCoreType.EthAddress: (20, "{:x} larger than EthAddress"),
+    StarknetCoreType.Bytes31: (31, "{:x} larger than Bytes31"),
+}
+
+
+def _compile_raw_decoder(decode_type: StarknetCoreType, output_format: OutputFormat) -> TypeDecoder:
+    """
+    Compiles a decoder returning felts and addresses as ints or big-endian bytes.  The output format is resolved
+    at compile time, so the per-value path only runs the range check and the conversion
+    """
+    not_enough_msg = f"Not Enough Calldata to decode {decode_type}"
+    type_err_msg = f"Could not decode {decode_type}: "
+    byte_width, range_msg = _FORMATTED_TYPES[decode_type]
+    max_value = decode_type.max_value()
+
+    if output_format is OutputFormat.INT:
+        def _decode_int(calldata: Sequence[int], offset: int) -> tuple[Any, int]:
+            try:
+                encoded_int = calldata[offset]
+
+                assert 0 <= encoded_int <= max_value, range_msg.format(encoded_int)
+                return encoded_int, offset + 1
+            except IndexError:
+                raise InvalidCalldataError(not_enough_msg)  # pylint: disable=raise-missing-from
+            except AssertionError as assert_err:
+                raise TypeDecodeError(f"{type_err_msg}{assert_err}")  # pylint: disable=raise-missing-from
+
+        return _decode_int
+
+    def _decode_bytes(calldata: Sequence[int], offset: int) -> tuple[Any, int]:
+        try:
+            encoded_int = calldata[offset]
+
+            assert 0 <= encoded_int <= max_value, range_msg.format(encoded_int)
+            return encoded_int.to_bytes(byte_width, "big"), offset + 1
+        except IndexError:
+            raise InvalidCalldataError(not_enough_msg)  # pylint: disable=raise-missing-from
+        except AssertionError as assert_err:
+            raise TypeDecodeError(f"{type_err_msg}{assert_err}")  # pylint: disable=raise-missing-from
+
+    return _decode_bytes
+
+
+def _compile_core_decoder(  # pylint: disable=too-many-statements,too-many-return-statements
+    decode_type: StarknetCoreType,
+) -> TypeDecoder:
+    """
+    Specializes decode_core_type_at for a single StarknetCoreType, hoisting the type dispatch and range bounds
+    out of the per-value path.  Exceptions are identical to decode_core_type_at
+    """
+    not_enough_msg = f"Not Enough Calldata to decode {decode_type}"
+    type_err_msg = f"Could not decode {decode_type}: "
+
+    match decode_type:
+        case (
+            StarknetCoreType.U8
+            | StarknetCoreType.U16
+            | StarknetCoreType.U32
+            | StarknetCoreType.U64
+            | StarknetCoreType.U128
+        ):
+            uint_max = decode_type.max_value()
+
+            def _decode_uint(calldata: Sequence[int], offset: int) -> tuple[Any, int]:
+                try:
+                    value = calldata[offset]
+                    assert 0 <= value <= uint_max, f"{value} exceeds {decode_type} Max Range"
+                    return value, offset + 1
+                except IndexError:
+                    raise InvalidCalldataError(not_enough_msg)  # pylint: disable=raise-missing-from
+                except AssertionError as assert_err:
+                    raise TypeDecodeError(f"{type_err_msg}{assert_err}")  # pylint: disable=raise-missing-from
+
+            return _decode_uint
+
+        case (
+            StarknetCoreType.I8
+            | StarknetCoreType.I16
+            | StarknetCoreType.I32
+            | StarknetCoreType.I64
+            | StarknetCoreType.I128
+        ):
+            int_min, int_max = decode_type.min_value(), decode_type.max_value()
+
+            def _decode_int(calldata: Sequence[int], offset: int) -> tuple[Any, int]:
+                try:
+                    value = calldata[offset]
+                    if value > int_max:
+                        value -= STARK_FIELD
+
+                    assert int_min <= value <= int_max
+                    return value, offset + 1
+                except IndexError:
+                    raise InvalidCalldataError(not_enough_msg)  # pylint: disable=raise-missing-from
+                except AssertionError as assert_err:
+                    raise TypeDecodeError(f"{type_err_msg}{assert_err}")  # pylint: disable=raise-missing-from
+
+            return _decode_int
+
+        case StarknetCoreType.U256:
+            def _decode_u256(calldata: Sequence[int], offset: int) -> tuple[Any, int]:
+                try:
+                    low = calldata[offset]
+                    high = calldata[offset + 1]
+
+                    assert 0 <= low < 2 ** 128, "Low Exceeds U128 Range"
+                    assert 0 <= high < 2 ** 128, "High Exceeds U128 Range"
+                    return (high << 128) + low, offset + 2
+                except IndexError:
+                    raise InvalidCalldataError(not_enough_msg)  # pylint: disable=raise-missing-from
+                except AssertionError as assert_err:
+                    raise TypeDecodeError(f"{type_err_msg}{assert_err}")  # pylint: disable=raise-missing-from
+
+            return _decode_u256
+
+        case StarknetCoreType.Bool:
+            def _decode_bool(calldata: Sequence[int], offset: int) -> tuple[Any, int]:
+                try:
+                    bool_val = calldata[offset]
+
+                    assert bool_val in (0, 1), "Bool Value must be 0 or 1"
+                    return bool_val == 1, offset + 1
+                except IndexError:
+                    raise InvalidCalldataError(not_enough_msg)  # pylint: disable=raise-missing-from
+                except AssertionError as assert_err:
+                    raise TypeDecodeError(f"{type_err_msg}{assert_err}")  # pylint: disable=raise-missing-from
+
+            return _decode_bool
+
+        case StarknetCoreType.Felt:
+            felt_max = decode_type.max_value()
+
+            def _decode_felt(calldata: Sequence[int], offset: int) -> tuple[Any, int]:
+                try:
+                    encoded_int = calldata[offset]
+
+                    assert 0 <= encoded_int <= felt_max, f"{encoded_int} larger than Felt"
+                    hexstr = f"{encoded_int:0x}"
+                    return (f"0x0{hexstr}" if len(hexstr) % 2 else f"0x{hexstr}"), offset + 1
+                except IndexError:
+                    raise InvalidCalldataError(not_enough_msg)  # pylint: disable=raise-missing-from
+                except AssertionError as assert_err:
+                    raise TypeDecodeError(f"{type_err_msg}{assert_err}")  # pylint: disable=raise-missing-from
+
+            return _decode_felt
+
+        case StarknetCoreType.ClassHash | StarknetCoreType.ContractAddress:
+            address_max = decode_type.max_value()
+
+            def _decode_address(calldata: Sequence[int], offset: int) -> tuple[Any, int]:
+                try:
+                    encoded_int = calldata[offset]
+
+                    assert 0 <= encoded_int <= address_max, f"{encoded_int} larger than Felt Address"
+                    return f"0x{encoded_int:064x}", offset + 1
+                except IndexError:
+                    raise InvalidCalldataError(not_enough_msg)  # pylint: disable=raise-missing-from
+                except AssertionError as assert_err:
+                    raise TypeDecodeError(f"{type_err_msg}{assert_err}")  # pylint: disable=raise-missing-from
+
+            return _decode_address
+
+        case StarknetCoreType.NoneType:
+            def _decode_none(calldata: Sequence[int], offset: int) -> tuple[Any, int]:  # pylint: disable=unused-argument
+                return "", offset
+
+            return _decode_none
+
+        case _:
+            # Less frequently decoded types are not specialized
+            return partial(decode_core_type_at, decode_type)
+
+
+_HEX_DECODERS: dict[StarknetCoreType, TypeDecoder] = {
+    core_type: _compile_core_decoder(core_type) for core_type in StarknetCoreType
+}
+
+# Core decoders of each OutputFormat.  Types unaffected by the output format share the hex decoders
+_CORE_DECODERS: dict[OutputFormat, dict[StarknetCoreType, TypeDecoder]] = {
+    OutputFormat.HEX: _HEX_DECODERS,
+    **{
+        output_format: {
+            core_type: (
+                _compile_raw_decoder(core_type, output_format)
+                if core_type in _FORMATTED_TYPES
+                else _HEX_DECODERS[core_type]
+            )
+            for core_type in StarknetCoreType
+        }
+        for output_format in (OutputFormat.INT, OutputFormat.BYTES)
+    },
+}
+
+
+def _compile_array_decoder(array_type: StarknetArray, output_format: OutputFormat) -> TypeDecoder:
+    inner_decoder = compile_decoder(array_type.inner_type, output_format)
+
+    def _decode_array(calldata: Sequence[int], offset: int) -> tuple[Any, int]:
+        try:
+            array_len = calldata[offset]
+            offset += 1
+
+            array_values = []
+            for _ in range(array_len):
+                array_value, offset = inner_decoder(calldata, offset)
+                array_values.append(array_value)
+
+            return array_values, offset
+
+        except (IndexError, InvalidCalldataError) as calldata_err:
+            raise _insufficient_calldata(array_type, calldata_err)  # pylint: disable=raise-missing-from
+        except TypeDecodeError as type_err:
+            raise _type_decode_error(array_type, type_err)  # pylint: disable=raise-missing-from
+
+    return _decode_array
+
+
+def _compile_option_decoder(option_type: StarknetOption, output_format: OutputFormat) -> TypeDecoder:
+    inner_decoder = compile_decoder(option_type.inner_type, output_format)
+
+    def _decode_option(calldata: Sequence[int], offset: int) -> tuple[Any, int]:
+        try:
+            if calldata[offset] == 1:
+                return None, offset + 1
+
+            return inner_decoder(calldata, offset + 1)
+
+        except (IndexError, InvalidCalldataError) as calldata_err:
+            raise _insufficient_calldata(option_type, calldata_err)  # pylint: disable=raise-missing-from
+        except TypeDecodeError as type_err:
+            raise _type_decode_error(option_type, type_err)  # pylint: disable=raise-missing-from
+
+    return _decode_option
+
+
+def _compile_struct_decoder(struct_type: StarknetStruct, output_format: OutputFormat) -> TypeDecoder:
+    member_decoders = [
+        (member.name, compile_decoder(member.type, output_format)) for member in struct_type.members
+    ]
+
+    def _decode_struct(calldata: Sequence[int], offset: int) -> tuple[Any, int]:
+        try:
+            struct_values = {}
+            for member_name, member_decoder in member_decoders:
+                struct_values[member_name], offset = member_decoder(calldata, offset)
+
+            return struct_values, offset
+
+        except InvalidCalldataError as calldata_err:
+            raise _insufficient_calldata(struct_type, calldata_err)  # pylint: disable=raise-missing-from
+        except TypeDecodeError as type_err:
+            raise _type_decode_error(struct_type, type_err)  # pylint: disable=raise-missing-from
+
+    return _decode_struct
+
+
+def _compile_enum_decoder(enum_type: StarknetEnum, output_format: OutputFormat) -> TypeDecoder:
+    variant_decoders = [
+        (variant_name, compile_decoder(variant_type, output_format)) for variant_name, variant_type in enum_type.variants
+    ]
+
+    def _decode_enum(calldata: Sequence[int], offset: int) -> tuple[Any, int]:
+        try:
+            variant_name, variant_decoder = variant_decoders[calldata[offset]]
+            variant_value, offset = variant_decoder(calldata, offset + 1)
+            return {variant_name: variant_value}, offset
+
+        except (IndexError, InvalidCalldataError) as calldata_err:
+            raise _insufficient_calldata(enum_type, calldata_err)  # pylint: disable=raise-missing-from
+        except TypeDecodeError as type_err:
+            raise _type_decode_error(enum_type, type_err)  # pylint: disable=raise-missing-from
+
+    return _decode_enum
+
+
+def _compile_tuple_decoder(tuple_type: StarknetTuple, output_format: OutputFormat) -> TypeDecoder:
+    member_decoders = [compile_decoder(tuple_member, output_format) for tuple_member in tuple_type.members]
+
+    def _decode_tuple(calldata: Sequence[int], offset: int) -> tuple[Any, int]:
+        try:
+            tuple_values = []
+            for member_decoder in member_decoders:
+                tuple_value, offset = member_decoder(calldata, offset)
+                tuple_values.append(tuple_value)
+
+            return tuple(tuple_values), offset
+
+        except InvalidCalldataError as calldata_err:
+            raise _insufficient_calldata(tuple_type, calldata_err)  # pylint: disable=raise-missing-from
+        except TypeDecodeError as type_err:
+            raise _type_decode_error(tuple_type, type_err)  # pylint: disable=raise-missing-from
+
+    return _decode_tuple
+
+
+def _compile_non_zero_decoder(non_zero_type: StarknetNonZero, output_format: OutputFormat) -> TypeDecoder:
+    inner_decoder = compile_decoder(non_zero_type.inner_type, output_format)
+
+    def _decode_non_zero(calldata: Sequence[int], offset: int) -> tuple[Any, int]:
+        try:
+            decoded, offset = inner_decoder(calldata, offset)
+
+            if decoded == 0:
+                raise ValueError("Zero Value Encoded in StarknetNonZero")
+            return decoded, offset
+
+        except InvalidCalldataError as calldata_err:
+            raise _insufficient_calldata(non_zero_type, calldata_err)  # pylint: disable=raise-missing-from
+        except TypeDecodeError as type_err:
+            raise _type_decode_error(non_zero_type, type_err)  # pylint: disable=raise-missing-from
+
+    return _decode_non_zero
+
+
+def compile_decoder(  # pylint: disable=too-many-branches
+    starknet_type: StarknetType, output_format: OutputFormat = OutputFormat.HEX
+) -> TypeDecoder:
+    """
+    Compiles a StarknetType tree into a specialized decoder callable.  The type dispatch is resolved once at
+    compile time, so decoding a value does not re-check the type of each node.  Compiled decoders are cached on
+    the type object, and are shared by every function, event, and dispatcher that references the type.
+
+    A separate decoder is compiled for each OutputFormat, so the output representation of felts and addresses
+    is also resolved at compile time.
+
+    .. doctest::
+        >>> from nethermind.starknet_abi.decode import compile_decoder, OutputFormat, StarknetArray, StarknetCoreType
+        >>> u8_array_decoder = compile_decoder(StarknetArray(StarknetCoreType.U8))
+        >>> u8_array_decoder([3, 123, 244, 210, 0], 0)
+        ([123, 244, 210], 4)
+        >>> compile_decoder(StarknetArray(StarknetCoreType.Felt), OutputFormat.INT)([2, 16, 255], 0)
+        ([16, 255], 3)
+
+    :param starknet_type:  StarknetType to compile a decoder for
+    :param output_format:  Representation of decoded felts and addresses.  Defaults to hex strings
+    :return: TypeDecoder, returning the decoded value and the end offset
+    """
+    # pylint: disable=protected-access
+    if isinstance(starknet_type, StarknetCoreType):
+        return _CORE_DECODERS[output_format][starknet_type]
+
+    if output_format is OutputFormat.HEX:
+        if starknet_type._decoder is not None:
+            return starknet_type._decoder
+    elif starknet_type._format_decoders is not None and output_format in starknet_type._format_decoders:
+        return starknet_type._format_decoders[output_format]
+
+    decoder: TypeDecoder
+    if isinstance(starknet_type, StarknetArray):
+        decoder = _compile_array_decoder(starknet_type, output_format)
+    elif isinstance(starknet_type, StarknetStruct):
+        decoder = _compile_struct_decoder(starknet_type, output_format)
+    elif isinstance(starknet_type, StarknetEnum):
+        decoder = _compile_enum_decoder(starknet_type, output_format)
+    elif isinstance(starknet_type, StarknetOption):
+        decoder = _compile_option_decoder(starknet_type, output_format)
+    elif isinstance(starknet_type, StarknetTuple):
+        decoder = _compile_tuple_decoder(starknet_type, output_format)
+    elif isinstance(starknet_type, StarknetNonZero):
+        decoder = _compile_non_zero_decoder(starknet_type, output_format)
+    else:
+        raise TypeError(f"Cannot Decode Calldata for Type: {starknet_type}")
+
+    if output_format is OutputFormat.HEX:
+        starknet_type._decoder = decoder
+    else:
+        if starknet_type._format_decoders is None:
+            starknet_type._format_decoders = {}
+        starknet_type._format_decoders[output_format] = decoder
+    return decoder
+
+
+TypeSkipper = Callable[[Sequence[int], int], int]
+"""
+Compiled skipper for a StarknetType.  Takes the calldata sequence and the offset of the first felt of an encoded
+value, and returns the end offset of the value without decoding it
+"""
+
+def _compile_skipper(starknet_type: StarknetType) -> TypeSkipper:  # pylint: disable=too-many-return-statements
+    width = type_layout(starknet_type).width
+    if width is not None:  # Fixed width types are skipped with a constant jump
+        return lambda calldata, offset: offset + width
+
+    if isinstance(starknet_type, StarknetArray):
+        inner_width = type_layout(starknet_type.inner_type).width
+        inner_skipper = compile_skipper(starknet_type.inner_type)
+
+        def _skip_array(calldata: Sequence[int], offset: int) -> int:
+            try:
+                if inner_width is not None:
+                    return offset + 1 + calldata[offset] * inner_width
+
+                end_offset = offset + 1
+                for _ in range(calldata[offset]):
+                    end_offset = inner_skipper(calldata, end_offset)
+                return end_offset
+            except (IndexError, InvalidCalldataError) as calldata_err:
+                raise _insufficient_calldata(starknet_type, calldata_err)  # pylint: disable=raise-missing-from
+
+        return _skip_array
+
+    if isinstance(starknet_type, StarknetOption):
+        option_skipper = compile_skipper(starknet_type.inner_type)
+
+        def _skip_option(calldata: Sequence[int], offset: int) -> int:
+            try:
+                return offset + 1 if calldata[offset] == 1 else option_skipper(calldata, offset + 1)
+            except (IndexError, InvalidCalldataError) as calldata_err:
+                raise _insufficient_calldata(starknet_type, calldata_err)  # pylint: disable=raise-missing-from
+
+        return _skip_option
+
+    if isinstance(starknet_type, StarknetEnum):
+        variant_skippers = [compile_skipper(variant_type) for _, variant_type in starknet_type.variants]
+
+        def _skip_enum(calldata: Sequence[int], offset: int) -> int:
+            try:
+                return variant_skippers[calldata[offset]](calldata, offset + 1)
+            except (IndexError, InvalidCalldataError) as calldata_err:
+                raise _insufficient_calldata(starknet_type, calldata_err)  # pylint: disable=raise-missing-from
+
+        return _skip_enum
+
+    if isinstance(starknet_type, StarknetNonZero):
+        return compile_skipper(starknet_type.inner_type)
+
+    if isinstance(starknet_type, (StarknetStruct, StarknetTuple)):
+        member_skippers = [
+            compile_skipper(member.type if isinstance(member, AbiParameter) else member)
+            for member in starknet_type.members
+        ]
+
+        def _skip_members(calldata: Sequence[int], offset: int) -> int:
+            for member_skipper in member_skippers:
+                offset = member_skipper(calldata, offset)
+            return offset
+
+        return _skip_members
+
+    raise TypeError(f"Cannot Skip Calldata for Type: {starknet_type}")
+
+
+_CORE_SKIPPERS: dict[StarknetCoreType, TypeSkipper] = {
+    core_type: _compile_skipper(core_type) for core_type in StarknetCoreType
+}
+
+
+def compile_skipper(starknet_type: StarknetType) -> TypeSkipper:
+    """
+    Compiles a StarknetType into a skipper, which returns the end offset of an encoded value without decoding it.
+    Fixed width types are skipped with a constant jump, and arrays of fixed width types with a single multiply.
+    Skipped felts are not validated, so callers must check the end offset against the calldata length.
+    Compiled skippers are cached on the type object.
+
+    .. doctest::
+        >>> from nethermind.starknet_abi.decode import compile_skipper, StarknetArray, StarknetCoreType
+        >>> compile_skipper(StarknetArray(StarknetCoreType.U256))([3, 1, 0, 2, 0, 3, 0, 77], 0)
+        7
+
+    :param starknet_type:  StarknetType to compile a skipper for
+    :return: TypeSkipper, returning the end offset
+    """
+    # pylint: disable=protected-access
+    if isinstance(starknet_type, StarknetCoreType):
+        return _CORE_SKIPPERS[starknet_type]
+
+    if starknet_type._skipper is None:
+        starknet_type._skipper = _compile_skipper(starknet_type)
+    return starknet_type._skipper
+
+
+def decode_type_at(
+    starknet_type: StarknetType,
+    calldata: Sequence[int],
+    offset: int,
+    output_format: OutputFormat = OutputFormat.HEX,
+) -> tuple[Any, int]:
+    """
+    Decodes a single StarknetType starting at the offset cursor.  Returns the decoded value and the offset of the
+    first felt after the decoded value.
+
+    .. doctest::
+        >>> from nethermind.starknet_abi.decode import decode_type_at, StarknetCoreType, StarknetOption
+        >>> decode_type_at(StarknetOption(StarknetCoreType.U128), [1, 0, 100], 1)
+        (100, 3)
+
+    :param starknet_type:  StarknetType to decode
+    :param calldata:  Immutable sequence of calldata
+    :param offset:  Index of the first felt of the encoded value
+    :param output_format:  Representation of decoded felts and addresses.  Defaults to hex strings
+    :return: tuple of decoded value and the end offset
+    """
+    return compile_decoder(starknet_type, output_format)(calldata, offset)
+
+
+def decode_from_types_at(
+    types: Sequence[StarknetType],
+    calldata: Sequence[int],
+    offset: int = 0,
+    output_format: OutputFormat = OutputFormat.HEX,
+) -> tuple[list[Any], int]:
+    """
+    Decodes a sequence of StarknetTypes by walking the calldata with an offset cursor.  The calldata is never
+    modified or copied, so decoding scales linearly with the calldata length.
+
+    .. doctest::
+        >>> from nethermind.starknet_abi.decode import decode_from_types_at, StarknetCoreType, StarknetArray
+        >>> decode_from_types_at([StarknetArray(StarknetCoreType.U8), StarknetCoreType.Bool], (3, 123, 244, 210, 0))
+        ([[123, 244, 210], False], 5)
+        >>> decode_from_types_at([StarknetCoreType.U32], [7, 8, 9], offset=1)
+        ([8], 2)
+
+    :param types:  Sequence of StarknetType to decode
+    :param calldata:  Immutable sequence of calldata
+    :param offset:  Index in calldata to begin decoding from
+    :param output_format:  Representation of decoded felts and addresses.  Defaults to hex strings
+    :return: tuple of decoded values and the end offset
+    """
+
+    output_data: list[Any] = []
+
+    for starknet_type in types:
+        decoded, offset = compile_decoder(starknet_type, output_format)(calldata, offset)
+        output_data.append(decoded)
+
+    return output_data, offset
+
+
+def decode_from_params_at(
+    params: Sequence[AbiParameter],
+    calldata: Sequence[int],
+    offset: int = 0,
+    output_format: OutputFormat = OutputFormat.HEX,
+) -> tuple[dict[str, Any], int]:
+    """
+    Decodes calldata using AbiParameters by walking the calldata with an offset cursor.  The calldata is
+    never modified or copied.
+
+    .. doctest::
+        >>> from nethermind.starknet_abi.decode import AbiParameter, decode_from_params_at, StarknetCoreType
+        >>> decode_from_params_at(
+        ...     [AbiParameter("a", StarknetCoreType.U32), AbiParameter("b", StarknetCoreType.U32)],
+        ...     (123456, 654321)
+        ... )
+        ({'a': 123456, 'b': 654321}, 2)
+
+    :param params: Sequence of AbiParameters
+    :param calldata:  Immutable sequence of calldata
+    :param offset:  Index in calldata to begin decoding from
+    :param output_format:  Representation of decoded felts and addresses.  Defaults to hex strings
+    :return: tuple of dict mapping parameter names to decoded values, and the end offset
+    """
+
+    output_data: dict[str, Any] = {}
+
+    for param in params:
+        output_data[param.name], offset = compile_decoder(param.type, output_format)(calldata, offset)
+
+    return output_data, offset
+
+
+FieldSelection = Mapping[str, Collection[Any]]
+"""
+Selection of the parameters to decode, used for projection pushdown.  Maps each section to the names of the
+parameters decoded from it: ``calldata`` for function inputs, ``keys`` and ``data`` for event parameters, and
+``result`` for the indices of function outputs.  Parameters that are not selected, and sections missing from
+the selection, are skipped without being decoded, like ``{"calldata": ["amount"], "keys": ["from", "to"]}``
+"""
+
+
+def decode_selected_params_at(
+    params: Sequence[AbiParameter],
+    selected: Collection[str],
+    calldata: Sequence[int],
+    offset: int = 0,
+    output_format: OutputFormat = OutputFormat.HEX,
+) -> tuple[dict[str, Any], int]:
+    """
+    Decodes the selected parameters, skipping the others with their compiled skippers.  Skipped fixed width
+    parameters are a constant jump, and skipped arrays of fixed width types a single multiply, so unused array
+    parameters cost almost nothing.  Skipped felts are not range checked.
+
+    .. doctest::
+        >>> from nethermind.starknet_abi.decode import AbiParameter, decode_selected_params_at, StarknetCoreType
+        >>> from nethermind.starknet_abi.abi_types import StarknetArray
+        >>> decode_selected_params_at(
+        ...     [AbiParameter("data", StarknetArray(StarknetCoreType.U8)), AbiParameter("b", StarknetCoreType.U32)],
+        ...     ["b"],
+        ...     (3, 1, 2, 3, 654321),
+        ... )
+        ({'b': 654321}, 5)
+
+    :param params: Sequence of AbiParameters
+    :param selected: names of the parameters to decode
+    :param calldata:  Immutable sequence of calldata
+    :param offset:  Index in calldata to begin decoding from
+    :param output_format:  Representation of decoded felts and addresses.  Defaults to hex strings
+    :return: tuple of dict mapping selected parameter names to decoded values, and the end offset
+    """
+
+    output_data: dict[str, Any] = {}
+
+    for param in params:
+        if param.name in selected:
+            output_data[param.name], offset = compile_decoder(param.type, output_format)(calldata, offset)
+        else:
+            offset = compile_skipper(param.type)(calldata, offset)
+
+    if offset > len(calldata):
+        raise InvalidCalldataError(f"Insufficient Calldata to decode {[param.name for param in params]}")
+
+    return output_data, offset
+
+
+def decode_from_types(
     types: Sequence[StarknetType],
     calldata: list[int],
+    output_format: OutputFormat = OutputFormat.HEX,
 ) -> list[Any]:
     """
     Decodes calldata array using a list of StarknetTypes.
 
     .. warning::
 
-        The calldata array passed to decode_from_types is mutated during decoding.  Calldata is recursively
-        popped off the stack as decoding occurs
+        The calldata array passed to decode_from_types is mutated during decoding.  After decoding, the decoded
+        felts are removed from the top of the calldata array.  Use :func:`decode_from_types_at` to decode without
+        mutating the calldata
 
     .. doctest::
-        >>> from nethermind.starknet_abi.decode import decode_from_types, StarknetCoreType, StarknetArray
+        >>> from nethermind.starknet_abi.decode import decode_from_types, OutputFormat, StarknetCoreType, StarknetArray
         >>> decode_from_types([StarknetArray(StarknetCoreType.U8), StarknetCoreType.Bool], [3, 123, 244, 210, 0])
         [[123, 244, 210], False]
         >>> decode_from_types(
@@ -161,101 +860,36 @@ def decode_from_types(  # pylint: disable=too-many-branches, too-many-locals
         ...     [0x49d36570d4e46f48e99674bd3fcc84644ddd6b96f7c741b1562b82f9e004dc7, 250_000, 0, 1]
         ... )
         ['0x049d36570d4e46f48e99674bd3fcc84644ddd6b96f7c741b1562b82f9e004dc7', 250000, True]
+        >>> decode_from_types(
+        ...     [StarknetCoreType.ContractAddress, StarknetCoreType.U256],
+        ...     [0x49d36570d4e46f48e99674bd3fcc84644ddd6b96f7c741b1562b82f9e004dc7, 250_000, 0],
+        ...     OutputFormat.INT,
+        ... )
+        [2087021424722619777119509474943472645767659996348769578120564519014510906823, 250000]
 
 
     :param types:  Sequence of StarknetType to decode
     :param calldata: Mutable Array of Calldata
+    :param output_format:  Representation of decoded felts and addresses.  Defaults to hex strings
     """
 
-    output_data: list[Any] = []
-
-    for starknet_type in types:
-        # Starknet Core Type decoding does not require the recursive try/except handler
-        if isinstance(starknet_type, StarknetCoreType):
-            output_data.append(decode_core_type(starknet_type, calldata))
-            continue
-
-        try:
-            if isinstance(starknet_type, StarknetArray):
-                array_len = calldata.pop(0)
-                output_data.append(
-                    [
-                        decode_from_types([starknet_type.inner_type], calldata)[0]
-                        for _ in range(array_len)
-                    ]
-                )
-                continue
-
-            if isinstance(starknet_type, StarknetOption):
-                if calldata.pop(0) == 1:
-                    output_data.append(None)
-                    continue
-
-                output_data.append(
-                    decode_from_types([starknet_type.inner_type], calldata)[0]
-                )
-                continue
-
-            if isinstance(starknet_type, StarknetStruct):
-                output_data.append(decode_from_params(starknet_type.members, calldata))
-                continue
-
-            if isinstance(starknet_type, StarknetEnum):
-                enum_index = calldata.pop(0)
-                variant_name, variant_type = starknet_type.variants[enum_index]
-                output_data.append(
-                    {variant_name: decode_from_types([variant_type], calldata)[0]}
-                )
-                continue
-
-            if isinstance(starknet_type, StarknetTuple):
-                output_data.append(
-                    tuple(
-                        decode_from_types([tuple_member], calldata)[0]
-                        for tuple_member in starknet_type.members
-                    )
-                )
-                continue
-
-            if isinstance(starknet_type, StarknetNonZero):
-                decoded = decode_from_types([starknet_type.inner_type], calldata)[0]
-
-                if decoded == 0:
-                    raise ValueError("Zero Value Encoded in StarknetNonZero")
-                output_data.append(decoded)
-                continue
-
-            raise TypeError(f"Cannot Decode Calldata for Type: {starknet_type}")
-
-        except IndexError:
-            # Raised When calldata.pop() fails for a StarknetOption, a StarknetArray, or a StarknetEnum
-            raise InvalidCalldataError(  # pylint: disable=raise-missing-from
-                f"Insufficient Calldata to decode {starknet_type}"
-            )
-
-        except InvalidCalldataError as calldata_err:
-            # Recursive Decode calls
-            raise InvalidCalldataError(
-                f"Insufficient Calldata to decode {starknet_type}"
-            ) from calldata_err
-
-        except TypeDecodeError as type_err:
-            raise TypeDecodeError(f"Could not decode {starknet_type}") from type_err
-
-    return output_data
+    decoded_values, end_offset = decode_from_types_at(types, calldata, output_format=output_format)
+    del calldata[:end_offset]
+    return decoded_values
 
 
 def decode_from_params(
     params: Sequence[AbiParameter],
     calldata: list[int],
+    output_format: OutputFormat = OutputFormat.HEX,
 ) -> dict[str, Any]:
     """
     Decodes Calldata using AbiParameters, which have names and types
 
     .. warning::
 
-        Calldata list is consumed during decoding, as calldata is recursively popped off the top of the calldata
-        throughout the decoding process
+        Calldata list is consumed during decoding.  After decoding, the decoded felts are removed from the top of
+        the calldata array.  Use :func:`decode_from_params_at` to decode without mutating the calldata
 
     .. doctest::
 
@@ -268,11 +902,10 @@ def decode_from_params(
 
     :param params: Sequence of AbiParameters
     :param calldata: Mutable calldata Array
+    :param output_format:  Representation of decoded felts and addresses.  Defaults to hex strings
     :return: Dict mapping Parameter names to decoded types
     """
 
-    parameter_names = [param.name for param in params]
-    parameter_types = [param.type for param in params]
-
-    decoded_values = decode_from_types(parameter_types, calldata)
-    return dict(zip(parameter_names, decoded_values, strict=True))
+    decoded_params, end_offset = decode_from_params_at(params, calldata, output_format=output_format)
+    del calldata[:end_offset]
+    return decoded_params
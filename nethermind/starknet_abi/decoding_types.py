@@ -1,11 +1,20 @@
-from dataclasses import dataclass
-from typing import Any, Sequence
-
-from nethermind.starknet_abi.abi_types import AbiParameter, StarknetType
-from nethermind.starknet_abi.decode import decode_from_params, decode_from_types
-from nethermind.starknet_abi.encode import encode_from_params
+from dataclasses import dataclass, field
+from typing import Any, Callable, Sequence
+
+from nethermind.starknet_abi.abi_types import AbiParameter, StarknetType, _CachedType
+from nethermind.starknet_abi.decode import (
+    FieldSelection,
+    OutputFormat,
+    compile_skipper,
+    decode_from_params_at,
+    decode_from_types_at,
+    decode_selected_params_at,
+    decode_type_at,
+)
+from nethermind.starknet_abi.encode import compile_params_encoder
 from nethermind.starknet_abi.exceptions import InvalidCalldataError, TypeDecodeError
-from nethermind.starknet_abi.utils import starknet_keccak
+from nethermind.starknet_abi.layout import params_layout
+from nethermind.starknet_abi.utils import id_hash, starknet_keccak
 
 
 @dataclass(slots=True)
@@ -34,7 +43,21 @@ class DecodedEvent:
 
 
 @dataclass(slots=True)
-class AbiFunction:
+class DecodedUserOperation:
+    """
+    Dataclass representing a decoded function call, and the decoded inner calls of account ``__execute__``
+    calls.  Inner calls are in the order of the calls in the calldata, and are themselves DecodedUserOperations,
+    None if the class of the called contract is unknown, or the Exception raised decoding the inner call
+    """
+
+    function: DecodedFunction
+
+    # Inner calls of account __execute__ calls, or None if the function is not an account execute function
+    calls: list["DecodedUserOperation | Exception | None"] | None = None
+
+
+@dataclass(slots=True)
+class AbiFunction(_CachedType):
     """
     Dataclass Representing an ABI Function.  Includes a function name, the function signature, and the input
     and output parameters.
@@ -47,6 +70,9 @@ class AbiFunction:
     inputs: Sequence[AbiParameter]
     outputs: Sequence[StarknetType]
 
+    _type_id: bytes | None = field(default=None, init=False, repr=False, compare=False)
+    _encoder: Callable | None = field(default=None, init=False, repr=False, compare=False)
+
     def __init__(
         self,
         name: str,
@@ -59,6 +85,8 @@ class AbiFunction:
         self.inputs = inputs
         self.outputs = outputs
         self.signature = starknet_keccak(self.name.encode())
+        self._type_id = None
+        self._encoder = None
 
     def id_str(self):
         """
@@ -83,10 +111,54 @@ class AbiFunction:
         outputs_str = ",".join([output.id_str() for output in self.outputs])
         return f"Function({inputs_str}) -> ({outputs_str})"
 
+    def type_id(self) -> bytes:
+        """
+        Returns the 8 byte hash of the function id_str().  Functions with identical types & parameter names share a
+        type_id, which is used by the DecodingDispatcher to share decoders between functions.  The hash is
+        computed once, and cached on the function.
+
+        .. doctest::
+
+            >>> from nethermind.starknet_abi.decoding_types import AbiFunction
+            >>> from nethermind.starknet_abi.abi_types import StarknetCoreType
+            >>> add_function = AbiFunction(
+            ...    name="add",
+            ...    inputs=[AbiParameter("a", StarknetCoreType.U32), AbiParameter("b", StarknetCoreType.U32)],
+            ...    outputs=[StarknetCoreType.U64]
+            ... )
+            >>> add_function.type_id().hex()
+            'f5f345f0f915bda4'
+
+        """
+        if self._type_id is None:
+            self._type_id = id_hash(self.id_str())
+        return self._type_id
+
+    def min_calldata_len(self) -> int:  # pylint: disable=line-too-long
+        """
+        Returns the minimum calldata length of the function inputs.  Calldata shorter than the minimum length
+        cannot be decoded.
+
+        .. doctest::
+
+            >>> from nethermind.starknet_abi.decoding_types import AbiFunction
+            >>> from nethermind.starknet_abi.abi_types import StarknetArray, StarknetCoreType
+            >>> transfer = AbiFunction(
+            ...    name="transfer",
+            ...    inputs=[AbiParameter("amount", StarknetCoreType.U256), AbiParameter("data", StarknetArray(StarknetCoreType.Felt))],
+            ...    outputs=[]
+            ... )
+            >>> transfer.min_calldata_len()
+            3
+        """
+        return params_layout(self.inputs).min_width
+
     def decode(  # pylint: disable=line-too-long
         self,
-        calldata: list[int],
-        result: list[int] | None = None,
+        calldata: Sequence[int],
+        result: Sequence[int] | None = None,
+        output_format: OutputFormat = OutputFormat.HEX,
+        selection: FieldSelection | None = None,
     ) -> DecodedFunction:
         """
         Decode the calldata and result of a function.
@@ -102,16 +174,34 @@ class AbiFunction:
             ... )
             >>> add_function.decode([123456, 654321], [777777])
             DecodedFunction(abi_name=None, name='add', inputs={'a': 123456, 'b': 654321}, outputs=[777777])
+            >>> add_function.decode([123456, 654321], [777777], selection={"calldata": ["b"]})
+            DecodedFunction(abi_name=None, name='add', inputs={'b': 654321}, outputs=None)
 
         :param calldata:
         :param result:
+        :param output_format: Representation of decoded felts and addresses.  Defaults to hex strings
+        :param selection: Optional FieldSelection of the ``calldata`` inputs and ``result`` output indices to
+            decode.  Other inputs are skipped, and outputs are only decoded if ``result`` is selected
         """
-        _calldata = calldata.copy()
-        decoded_inputs = decode_from_params(self.inputs, _calldata)
+        if selection is None:
+            decoded_inputs, _ = decode_from_params_at(
+                self.inputs, calldata, output_format=output_format
+            )
+        else:
+            decoded_inputs, _ = decode_selected_params_at(
+                self.inputs, selection.get("calldata", ()), calldata, output_format=output_format
+            )
 
-        if result:
-            _result = result.copy()
-            decoded_outputs = decode_from_types(self.outputs, _result)
+        if result and (selection is None or "result" in selection):
+            decoded_outputs, _ = decode_from_types_at(
+                self.outputs, result, output_format=output_format
+            )
+            if selection is not None:
+                decoded_outputs = [
+                    output
+                    for index, output in enumerate(decoded_outputs)
+                    if index in selection["result"]
+                ]
         else:
             decoded_outputs = None
 
@@ -127,7 +217,8 @@ class AbiFunction:
         inputs: dict[str, Any],
     ) -> list[int]:
         """
-        Encode the inputs of a function into calldata.
+        Encode the inputs of a function into calldata.  The parameter encoders are compiled on the first call,
+        and reused by later calls.
 
         .. doctest::
 
@@ -144,8 +235,9 @@ class AbiFunction:
         :param inputs: dict[function-param: value]
         :return: calldata array
         """
-
-        return encode_from_params(self.inputs, inputs)
+        if self._encoder is None:
+            self._encoder = compile_params_encoder(self.inputs)
+        return self._encoder(inputs)
 
 
 @dataclass(slots=True)
@@ -162,6 +254,8 @@ class AbiEvent:
     keys: dict[str, StarknetType]
     data: dict[str, StarknetType]
 
+    _type_id: bytes | None = field(init=False, repr=False, compare=False)
+
     def __init__(
         self,
         name: str,
@@ -176,6 +270,7 @@ class AbiEvent:
         self.keys = keys or {}
         self.abi_name = abi_name
         self.signature = starknet_keccak(self.name.encode())
+        self._type_id = None
 
     def id_str(self):
         """
@@ -206,31 +301,65 @@ class AbiEvent:
 
         return f"Event({','.join(event_params)})"
 
-    def decode(self, data: list[int], keys: list[int]) -> DecodedEvent:
+    def type_id(self) -> bytes:
+        """
+        Returns the 8 byte hash of the event id_str().  Events with identical parameters share a type_id, which is
+        used by the DecodingDispatcher to share decoders between events.  The hash is computed once, and cached on
+        the event.
+        """
+        if self._type_id is None:
+            self._type_id = id_hash(self.id_str())
+        return self._type_id
+
+    def decode(
+        self,
+        data: Sequence[int],
+        keys: Sequence[int],
+        output_format: OutputFormat = OutputFormat.HEX,
+        selection: FieldSelection | None = None,
+    ) -> DecodedEvent:
         """
         Decode the keys and data of an event.
 
         :param data: Data array for decoding
         :param keys: Optional data array of event keys
+        :param output_format: Representation of decoded felts and addresses.  Defaults to hex strings
+        :param selection: Optional FieldSelection of the ``keys`` and ``data`` parameters to decode.  Other
+            parameters are skipped without decoding
         :return: DecodedEvent
         """
 
-        _data = data.copy()
-        _keys = keys[1:].copy()  # Key[0] is the event signature
+        data_offset, keys_offset = 0, 1  # Key[0] is the event signature
 
         decoded_data = {}
+        selected_keys, selected_data = (
+            (None, None)
+            if selection is None
+            else (selection.get("keys", ()), selection.get("data", ()))
+        )
 
         for param in self.parameters:
             if param in self.data:
-                decoded_data.update({param: decode_from_types([self.data[param]], _data)[0]})
+                if selected_data is None or param in selected_data:
+                    decoded_data[param], data_offset = decode_type_at(
+                        self.data[param], data, data_offset, output_format
+                    )
+                else:
+                    data_offset = compile_skipper(self.data[param])(data, data_offset)
             elif param in self.keys:
-                decoded_data.update({param: decode_from_types([self.keys[param]], _keys)[0]})
+                if selected_keys is None or param in selected_keys:
+                    decoded_data[param], keys_offset = decode_type_at(
+                        self.keys[param], keys, keys_offset, output_format
+                    )
+                else:
+                    keys_offset = compile_skipper(self.keys[param])(keys, keys_offset)
             else:
                 raise TypeDecodeError(
                     f"Event Parameter {param} not present in Keys or Data for Event {self.name}"
                 )
 
-        if len(_data) != 0 or len(_keys) != 0:
+        # Keys are only empty if the event selector is omitted, and the event has no key parameters
+        if data_offset != len(data) or keys_offset != max(len(keys), 1):
             raise InvalidCalldataError(
                 f"Calldata Not Completely Consumed decoding Event: {self.id_str()}"
             )
@@ -1,35 +1,267 @@
-import hashlib
-from dataclasses import dataclass
-from typing import Sequence
+# pylint: disable=too-many-lines
+from dataclasses import dataclass, field
+from functools import partial
+from os import PathLike
+from time import perf_counter_ns
+from typing import Any, Callable, Iterator, Sequence
 
-from nethermind.starknet_abi.abi_types import AbiParameter, StarknetArray, StarknetType
+from nethermind.starknet_abi.abi_types import (
+    AbiParameter,
+    StarknetArray,
+    StarknetCoreType,
+    StarknetStruct,
+    StarknetType,
+)
+from nethermind.starknet_abi.columnar import (
+    ColumnarCollector,
+    ColumnarDecodeResult,
+    ColumnBuilder,
+)
 from nethermind.starknet_abi.core import StarknetAbi
-from nethermind.starknet_abi.decode import decode_from_params, decode_from_types
-from nethermind.starknet_abi.decoding_types import DecodedEvent, DecodedFunction
+from nethermind.starknet_abi.decode import (
+    FieldSelection,
+    OutputFormat,
+    compile_skipper,
+    decode_from_params_at,
+    decode_from_types_at,
+    decode_selected_params_at,
+    decode_type_at,
+)
+from nethermind.starknet_abi.decoding_types import (
+    DecodedEvent,
+    DecodedFunction,
+    DecodedUserOperation,
+)
 from nethermind.starknet_abi.exceptions import InvalidCalldataError, TypeDecodeError
+from nethermind.starknet_abi.layout import TypeLayout, params_layout
+from nethermind.starknet_abi.lazy import LazyStruct
+from nethermind.starknet_abi.metrics import DispatcherMetrics
+from nethermind.starknet_abi.resolver import ClassHashResolver
+from nethermind.starknet_abi.selector_index import SelectorCandidate, SelectorIndex
 
+# Errors raised by decoding a single function or event, that are returned in place by the batch decoders
+_BATCH_DECODE_ERRORS = (InvalidCalldataError, TypeDecodeError, ValueError, KeyError)
 
-def _id_hash(id_str: str) -> bytes:
+# Errors of rows written straight into columns, which are decoded again to raise the error of the row decoders
+_COLUMN_WRITE_ERRORS = (*_BATCH_DECODE_ERRORS, IndexError)
+
+# (abi_name, function_name, input parameters, output types, minimum calldata length)
+_ResolvedFunction = tuple[str | None, str, Sequence[AbiParameter], Sequence[StarknetType], int]
+
+# (start, end) offsets of a call or event in the flattened arrays of a batch, decoded without slicing the arrays
+_Span = tuple[int, int]
+
+
+def _function_columns(resolved_function: tuple) -> list[tuple[str, StarknetType]]:
+    _, _, input_types, output_types, _ = resolved_function
+    return [(param.name, param.type) for param in input_types] + [
+        (f"outputs.{index}", output_type) for index, output_type in enumerate(output_types)
+    ]
+
+
+def _event_columns(resolved_event: tuple) -> list[tuple[str, StarknetType]]:
+    _, _, event_params, event_keys, event_data, _ = resolved_event
+    return [
+        (param, event_data[param] if param in event_data else event_keys[param])
+        for param in event_params
+    ]
+
+
+def _write_function_row(  # pylint: disable=too-many-arguments
+    builder: ColumnBuilder,
+    resolved_function: _ResolvedFunction,
+    calldata: Sequence[int],
+    results: Sequence[int],
+    calldata_span: _Span,
+    result_span: _Span,
+) -> bool:
+    """
+    Decodes the inputs and outputs of a call straight into the columns of its group.  Returns False, and discards
+    the written values, if the call does not decode to exactly its calldata and result spans
+    """
+    _, _, input_types, _, min_calldata_len = resolved_function
+    (calldata_offset, calldata_end), (result_offset, result_end) = calldata_span, result_span
+
+    if calldata_end - calldata_offset >= min_calldata_len:
+        writers, input_count = builder.writers, len(input_types)
+        try:
+            for writer in writers[:input_count]:
+                calldata_offset = writer(calldata, calldata_offset)
+            if calldata_offset == calldata_end:
+                for writer in writers[input_count:]:
+                    result_offset = writer(results, result_offset)
+                if result_offset == result_end:
+                    return True
+        except _COLUMN_WRITE_ERRORS:
+            pass
+
+    builder.discard_row()
+    return False
+
+
+def _write_event_row(
+    builder: ColumnBuilder,
+    resolved_event: tuple,
+    data: Sequence[int],
+    keys: Sequence[int],
+    data_span: _Span,
+) -> bool:
+    """
+    Decodes the parameters of an event straight into the columns of its group.  Returns False, and discards the
+    written values, if the event does not decode to exactly its keys and data span
+    """
+    _, _, event_params, event_keys, event_data, keys_offset = resolved_event
+    data_offset, data_end = data_span
+
+    try:
+        for param, writer in zip(event_params, builder.writers):
+            if param in event_data:
+                data_offset = writer(data, data_offset)
+            elif param in event_keys:
+                keys_offset = writer(keys, keys_offset)
+            else:
+                break
+        else:
+            if data_offset == data_end and keys_offset == len(keys):
+                return True
+    except _COLUMN_WRITE_ERRORS:
+        pass
+
+    builder.discard_row()
+    return False
+
+
+def _check_batch_lengths(
+    calldata_offsets: Sequence[int],
+    result_offsets: Sequence[int],
+    function_selectors: Sequence[bytes],
+    class_hashes: Sequence[bytes],
+):
+    if (
+        not len(function_selectors)
+        == len(calldata_offsets) - 1
+        == len(result_offsets) - 1
+        == len(class_hashes)
+    ):
+        raise ValueError(
+            "Batch inputs must have one entry per call, and offsets must have one extra entry"
+        )
+
+
+def _event_selector_id(key: int) -> bytes:
+    """Returns the selector id of an event key, raising a KeyError for keys that do not fit in a felt"""
+    if not 0 <= key < 2**256:
+        raise KeyError(f"Event key {key:#x} is not a valid selector")
+    return key.to_bytes(32, "big")[-8:]
+
+
+ContractClassResolver = Callable[[int], bytes | None]
+"""
+Resolves the class hash of a contract address, and is used to decode the inner calls of account ``__execute__``
+calls.  Returns None if the class of the contract is unknown
+"""
+
+# Inner call of an account __execute__ call: (contract address, selector, span of the calldata)
+_AccountCall = tuple[int, int, _Span]
+
+_CALL_RESULTS_TYPE = StarknetArray(StarknetArray(StarknetCoreType.Felt))
+
+# Maximum nesting of account execute calls decoded by user operations, which bounds the decoding recursion
+_MAX_CALL_DEPTH = 32
+
+
+def _call_member_names(calls_type: StarknetType) -> list[str] | None:
+    if isinstance(calls_type, StarknetArray) and isinstance(calls_type.inner_type, StarknetStruct):
+        return [member.name for member in calls_type.inner_type.members]
+    return None
+
+
+def _split_account_calls(
+    input_types: Sequence[AbiParameter], calldata: Sequence[int], calldata_span: _Span
+) -> list[_AccountCall] | None:
     """
-    Python's builtin hash() function is seeded with a random value at interpreter startup, so it is not
-    consistent across runs. Using a consistent hash allows a DecodingDispatcher to be pickled and
-    cached between uses
+    Splits the calldata of an account ``__execute__`` call into the calldata span of each inner call.  Supports the
+    Cairo 1 ``calls: Array<Call>`` input, and the Cairo 0 ``call_array`` and ``calldata`` inputs.  Returns None if
+    the inputs are not an account execute.  The calldata must already be validated by decoding the inputs
     """
+    input_names = [param.name for param in input_types]
+    inner_calls: list[_AccountCall] = []
+    call_start, call_end = calldata_span
 
-    h = hashlib.md5()
-    h.update(id_str.encode())
-    # MD5 returns a 16byte digest.  We only need the last 8
-    return h.digest()[-8:]
+    if input_names == ["calls"] and _call_member_names(input_types[0].type) == [
+        "to",
+        "selector",
+        "calldata",
+    ]:
+        offset = call_start + 1
+        for _ in range(calldata[call_start]):
+            to_address, selector, data_len = calldata[offset : offset + 3]
+            inner_calls.append((to_address, selector, (offset + 3, offset + 3 + data_len)))
+            offset += 3 + data_len
+        return inner_calls
+
+    if input_names == ["call_array", "calldata"] and _call_member_names(input_types[0].type) == [
+        "to",
+        "selector",
+        "data_offset",
+        "data_len",
+    ]:
+        # Calls index into the shared calldata array, which follows the call array and its length.  Offsets are not
+        # validated by decoding, so spans are clamped to the calldata of the execute call
+        call_count = calldata[call_start]
+        data_start = call_start + 2 + 4 * call_count
+        for index in range(call_count):
+            to_address, selector, data_offset, data_len = calldata[
+                call_start + 1 + 4 * index : call_start + 5 + 4 * index
+            ]
+            data_offset = min(data_start + data_offset, call_end)
+            inner_calls.append(
+                (to_address, selector, (data_offset, min(data_offset + data_len, call_end)))
+            )
+        return inner_calls
+
+    return None
+
+
+def _split_call_results(
+    output_types: Sequence[StarknetType],
+    result: Sequence[int],
+    result_span: _Span | None,
+    call_count: int,
+) -> list[_Span | None]:
+    """
+    Splits the result of a Cairo 1 account ``__execute__`` call, which returns the result of every inner call as
+    an ``Array<Span<felt252>>``.  If the results cannot be split, the result of each inner call is None
+    """
+    if (
+        result_span is not None
+        and result_span[0] < result_span[1]
+        and len(output_types) == 1
+        and output_types[0] == _CALL_RESULTS_TYPE
+        and result[result_span[0]] == call_count
+    ):
+        call_results: list[_Span | None] = []
+        offset = result_span[0] + 1
+        for _ in range(call_count):
+            if offset >= result_span[1]:
+                break
+            call_results.append((offset + 1, offset + 1 + result[offset]))
+            offset += 1 + result[offset]
+
+        if offset == result_span[1] and len(call_results) == call_count:
+            return call_results
+
+    return [None] * call_count
 
 
 @dataclass(slots=True)
 class FunctionDispatchInfo:
     """
     Dispatcher storing a function name, and a reference to the type of the event.  The reference is the result of
-    _id_hash(AbiFunction.id_str())
+    AbiFunction.type_id()
     """
 
-    decoder_reference: bytes  # Result of _id_hash(type.id_str())
+    decoder_reference: bytes  # Result of type.type_id()
     function_name: str
 
 
@@ -37,11 +269,16 @@ class FunctionDispatchInfo:
 class EventDispatchInfo:
     """
     Dispatcher storing an Event Name, and a reference to the type of the event.  The reference is the hash of the
-    event type id_str(), and is stored in a separate mapping to reduce object size
+    event type id_str(), and is stored in a separate mapping to reduce object size.
+
+    Events emitted through nested event enums have several selector keys.  Each selector level is a node with
+    nested_events, mapping the next key to the EventDispatchInfo of the following level.  Nodes that only route
+    to nested events have no decoder_reference or event_name.
     """
 
-    decoder_reference: bytes  # Result of _id_hash(type.id_str())
-    event_name: str
+    decoder_reference: bytes | None  # Result of type.type_id()
+    event_name: str | None
+    nested_events: dict[bytes, "EventDispatchInfo"] | None = None
 
 
 @dataclass(slots=True)
@@ -71,7 +308,7 @@ class DecodingDispatcher:
     class_ids: dict[bytes, ClassDispatcher]
 
     function_types: dict[
-        bytes,  # Result of _id_hash(type.id_str())
+        bytes,  # Result of type.type_id()
         tuple[
             Sequence[AbiParameter],  # Parameters for Function Inputs
             Sequence[StarknetType],  # Types of Function Outputs
@@ -79,7 +316,7 @@ class DecodingDispatcher:
     ]
 
     event_types: dict[
-        bytes,  # Result of _id_hash(type.id_str())
+        bytes,  # Result of type.type_id()
         tuple[
             Sequence[str],
             dict[str, StarknetType],  # Parameters for Event Data
@@ -87,10 +324,22 @@ class DecodingDispatcher:
         ],
     ]
 
+    # Global selector index, built on the first class-agnostic decode
+    _selector_index: SelectorIndex | None = field(init=False, repr=False, compare=False)
+
+    # Runtime metrics, only recorded once enabled with enable_metrics()
+    _metrics: DispatcherMetrics | None = field(init=False, repr=False, compare=False)
+
+    # Layout of the inputs of each function type, computed on first decode
+    _input_layouts: dict[bytes, TypeLayout] = field(init=False, repr=False, compare=False)
+
     def __init__(self):
         self.class_ids = {}
         self.event_types = {}
         self.function_types = {}
+        self._selector_index = None
+        self._metrics = None
+        self._input_layouts = {}
 
     def get_class(self, class_hash: bytes) -> ClassDispatcher | None:
         """
@@ -102,8 +351,8 @@ class DecodingDispatcher:
     def _add_abi_functions(self, abi: StarknetAbi) -> dict[bytes, FunctionDispatchInfo]:
         """
         Parse the list of ABI Functions to a dictionary of FunctionDispatchInfo objects.
-        For each function, in the ABI, compute the id_str(), and hash that id-str.  If the hash of the id-str is not
-        present in DecodingDispatcher.function_types, add it.
+        For each function, in the ABI, compute the type_id(), the hash of the function id_str().  If the type_id is
+        not present in DecodingDispatcher.function_types, add it.
 
         :param abi: Starknet ABI to add
         :return: dict[function_signature[-8:]: FunctionDispatchInfo]
@@ -115,7 +364,7 @@ class DecodingDispatcher:
             abi_functions.append(abi.constructor)
 
         for function in abi_functions:
-            function_type_id = _id_hash(function.id_str())
+            function_type_id = function.type_id()
             if function_type_id not in self.function_types:
                 self.function_types.update({function_type_id: (function.inputs, function.outputs)})
             function_ids.update(
@@ -131,7 +380,7 @@ class DecodingDispatcher:
     def _add_abi_events(self, abi: StarknetAbi) -> dict[bytes, EventDispatchInfo]:
         """
         Parse the list of ABI Events to a dictionary of EventDispatchInfo objects.
-        For each event, in the ABI, compute the id_str(), and hash that id-str.  If the hash of the id-str is not
+        For each event, in the ABI, compute the type_id(), the hash of the event id_str().  If the type_id is not
         present in DecodingDispatcher.event_types, add it.
 
         :param abi: Starknet ABI to add
@@ -139,7 +388,7 @@ class DecodingDispatcher:
         """
         event_ids = {}
         for event in abi.events.values():
-            event_type_id = _id_hash(event.id_str())
+            event_type_id = event.type_id()
             if event_type_id not in self.event_types:
                 self.event_types.update({event_type_id: (event.parameters, event.keys, event.data)})
 
@@ -151,6 +400,25 @@ class DecodingDispatcher:
                     )
                 }
             )
+
+        # Selector chains of nested events are stored as a trie, with one dict lookup per key
+        for selector_chain, event in abi.event_selectors.items():
+            level = event_ids
+            for selector in selector_chain[:-1]:
+                node = level.get(selector[-8:])
+                if node is None:
+                    node = level[selector[-8:]] = EventDispatchInfo(None, None, {})
+                elif node.nested_events is None:
+                    node.nested_events = {}
+                level = node.nested_events  # type: ignore[assignment]
+
+            leaf = level.get(selector_chain[-1][-8:])
+            level[selector_chain[-1][-8:]] = EventDispatchInfo(
+                decoder_reference=event.type_id(),
+                event_name=event.name,
+                nested_events=None if leaf is None else leaf.nested_events,
+            )
+
         return event_ids
 
     def add_abi(self, abi: StarknetAbi):
@@ -160,6 +428,7 @@ class DecodingDispatcher:
         is cached and shared between the identical functions
 
         :param abi:
+        :raises ReadOnlyDispatcherError: if the dispatcher is read-only, like a MappedDecodingDispatcher
         """
 
         assert abi.class_hash, "class_hash must be specified to add ABI to DecodingDispatcher"
@@ -174,63 +443,249 @@ class DecodingDispatcher:
         )
         self.class_ids.update({class_id: class_dispatcher})
 
-    def decode_function(  # pylint: disable=too-many-locals
-        self,
-        calldata: list[int],
-        result: list[int],
-        function_selector: bytes,
-        class_hash: bytes,
-    ) -> DecodedFunction | None:
+        if self._selector_index is not None:
+            self._selector_index.add_class(class_dispatcher)
+
+    def enable_metrics(self, metrics: DispatcherMetrics | None = None) -> DispatcherMetrics:
         """
-        Attempts to decode the input calldata and result array into a DecodedFunction.
+        Enables recording of runtime metrics, returning the DispatcherMetrics.  If metrics are already enabled,
+        the existing DispatcherMetrics is returned.  While metrics are disabled, the decoders only check that
+        metrics are disabled
 
-        If the class-hash is not present in the Dispatcher, None is returned
+        :param metrics: Optional DispatcherMetrics to record into, so metrics can be shared between dispatchers
+        """
+        if metrics is not None:
+            self._metrics = metrics
+        elif self._metrics is None:
+            self._metrics = DispatcherMetrics()
+        return self._metrics
 
-        :param calldata: array of calldata as integers
-        :param result: array of calldata as intergers
-        :param function_selector: function_selector of the trace or transaction
-        :param class_hash:  class hash of the trace or transaction
+    def disable_metrics(self) -> DispatcherMetrics | None:
+        """Disables recording of runtime metrics, returning the metrics recorded while enabled"""
+        metrics, self._metrics = self._metrics, None
+        return metrics
+
+    def selector_index(self) -> SelectorIndex:
+        """
+        Returns the global SelectorIndex of every function and event selector loaded in the dispatcher.  The index
+        is built from the loaded classes on first use, and updated as ABIs are added
         """
+        if self._selector_index is None:
+            self._selector_index = SelectorIndex.from_classes(self.class_ids.values())
+        return self._selector_index
 
-        class_dispatcher = self.get_class(class_hash)
-        if class_dispatcher is None:
-            return None
+    def save(self, path: str | PathLike):
+        """
+        Saves the DecodingDispatcher to a compact binary snapshot.  Shared type trees and strings are stored once,
+        and snapshots load several times faster than pickled dispatchers.
+
+        :param path: file path of the snapshot
+        """
+        # pylint: disable=import-outside-toplevel,cyclic-import
+        from nethermind.starknet_abi.snapshot import save_dispatcher
+
+        save_dispatcher(self, path)
+
+    @classmethod
+    def load(cls, path: str | PathLike) -> "DecodingDispatcher":
+        """
+        Loads a DecodingDispatcher from a snapshot written by :meth:`DecodingDispatcher.save`
+
+        :param path: file path of the snapshot
+        :return: DecodingDispatcher
+        """
+        # pylint: disable=import-outside-toplevel,cyclic-import
+        from nethermind.starknet_abi.snapshot import load_dispatcher
+
+        return load_dispatcher(path)
+
+    def _resolve_function(
+        self,
+        class_dispatcher: ClassDispatcher,
+        function_selector: bytes,
+    ) -> _ResolvedFunction:
+        """
+        Resolves the abi name, function name, input and output types, and the minimum calldata length for a
+        function selector of a class.  Raises a KeyError if the selector is not present in the class
+        """
 
         # Both function_dispatcher and function_type should throw if keys not found
         function_dispatcher = class_dispatcher.function_ids[function_selector[-8:]]
-        input_types, output_types = self.function_types[function_dispatcher.decoder_reference]
-        function_name, abi_name = (
-            function_dispatcher.function_name,
+        decoder_reference = function_dispatcher.decoder_reference
+        input_types, output_types = self.function_types[decoder_reference]
+
+        input_layout = self._input_layouts.get(decoder_reference)
+        if input_layout is None:
+            input_layout = self._input_layout(decoder_reference)
+
+        return (
             class_dispatcher.abi_name,
+            function_dispatcher.function_name,
+            input_types,
+            output_types,
+            input_layout.min_width,
         )
 
-        # Copy Arrays that can be consumed by decoder
-        _calldata = calldata.copy()
-        decoded_inputs = decode_from_params(input_types, _calldata)
+    def _input_layout(self, decoder_reference: bytes) -> TypeLayout:
+        """
+        Returns the layout of the inputs of a function type.  Layouts are computed once per function type, as
+        computing the layout walks every input type
+        """
+        input_layout = self._input_layouts.get(decoder_reference)
+        if input_layout is None:
+            input_layout = params_layout(self.function_types[decoder_reference][0])
+            self._input_layouts[decoder_reference] = input_layout
+        return input_layout
+
+    @staticmethod
+    def _decode_function_values(  # pylint: disable=too-many-arguments
+        resolved_function: _ResolvedFunction,
+        calldata: Sequence[int],
+        result: Sequence[int],
+        output_format: OutputFormat = OutputFormat.HEX,
+        selection: FieldSelection | None = None,
+        calldata_span: _Span | None = None,
+        result_span: _Span | None = None,
+    ) -> tuple[dict[str, Any], list[Any] | None]:
+        """
+        Decodes the inputs of a resolved function, and the list of function outputs.  If a selection is passed,
+        only the selected inputs and outputs are decoded, and the outputs are None unless ``result`` is selected.
+        Batches pass the span of the call in the flattened calldata and results, which are decoded in place
+        """
+        if calldata_span is None or result_span is None:
+            return DecodingDispatcher._decode_function_values_at(
+                resolved_function,
+                calldata,
+                result,
+                output_format,
+                selection,
+                (0, len(calldata)),
+                (0, len(result)),
+            )
+
+        try:
+            return DecodingDispatcher._decode_function_values_at(
+                resolved_function,
+                calldata,
+                result,
+                output_format,
+                selection,
+                calldata_span,
+                result_span,
+            )
+        except _BATCH_DECODE_ERRORS:
+            # Calls decoded in place can read past their span into the next call.  Failed calls are decoded again
+            # from slices, so batches return the same errors as decode_function
+            (calldata_start, calldata_end), (result_start, result_end) = calldata_span, result_span
+            return DecodingDispatcher._decode_function_values_at(
+                resolved_function,
+                calldata[calldata_start:calldata_end],
+                result[result_start:result_end],
+                output_format,
+                selection,
+                (0, calldata_end - calldata_start),
+                (0, result_end - result_start),
+            )
 
-        if len(_calldata) > 0:
+    @staticmethod
+    def _decode_function_values_at(  # pylint: disable=too-many-arguments,too-many-locals
+        resolved_function: _ResolvedFunction,
+        calldata: Sequence[int],
+        result: Sequence[int],
+        output_format: OutputFormat,
+        selection: FieldSelection | None,
+        calldata_span: _Span,
+        result_span: _Span,
+    ) -> tuple[dict[str, Any], list[Any] | None]:
+        _, _, input_types, output_types, min_calldata_len = resolved_function
+        calldata_start, calldata_end = calldata_span
+
+        # Reject truncated calldata before decoding
+        if calldata_end - calldata_start < min_calldata_len:
             raise InvalidCalldataError(
-                f"Calldata Remaining after decoding function input {calldata} from {input_types}"
+                f"Calldata of length {calldata_end - calldata_start} is shorter than the minimum length "
+                f"{min_calldata_len} of function inputs {input_types}"
             )
 
-        _result = result.copy()
-        decoded_outputs = decode_from_types(output_types, _result)
+        if selection is None:
+            decoded_inputs, calldata_offset = decode_from_params_at(
+                input_types, calldata, calldata_start, output_format
+            )
+        else:
+            decoded_inputs, calldata_offset = decode_selected_params_at(
+                input_types, selection.get("calldata", ()), calldata, calldata_start, output_format
+            )
+
+        if calldata_offset != calldata_end:
+            raise InvalidCalldataError(
+                f"Calldata Remaining after decoding function input {calldata[calldata_start:calldata_end]} "
+                f"from {input_types}"
+            )
+
+        if selection is not None and "result" not in selection:
+            return decoded_inputs, None
+
+        result_start, result_end = result_span
+        decoded_outputs, result_offset = decode_from_types_at(
+            output_types, result, result_start, output_format
+        )
 
         # Some early results of single type do not have a length prefix, try legacy before failing
-        if len(_result) > 0 and isinstance(output_types[0], StarknetArray):
+        if result_offset < result_end and isinstance(output_types[0], StarknetArray):
 
-            _retry, decoded_outputs = result.copy(), [[]]
-            while len(_retry):
+            result_offset, decoded_outputs = result_start, [[]]
+            while result_offset < result_end:
                 try:
-                    decoded_outputs[0].append(
-                        decode_from_types([output_types[0].inner_type], _retry)[0]
+                    legacy_output, result_offset = decode_type_at(
+                        output_types[0].inner_type, result, result_offset, output_format
                     )
+                    decoded_outputs[0].append(legacy_output)
                 except TypeDecodeError:
                     raise InvalidCalldataError(  # pylint: disable=raise-missing-from
-                        f"Calldata Remaining after decoding function result {result} from {output_types}"
+                        f"Calldata Remaining after decoding function result {result[result_start:result_end]} "
+                        f"from {output_types}"
                     )
 
-        if len(decoded_outputs) == 1 and isinstance(output_types[0], StarknetArray):
+        if result_offset > result_end:
+            raise InvalidCalldataError(
+                f"Insufficient Calldata to decode function outputs {output_types}"
+            )
+
+        if selection is not None:
+            decoded_outputs = [
+                output
+                for index, output in enumerate(decoded_outputs)
+                if index in selection["result"]
+            ]
+
+        return decoded_inputs, decoded_outputs
+
+    @staticmethod
+    def _decode_resolved_function(  # pylint: disable=too-many-arguments
+        resolved_function: _ResolvedFunction,
+        calldata: Sequence[int],
+        result: Sequence[int],
+        output_format: OutputFormat = OutputFormat.HEX,
+        selection: FieldSelection | None = None,
+        calldata_span: _Span | None = None,
+        result_span: _Span | None = None,
+    ) -> DecodedFunction:
+        abi_name, function_name, _, output_types, _ = resolved_function
+        decoded_inputs, decoded_outputs = DecodingDispatcher._decode_function_values(
+            resolved_function,
+            calldata,
+            result,
+            output_format,
+            selection,
+            calldata_span,
+            result_span,
+        )
+
+        if (
+            decoded_outputs is not None
+            and len(decoded_outputs) == 1
+            and isinstance(output_types[0], StarknetArray)
+        ):
             decoded_outputs = decoded_outputs[0]
 
         return DecodedFunction(
@@ -240,58 +695,1218 @@ class DecodingDispatcher:
             outputs=decoded_outputs,
         )
 
-    def decode_event(
+    def decode_function(
         self,
-        data: list[int],
-        keys: list[int],
+        calldata: Sequence[int],
+        result: Sequence[int],
+        function_selector: bytes,
         class_hash: bytes,
-    ) -> DecodedEvent | None:
+        output_format: OutputFormat = OutputFormat.HEX,
+        selection: FieldSelection | None = None,
+    ) -> DecodedFunction | None:
         """
-        Decodes an emitted event.  If the ClassHash is not present in the Dispatcher, returns None
+        Attempts to decode the input calldata and result array into a DecodedFunction.
 
-        The class hash, and keys[0] are used to select the dispatcher entry for the specific event
+        If the class-hash is not present in the Dispatcher, None is returned
 
-        :param data:
-        :param keys:
-        :param class_hash:
+        :param calldata: array of calldata as integers
+        :param result: array of calldata as intergers
+        :param function_selector: function_selector of the trace or transaction
+        :param class_hash:  class hash of the trace or transaction
+        :param output_format:  Representation of decoded felts and addresses.  Defaults to hex strings
+        :param selection:  Optional FieldSelection of the ``calldata`` inputs and ``result`` output indices to
+            decode.  Other inputs are skipped without decoding, and outputs are only decoded if ``result`` is
+            selected
         """
+
+        if self._metrics is not None:
+            return self._decode_function_measured(
+                self._metrics,
+                calldata,
+                result,
+                function_selector,
+                class_hash,
+                output_format,
+                selection,
+            )
+
         class_dispatcher = self.get_class(class_hash)
         if class_dispatcher is None:
             return None
 
-        if len(keys) == 0:
-            raise InvalidCalldataError("Events require at least 1 key parameter as the selector")
+        return self._decode_resolved_function(
+            self._resolve_function(class_dispatcher, function_selector),
+            calldata,
+            result,
+            output_format,
+            selection,
+        )
 
-        event_selector = keys[0].to_bytes(length=32, byteorder="big")
+    def _decode_function_measured(
+        self,
+        metrics: DispatcherMetrics,
+        calldata: Sequence[int],
+        result: Sequence[int],
+        function_selector: bytes,
+        class_hash: bytes,
+        output_format: OutputFormat,
+        selection: FieldSelection | None,
+    ) -> DecodedFunction | None:
+        """decode_function, recording the lookup and decode into the dispatcher metrics"""
+        started_ns = perf_counter_ns()
+        class_id, selector_id = class_hash[-8:], function_selector[-8:]
+
+        class_dispatcher = self.get_class(class_id)
+        if class_dispatcher is None:
+            metrics.record_unknown_class(class_id)
+            return None
+
+        try:
+            resolved_function = self._resolve_function(class_dispatcher, selector_id)
+        except KeyError:
+            metrics.record_unknown_selector(class_id, selector_id)
+            raise
+
+        try:
+            decoded_function = self._decode_resolved_function(
+                resolved_function, calldata, result, output_format, selection
+            )
+        except Exception as decode_err:
+            metrics.record_error(class_id, selector_id, decode_err)
+            raise
+
+        metrics.record_decode(
+            class_id, selector_id, len(calldata) + len(result), perf_counter_ns() - started_ns
+        )
+        return decoded_function
+
+    def decode_function_at(
+        self,
+        calldata: Sequence[int],
+        result: Sequence[int],
+        function_selector: bytes,
+        contract_address: int,
+        block_number: int,
+        class_resolver: ClassHashResolver,
+        output_format: OutputFormat = OutputFormat.HEX,
+        selection: FieldSelection | None = None,
+    ) -> DecodedFunction | None:
+        """
+        Decodes a call to a contract address at a block.  The class hash of the contract is resolved with the
+        class_resolver.  Returns None if the contract has no known class at the block, or the class is not
+        present in the Dispatcher
+
+        :param calldata: array of calldata as integers
+        :param result: array of calldata as intergers
+        :param function_selector: function_selector of the trace or transaction
+        :param contract_address: Address of the called contract
+        :param block_number: Block number of the call
+        :param class_resolver: ClassHashResolver holding the class history of the contract
+        :param output_format:  Representation of decoded felts and addresses.  Defaults to hex strings
+        :param selection:  Optional FieldSelection of the ``calldata`` inputs and ``result`` output indices
+        """
+        class_hash = class_resolver.resolve(contract_address, block_number)
+        if class_hash is None:
+            return None
+
+        return self.decode_function(
+            calldata, result, function_selector, class_hash, output_format, selection
+        )
+
+    def _resolve_function_candidate(self, candidate: SelectorCandidate) -> _ResolvedFunction:
+        if candidate.resolved is None:
+            input_types, output_types = self.function_types[candidate.decoder_reference]
+            candidate.resolved = (
+                candidate.abi_name,
+                candidate.name,
+                input_types,
+                output_types,
+                self._input_layout(candidate.decoder_reference).min_width,
+            )
+        return candidate.resolved
+
+    def decode_function_by_selector(
+        self,
+        calldata: Sequence[int],
+        result: Sequence[int] | None,
+        function_selector: bytes,
+        output_format: OutputFormat = OutputFormat.HEX,
+        selection: FieldSelection | None = None,
+    ) -> DecodedFunction | None:
+        """
+        Decodes a function call without its class hash, for traces of classes that are not loaded, or calls with a
+        missing class hash.  The distinct function types declared for the selector by every loaded class are
+        looked up in the :meth:`selector_index`, and tried in order of how often each type has matched.  The first
+        type consuming the calldata exactly is returned.
+
+        The abi_name of the result is only set if every class declaring the matching type has the same abi name.
+        If the result is None, outputs are not decoded, otherwise the result must also match the output types.
+        Returns None if no loaded class declares the selector, and raises an InvalidCalldataError if no candidate
+        type decodes the calldata
+
+        :param calldata: array of calldata as integers
+        :param result: array of the call result as integers, or None
+        :param function_selector: function_selector of the trace or transaction
+        :param output_format:  Representation of decoded felts and addresses.  Defaults to hex strings
+        :param selection:  Optional FieldSelection of the ``calldata`` inputs and ``result`` output indices
+        """
+        candidates = self.selector_index().function_candidates(function_selector)
+        if not candidates:
+            return None
+
+        for position, candidate in enumerate(candidates):
+            resolved_function = self._resolve_function_candidate(candidate)
+            if selection is None and result is None:
+                candidate_selection: FieldSelection | None = {
+                    "calldata": [param.name for param in resolved_function[2]]
+                }
+            else:
+                candidate_selection = selection
+
+            try:
+                decoded_function = self._decode_resolved_function(
+                    resolved_function, calldata, result or (), output_format, candidate_selection
+                )
+            except _BATCH_DECODE_ERRORS:
+                continue
+
+            SelectorIndex.record_match(candidates, position)
+            return decoded_function
+
+        raise InvalidCalldataError(
+            f"Calldata {calldata} does not match any of the {len(candidates)} types of function selector "
+            f"0x{function_selector.hex()}"
+        )
+
+    def decode_function_lazy(
+        self,
+        calldata: Sequence[int],
+        function_selector: bytes,
+        class_hash: bytes,
+        output_format: OutputFormat = OutputFormat.HEX,
+    ) -> LazyStruct | None:
+        """
+        Lazily decodes the inputs of a function call.  Inputs are only decoded when accessed, so reading a few
+        inputs of a large call skips the rest of the calldata.  If the class-hash is not present in the
+        Dispatcher, None is returned
+
+        :param calldata: array of calldata as integers
+        :param function_selector: function_selector of the trace or transaction
+        :param class_hash:  class hash of the trace or transaction
+        :param output_format:  Representation of decoded felts and addresses.  Defaults to hex strings
+        :return: LazyStruct of the function inputs
+        """
+        class_dispatcher = self.get_class(class_hash)
+        if class_dispatcher is None:
+            return None
+
+        decoder_reference = class_dispatcher.function_ids[function_selector[-8:]].decoder_reference
+        input_types, _ = self.function_types[decoder_reference]
+        return LazyStruct(
+            input_types,
+            calldata,
+            0,
+            output_format,
+            self._input_layout(decoder_reference).member_offsets,
+        )
+
+    def decode_functions_batch(  # pylint: disable=too-many-locals
+        self,
+        calldata: Sequence[int],
+        calldata_offsets: Sequence[int],
+        results: Sequence[int],
+        result_offsets: Sequence[int],
+        function_selectors: Sequence[bytes],
+        class_hashes: Sequence[bytes],
+        output_format: OutputFormat = OutputFormat.HEX,
+        selection: FieldSelection | None = None,
+    ) -> list[DecodedFunction | Exception | None]:
+        """
+        Decodes a batch of function calls, like all the traces in a block, from columnar inputs.  The calldata and
+        results of every call are flattened into a single array, and the offsets arrays hold the start of each
+        call's calldata, followed by the end of the final call, so the calldata for call ``i`` is
+        ``calldata[calldata_offsets[i]:calldata_offsets[i + 1]]``.
+
+        The class and function lookups are resolved once for each distinct (class_id, selector) pair in the batch.
+        Results are returned in input order.  If the class hash is not present in the Dispatcher, the result for
+        that call is None.  If a call fails to decode, the raised exception is returned in place of the result,
+        and the rest of the batch is still decoded.
+
+        .. doctest::
+
+            >>> from nethermind.starknet_abi.dispatch import DecodingDispatcher
+            >>> from nethermind.starknet_abi.core import StarknetAbi
+            >>> from nethermind.starknet_abi.decoding_types import AbiFunction
+            >>> from nethermind.starknet_abi.abi_types import AbiParameter, StarknetCoreType
+            >>> add = AbiFunction("add", [AbiParameter("a", StarknetCoreType.U32)], [StarknetCoreType.U32])
+            >>> dispatcher = DecodingDispatcher()
+            >>> dispatcher.add_abi(StarknetAbi("math", b"\\x01" * 32, {"add": add}, {}, None, None, {}))
+            >>> decoded = dispatcher.decode_functions_batch(
+            ...     calldata=[1, 2, 2**40],
+            ...     calldata_offsets=[0, 1, 2, 3],
+            ...     results=[5, 6, 7],
+            ...     result_offsets=[0, 1, 2, 3],
+            ...     function_selectors=[add.signature] * 3,
+            ...     class_hashes=[b"\\x01" * 32, b"\\x02" * 32, b"\\x01" * 32],
+            ... )
+            >>> decoded[0]
+            DecodedFunction(abi_name='math', name='add', inputs={'a': 1}, outputs=[5])
+            >>> decoded[1] is None, type(decoded[2]).__name__
+            (True, 'TypeDecodeError')
+
+        :param calldata: flattened calldata of every call in the batch
+        :param calldata_offsets: start offset of each call's calldata, followed by the end offset of the last call
+        :param results: flattened results of every call in the batch
+        :param result_offsets: start offset of each call's result, followed by the end offset of the last call
+        :param function_selectors: function selector of each call
+        :param class_hashes: class hash of each call
+        :param output_format: Representation of decoded felts and addresses.  Defaults to hex strings
+        :param selection: Optional FieldSelection of the inputs and outputs decoded for every call
+        :return: list of DecodedFunction, None, or the Exception raised decoding the call
+        """
+        decoded_functions: list[DecodedFunction | Exception | None] = []
+        metrics = self._metrics
+
+        for index, resolved_function in self._iter_resolved_functions(
+            calldata_offsets, result_offsets, function_selectors, class_hashes
+        ):
+            if resolved_function is None or isinstance(resolved_function, Exception):
+                if metrics is not None:
+                    metrics.record_unresolved(
+                        class_hashes[index][-8:], function_selectors[index][-8:], resolved_function
+                    )
+                decoded_functions.append(resolved_function)
+                continue
+
+            started_ns = perf_counter_ns() if metrics is not None else 0
+            try:
+                decoded_functions.append(
+                    self._decode_resolved_function(
+                        resolved_function,
+                        calldata,
+                        results,
+                        output_format,
+                        selection,
+                        (calldata_offsets[index], calldata_offsets[index + 1]),
+                        (result_offsets[index], result_offsets[index + 1]),
+                    )
+                )
+            except _BATCH_DECODE_ERRORS as decode_err:
+                decoded_functions.append(decode_err)
+                if metrics is not None:
+                    metrics.record_error(
+                        class_hashes[index][-8:], function_selectors[index][-8:], decode_err
+                    )
+                continue
+
+            if metrics is not None:
+                metrics.record_decode(
+                    class_hashes[index][-8:],
+                    function_selectors[index][-8:],
+                    calldata_offsets[index + 1]
+                    - calldata_offsets[index]
+                    + result_offsets[index + 1]
+                    - result_offsets[index],
+                    perf_counter_ns() - started_ns,
+                )
+
+        return decoded_functions
+
+    def decode_functions_columnar(  # pylint: disable=too-many-locals
+        self,
+        calldata: Sequence[int],
+        calldata_offsets: Sequence[int],
+        results: Sequence[int],
+        result_offsets: Sequence[int],
+        function_selectors: Sequence[bytes],
+        class_hashes: Sequence[bytes],
+        output_format: OutputFormat = OutputFormat.HEX,
+    ) -> ColumnarDecodeResult:
+        """
+        Decodes a batch of function calls into columns.  Takes the same columnar inputs as
+        :meth:`decode_functions_batch`, but instead of building a DecodedFunction for each call, the decoded inputs
+        and outputs are appended to a column for each parameter, grouped by (abi_name, function name).  Struct
+        inputs are flattened to a column per member, named by the dotted path of the member, and outputs are
+        stored in ``outputs.<index>`` columns.
+
+        Groups are returned as Arrow RecordBatches if pyarrow is installed, and dicts of column lists otherwise.
+
+        Each call is decoded in place, straight into the columns of its group, with the compiled decoder of each
+        column, so struct parameters are never built as dicts.  Calls that fail to decode, or have legacy results
+        without a length prefix, are decoded again like :meth:`decode_function`, so errors and legacy outputs
+        match the row decoders.
+
+        .. doctest::
+
+            >>> from nethermind.starknet_abi.dispatch import DecodingDispatcher
+            >>> from nethermind.starknet_abi.core import StarknetAbi
+            >>> from nethermind.starknet_abi.decoding_types import AbiFunction
+            >>> from nethermind.starknet_abi.abi_types import AbiParameter, StarknetCoreType
+            >>> add = AbiFunction("add", [AbiParameter("a", StarknetCoreType.U32)], [StarknetCoreType.U32])
+            >>> dispatcher = DecodingDispatcher()
+            >>> dispatcher.add_abi(StarknetAbi("math", b"\\x01" * 32, {"add": add}, {}, None, None, {}))
+            >>> decoded = dispatcher.decode_functions_columnar(
+            ...     calldata=[1, 2, 3],
+            ...     calldata_offsets=[0, 1, 2, 3],
+            ...     results=[5, 6, 7],
+            ...     result_offsets=[0, 1, 2, 3],
+            ...     function_selectors=[add.signature] * 3,
+            ...     class_hashes=[b"\\x01" * 32, b"\\x02" * 32, b"\\x01" * 32],
+            ... )
+            >>> list(decoded.tables), decoded.unknown_classes
+            ([('math', 'add')], [1])
+
+        :param calldata: flattened calldata of every call in the batch
+        :param calldata_offsets: start offset of each call's calldata, followed by the end offset of the last call
+        :param results: flattened results of every call in the batch
+        :param result_offsets: start offset of each call's result, followed by the end offset of the last call
+        :param function_selectors: function selector of each call
+        :param class_hashes: class hash of each call
+        :param output_format: Representation of decoded felts and addresses.  Defaults to hex strings
+        :return: ColumnarDecodeResult
+        """
+        collector = ColumnarCollector(output_format)
+
+        for index, resolved_function in self._iter_resolved_functions(
+            calldata_offsets, result_offsets, function_selectors, class_hashes
+        ):
+            if resolved_function is None:
+                collector.result.unknown_classes.append(index)
+                continue
+            if isinstance(resolved_function, Exception):
+                collector.result.errors[index] = resolved_function
+                continue
+
+            abi_name, function_name, input_types, output_types, _ = resolved_function
+            calldata_span = (calldata_offsets[index], calldata_offsets[index + 1])
+            result_span = (result_offsets[index], result_offsets[index + 1])
+            try:
+                group_builder = collector.builder(
+                    abi_name,
+                    function_name,
+                    input_types,
+                    partial(_function_columns, resolved_function),
+                )
+                if _write_function_row(
+                    group_builder, resolved_function, calldata, results, calldata_span, result_span
+                ):
+                    group_builder.end_row(index)
+                    continue
+
+                decoded_inputs, decoded_outputs = self._decode_function_values(
+                    resolved_function,
+                    calldata,
+                    results,
+                    output_format,
+                    None,
+                    calldata_span,
+                    result_span,
+                )
+                if decoded_outputs is None or len(decoded_outputs) != len(output_types):
+                    raise InvalidCalldataError(
+                        f"Decoded outputs of {function_name} do not match the output types"
+                    )
+                group_builder.append(index, [*decoded_inputs.values(), *decoded_outputs])
+            except _BATCH_DECODE_ERRORS as decode_err:
+                collector.result.errors[index] = decode_err
+
+        return collector.finish()
+
+    def decode_user_operation(
+        self,
+        calldata: Sequence[int],
+        result: Sequence[int] | None,
+        function_selector: bytes,
+        class_hash: bytes,
+        class_resolver: ContractClassResolver,
+        output_format: OutputFormat = OutputFormat.HEX,
+    ) -> DecodedUserOperation | None:
+        """
+        Decodes a function call, and if the function is an account ``__execute__``, recursively decodes every
+        inner ``(to, selector, calldata)`` call against the class of the called contract.  The class of each
+        contract is resolved with the class_resolver.
+
+        If the result is empty or None, outputs are not decoded.  The results of Cairo 1 account calls hold the
+        result of every inner call, which are decoded as the outputs of the inner calls.
+
+        If the class-hash is not present in the Dispatcher, None is returned.  Inner calls to unknown classes
+        are None, and the exceptions raised decoding inner calls are returned in place of the inner call.  Execute
+        calls are decoded up to 32 levels of nesting, and deeper inner calls are returned as InvalidCalldataErrors.
+
+        .. doctest::
+
+            >>> from nethermind.starknet_abi.dispatch import DecodingDispatcher
+            >>> from nethermind.starknet_abi.core import StarknetAbi
+            >>> from nethermind.starknet_abi.decoding_types import AbiFunction
+            >>> from nethermind.starknet_abi.abi_types import AbiParameter, StarknetArray, StarknetCoreType, StarknetStruct
+            >>> from nethermind.starknet_abi.multicall import encode_multicall
+            >>> call = StarknetStruct("Call", [
+            ...     AbiParameter("to", StarknetCoreType.ContractAddress),
+            ...     AbiParameter("selector", StarknetCoreType.Felt),
+            ...     AbiParameter("calldata", StarknetArray(StarknetCoreType.Felt)),
+            ... ])
+            >>> execute = AbiFunction("__execute__", [AbiParameter("calls", StarknetArray(call))], [])
+            >>> account = StarknetAbi("account", b"\\x01" * 32, {"__execute__": execute}, {}, None, None, {})
+            >>> add = AbiFunction("add", [AbiParameter("a", StarknetCoreType.U32)], [StarknetCoreType.U32])
+            >>> math = StarknetAbi("math", b"\\x02" * 32, {"add": add}, {}, None, None, {})
+            >>> dispatcher = DecodingDispatcher()
+            >>> dispatcher.add_abi(account)
+            >>> dispatcher.add_abi(math)
+            >>> decoded = dispatcher.decode_user_operation(
+            ...     calldata=encode_multicall([(0x123, math, "add", {"a": 5}), (0x456, math, "add", {"a": 6})]),
+            ...     result=None,
+            ...     function_selector=account.functions["__execute__"].signature,
+            ...     class_hash=b"\\x01" * 32,
+            ...     class_resolver={0x123: b"\\x02" * 32}.get,
+            ... )
+            >>> decoded.calls
+            [DecodedUserOperation(function=DecodedFunction(abi_name='math', name='add', inputs={'a': 5}, outputs=None), calls=None), None]
+
+        :param calldata: array of calldata as integers
+        :param result: array of the call result as integers, or None
+        :param function_selector: function_selector of the trace or transaction
+        :param class_hash: class hash of the trace or transaction
+        :param class_resolver: Resolves the class hash of the contracts called by account execute calls
+        :param output_format: Representation of decoded felts and addresses.  Defaults to hex strings
+        """
+        class_dispatcher = self.get_class(class_hash)
+        if class_dispatcher is None:
+            return None
+
+        return self._decode_user_operation(
+            self._resolve_function(class_dispatcher, function_selector),
+            calldata,
+            (0, len(calldata)),
+            result or (),
+            (0, len(result)) if result else None,
+            class_resolver,
+            output_format,
+            {},
+            {},
+        )
+
+    def decode_user_operations_batch(  # pylint: disable=too-many-locals
+        self,
+        calldata: Sequence[int],
+        calldata_offsets: Sequence[int],
+        results: Sequence[int],
+        result_offsets: Sequence[int],
+        function_selectors: Sequence[bytes],
+        class_hashes: Sequence[bytes],
+        class_resolver: ContractClassResolver,
+        output_format: OutputFormat = OutputFormat.HEX,
+    ) -> list[DecodedUserOperation | Exception | None]:
+        """
+        Decodes a batch of function calls and the inner calls of account ``__execute__`` calls, like all the
+        transactions in a block, from the columnar inputs described in :meth:`decode_functions_batch`.
+
+        Contract classes and function lookups are shared by every call and inner call in the batch, so each
+        contract address is resolved once with the class_resolver, and each (class_id, selector) pair is resolved
+        once.  Calls with an empty result are decoded without outputs.
+
+        :param calldata: flattened calldata of every call in the batch
+        :param calldata_offsets: start offset of each call's calldata, followed by the end offset of the last call
+        :param results: flattened results of every call in the batch
+        :param result_offsets: start offset of each call's result, followed by the end offset of the last call
+        :param function_selectors: function selector of each call
+        :param class_hashes: class hash of each call
+        :param class_resolver: Resolves the class hash of the contracts called by account execute calls
+        :param output_format: Representation of decoded felts and addresses.  Defaults to hex strings
+        :return: list of DecodedUserOperation, None, or the Exception raised decoding the call
+        """
+        resolved_classes: dict[int, bytes | None] = {}
+        resolved_functions: dict[tuple[bytes, bytes], Any] = {}
+        decoded_operations: list[DecodedUserOperation | Exception | None] = []
+
+        _check_batch_lengths(calldata_offsets, result_offsets, function_selectors, class_hashes)
+        for index, class_hash in enumerate(class_hashes):
+            resolved_function = self._resolve_function_cached(
+                resolved_functions, class_hash, function_selectors[index]
+            )
+            if resolved_function is None or isinstance(resolved_function, Exception):
+                decoded_operations.append(resolved_function)
+                continue
+
+            try:
+                decoded_operations.append(
+                    self._decode_user_operation(
+                        resolved_function,
+                        calldata,
+                        (calldata_offsets[index], calldata_offsets[index + 1]),
+                        results,
+                        (result_offsets[index], result_offsets[index + 1]),
+                        class_resolver,
+                        output_format,
+                        resolved_classes,
+                        resolved_functions,
+                    )
+                )
+            except _BATCH_DECODE_ERRORS as decode_err:
+                decoded_operations.append(decode_err)
+
+        return decoded_operations
+
+    def _decode_user_operation(  # pylint: disable=too-many-locals,too-many-arguments
+        self,
+        resolved_function: _ResolvedFunction,
+        calldata: Sequence[int],
+        calldata_span: _Span,
+        result: Sequence[int],
+        result_span: _Span | None,
+        class_resolver: ContractClassResolver,
+        output_format: OutputFormat,
+        resolved_classes: dict[int, bytes | None],
+        resolved_functions: dict[tuple[bytes, bytes], Any],
+        depth: int = 0,
+    ) -> DecodedUserOperation:
+        """
+        Decodes a resolved function, and recursively decodes the inner calls of account execute calls.  Inner calls
+        are decoded from their spans in the calldata and result of the execute call.  Contract classes and function
+        lookups are cached in resolved_classes and resolved_functions.  depth is the nesting of the call
+        """
+        _, _, input_types, output_types, _ = resolved_function
+        if result_span is not None and result_span[0] == result_span[1]:
+            result_span = None
+
+        decoded_function = self._decode_resolved_function(
+            resolved_function,
+            calldata,
+            result,
+            output_format,
+            (
+                None
+                if result_span is not None
+                else {"calldata": [param.name for param in input_types]}
+            ),
+            calldata_span,
+            result_span or (0, 0),
+        )
+
+        inner_calls = _split_account_calls(input_types, calldata, calldata_span)
+        if inner_calls is None:
+            return DecodedUserOperation(decoded_function)
+
+        if depth == _MAX_CALL_DEPTH:
+            depth_err = InvalidCalldataError(
+                f"Account calls nested deeper than {_MAX_CALL_DEPTH} levels are not decoded"
+            )
+            return DecodedUserOperation(decoded_function, [depth_err] * len(inner_calls))
+
+        decoded_calls: list[DecodedUserOperation | Exception | None] = []
+        for (to_address, selector, inner_span), inner_result_span in zip(
+            inner_calls, _split_call_results(output_types, result, result_span, len(inner_calls))
+        ):
+            if to_address not in resolved_classes:
+                resolved_classes[to_address] = class_resolver(to_address)
+
+            inner_class = resolved_classes[to_address]
+            inner_function = (
+                None
+                if inner_class is None
+                else self._resolve_function_cached(
+                    resolved_functions, inner_class, selector.to_bytes(32, "big")
+                )
+            )
+            if inner_function is None or isinstance(inner_function, Exception):
+                decoded_calls.append(inner_function)
+                continue
+
+            try:
+                decoded_calls.append(
+                    self._decode_user_operation(
+                        inner_function,
+                        calldata,
+                        inner_span,
+                        result,
+                        inner_result_span,
+                        class_resolver,
+                        output_format,
+                        resolved_classes,
+                        resolved_functions,
+                        depth + 1,
+                    )
+                )
+            except _BATCH_DECODE_ERRORS as decode_err:
+                decoded_calls.append(decode_err)
+
+        return DecodedUserOperation(decoded_function, decoded_calls)
+
+    def _iter_resolved_functions(
+        self,
+        calldata_offsets: Sequence[int],
+        result_offsets: Sequence[int],
+        function_selectors: Sequence[bytes],
+        class_hashes: Sequence[bytes],
+    ) -> Iterator[tuple[int, Any]]:
+        """
+        Resolves each call of a columnar batch, yielding the index of the call, and the resolved function, None if
+        the class is not present, or the KeyError raised resolving the selector.  Lookups are resolved once for each
+        distinct (class_id, selector) pair
+        """
+        _check_batch_lengths(calldata_offsets, result_offsets, function_selectors, class_hashes)
+        resolved_functions: dict[tuple[bytes, bytes], Any] = {}
+
+        for index, class_hash in enumerate(class_hashes):
+            yield index, self._resolve_function_cached(
+                resolved_functions, class_hash, function_selectors[index]
+            )
+
+    def _resolve_function_cached(
+        self,
+        resolved_functions: dict[tuple[bytes, bytes], Any],
+        class_hash: bytes,
+        function_selector: bytes,
+    ) -> Any:
+        """
+        Resolves a function through a lookup cache shared by a batch, returning the resolved function, None if the
+        class is not present, or the KeyError raised resolving the selector
+        """
+        lookup_key = (class_hash[-8:], function_selector[-8:])
+        try:
+            return resolved_functions[lookup_key]
+        except KeyError:
+            class_dispatcher = self.get_class(lookup_key[0])
+            resolved_function: Any
+            try:
+                resolved_function = (
+                    None
+                    if class_dispatcher is None
+                    else self._resolve_function(class_dispatcher, lookup_key[1])
+                )
+            except KeyError as key_err:
+                resolved_function = key_err
+            resolved_functions[lookup_key] = resolved_function
+            return resolved_function
+
+    def _resolve_event(
+        self,
+        class_dispatcher: ClassDispatcher,
+        keys: Sequence[int],
+    ) -> tuple[
+        str | None, str, Sequence[str], dict[str, StarknetType], dict[str, StarknetType], int
+    ]:
+        """
+        Resolves the abi name, event name, the parameters, key types and data types, and the number of selector
+        keys for the keys of an event emitted by a class.  Nested event selectors are followed with one lookup
+        per key.  Raises a KeyError if the selectors are not present in the class
+        """
+
+        event_dispatcher = class_dispatcher.event_ids[_event_selector_id(keys[0])]
+        selector_count = 1
+        while event_dispatcher.nested_events is not None and selector_count < len(keys):
+            nested_dispatcher = event_dispatcher.nested_events.get(
+                _event_selector_id(keys[selector_count])
+            )
+            if nested_dispatcher is None:
+                break
+            event_dispatcher, selector_count = nested_dispatcher, selector_count + 1
+
+        if event_dispatcher.decoder_reference is None or event_dispatcher.event_name is None:
+            raise KeyError(f"No event for selectors {[hex(key) for key in keys[:selector_count]]}")
 
-        # These two should never fail if class_dispatcher is valid
-        event_dispatcher = class_dispatcher.event_ids[event_selector[-8:]]
         event_params, event_keys, event_data = self.event_types[event_dispatcher.decoder_reference]
 
-        _data = data.copy()
-        _keys = keys[1:].copy()  # Key[0] is the event signature
+        return (
+            class_dispatcher.abi_name,
+            event_dispatcher.event_name,
+            event_params,
+            event_keys,
+            event_data,
+            selector_count,
+        )
+
+    @staticmethod
+    def _decode_event_values(  # pylint: disable=too-many-arguments
+        resolved_event: tuple[
+            str | None, str, Sequence[str], dict[str, StarknetType], dict[str, StarknetType], int
+        ],
+        data: Sequence[int],
+        keys: Sequence[int],
+        class_hash: bytes,
+        output_format: OutputFormat = OutputFormat.HEX,
+        selection: FieldSelection | None = None,
+        data_span: _Span | None = None,
+    ) -> dict[str, Any]:
+        """
+        Decodes the parameters of a resolved event, in the order of the event parameters.  If a selection is
+        passed, parameters missing from the selected ``keys`` and ``data`` are skipped.  Batches pass the span of
+        the event in the flattened data, which is decoded in place
+        """
+        if data_span is None:
+            return DecodingDispatcher._decode_event_values_at(
+                resolved_event, data, keys, class_hash, output_format, selection, (0, len(data))
+            )
+
+        try:
+            return DecodingDispatcher._decode_event_values_at(
+                resolved_event, data, keys, class_hash, output_format, selection, data_span
+            )
+        except _BATCH_DECODE_ERRORS:
+            # Like calls, failed events are decoded again from a slice, so batches return the errors of decode_event
+            data_start, data_end = data_span
+            return DecodingDispatcher._decode_event_values_at(
+                resolved_event,
+                data[data_start:data_end],
+                keys,
+                class_hash,
+                output_format,
+                selection,
+                (0, data_end - data_start),
+            )
+
+    @staticmethod
+    def _decode_event_values_at(  # pylint: disable=too-many-locals,too-many-arguments
+        resolved_event: tuple[
+            str | None, str, Sequence[str], dict[str, StarknetType], dict[str, StarknetType], int
+        ],
+        data: Sequence[int],
+        keys: Sequence[int],
+        class_hash: bytes,
+        output_format: OutputFormat,
+        selection: FieldSelection | None,
+        data_span: _Span,
+    ) -> dict[str, Any]:
+        _, _, event_params, event_keys, event_data, selector_count = resolved_event
+        data_start, data_end = data_span
+
+        # Leading keys are the event selectors
+        data_offset, keys_offset = data_start, selector_count
 
         decoded_data = {}
+        selected_keys, selected_data = (
+            (None, None)
+            if selection is None
+            else (selection.get("keys", ()), selection.get("data", ()))
+        )
 
         for param in event_params:
             if param in event_data:
-                decoded_data.update({param: decode_from_types([event_data[param]], _data)[0]})
+                if selected_data is None or param in selected_data:
+                    decoded_data[param], data_offset = decode_type_at(
+                        event_data[param], data, data_offset, output_format
+                    )
+                else:
+                    data_offset = compile_skipper(event_data[param])(data, data_offset)
             elif param in event_keys:
-                decoded_data.update({param: decode_from_types([event_keys[param]], _keys)[0]})
+                if selected_keys is None or param in selected_keys:
+                    decoded_data[param], keys_offset = decode_type_at(
+                        event_keys[param], keys, keys_offset, output_format
+                    )
+                else:
+                    keys_offset = compile_skipper(event_keys[param])(keys, keys_offset)
             else:
                 raise TypeDecodeError(
                     f"Event Parameter {param} not present in Keys or Data for "
-                    f"Event 0x{event_selector.hex()} for class 0x{class_hash.hex()}"
+                    f"Event 0x{keys[0]:064x} for class 0x{class_hash.hex()}"
                 )
 
-        if len(_data) != 0 or len(_keys) != 0:
+        if data_offset != data_end or keys_offset != len(keys):
             raise InvalidCalldataError(
-                f"Calldata Not Completely Consumed decoding "
-                f"Event 0x{event_selector.hex()} for class 0x{class_hash.hex()}.  Keys: {keys} Data: {data}"
+                f"Calldata Not Completely Consumed decoding Event 0x{keys[0]:064x} for class "
+                f"0x{class_hash.hex()}.  Keys: {keys} Data: {data[data_start:data_end]}"
             )
 
+        return decoded_data
+
+    @staticmethod
+    def _decode_resolved_event(  # pylint: disable=too-many-arguments
+        resolved_event: tuple[
+            str | None, str, Sequence[str], dict[str, StarknetType], dict[str, StarknetType], int
+        ],
+        data: Sequence[int],
+        keys: Sequence[int],
+        class_hash: bytes,
+        output_format: OutputFormat = OutputFormat.HEX,
+        selection: FieldSelection | None = None,
+        data_span: _Span | None = None,
+    ) -> DecodedEvent:
         return DecodedEvent(
-            abi_name=class_dispatcher.abi_name,
-            name=event_dispatcher.event_name,
-            data=decoded_data,
+            abi_name=resolved_event[0],
+            name=resolved_event[1],
+            data=DecodingDispatcher._decode_event_values(
+                resolved_event, data, keys, class_hash, output_format, selection, data_span
+            ),
         )
+
+    def decode_event(
+        self,
+        data: Sequence[int],
+        keys: Sequence[int],
+        class_hash: bytes,
+        output_format: OutputFormat = OutputFormat.HEX,
+        selection: FieldSelection | None = None,
+    ) -> DecodedEvent | None:
+        """
+        Decodes an emitted event.  If the ClassHash is not present in the Dispatcher, returns None
+
+        The class hash, and keys[0] are used to select the dispatcher entry for the specific event.  Events emitted
+        through nested event enums are resolved from the following selector keys, with one lookup per key
+
+        :param data:
+        :param keys:
+        :param class_hash:
+        :param output_format:  Representation of decoded felts and addresses.  Defaults to hex strings
+        :param selection:  Optional FieldSelection of the ``keys`` and ``data`` parameters to decode.  Other
+            parameters are skipped without decoding
+        """
+        if self._metrics is not None:
+            return self._decode_event_measured(
+                self._metrics, data, keys, class_hash, output_format, selection
+            )
+
+        class_dispatcher = self.get_class(class_hash)
+        if class_dispatcher is None:
+            return None
+
+        if len(keys) == 0:
+            raise InvalidCalldataError("Events require at least 1 key parameter as the selector")
+
+        return self._decode_resolved_event(
+            self._resolve_event(class_dispatcher, keys),
+            data,
+            keys,
+            class_hash,
+            output_format,
+            selection,
+        )
+
+    def _decode_event_measured(
+        self,
+        metrics: DispatcherMetrics,
+        data: Sequence[int],
+        keys: Sequence[int],
+        class_hash: bytes,
+        output_format: OutputFormat,
+        selection: FieldSelection | None,
+    ) -> DecodedEvent | None:
+        """decode_event, recording the lookup and decode into the dispatcher metrics"""
+        started_ns = perf_counter_ns()
+        class_id = class_hash[-8:]
+
+        class_dispatcher = self.get_class(class_id)
+        if class_dispatcher is None:
+            metrics.record_unknown_class(class_id)
+            return None
+
+        if len(keys) == 0:
+            keys_err = InvalidCalldataError(
+                "Events require at least 1 key parameter as the selector"
+            )
+            metrics.record_error(class_id, b"", keys_err)
+            raise keys_err
+
+        selector_id = (keys[0] % 2**64).to_bytes(8, "big")
+        try:
+            resolved_event = self._resolve_event(class_dispatcher, keys)
+        except KeyError:
+            metrics.record_unknown_selector(class_id, selector_id)
+            raise
+
+        try:
+            decoded_event = self._decode_resolved_event(
+                resolved_event, data, keys, class_hash, output_format, selection
+            )
+        except Exception as decode_err:
+            metrics.record_error(class_id, selector_id, decode_err)
+            raise
+
+        metrics.record_decode(
+            class_id, selector_id, len(keys) + len(data), perf_counter_ns() - started_ns
+        )
+        return decoded_event
+
+    def decode_event_at(
+        self,
+        contract_address: int,
+        block_number: int,
+        keys: Sequence[int],
+        data: Sequence[int],
+        class_resolver: ClassHashResolver,
+        output_format: OutputFormat = OutputFormat.HEX,
+        selection: FieldSelection | None = None,
+    ) -> DecodedEvent | None:
+        """
+        Decodes an event emitted by a contract address at a block.  The class hash of the contract is resolved
+        with the class_resolver, so events keyed by contract address are decoded against the class of the
+        contract when the event was emitted.  Returns None if the contract has no known class at the block, or
+        the class is not present in the Dispatcher
+
+        :param contract_address: Address of the contract emitting the event
+        :param block_number: Block number of the event
+        :param keys:
+        :param data:
+        :param class_resolver: ClassHashResolver holding the class history of the contract
+        :param output_format:  Representation of decoded felts and addresses.  Defaults to hex strings
+        :param selection:  Optional FieldSelection of the ``keys`` and ``data`` parameters to decode
+        """
+        class_hash = class_resolver.resolve(contract_address, block_number)
+        if class_hash is None:
+            return None
+
+        return self.decode_event(data, keys, class_hash, output_format, selection)
+
+    def decode_event_by_selector(
+        self,
+        data: Sequence[int],
+        keys: Sequence[int],
+        output_format: OutputFormat = OutputFormat.HEX,
+        selection: FieldSelection | None = None,
+    ) -> DecodedEvent | None:
+        """
+        Decodes an event without the class hash of the emitting contract.  The distinct event types declared for
+        keys[0] by every loaded class are looked up in the :meth:`selector_index`, and tried in order of how often
+        each type has matched.  Nested event candidates are only tried if the following keys match their selector
+        chain.  The first type consuming the keys and data exactly is returned.
+
+        The abi_name of the result is only set if every class declaring the matching type has the same abi name.
+        Returns None if no loaded class declares the selector, and raises an InvalidCalldataError if no candidate
+        type decodes the event
+
+        :param data:
+        :param keys:
+        :param output_format:  Representation of decoded felts and addresses.  Defaults to hex strings
+        :param selection:  Optional FieldSelection of the ``keys`` and ``data`` parameters to decode
+        """
+        if len(keys) == 0:
+            raise InvalidCalldataError("Events require at least 1 key parameter as the selector")
+
+        candidates = self.selector_index().event_candidates(keys[0].to_bytes(32, "big"))
+        if not candidates:
+            return None
+
+        for position, candidate in enumerate(candidates):
+            selector_count = len(candidate.nested_selectors) + 1
+            if len(keys) < selector_count or any(
+                key.to_bytes(32, "big")[-8:] != selector_id
+                for key, selector_id in zip(keys[1:], candidate.nested_selectors)
+            ):
+                continue
+
+            if candidate.resolved is None:
+                event_params, event_keys, event_data = self.event_types[candidate.decoder_reference]
+                candidate.resolved = (
+                    candidate.abi_name,
+                    candidate.name,
+                    event_params,
+                    event_keys,
+                    event_data,
+                    selector_count,
+                )
+
+            try:
+                decoded_event = self._decode_resolved_event(
+                    candidate.resolved, data, keys, b"", output_format, selection
+                )
+            except _BATCH_DECODE_ERRORS:
+                continue
+
+            SelectorIndex.record_match(candidates, position)
+            return decoded_event
+
+        raise InvalidCalldataError(
+            f"Event data {data} and keys {keys} do not match any of the {len(candidates)} types of event "
+            f"selector 0x{keys[0]:064x}"
+        )
+
+    def decode_events_batch(  # pylint: disable=too-many-locals
+        self,
+        data: Sequence[int],
+        data_offsets: Sequence[int],
+        keys: Sequence[int],
+        keys_offsets: Sequence[int],
+        class_hashes: Sequence[bytes],
+        output_format: OutputFormat = OutputFormat.HEX,
+        selection: FieldSelection | None = None,
+    ) -> list[DecodedEvent | Exception | None]:
+        """
+        Decodes a batch of events, like all the events emitted in a block, from columnar inputs.  The data and keys
+        of every event are flattened into single arrays, and the offsets arrays hold the start of each event's
+        data and keys, followed by the end of the final event.  The first key of each event is the event selector.
+
+        The class and event lookups are resolved once for each distinct (class_id, selector) pair in the batch.
+        Selectors of nested events are resolved once per (class_id, selector), and the nested keys are followed for
+        each event.  Results are returned in input order.  If the class hash is not present in the Dispatcher, the result for
+        that event is None.  If an event fails to decode, the raised exception is returned in place of the result,
+        and the rest of the batch is still decoded.
+
+        :param data: flattened data of every event in the batch
+        :param data_offsets: start offset of each event's data, followed by the end offset of the last event
+        :param keys: flattened keys of every event in the batch
+        :param keys_offsets: start offset of each event's keys, followed by the end offset of the last event
+        :param class_hashes: class hash of each event
+        :param output_format: Representation of decoded felts and addresses.  Defaults to hex strings
+        :param selection: Optional FieldSelection of the keys and data decoded for every event
+        :return: list of DecodedEvent, None, or the Exception raised decoding the event
+        """
+        decoded_events: list[DecodedEvent | Exception | None] = []
+        metrics = self._metrics
+
+        for index, event_keys, resolved_event in self._iter_resolved_events(
+            keys, data_offsets, keys_offsets, class_hashes
+        ):
+            if resolved_event is None or isinstance(resolved_event, Exception):
+                if metrics is not None:
+                    metrics.record_unresolved(
+                        class_hashes[index][-8:],
+                        (event_keys[0] % 2**64).to_bytes(8, "big") if event_keys else b"",
+                        resolved_event,
+                    )
+                decoded_events.append(resolved_event)
+                continue
+
+            started_ns = perf_counter_ns() if metrics is not None else 0
+            try:
+                decoded_events.append(
+                    self._decode_resolved_event(
+                        resolved_event,
+                        data,
+                        event_keys,
+                        class_hashes[index],
+                        output_format,
+                        selection,
+                        (data_offsets[index], data_offsets[index + 1]),
+                    )
+                )
+            except _BATCH_DECODE_ERRORS as decode_err:
+                decoded_events.append(decode_err)
+                if metrics is not None:
+                    metrics.record_error(
+                        class_hashes[index][-8:], event_keys[0].to_bytes(32, "big")[-8:], decode_err
+                    )
+                continue
+
+            if metrics is not None:
+                metrics.record_decode(
+                    class_hashes[index][-8:],
+                    event_keys[0].to_bytes(32, "big")[-8:],
+                    len(event_keys) + data_offsets[index + 1] - data_offsets[index],
+                    perf_counter_ns() - started_ns,
+                )
+
+        return decoded_events
+
+    def decode_events_columnar(
+        self,
+        data: Sequence[int],
+        data_offsets: Sequence[int],
+        keys: Sequence[int],
+        keys_offsets: Sequence[int],
+        class_hashes: Sequence[bytes],
+        output_format: OutputFormat = OutputFormat.HEX,
+    ) -> ColumnarDecodeResult:
+        """
+        Decodes a batch of events into columns.  Takes the same columnar inputs as :meth:`decode_events_batch`, but
+        instead of building a DecodedEvent for each event, the decoded parameters are appended to a column for
+        each parameter, grouped by (abi_name, event name).  Struct parameters are flattened to a column per member,
+        named by the dotted path of the member.
+
+        Groups are returned as Arrow RecordBatches if pyarrow is installed, and dicts of column lists otherwise.
+
+        Like :meth:`decode_functions_columnar`, each event is decoded in place, straight into the columns of its
+        group, and events that fail to decode are decoded again like :meth:`decode_event`, to return its errors.
+
+        :param data: flattened data of every event in the batch
+        :param data_offsets: start offset of each event's data, followed by the end offset of the last event
+        :param keys: flattened keys of every event in the batch
+        :param keys_offsets: start offset of each event's keys, followed by the end offset of the last event
+        :param class_hashes: class hash of each event
+        :param output_format: Representation of decoded felts and addresses.  Defaults to hex strings
+        :return: ColumnarDecodeResult
+        """
+        collector = ColumnarCollector(output_format)
+
+        for index, event_keys, resolved_event in self._iter_resolved_events(
+            keys, data_offsets, keys_offsets, class_hashes
+        ):
+            if resolved_event is None:
+                collector.result.unknown_classes.append(index)
+                continue
+            if isinstance(resolved_event, Exception):
+                collector.result.errors[index] = resolved_event
+                continue
+
+            data_span = (data_offsets[index], data_offsets[index + 1])
+            try:
+                group_builder = collector.builder(
+                    resolved_event[0],
+                    resolved_event[1],
+                    resolved_event[2],
+                    partial(_event_columns, resolved_event),
+                )
+                if _write_event_row(group_builder, resolved_event, data, event_keys, data_span):
+                    group_builder.end_row(index)
+                    continue
+
+                decoded_data = self._decode_event_values(
+                    resolved_event,
+                    data,
+                    event_keys,
+                    class_hashes[index],
+                    output_format,
+                    None,
+                    data_span,
+                )
+                group_builder.append(index, decoded_data.values())
+            except _BATCH_DECODE_ERRORS as decode_err:
+                collector.result.errors[index] = decode_err
+
+        return collector.finish()
+
+    def _iter_resolved_events(
+        self,
+        keys: Sequence[int],
+        data_offsets: Sequence[int],
+        keys_offsets: Sequence[int],
+        class_hashes: Sequence[bytes],
+    ) -> Iterator[tuple[int, Sequence[int], Any]]:
+        """
+        Resolves each event of a columnar batch, yielding the index and keys of the event, and the resolved event,
+        None if the class is not present, or the exception raised resolving the event selectors
+        """
+        batch_size = len(class_hashes)
+        if not len(data_offsets) - 1 == len(keys_offsets) - 1 == batch_size:
+            raise ValueError(
+                "Batch inputs must have one entry per event, and offsets must have one extra entry"
+            )
+
+        resolved_events: dict[tuple[bytes, int], Any] = {}
+
+        for index in range(batch_size):
+            event_keys = keys[keys_offsets[index] : keys_offsets[index + 1]]
+            if len(event_keys) == 0:
+                # Like decode_event, events of unknown classes are None before the keys are checked
+                yield index, event_keys, (
+                    None
+                    if self.get_class(class_hashes[index]) is None
+                    else InvalidCalldataError(
+                        "Events require at least 1 key parameter as the selector"
+                    )
+                )
+                continue
+
+            lookup_key = (class_hashes[index][-8:], event_keys[0])
+            try:
+                resolved_event = resolved_events[lookup_key]
+            except KeyError:
+                class_dispatcher = self.get_class(lookup_key[0])
+                try:
+                    if class_dispatcher is None:
+                        resolved_event = None
+                    elif class_dispatcher.event_ids[
+                        _event_selector_id(event_keys[0])
+                    ].nested_events:
+                        resolved_event = class_dispatcher  # Nested keys are resolved per event
+                    else:
+                        resolved_event = self._resolve_event(class_dispatcher, event_keys)
+                except KeyError as key_err:
+                    resolved_event = key_err
+                resolved_events[lookup_key] = resolved_event
+
+            if isinstance(resolved_event, ClassDispatcher):
+                try:
+                    yield index, event_keys, self._resolve_event(resolved_event, event_keys)
+                except KeyError as key_err:
+                    yield index, event_keys, key_err
+                continue
+
+            yield index, event_keys, resolved_event
@@ -1,4 +1,4 @@
-from typing import Any, Sequence
+from typing import Any, Callable, Sequence
 
 from nethermind.starknet_abi.abi_types import (
     AbiParameter,
@@ -19,21 +19,6 @@ from nethermind.starknet_abi.utils import STARK_FIELD
 # pylint: disable=too-many-return-statements,raise-missing-from
 
 
-def _get_enum_index(enum_type: StarknetEnum, enum_key: str) -> tuple[int, StarknetType]:
-    """
-    Get the index of the enum key and the enum type.
-
-    :param enum_type:
-    :param enum_key:
-    :return:
-    """
-    for idx, (key, value) in enumerate(enum_type.variants):
-        if key == enum_key:
-            return idx, value
-
-    raise ValueError(f"Enum Key {enum_key} not found in Enum {enum_type}")
-
-
 def encode_core_type(  # pylint: disable=too-many-return-statements,too-many-branches
     encode_type: StarknetCoreType,
     value: bytes | int | bool | str,
@@ -128,7 +113,7 @@ def encode_core_type(  # pylint: disable=too-many-return-statements,too-many-bra
                     elif encode_type == StarknetCoreType.Bytes31:
                         assert 0 <= int_encoded <= encode_type.max_value(), f"{value!r} Does not Fit into 31 Bytes"
                     else:
-                        assert value <= encode_type.max_value(), f"{value!r} Does not Fit into Starknet Felt"
+                        assert int_encoded <= encode_type.max_value(), f"{value!r} Does not Fit into Starknet Felt"
 
                     return [int_encoded]
 
@@ -147,85 +132,377 @@ def encode_core_type(  # pylint: disable=too-many-return-statements,too-many-bra
         raise TypeEncodeError(assert_err)
 
 
-def encode_from_types(  # pylint: disable=too-many-branches, too-many-locals
-    types: Sequence[StarknetType],
-    values: list[Any],
-) -> list[int]:
+TypeEncoder = Callable[[Any, list[int]], None]
+"""
+Compiled encoder for a StarknetType.  Takes the value to encode and the output calldata list, and appends the
+encoded felts to the output list
+"""
+
+ParamsEncoder = Callable[[dict[str, Any]], list[int]]
+"""
+Compiled encoder for a sequence of AbiParameters.  Takes a dict of parameter values, and returns the calldata
+"""
+
+ParamsWriter = Callable[[dict[str, Any], list[int]], None]
+"""
+Compiled writer for a sequence of AbiParameters.  Takes a dict of parameter values and the output calldata list,
+and appends the encoded parameters to the output list
+"""
+
+_U128_MASK = (1 << 128) - 1
+
+_FELT_RANGE_MESSAGES: dict[StarknetCoreType, str] = {
+    StarknetCoreType.Felt: "{!r} Does not Fit into Starknet Felt",
+    StarknetCoreType.ContractAddress: "{!r} Does not Fit into Starknet Felt",
+    StarknetCoreType.ClassHash: "{!r} Does not Fit into Starknet Felt",
+    StarknetCoreType.StorageAddress: "{!r} Does not Fit into Starknet Felt",
+    StarknetCoreType.EthAddress: "{!r} Is larger than an Eth Address",
+    StarknetCoreType.Bytes31: "{!r} Does not Fit into 31 Bytes",
+}
+
+
+def _type_encode_error(value: Any, starknet_type: StarknetType, err: TypeEncodeError) -> TypeEncodeError:
+    encode_err = TypeEncodeError(f"Failed to Encode {value} to {starknet_type}")
+    encode_err.__cause__ = err
+    return encode_err
+
+
+def _compile_core_encoder(encode_type: StarknetCoreType) -> TypeEncoder:
     """
-    Decode data from types.
+    Specializes encode_core_type for a single StarknetCoreType, hoisting the type dispatch and range bounds out
+    of the per-value path.  Encoded felts and exception messages are identical to encode_core_type
     """
-    encoded_calldata = []
-    for encode_type, encode_value in zip(types, values, strict=True):
-        if isinstance(encode_type, StarknetCoreType):
-            encoded_calldata += encode_core_type(encode_type, encode_value)
-            continue
-
-        try:
-            if isinstance(encode_type, StarknetArray):
-                assert isinstance(encode_value, (list, tuple)), f"{encode_value} cannot be encoded into a StarknetArray"
-
-                encoded_calldata.append(len(encode_value))
-
-                for array_element in encode_value:
-                    encoded_calldata += encode_from_types(
-                        [encode_type.inner_type], [array_element]
-                    )
-                continue
-
-            if isinstance(encode_type, StarknetOption):
-                if encode_value is None:
-                    encoded_calldata.append(1)
-                else:
-                    encoded_calldata.append(0)
-                    encoded_calldata += encode_from_types(
-                        [encode_type.inner_type], [encode_value]
-                    )
-                continue
-
-            if isinstance(encode_type, StarknetStruct):
-                assert isinstance(encode_value, dict), f"{encode_value} cannot be encoded into a StarknetStruct"
-
-                encoded_calldata += encode_from_params(
-                    encode_type.members, encode_value
+    if encode_type in _FELT_RANGE_MESSAGES:
+        felt_max = encode_type.max_value()
+        range_msg = _FELT_RANGE_MESSAGES[encode_type]
+
+        def _encode_felt(value: Any, output: list[int]) -> None:
+            if isinstance(value, int):
+                int_encoded = value
+            elif isinstance(value, str):
+                if not value.startswith("0x"):
+                    raise TypeEncodeError("Hex Strings must be 0x Prefixed")
+                int_encoded = int(value, 16)
+            elif isinstance(value, bytes):
+                int_encoded = int.from_bytes(value, "big")
+            else:
+                raise TypeError(
+                    f"Cannot Encode Python {type(value)} Type to {encode_type}.  Represent Felt Types "
+                    f"as int, hex strings, or big-endian bytes"
                 )
-                continue
 
-            if isinstance(encode_type, StarknetEnum):
-                assert isinstance(encode_value, dict), f"{encode_value} cannot be encoded into a StarknetEnum"
-                enum_items = list(encode_value.items())
-                assert len(enum_items) == 1, f"Enum Value {encode_value} must have exactly one key-value pair"
+            if not 0 <= int_encoded <= felt_max:
+                raise TypeEncodeError(range_msg.format(value))
+            output.append(int_encoded)
+
+        return _encode_felt
+
+    match encode_type:
+        case (
+            StarknetCoreType.U8
+            | StarknetCoreType.U16
+            | StarknetCoreType.U32
+            | StarknetCoreType.U64
+            | StarknetCoreType.U128
+        ):
+            uint_max = encode_type.max_value()
+
+            def _encode_uint(value: Any, output: list[int]) -> None:
+                if not isinstance(value, int):
+                    raise TypeEncodeError(f"Cannot Encode Non-Integer Value '{value!r}' to {encode_type}")
+                if not 0 <= value <= uint_max:
+                    raise TypeEncodeError(f"Unsigned Integer {value!r} is out of range for {encode_type}")
+                output.append(value)
+
+            return _encode_uint
+
+        case (
+            StarknetCoreType.I8
+            | StarknetCoreType.I16
+            | StarknetCoreType.I32
+            | StarknetCoreType.I64
+            | StarknetCoreType.I128
+        ):
+            int_min, int_max = encode_type.min_value(), encode_type.max_value()
+
+            def _encode_int(value: Any, output: list[int]) -> None:
+                if not isinstance(value, int):
+                    raise TypeEncodeError(f"Cannot Encode Integer Value '{value!r}' to {encode_type}")
+                if not int_min <= value <= int_max:
+                    raise TypeEncodeError(f"Signed Integer {value!r} is out of range for {encode_type}")
+                output.append(value if value >= 0 else STARK_FIELD + value)
+
+            return _encode_int
+
+        case StarknetCoreType.U256 | StarknetCoreType.U512:
+            big_uint_max = encode_type.max_value()
+            split_words = 2 if encode_type == StarknetCoreType.U256 else 4
+
+            def _encode_big_uint(value: Any, output: list[int]) -> None:
+                if not isinstance(value, int):
+                    raise TypeEncodeError(f"Cannot Encode Non-Integer Value '{value!r}' to {encode_type}")
+                if not 0 <= value <= big_uint_max:
+                    raise TypeEncodeError(f"Integer {value!r} is out of range for {encode_type}")
+
+                for _ in range(split_words):
+                    output.append(value & _U128_MASK)
+                    value >>= 128
+
+            return _encode_big_uint
 
-                enum_key, enum_value = enum_items[0]
+        case StarknetCoreType.Bool:
+            def _encode_bool(value: Any, output: list[int]) -> None:
+                if not isinstance(value, bool):
+                    raise TypeEncodeError(f"Cannot Encode Non-Boolean Value '{value!r}' to {encode_type}")
+                output.append(1 if value else 0)
 
-                enum_index, enum_type = _get_enum_index(encode_type, enum_key)
+            return _encode_bool
 
-                encoded_calldata.append(enum_index)
-                encoded_calldata += encode_from_types([enum_type], [enum_value])
-                continue
+        case StarknetCoreType.NoneType:
+            def _encode_none(value: Any, output: list[int]) -> None:  # pylint: disable=unused-argument
+                return
 
-            if isinstance(encode_type, StarknetTuple):
-                assert isinstance(encode_value, tuple), f"{encode_value} cannot be encoded into a StarknetTuple"
-                for tuple_type, tuple_value in zip(encode_type.members, encode_value):
-                    encoded_calldata += encode_from_types([tuple_type], [tuple_value])
-                continue
+            return _encode_none
 
-            if isinstance(encode_type, StarknetNonZero):
-                encoded_nonzero = encode_from_types([encode_type.inner_type], [encode_value])
+        case _:
+            raise TypeError(f"Unable to encode Type {encode_type}")
 
-                assert encoded_nonzero != 0, f"Zero Value {encode_value} Cannot encode to StarknetNonZero"
 
-                encoded_calldata += encoded_nonzero
-                continue
+_CORE_ENCODERS: dict[StarknetCoreType, TypeEncoder] = {
+    core_type: _compile_core_encoder(core_type) for core_type in StarknetCoreType
+}
 
-            raise TypeError(
-                f"Cannot Encode {encode_value} for Type {encode_type}"
+
+def compile_params_writer(params: Sequence[AbiParameter]) -> ParamsWriter:
+    """
+    Compiles the parameters of a function into a writer, which appends the encoded parameters to an existing
+    calldata list.  Writers are used to embed the calldata of a function into a larger calldata array without
+    building an intermediate list.  Encode errors of the parameters are raised unchanged.
+
+    .. doctest::
+        >>> from nethermind.starknet_abi.encode import compile_params_writer, AbiParameter, StarknetCoreType
+        >>> calldata = [1, 2]
+        >>> compile_params_writer([AbiParameter("amount", StarknetCoreType.U256)])({"amount": 5}, calldata)
+        >>> calldata
+        [1, 2, 5, 0]
+
+    :param params:  Sequence of AbiParameters to compile a writer for
+    :return: ParamsWriter, appending the encoded parameters to the output list
+    """
+    param_count = len(params)
+    param_encoders = [(param.name, compile_encoder(param.type)) for param in params]
+
+    def _encode_params(encode_values: dict[str, Any], output: list[int]) -> None:
+        if len(encode_values) != param_count:
+            raise ValueError(
+                f"Number of Encode Values '{len(encode_values)}' does not match Number of Abi Params '{param_count}'"
             )
 
-        except AssertionError as assert_err:
-            raise TypeEncodeError(assert_err)
+        for param_name, param_encoder in param_encoders:
+            try:
+                param_value = encode_values[param_name]
+            except KeyError:
+                raise ValueError(f"Missing Encode Value for Param: {param_name}")
+            param_encoder(param_value, output)
+
+    return _encode_params
+
+
+def _compile_array_encoder(array_type: StarknetArray) -> TypeEncoder:
+    inner_encoder = compile_encoder(array_type.inner_type)
+
+    def _encode_array(value: Any, output: list[int]) -> None:
+        if not isinstance(value, (list, tuple)):
+            raise TypeEncodeError(f"{value} cannot be encoded into a StarknetArray")
+
+        output.append(len(value))
+        try:
+            for array_element in value:
+                inner_encoder(array_element, output)
+        except TypeEncodeError as encode_err:
+            raise _type_encode_error(value, array_type, encode_err)
 
+    return _encode_array
+
+
+def _compile_option_encoder(option_type: StarknetOption) -> TypeEncoder:
+    inner_encoder = compile_encoder(option_type.inner_type)
+
+    def _encode_option(value: Any, output: list[int]) -> None:
+        if value is None:
+            output.append(1)
+            return
+
+        output.append(0)
+        try:
+            inner_encoder(value, output)
+        except TypeEncodeError as encode_err:
+            raise _type_encode_error(value, option_type, encode_err)
+
+    return _encode_option
+
+
+def _compile_struct_encoder(struct_type: StarknetStruct) -> TypeEncoder:
+    members_encoder = compile_params_writer(struct_type.members)
+
+    def _encode_struct(value: Any, output: list[int]) -> None:
+        if not isinstance(value, dict):
+            raise TypeEncodeError(f"{value} cannot be encoded into a StarknetStruct")
+
+        try:
+            members_encoder(value, output)
         except TypeEncodeError as encode_err:
-            raise TypeEncodeError(f"Failed to Encode {encode_value} to {encode_type}") from encode_err
+            raise _type_encode_error(value, struct_type, encode_err)
+
+    return _encode_struct
+
+
+def _compile_enum_encoder(enum_type: StarknetEnum) -> TypeEncoder:
+    # Variant name -> (variant index, variant encoder)
+    variant_encoders = {
+        variant_name: (variant_index, compile_encoder(variant_type))
+        for variant_index, (variant_name, variant_type) in reversed(list(enumerate(enum_type.variants)))
+    }
+
+    def _encode_enum(value: Any, output: list[int]) -> None:
+        if not isinstance(value, dict):
+            raise TypeEncodeError(f"{value} cannot be encoded into a StarknetEnum")
+        if len(value) != 1:
+            raise TypeEncodeError(f"Enum Value {value} must have exactly one key-value pair")
+
+        ((variant_name, variant_value),) = value.items()
+        try:
+            variant_index, variant_encoder = variant_encoders[variant_name]
+        except KeyError:
+            raise ValueError(f"Enum Key {variant_name} not found in Enum {enum_type}")
+
+        output.append(variant_index)
+        try:
+            variant_encoder(variant_value, output)
+        except TypeEncodeError as encode_err:
+            raise _type_encode_error(value, enum_type, encode_err)
+
+    return _encode_enum
+
+
+def _compile_tuple_encoder(tuple_type: StarknetTuple) -> TypeEncoder:
+    member_encoders = [compile_encoder(tuple_member) for tuple_member in tuple_type.members]
+
+    def _encode_tuple(value: Any, output: list[int]) -> None:
+        if not isinstance(value, tuple):
+            raise TypeEncodeError(f"{value} cannot be encoded into a StarknetTuple")
+
+        try:
+            for member_encoder, member_value in zip(member_encoders, value):
+                member_encoder(member_value, output)
+        except TypeEncodeError as encode_err:
+            raise _type_encode_error(value, tuple_type, encode_err)
+
+    return _encode_tuple
+
+
+def _compile_non_zero_encoder(non_zero_type: StarknetNonZero) -> TypeEncoder:
+    inner_encoder = compile_encoder(non_zero_type.inner_type)
+
+    def _encode_non_zero(value: Any, output: list[int]) -> None:
+        start_len = len(output)
+        try:
+            inner_encoder(value, output)
+        except TypeEncodeError as encode_err:
+            raise _type_encode_error(value, non_zero_type, encode_err)
+
+        if not any(output[start_len:]):
+            raise TypeEncodeError(f"Zero Value {value} Cannot encode to StarknetNonZero")
+
+    return _encode_non_zero
+
+
+def compile_encoder(starknet_type: StarknetType) -> TypeEncoder:
+    """
+    Compiles a StarknetType tree into a specialized encoder callable, which appends the encoded felts of a value
+    to an output list.  The type dispatch, range bounds and enum variant indexes are resolved once at compile
+    time, and every nested value is written into the same output list.  Compiled encoders are cached on the type
+    object, and raise the same exceptions as :func:`encode_from_types`.
+
+    .. doctest::
+        >>> from nethermind.starknet_abi.encode import compile_encoder, StarknetArray, StarknetCoreType
+        >>> u256_array_encoder = compile_encoder(StarknetArray(StarknetCoreType.U256))
+        >>> calldata = [7]
+        >>> u256_array_encoder([1, 2**128], calldata)
+        >>> calldata
+        [7, 2, 1, 0, 0, 1]
+
+    :param starknet_type:  StarknetType to compile an encoder for
+    :return: TypeEncoder, appending the encoded value to the output list
+    """
+    # pylint: disable=protected-access
+    if isinstance(starknet_type, StarknetCoreType):
+        return _CORE_ENCODERS[starknet_type]
+
+    if starknet_type._encoder is not None:
+        return starknet_type._encoder
+
+    encoder: TypeEncoder
+    if isinstance(starknet_type, StarknetArray):
+        encoder = _compile_array_encoder(starknet_type)
+    elif isinstance(starknet_type, StarknetStruct):
+        encoder = _compile_struct_encoder(starknet_type)
+    elif isinstance(starknet_type, StarknetEnum):
+        encoder = _compile_enum_encoder(starknet_type)
+    elif isinstance(starknet_type, StarknetOption):
+        encoder = _compile_option_encoder(starknet_type)
+    elif isinstance(starknet_type, StarknetTuple):
+        encoder = _compile_tuple_encoder(starknet_type)
+    elif isinstance(starknet_type, StarknetNonZero):
+        encoder = _compile_non_zero_encoder(starknet_type)
+    else:
+        raise TypeError(f"Cannot Encode Values for Type: {starknet_type}")
+
+    starknet_type._encoder = encoder
+    return encoder
+
+
+def compile_params_encoder(params: Sequence[AbiParameter]) -> ParamsEncoder:
+    """
+    Compiles the parameters of a function into a reusable encoder.  The parameter encoders are resolved once,
+    so encoding calldata with the returned callable only runs the compiled type encoders.
+
+    .. doctest::
+        >>> from nethermind.starknet_abi.encode import compile_params_encoder, AbiParameter, StarknetCoreType
+        >>> transfer_encoder = compile_params_encoder(
+        ...     [AbiParameter("recipient", StarknetCoreType.ContractAddress), AbiParameter("amount", StarknetCoreType.U256)]
+        ... )
+        >>> transfer_encoder({"recipient": "0x0123", "amount": 2**128 + 5})
+        [291, 5, 1]
+
+    :param params:  Sequence of AbiParameters to compile an encoder for
+    :return: ParamsEncoder, returning the calldata of a dict of parameter values
+    """
+    params_encoder = compile_params_writer(params)
+
+    def _encode(encode_values: dict[str, Any]) -> list[int]:
+        output: list[int] = []
+        params_encoder(encode_values, output)
+        return output
+
+    return _encode
+
+
+def encode_from_types(
+    types: Sequence[StarknetType],
+    values: list[Any],
+) -> list[int]:
+    """
+    Encode a list of values into calldata using a sequence of StarknetTypes.
+
+    .. doctest::
+        >>> from nethermind.starknet_abi.encode import encode_from_types, StarknetArray, StarknetCoreType
+        >>> encode_from_types([StarknetArray(StarknetCoreType.U8), StarknetCoreType.Bool], [[3, 4], True])
+        [2, 3, 4, 1]
+    """
+    encoded_calldata: list[int] = []
+    for encode_type, encode_value in zip(types, values, strict=True):
+        compile_encoder(encode_type)(encode_value, encoded_calldata)
 
     return encoded_calldata
 
@@ -235,22 +512,9 @@ def encode_from_params(
     encode_values: dict[str, Any],
 ) -> list[int]:
     """
-    Decode data from types.
+    Encode a dict of parameter values into calldata.  Use :func:`compile_params_encoder` to reuse the compiled
+    encoder when encoding many calls to the same function.
     """
-    if len(encode_values) != len(params):
-        raise ValueError(
-            f"Number of Encode Values '{len(encode_values)}' does not match Number of Abi Params '{len(params)}'"
-        )
-
-    parameter_names = [param.name for param in params]
-    parameter_types = [param.type for param in params]
-
-    encode_values_list = []
-
-    for name in parameter_names:
-        try:
-            encode_values_list.append(encode_values[name])
-        except KeyError:
-            raise ValueError(f"Missing Encode Value for Param: {name}")
-
-    return encode_from_types(parameter_types, encode_values_list)
+    encoded_calldata: list[int] = []
+    compile_params_writer(params)(encode_values, encoded_calldata)
+    return encoded_calldata
@@ -67,3 +67,10 @@ class DispatcherDecodeError(Exception):
     """
     Raised when there is an error decoding Functions, Events, or User Operations using the decoding dispatcher
     """
+
+
+class ReadOnlyDispatcherError(TypeError):
+    """
+    Raised when adding ABIs to a read-only dispatcher, like a MappedDecodingDispatcher.  Add the ABIs to a
+    DecodingDispatcher, and rebuild the index or snapshot it was written from
+    """
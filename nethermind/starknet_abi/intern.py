@@ -0,0 +1,125 @@
+from typing import TypeVar
+
+from nethermind.starknet_abi.abi_types import (
+    AbiParameter,
+    StarknetArray,
+    StarknetCoreType,
+    StarknetEnum,
+    StarknetNonZero,
+    StarknetOption,
+    StarknetStruct,
+    StarknetTuple,
+    StarknetType,
+)
+
+_T = TypeVar("_T", bound=StarknetType)
+
+
+class TypeInterner:
+    """
+    Intern table for StarknetTypes and AbiParameters.  Structurally identical types, including struct, enum, member
+    and variant names, are resolved to a single shared object, so common types like u256 structs, spans, and
+    OpenZeppelin event structs exist once in memory, regardless of how many ABIs define them.
+
+    Types are interned bottom-up as they are parsed, so the children of a type are always interned before the type
+    itself.  The intern key of a type only contains the ids of its interned children, and is computed without
+    walking the type tree.
+
+    A TypeInterner can be shared by all ABIs loaded into a DecodingDispatcher, or used as a global intern table.
+
+    .. doctest::
+
+        >>> from nethermind.starknet_abi.core import StarknetAbi
+        >>> from nethermind.starknet_abi.intern import TypeInterner
+        >>> abi_json = [
+        ...     {"type": "struct", "name": "Pair", "members": [
+        ...         {"name": "a", "type": "core::felt252"}, {"name": "b", "type": "core::felt252"}
+        ...     ]},
+        ...     {"type": "function", "name": "swap", "inputs": [{"name": "pair", "type": "Pair"}], "outputs": []},
+        ... ]
+        >>> interner = TypeInterner()
+        >>> first_abi = StarknetAbi.from_json(abi_json, interner=interner)
+        >>> second_abi = StarknetAbi.from_json(abi_json, interner=interner)
+        >>> first_abi.functions["swap"].inputs[0] is second_abi.functions["swap"].inputs[0]
+        True
+        >>> interner.unique_nodes, interner.nodes_saved
+        (4, 4)
+    """
+
+    def __init__(self) -> None:
+        self._types: dict[tuple, StarknetType] = {}
+        self._parameters: dict[tuple[str, int], AbiParameter] = {}
+
+        # Number of duplicate type and parameter objects replaced by an interned object
+        self.nodes_saved = 0
+
+    def __len__(self) -> int:
+        return self.unique_nodes
+
+    @property
+    def unique_nodes(self) -> int:
+        """Number of distinct types and parameters stored in the intern table"""
+        return len(self._types) + len(self._parameters)
+
+    def clear(self):
+        """Clears the intern table and statistics"""
+        self._types.clear()
+        self._parameters.clear()
+        self.nodes_saved = 0
+
+    def intern_type(self, starknet_type: _T) -> _T:
+        """
+        Returns the interned instance of a type.  The children of the type must already be interned.
+
+        :param starknet_type: StarknetType with interned children
+        :return: shared StarknetType, structurally identical to starknet_type
+        """
+        if isinstance(starknet_type, StarknetCoreType):
+            return starknet_type
+
+        key = self._type_key(starknet_type)
+        interned = self._types.get(key)
+        if interned is None:
+            self._types[key] = starknet_type
+            return starknet_type
+
+        if interned is not starknet_type:
+            self.nodes_saved += 1
+        return interned  # type: ignore[return-value]
+
+    def intern_parameter(self, parameter: AbiParameter) -> AbiParameter:
+        """
+        Returns the interned instance of an AbiParameter.  The type of the parameter must already be interned.
+
+        :param parameter: AbiParameter with an interned type
+        :return: shared AbiParameter with identical name and type
+        """
+        key = (parameter.name, id(parameter.type))
+        interned = self._parameters.get(key)
+        if interned is None:
+            self._parameters[key] = parameter
+            return parameter
+
+        if interned is not parameter:
+            self.nodes_saved += 1
+        return interned
+
+    @staticmethod
+    def _type_key(starknet_type: StarknetType) -> tuple:
+        # Children are interned, so their ids uniquely identify their structure.  Interned objects are
+        # referenced by the intern table, so their ids are never reused
+        match starknet_type:
+            case StarknetArray(inner_type=inner_type):
+                return StarknetArray, id(inner_type)
+            case StarknetOption(inner_type=inner_type):
+                return StarknetOption, id(inner_type)
+            case StarknetNonZero(inner_type=inner_type):
+                return StarknetNonZero, id(inner_type)
+            case StarknetTuple(members=members):
+                return StarknetTuple, *[id(member) for member in members]
+            case StarknetStruct(name=name, members=members):
+                return StarknetStruct, name, *[id(member) for member in members]
+            case StarknetEnum(name=name, variants=variants):
+                return StarknetEnum, name, *[(variant, id(type_)) for variant, type_ in variants]
+
+        raise TypeError(f"Cannot intern type {starknet_type}")
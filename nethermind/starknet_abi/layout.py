@@ -0,0 +1,153 @@
+from dataclasses import dataclass
+from typing import Sequence
+
+from nethermind.starknet_abi.abi_types import (
+    AbiParameter,
+    StarknetArray,
+    StarknetCoreType,
+    StarknetEnum,
+    StarknetNonZero,
+    StarknetOption,
+    StarknetStruct,
+    StarknetTuple,
+    StarknetType,
+)
+
+
+@dataclass(slots=True, frozen=True)
+class TypeLayout:
+    """
+    Felt layout of an encoded StarknetType.  Fixed width types always encode to the same number of felts, and
+    variable width types, like Arrays, depend on the encoded value.
+
+    .. doctest::
+
+        >>> from nethermind.starknet_abi.layout import type_layout
+        >>> from nethermind.starknet_abi.abi_types import StarknetArray, StarknetCoreType, StarknetTuple
+        >>> type_layout(StarknetTuple([StarknetCoreType.U256, StarknetCoreType.ContractAddress]))
+        TypeLayout(width=3, min_width=3, member_offsets=(0, 2))
+        >>> type_layout(StarknetTuple([StarknetArray(StarknetCoreType.U8), StarknetCoreType.Bool]))
+        TypeLayout(width=None, min_width=2, member_offsets=(0, None))
+    """
+
+    # Number of felts of fixed width types, or None for variable width types
+    width: int | None
+
+    # Minimum number of felts of any encoded value
+    min_width: int
+
+    # Offset of each Struct or Tuple member from the start of the value.  Members following a variable width member
+    # do not have a static offset, and are None
+    member_offsets: tuple[int | None, ...] = ()
+
+    @property
+    def is_fixed(self) -> bool:
+        """True if every encoded value has the same width"""
+        return self.width is not None
+
+
+def _members_layout(member_types: Sequence[StarknetType]) -> TypeLayout:
+    member_offsets: list[int | None] = []
+    offset: int | None = 0
+    min_width = 0
+
+    for member_type in member_types:
+        member_offsets.append(offset)
+        member_layout = type_layout(member_type)
+        min_width += member_layout.min_width
+        offset = (
+            None if offset is None or member_layout.width is None else offset + member_layout.width
+        )
+
+    return TypeLayout(offset, min_width, tuple(member_offsets))
+
+
+def _compute_layout(  # pylint: disable=too-many-return-statements
+    starknet_type: StarknetType,
+) -> TypeLayout:
+    if isinstance(starknet_type, StarknetCoreType):
+        width = {
+            StarknetCoreType.U256: 2,
+            StarknetCoreType.U512: 4,
+            StarknetCoreType.NoneType: 0,
+        }.get(starknet_type, 1)
+        return TypeLayout(width, width)
+
+    if isinstance(starknet_type, StarknetStruct):
+        return _members_layout([member.type for member in starknet_type.members])
+
+    if isinstance(starknet_type, StarknetTuple):
+        return _members_layout(starknet_type.members)
+
+    if isinstance(starknet_type, StarknetNonZero):
+        return type_layout(starknet_type.inner_type)
+
+    if isinstance(starknet_type, StarknetArray):
+        return TypeLayout(None, 1)  # Empty arrays only encode the length
+
+    if isinstance(starknet_type, StarknetOption):
+        # None is encoded as a single felt, and Some as a felt followed by the inner value
+        inner_layout = type_layout(starknet_type.inner_type)
+        return TypeLayout(1 if inner_layout.width == 0 else None, 1)
+
+    if isinstance(starknet_type, StarknetEnum):
+        # Enums are fixed width if every variant has the same width
+        variant_layouts = [type_layout(variant_type) for _, variant_type in starknet_type.variants]
+        variant_widths = {variant_layout.width for variant_layout in variant_layouts}
+        fixed_width = variant_widths.pop() if len(variant_widths) == 1 else None
+        return TypeLayout(
+            None if fixed_width is None else fixed_width + 1,
+            1 + min((variant_layout.min_width for variant_layout in variant_layouts), default=0),
+        )
+
+    raise TypeError(f"Cannot compute layout of Type: {starknet_type}")
+
+
+_CORE_LAYOUTS: dict[StarknetCoreType, TypeLayout] = {
+    core_type: _compute_layout(core_type) for core_type in StarknetCoreType
+}
+
+
+def type_layout(starknet_type: StarknetType) -> TypeLayout:
+    """
+    Returns the felt layout of a StarknetType.  Layouts are computed once, and cached on the type object.
+
+    .. doctest::
+
+        >>> from nethermind.starknet_abi.layout import type_layout
+        >>> from nethermind.starknet_abi.abi_types import StarknetArray, StarknetCoreType
+        >>> type_layout(StarknetCoreType.U256).width
+        2
+        >>> type_layout(StarknetArray(StarknetCoreType.U256)).is_fixed
+        False
+
+    :param starknet_type: StarknetType to analyze
+    :return: TypeLayout of the type
+    """
+    # pylint: disable=protected-access
+    if isinstance(starknet_type, StarknetCoreType):
+        return _CORE_LAYOUTS[starknet_type]
+
+    if starknet_type._layout is None:
+        starknet_type._layout = _compute_layout(starknet_type)
+    return starknet_type._layout
+
+
+def params_layout(params: Sequence[AbiParameter]) -> TypeLayout:
+    """
+    Returns the felt layout of a sequence of parameters, like the inputs of a function.  The min_width is the
+    minimum calldata length of the parameters, and member_offsets holds the static offset of each parameter.
+
+    .. doctest::
+
+        >>> from nethermind.starknet_abi.layout import params_layout
+        >>> from nethermind.starknet_abi.abi_types import AbiParameter, StarknetArray, StarknetCoreType
+        >>> params_layout(
+        ...     [AbiParameter("amount", StarknetCoreType.U256), AbiParameter("calls", StarknetArray(StarknetCoreType.Felt))]
+        ... )
+        TypeLayout(width=None, min_width=3, member_offsets=(0, 2))
+
+    :param params: Sequence of AbiParameters
+    :return: TypeLayout of the parameters
+    """
+    return _members_layout([param.type for param in params])
@@ -0,0 +1,363 @@
+from collections.abc import Mapping
+from collections.abc import Sequence as SequenceABC
+from typing import Any, Iterator, Sequence
+
+from nethermind.starknet_abi.abi_types import (
+    AbiParameter,
+    StarknetArray,
+    StarknetEnum,
+    StarknetStruct,
+    StarknetType,
+)
+from nethermind.starknet_abi.decode import (
+    OutputFormat,
+    compile_decoder,
+    compile_skipper,
+    decode_from_params_at,
+    decode_type_at,
+)
+from nethermind.starknet_abi.decoding_types import AbiFunction
+from nethermind.starknet_abi.exceptions import InvalidCalldataError
+from nethermind.starknet_abi.layout import params_layout, type_layout
+
+_NOT_DECODED = object()
+
+
+def decode_lazy(
+    starknet_type: StarknetType,
+    calldata: Sequence[int],
+    offset: int = 0,
+    output_format: OutputFormat = OutputFormat.HEX,
+) -> Any:
+    """
+    Decodes a StarknetType lazily.  Structs, Arrays and Enums are returned as :class:`LazyStruct`,
+    :class:`LazyArray` and :class:`LazyEnum` views, and all other types are decoded immediately.
+
+    :param starknet_type: StarknetType to decode
+    :param calldata: Immutable sequence of calldata.  Views hold a reference to the calldata until discarded
+    :param offset: Index of the first felt of the encoded value
+    :param output_format: Representation of decoded felts and addresses.  Defaults to hex strings
+    :return: lazy view, or the decoded value
+    """
+    if isinstance(starknet_type, StarknetStruct):
+        return LazyStruct(
+            starknet_type.members,
+            calldata,
+            offset,
+            output_format,
+            type_layout(starknet_type).member_offsets,
+        )
+    if isinstance(starknet_type, StarknetArray):
+        return LazyArray(starknet_type, calldata, offset, output_format)
+    if isinstance(starknet_type, StarknetEnum):
+        return LazyEnum(starknet_type, calldata, offset, output_format)
+
+    return decode_type_at(starknet_type, calldata, offset, output_format)[0]
+
+
+class LazyStruct(Mapping):
+    """
+    Read-only mapping over an encoded struct, or the parameters of a function.  Members are only decoded when
+    accessed, and are memoized.  The offset of a member is found by skipping the preceding members, which is a
+    constant jump for fixed width members, so reading a single member does not decode the rest of the calldata.
+
+    Nested Structs, Arrays and Enums are returned as lazy views.  Lazy views compare equal to the plain values
+    returned by :func:`decode_from_params`, and :meth:`to_dict` decodes the whole struct into a plain dict.
+
+    .. doctest::
+
+        >>> from nethermind.starknet_abi.lazy import LazyStruct
+        >>> from nethermind.starknet_abi.abi_types import AbiParameter, StarknetArray, StarknetCoreType
+        >>> params = [
+        ...     AbiParameter("routes", StarknetArray(StarknetCoreType.U128)),
+        ...     AbiParameter("amount", StarknetCoreType.U256),
+        ... ]
+        >>> decoded = LazyStruct(params, [3, 10, 20, 30, 500, 0])
+        >>> decoded["amount"]
+        500
+        >>> decoded["routes"][-1]
+        30
+        >>> decoded.to_dict()
+        {'routes': [10, 20, 30], 'amount': 500}
+
+    :param members: parameters of the struct, in encoding order
+    :param calldata: Immutable sequence of calldata
+    :param offset: Index of the first felt of the struct
+    :param output_format: Representation of decoded felts and addresses.  Defaults to hex strings
+    :param member_offsets: Optional static offset of each member from the start of the struct, from
+        :attr:`TypeLayout.member_offsets`.  Members with a static offset are read by direct indexing
+    """
+
+    __slots__ = (
+        "members",
+        "calldata",
+        "offset",
+        "output_format",
+        "_member_offsets",
+        "_offsets",
+        "_values",
+    )
+
+    def __init__(
+        self,
+        members: Sequence[AbiParameter],
+        calldata: Sequence[int],
+        offset: int = 0,
+        output_format: OutputFormat = OutputFormat.HEX,
+        member_offsets: Sequence[int | None] | None = None,
+    ):
+        self.members = members
+        self.calldata = calldata
+        self.offset = offset
+        self.output_format = output_format
+
+        self._member_offsets = member_offsets or ()
+        self._offsets = [offset]  # Start offset of each member resolved by skipping
+        self._values: dict[str, Any] = {}
+
+    def _member_offset(self, index: int) -> int:
+        if index < len(self._member_offsets):
+            static_offset = self._member_offsets[index]
+            if static_offset is not None:
+                return self.offset + static_offset
+
+        offsets = self._offsets
+        while len(offsets) <= index:
+            member_type = self.members[len(offsets) - 1].type
+            offsets.append(compile_skipper(member_type)(self.calldata, offsets[-1]))
+        return offsets[index]
+
+    def __getitem__(self, name: str) -> Any:
+        value = self._values.get(name, _NOT_DECODED)
+        if value is not _NOT_DECODED:
+            return value
+
+        for index, member in enumerate(self.members):
+            if member.name == name:
+                value = self._values[name] = decode_lazy(
+                    member.type, self.calldata, self._member_offset(index), self.output_format
+                )
+                return value
+
+        raise KeyError(name)
+
+    def __iter__(self) -> Iterator[str]:
+        return (member.name for member in self.members)
+
+    def __len__(self) -> int:
+        return len(self.members)
+
+    def __repr__(self) -> str:
+        return f"LazyStruct({[member.name for member in self.members]}, offset={self.offset})"
+
+    @property
+    def end_offset(self) -> int:
+        """Offset of the first felt after the struct"""
+        return self._member_offset(len(self.members))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Decodes every member, returning the same dict as :func:`decode_from_params`"""
+        decoded, _ = decode_from_params_at(
+            self.members, self.calldata, self.offset, self.output_format
+        )
+        return decoded
+
+
+class LazyArray(SequenceABC):
+    """
+    Read-only sequence over an encoded array.  Only the array length is read when the view is created, and
+    elements are decoded when accessed, and memoized.  Elements of fixed width types are located by direct
+    indexing, and variable width elements by skipping the preceding elements.
+
+    :param array_type: StarknetArray of the encoded value
+    :param calldata: Immutable sequence of calldata
+    :param offset: Index of the array length felt
+    :param output_format: Representation of decoded felts and addresses.  Defaults to hex strings
+    """
+
+    __slots__ = (
+        "array_type",
+        "calldata",
+        "offset",
+        "output_format",
+        "_length",
+        "_element_width",
+        "_offsets",
+        "_values",
+    )
+
+    def __init__(
+        self,
+        array_type: StarknetArray,
+        calldata: Sequence[int],
+        offset: int = 0,
+        output_format: OutputFormat = OutputFormat.HEX,
+    ):
+        try:
+            self._length: int = calldata[offset]
+        except IndexError:
+            raise InvalidCalldataError(  # pylint: disable=raise-missing-from
+                f"Insufficient Calldata to decode {array_type}"
+            )
+
+        self.array_type = array_type
+        self.calldata = calldata
+        self.offset = offset
+        self.output_format = output_format
+
+        self._element_width = type_layout(array_type.inner_type).width
+        self._offsets = [offset + 1]  # Start offset of each element resolved so far
+        self._values: dict[int, Any] = {}
+
+    def _element_offset(self, index: int) -> int:
+        if self._element_width is not None:
+            return self.offset + 1 + index * self._element_width
+
+        offsets, skipper = self._offsets, compile_skipper(self.array_type.inner_type)
+        while len(offsets) <= index:
+            offsets.append(skipper(self.calldata, offsets[-1]))
+        return offsets[index]
+
+    def __getitem__(self, index):  # type: ignore[override]
+        if isinstance(index, slice):
+            return [self[element] for element in range(*index.indices(self._length))]
+
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("array index out of range")
+
+        value = self._values.get(index, _NOT_DECODED)
+        if value is _NOT_DECODED:
+            value = self._values[index] = decode_lazy(
+                self.array_type.inner_type,
+                self.calldata,
+                self._element_offset(index),
+                self.output_format,
+            )
+        return value
+
+    def __iter__(self) -> Iterator[Any]:
+        return (self[index] for index in range(self._length))
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (list, LazyArray)):
+            return len(self) == len(other) and all(
+                value == other_value for value, other_value in zip(self, other)
+            )
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"LazyArray({self.array_type.id_str()}, length={self._length}, offset={self.offset})"
+
+    @property
+    def end_offset(self) -> int:
+        """Offset of the first felt after the array"""
+        return compile_skipper(self.array_type)(self.calldata, self.offset)
+
+    def to_list(self) -> list[Any]:
+        """Decodes every element, returning the same list as :func:`decode_from_types`"""
+        return compile_decoder(self.array_type, self.output_format)(self.calldata, self.offset)[0]
+
+
+class LazyEnum(Mapping):
+    """
+    Read-only mapping over an encoded enum, with the variant name as the only key.  The variant index is read
+    when the view is created, and the variant value is decoded on first access.
+
+    :param enum_type: StarknetEnum of the encoded value
+    :param calldata: Immutable sequence of calldata
+    :param offset: Index of the variant index felt
+    :param output_format: Representation of decoded felts and addresses.  Defaults to hex strings
+    """
+
+    __slots__ = (
+        "enum_type",
+        "calldata",
+        "offset",
+        "output_format",
+        "variant",
+        "_variant_type",
+        "_value",
+    )
+
+    def __init__(
+        self,
+        enum_type: StarknetEnum,
+        calldata: Sequence[int],
+        offset: int = 0,
+        output_format: OutputFormat = OutputFormat.HEX,
+    ):
+        try:
+            self.variant, self._variant_type = enum_type.variants[calldata[offset]]
+        except IndexError:
+            raise InvalidCalldataError(  # pylint: disable=raise-missing-from
+                f"Insufficient Calldata to decode {enum_type}"
+            )
+
+        self.enum_type = enum_type
+        self.calldata = calldata
+        self.offset = offset
+        self.output_format = output_format
+        self._value: Any = _NOT_DECODED
+
+    @property
+    def value(self) -> Any:
+        """Decoded value of the variant"""
+        if self._value is _NOT_DECODED:
+            self._value = decode_lazy(
+                self._variant_type, self.calldata, self.offset + 1, self.output_format
+            )
+        return self._value
+
+    def __getitem__(self, name: str) -> Any:
+        if name != self.variant:
+            raise KeyError(name)
+        return self.value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter((self.variant,))
+
+    def __len__(self) -> int:
+        return 1
+
+    def __repr__(self) -> str:
+        return f"LazyEnum({self.enum_type.name}.{self.variant}, offset={self.offset})"
+
+    @property
+    def end_offset(self) -> int:
+        """Offset of the first felt after the enum"""
+        return compile_skipper(self.enum_type)(self.calldata, self.offset)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Decodes the variant, returning the same dict as :func:`decode_from_types`"""
+        return compile_decoder(self.enum_type, self.output_format)(self.calldata, self.offset)[0]
+
+
+def decode_function_lazy(
+    function: AbiFunction,
+    calldata: Sequence[int],
+    output_format: OutputFormat = OutputFormat.HEX,
+) -> LazyStruct:
+    """
+    Lazily decodes the inputs of a function.  Inputs are decoded when accessed, so reading a few inputs of a
+    function with large array inputs only decodes the inputs that are read.  The calldata length is not
+    validated until the inputs are accessed, or :attr:`LazyStruct.end_offset` is compared to the calldata length.
+
+    :param function: AbiFunction of the calldata
+    :param calldata: Immutable sequence of calldata
+    :param output_format: Representation of decoded felts and addresses.  Defaults to hex strings
+    :return: LazyStruct of the function inputs
+    """
+    return LazyStruct(
+        function.inputs,
+        calldata,
+        0,
+        output_format,
+        params_layout(function.inputs).member_offsets,
+    )
@@ -0,0 +1,213 @@
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
+from itertools import islice
+from multiprocessing.context import BaseContext
+from os import PathLike
+from pathlib import Path
+from typing import Callable, Iterator
+
+from nethermind.starknet_abi.core import AbiParseCache, StarknetAbi
+from nethermind.starknet_abi.dispatch import DecodingDispatcher
+
+# (class_hash, abi_name, content_hash, parsed ABI or None if already parsed by the worker, error message)
+_ParsedRecord = tuple[bytes | None, str | None, bytes | None, StarknetAbi | None, str | None]
+
+# Content hashes parsed by the current worker process.  Duplicate ABIs are only parsed once per worker
+_worker_parsed: set[bytes] = set()
+
+# Number of error messages kept in BulkLoadStats.errors
+_MAX_ERRORS = 100
+
+
+@dataclass(slots=True)
+class BulkLoadStats:
+    """
+    Progress and throughput of a bulk ABI load.  Passed to the progress callback while loading, and returned once
+    the load is complete.
+    """
+
+    records: int = 0  # Records read from the dump
+    unique_abis: int = 0  # Distinct ABIs parsed
+    duplicate_abis: int = 0  # Records with an ABI identical to an already parsed ABI
+    failed: int = 0  # Records that could not be parsed
+    bytes_read: int = 0  # Size of the raw JSON read
+    elapsed: float = 0.0  # Seconds since the load started
+
+    errors: list[str] = field(default_factory=list, repr=False)  # First errors encountered
+
+    @property
+    def records_per_second(self) -> float:
+        """Record throughput of the load"""
+        return self.records / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def megabytes_per_second(self) -> float:
+        """Input throughput of the load, in MB/s"""
+        return self.bytes_read / 1_000_000 / self.elapsed if self.elapsed else 0.0
+
+
+def _parse_class_hash(class_hash: str | bytes) -> bytes:
+    if isinstance(class_hash, bytes):
+        return class_hash.rjust(32, b"\x00")
+    return int(class_hash, 16).to_bytes(32, "big")
+
+
+def _parse_record(raw_record: str, class_hash: str | None) -> _ParsedRecord:
+    try:
+        record = json.loads(raw_record)
+        if class_hash is None:  # JSONL record containing the class hash and ABI
+            class_hash, abi_json, abi_name = (
+                record["class_hash"],
+                record["abi"],
+                record.get("abi_name"),
+            )
+        else:  # Per-class JSON file, containing the ABI, or a record with the ABI
+            abi_json, abi_name = (
+                (record["abi"], record.get("abi_name"))
+                if isinstance(record, dict)
+                else (record, None)
+            )
+
+        # Some dumps store the ABI as a JSON encoded string
+        if isinstance(abi_json, str):
+            abi_json = json.loads(abi_json)
+
+        parsed_hash = _parse_class_hash(class_hash)
+        content_hash = AbiParseCache.content_hash(abi_json)
+        if content_hash in _worker_parsed:
+            return parsed_hash, abi_name, content_hash, None, None
+
+        parsed_abi = StarknetAbi.from_json(abi_json)
+        _worker_parsed.add(content_hash)
+        return parsed_hash, abi_name, content_hash, parsed_abi, None
+
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        return None, None, None, None, f"{class_hash or 'JSONL Record'}: {e!r}"
+
+
+def _init_worker():
+    _worker_parsed.clear()
+
+
+def _parse_chunk(chunk: list[tuple[str, str | None]]) -> list[_ParsedRecord]:
+    return [_parse_record(raw_record, class_hash) for raw_record, class_hash in chunk]
+
+
+def iter_abi_records(path: str | PathLike) -> Iterator[tuple[str, str | None]]:
+    """
+    Streams raw ABI records from a class dump.  Records are not decoded, so only a single line or file is held in
+    memory at a time.
+
+    * JSONL files contain one ``{"class_hash": "0x...", "abi": [...]}`` record per line.  The ABI can also be a JSON
+      encoded string, and an optional ``abi_name`` can be included.
+    * Directories contain one ``<class_hash>.json`` file per class, containing the JSON ABI, or a record with an
+      ``abi`` key.
+
+    :param path: JSONL file, or directory of per-class JSON files
+    :return: iterator of (raw JSON, class_hash or None if the class hash is part of the record)
+    """
+    path = Path(path)
+    if path.is_dir():
+        for class_file in sorted(path.glob("*.json")):
+            yield class_file.read_text(), class_file.stem
+        return
+
+    with open(path, "r", encoding="utf-8") as dump_file:
+        for line in dump_file:
+            if line.strip():
+                yield line, None
+
+
+def bulk_load_abis(  # pylint: disable=too-many-arguments,too-many-locals
+    dispatcher: DecodingDispatcher,
+    path: str | PathLike,
+    max_workers: int | None = None,
+    chunk_size: int = 256,
+    progress_callback: Callable[[BulkLoadStats], None] | None = None,
+    progress_interval: float = 5.0,
+    mp_context: BaseContext | None = None,
+) -> BulkLoadStats:
+    """
+    Streams a bulk class dump into a DecodingDispatcher, parsing ABIs in parallel across worker processes.
+
+    Raw records are read lazily, and at most ``2 * max_workers`` chunks are in flight, so memory usage is bounded
+    regardless of the size of the dump.  ABIs are deduplicated by the hash of their canonical JSON, so each distinct
+    ABI is parsed once, and classes with identical ABIs share the parsed functions and events.  Records that fail to
+    parse are counted, and do not stop the load.
+
+    .. code-block:: python
+
+        stats = bulk_load_abis(
+            dispatcher,
+            "mainnet_classes.jsonl",
+            progress_callback=lambda stats: print(f"{stats.records} classes, {stats.records_per_second:.0f}/s"),
+        )
+
+    :param dispatcher: DecodingDispatcher to add ABIs to
+    :param path: JSONL file, or directory of per-class JSON files.  See :func:`iter_abi_records`
+    :param max_workers: Number of parsing processes.  Defaults to the number of CPUs
+    :param chunk_size: Number of records parsed in each task
+    :param progress_callback: Optional callback, called with the current BulkLoadStats while loading
+    :param progress_interval: Minimum number of seconds between progress callbacks
+    :param mp_context: Optional multiprocessing context used to start the workers
+    :return: BulkLoadStats of the completed load
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer")
+
+    max_workers = max_workers or os.cpu_count() or 1
+    stats = BulkLoadStats()
+    parsed_abis: dict[bytes, StarknetAbi] = {}
+
+    start_time, last_progress = time.perf_counter(), 0.0
+    records = iter_abi_records(path)
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers, mp_context=mp_context, initializer=_init_worker
+    ) as executor:
+        pending: deque[Future] = deque()
+        while True:
+            while len(pending) < 2 * max_workers:
+                chunk = list(islice(records, chunk_size))
+                if not chunk:
+                    break
+                stats.bytes_read += sum(len(raw_record) for raw_record, _ in chunk)
+                pending.append(executor.submit(_parse_chunk, chunk))
+
+            if not pending:
+                break
+
+            for class_hash, abi_name, content_hash, parsed_abi, error in pending.popleft().result():
+                stats.records += 1
+                if error is not None or class_hash is None or content_hash is None:
+                    stats.failed += 1
+                    if len(stats.errors) < _MAX_ERRORS:
+                        stats.errors.append(str(error))
+                    continue
+
+                if content_hash in parsed_abis:
+                    stats.duplicate_abis += 1
+                else:
+                    # Workers process chunks in submission order, so a worker only skips an ABI after returning it
+                    assert parsed_abi is not None, "Parsed ABI missing from worker result"
+                    parsed_abis[content_hash] = parsed_abi
+                    stats.unique_abis += 1
+
+                dispatcher.add_abi(
+                    replace(parsed_abis[content_hash], class_hash=class_hash, abi_name=abi_name)
+                )
+
+            stats.elapsed = time.perf_counter() - start_time
+            if progress_callback is not None and stats.elapsed - last_progress >= progress_interval:
+                last_progress = stats.elapsed
+                progress_callback(stats)
+
+    stats.elapsed = time.perf_counter() - start_time
+    if progress_callback is not None:
+        progress_callback(stats)
+
+    return stats
@@ -0,0 +1,500 @@
+import marshal
+import mmap
+import struct
+from bisect import bisect_left
+from os import PathLike, fspath
+from typing import Callable, Iterator, Mapping, Sequence
+
+from nethermind.starknet_abi.abi_types import AbiParameter, StarknetType
+from nethermind.starknet_abi.core import StarknetAbi
+from nethermind.starknet_abi.dispatch import (
+    ClassDispatcher,
+    DecodingDispatcher,
+    EventDispatchInfo,
+    FunctionDispatchInfo,
+)
+from nethermind.starknet_abi.exceptions import ReadOnlyDispatcherError
+from nethermind.starknet_abi.snapshot import _SnapshotReader, _SnapshotWriter
+
+MAPPED_INDEX_MAGIC = b"SNABIMAP"
+MAPPED_INDEX_VERSION = 3
+
+# magic, version, marshal_version, class_count, function_entry_count, event_entry_count, function_type_count,
+# event_type_count, string_count, string_offsets_offset, string_data_offset, type_data_offset
+_HEADER = struct.Struct(">8sHHIIIIIIQQQ")
+
+# class_hash, function_start, function_count, event_start, event_count, abi_name_id
+_CLASS_RECORD = struct.Struct(">32sIIIIi")
+
+# selector_id, decoder_reference, name_id
+_ENTRY_RECORD = struct.Struct(">8s8sI")
+
+# selector_id, decoder_reference, name_id, nested_start, nested_count
+_EVENT_RECORD = struct.Struct(">8s8siII")
+
+# Stored in place of the decoder_reference of event selectors that only route to nested events
+_NO_DECODER = bytes(8)
+
+# decoder_reference, type_data offset, type_data length
+_TYPE_RECORD = struct.Struct(">8sQI")
+
+_STRING_OFFSET = struct.Struct(">Q")
+
+_NO_STRING = -1
+
+
+class _RecordKeys(Sequence[bytes]):
+    """Sequence view over the sort keys of fixed-size records, allowing binary search with bisect"""
+
+    def __init__(
+        self, buffer: mmap.mmap, offset: int, count: int, record_size: int, key_slice: slice
+    ):
+        self.buffer = buffer
+        self.offset = offset
+        self.length = count
+        self.record_size = record_size
+        self.key_start, self.key_end = key_slice.start, key_slice.stop
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getitem__(self, index):  # type: ignore[override]
+        record_offset = self.offset + index * self.record_size
+        return self.buffer[record_offset + self.key_start : record_offset + self.key_end]
+
+    def find(self, key: bytes) -> int | None:
+        """Returns the index of the record with the key, or None if the key is not present"""
+        index = bisect_left(self, key)
+        if index < self.length and self[index] == key:
+            return index
+        return None
+
+
+class _MappedIndex:
+    """
+    Read-only view over a mapped index file.  The file is memory-mapped, so the index pages are loaded on demand, and
+    shared through the OS page cache between every process mapping the same file.
+    """
+
+    def __init__(self, path: str | PathLike):
+        self.path = fspath(path)
+        with open(self.path, "rb") as index_file:
+            self.buffer = mmap.mmap(index_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        (
+            magic,
+            version,
+            marshal_version,
+            self.class_count,
+            function_entry_count,
+            event_entry_count,
+            function_type_count,
+            event_type_count,
+            self.string_count,
+            self.string_offsets_offset,
+            string_data_offset,
+            self.type_data_offset,
+        ) = _HEADER.unpack_from(self.buffer, 0)
+
+        if magic != MAPPED_INDEX_MAGIC:
+            raise ValueError("File is not a Mapped DecodingDispatcher Index")
+        if version != MAPPED_INDEX_VERSION:
+            raise ValueError(
+                f"Unsupported Mapped DecodingDispatcher Index version {version}.  Expected {MAPPED_INDEX_VERSION}"
+            )
+        if marshal_version != marshal.version:
+            raise ValueError(
+                f"Mapped DecodingDispatcher Index was written with marshal version {marshal_version}, and cannot be "
+                f"loaded by this interpreter with marshal version {marshal.version}.  Rebuild the index"
+            )
+
+        self.class_offset = _HEADER.size
+        self.function_entry_offset = self.class_offset + self.class_count * _CLASS_RECORD.size
+        self.event_entry_offset = (
+            self.function_entry_offset + function_entry_count * _ENTRY_RECORD.size
+        )
+        function_type_offset = self.event_entry_offset + event_entry_count * _EVENT_RECORD.size
+        event_type_offset = function_type_offset + function_type_count * _TYPE_RECORD.size
+        self.string_data_offset = string_data_offset
+
+        self.class_keys = _RecordKeys(
+            self.buffer, self.class_offset, self.class_count, _CLASS_RECORD.size, slice(24, 32)
+        )
+        self.function_type_keys = _RecordKeys(
+            self.buffer, function_type_offset, function_type_count, _TYPE_RECORD.size, slice(0, 8)
+        )
+        self.event_type_keys = _RecordKeys(
+            self.buffer, event_type_offset, event_type_count, _TYPE_RECORD.size, slice(0, 8)
+        )
+
+    def __reduce__(self):
+        # Each process re-maps the file, instead of copying the index
+        return _MappedIndex, (self.path,)
+
+    def close(self):
+        """Unmaps the index file"""
+        self.buffer.close()
+
+    def string(self, string_id: int) -> str:
+        """Reads a string from the string table"""
+        start, end = struct.unpack_from(
+            ">QQ", self.buffer, self.string_offsets_offset + string_id * _STRING_OFFSET.size
+        )
+        return self.buffer[self.string_data_offset + start : self.string_data_offset + end].decode()
+
+    def read_class(self, index: int) -> ClassDispatcher:
+        """Materializes the ClassDispatcher of the class record at index"""
+        class_hash, function_start, function_count, event_start, event_count, abi_name_id = (
+            _CLASS_RECORD.unpack_from(self.buffer, self.class_offset + index * _CLASS_RECORD.size)
+        )
+
+        function_ids = {}
+        for selector, decoder_reference, name_id in _ENTRY_RECORD.iter_unpack(
+            self.buffer[
+                self.function_entry_offset
+                + function_start * _ENTRY_RECORD.size : self.function_entry_offset
+                + (function_start + function_count) * _ENTRY_RECORD.size
+            ]
+        ):
+            function_ids[selector] = FunctionDispatchInfo(decoder_reference, self.string(name_id))
+
+        return ClassDispatcher(
+            function_ids=function_ids,
+            event_ids=self.read_events(event_start, event_count),
+            abi_name=None if abi_name_id == _NO_STRING else self.string(abi_name_id),
+            class_hash=class_hash,
+        )
+
+    def read_events(self, start: int, count: int) -> dict[bytes, EventDispatchInfo]:
+        """Materializes a range of event entries, and the nested event entries they reference"""
+        event_ids = {}
+        for (
+            selector,
+            decoder_reference,
+            name_id,
+            nested_start,
+            nested_count,
+        ) in _EVENT_RECORD.iter_unpack(
+            self.buffer[
+                self.event_entry_offset
+                + start * _EVENT_RECORD.size : self.event_entry_offset
+                + (start + count) * _EVENT_RECORD.size
+            ]
+        ):
+            event_ids[selector] = EventDispatchInfo(
+                None if decoder_reference == _NO_DECODER else decoder_reference,
+                None if name_id == _NO_STRING else self.string(name_id),
+                self.read_events(nested_start, nested_count) if nested_count else None,
+            )
+        return event_ids
+
+    def read_types(self, type_keys: _RecordKeys, index: int) -> tuple:
+        """Reads the marshal encoded type tables of the type record at index"""
+        _, data_offset, data_length = _TYPE_RECORD.unpack_from(
+            self.buffer, type_keys.offset + index * _TYPE_RECORD.size
+        )
+        start = self.type_data_offset + data_offset
+        return marshal.loads(self.buffer[start : start + data_length])
+
+
+class _MappedClassIds(Mapping[bytes, ClassDispatcher]):
+    """Lazy mapping of class ids to ClassDispatchers.  Classes are read from the index on first access"""
+
+    def __init__(self, index: _MappedIndex):
+        self.index = index
+        self.materialized: dict[bytes, ClassDispatcher] = {}
+
+    def __reduce__(self):
+        return _MappedClassIds, (self.index,)
+
+    def get(self, key, default=None):
+        class_dispatcher = self.materialized.get(key)
+        if class_dispatcher is not None:
+            return class_dispatcher
+
+        # Missing classes are not cached, so lookups of unknown classes do not grow the cache
+        record_index = self.index.class_keys.find(key)
+        if record_index is None:
+            return default
+
+        class_dispatcher = self.materialized[key] = self.index.read_class(record_index)
+        return class_dispatcher
+
+    def __getitem__(self, key: bytes) -> ClassDispatcher:
+        class_dispatcher = self.get(key)
+        if class_dispatcher is None:
+            raise KeyError(key)
+        return class_dispatcher
+
+    def __contains__(self, key: object) -> bool:
+        return self.get(key) is not None
+
+    def __iter__(self) -> Iterator[bytes]:
+        return (self.index.class_keys[record] for record in range(self.index.class_count))
+
+    def __len__(self) -> int:
+        return self.index.class_count
+
+
+class _MappedTypes(Mapping[bytes, tuple]):
+    """Lazy mapping of decoder references to function or event types.  Type trees are built on first access"""
+
+    def __init__(self, index: _MappedIndex, events: bool):
+        self.index = index
+        self.events = events
+        self.type_keys = index.event_type_keys if events else index.function_type_keys
+        self.materialized: dict[bytes, tuple] = {}
+
+    def __reduce__(self):
+        return _MappedTypes, (self.index, self.events)
+
+    def __getitem__(self, key: bytes) -> tuple:
+        if key in self.materialized:
+            return self.materialized[key]
+
+        record_index = self.type_keys.find(key)
+        if record_index is None:
+            raise KeyError(key)
+
+        encoded = self.index.read_types(self.type_keys, record_index)
+        reader = _SnapshotReader(encoded[0], encoded[1])
+
+        decoded_types: tuple
+        if self.events:
+            parameters, keys, data = encoded[2:]
+            decoded_types = (
+                [reader.strings[param] for param in parameters],
+                reader.named_types(keys),
+                reader.named_types(data),
+            )
+        else:
+            inputs, outputs = encoded[2:]
+            decoded_types = (
+                reader.parameters(inputs),
+                [reader.types[output] for output in outputs],
+            )
+
+        self.materialized[key] = decoded_types
+        return decoded_types
+
+    def __iter__(self) -> Iterator[bytes]:
+        return (self.type_keys[record] for record in range(len(self.type_keys)))
+
+    def __len__(self) -> int:
+        return len(self.type_keys)
+
+
+class MappedDecodingDispatcher(DecodingDispatcher):
+    """
+    Read-only DecodingDispatcher backed by a memory-mapped index file written by :func:`write_mapped_index`.
+
+    The class -> selector -> decoder reference index is stored as sorted fixed-size records, which are binary
+    searched in the mapped file.  ClassDispatchers are only created when a class is first decoded, and type trees
+    are only built when a function or event type is first decoded, so memory usage scales with the classes that are
+    actually used, rather than the size of the index.
+
+    Worker processes opening the same index file share its pages through the OS page cache.  Pickling a
+    MappedDecodingDispatcher only pickles the index path, so it can be sent to worker processes, and used with the
+    ParallelDecodingDispatcher.
+
+    .. code-block:: python
+
+        write_mapped_index(dispatcher, "mainnet.index")
+
+        with MappedDecodingDispatcher("mainnet.index") as mapped_dispatcher:
+            decoded = mapped_dispatcher.decode_function(calldata, result, selector, class_hash)
+
+    :param path: file path of the mapped index
+    """
+
+    def __init__(self, path: str | PathLike):
+        super().__init__()
+        self._index = _MappedIndex(path)
+        self.class_ids = _MappedClassIds(self._index)  # type: ignore[assignment]
+        self.function_types = _MappedTypes(self._index, events=False)  # type: ignore[assignment]
+        self.event_types = _MappedTypes(self._index, events=True)  # type: ignore[assignment]
+
+    def __reduce__(self):
+        return MappedDecodingDispatcher, (self._index.path,)
+
+    def __enter__(self) -> "MappedDecodingDispatcher":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Unmaps the index file"""
+        self._index.close()
+
+    def add_abi(self, abi: StarknetAbi):
+        """
+        Mapped indexes are read-only, so ABIs cannot be added.  Add the ABI to a DecodingDispatcher, and rebuild
+        the index with :func:`write_mapped_index`
+
+        :param abi: parsed StarknetAbi
+        :raises ReadOnlyDispatcherError: always
+        """
+        raise ReadOnlyDispatcherError(
+            "MappedDecodingDispatcher is read-only.  Rebuild the index to add ABIs"
+        )
+
+
+def _encode_function_types(
+    inputs: Sequence[AbiParameter], outputs: Sequence[StarknetType]
+) -> bytes:
+    writer = _SnapshotWriter()
+    encoded_inputs = writer.parameters(inputs)
+    encoded_outputs = tuple(writer.type_node(output) for output in outputs)
+    return marshal.dumps((writer.strings, writer.nodes, encoded_inputs, encoded_outputs))
+
+
+def _encode_event_types(
+    parameters: Sequence[str], keys: dict[str, StarknetType], data: dict[str, StarknetType]
+) -> bytes:
+    writer = _SnapshotWriter()
+    encoded_parameters = tuple(writer.string(param) for param in parameters)
+    encoded_keys, encoded_data = writer.named_types(keys), writer.named_types(data)
+    return marshal.dumps(
+        (writer.strings, writer.nodes, encoded_parameters, encoded_keys, encoded_data)
+    )
+
+
+def write_mapped_index(  # pylint: disable=too-many-locals
+    dispatcher: DecodingDispatcher, path: str | PathLike
+):
+    """
+    Writes the index of a DecodingDispatcher to a file that can be opened with :class:`MappedDecodingDispatcher`.
+
+    Index Layout::
+
+        header                  magic b"SNABIMAP", version, marshal version, record counts, and section offsets
+        class records           sorted by class id.  (class_hash, function range, event range, abi_name)
+        function entries        sorted by selector within each class.  (selector, decoder_reference, name)
+        event entries           sorted by selector within each class.  (selector, decoder_reference, name,
+                                nested event range)
+        function type records   sorted by decoder_reference.  (decoder_reference, type data offset & length)
+        event type records      sorted by decoder_reference.  (decoder_reference, type data offset & length)
+        string offsets          utf-8 string table
+        type data               marshal encoded type trees, one per decoder_reference
+
+    Classes with identical selector tables share a single range of entries.
+
+    :param dispatcher: DecodingDispatcher to index
+    :param path: file path of the index
+    """
+    strings: list[str] = []
+    string_ids: dict[str, int] = {}
+
+    def _string(value: str | None) -> int:
+        if value is None:
+            return _NO_STRING
+        if value not in string_ids:
+            string_ids[value] = len(strings)
+            strings.append(value)
+        return string_ids[value]
+
+    function_section, event_section = bytearray(), bytearray()
+    function_ranges: dict[tuple, int] = {}
+    event_ranges: dict[tuple, int] = {}
+
+    def _function_entries(function_ids: dict[bytes, FunctionDispatchInfo]) -> tuple[int, int]:
+        entries = tuple(
+            (selector, info.decoder_reference, _string(info.function_name))
+            for selector, info in sorted(function_ids.items())
+        )
+        if entries not in function_ranges:
+            function_ranges[entries] = len(function_section) // _ENTRY_RECORD.size
+            for entry in entries:
+                function_section.extend(_ENTRY_RECORD.pack(*entry))
+        return function_ranges[entries], len(entries)
+
+    def _event_entries(event_ids: dict[bytes, EventDispatchInfo]) -> tuple[int, int]:
+        # Nested event entries are written before the entries referencing them
+        entries = tuple(
+            (
+                selector,
+                info.decoder_reference or _NO_DECODER,
+                _string(info.event_name),
+                *((0, 0) if info.nested_events is None else _event_entries(info.nested_events)),
+            )
+            for selector, info in sorted(event_ids.items())
+        )
+        if entries not in event_ranges:
+            event_ranges[entries] = len(event_section) // _EVENT_RECORD.size
+            for entry in entries:
+                event_section.extend(_EVENT_RECORD.pack(*entry))
+        return event_ranges[entries], len(entries)
+
+    class_section = bytearray()
+    for class_id in sorted(dispatcher.class_ids):
+        class_dispatcher = dispatcher.class_ids[class_id]
+        class_section.extend(
+            _CLASS_RECORD.pack(
+                class_dispatcher.class_hash.rjust(32, b"\x00"),
+                *_function_entries(class_dispatcher.function_ids),
+                *_event_entries(class_dispatcher.event_ids),
+                _string(class_dispatcher.abi_name),
+            )
+        )
+
+    type_data = bytearray()
+
+    def _type_section(
+        type_table: Mapping[bytes, tuple], encoder: Callable[..., bytes]
+    ) -> bytearray:
+        type_section = bytearray()
+        for decoder_reference in sorted(type_table):
+            encoded = encoder(*type_table[decoder_reference])
+            type_section.extend(_TYPE_RECORD.pack(decoder_reference, len(type_data), len(encoded)))
+            type_data.extend(encoded)
+        return type_section
+
+    type_sections = [
+        _type_section(dispatcher.function_types, _encode_function_types),
+        _type_section(dispatcher.event_types, _encode_event_types),
+    ]
+
+    string_offsets = bytearray(_STRING_OFFSET.pack(0))
+    string_data = bytearray()
+    for value in strings:
+        string_data.extend(value.encode())
+        string_offsets.extend(_STRING_OFFSET.pack(len(string_data)))
+
+    string_offsets_offset = (
+        _HEADER.size
+        + len(class_section)
+        + len(function_section)
+        + len(event_section)
+        + sum(len(type_section) for type_section in type_sections)
+    )
+    string_data_offset = string_offsets_offset + len(string_offsets)
+
+    header = _HEADER.pack(
+        MAPPED_INDEX_MAGIC,
+        MAPPED_INDEX_VERSION,
+        marshal.version,
+        len(dispatcher.class_ids),
+        len(function_section) // _ENTRY_RECORD.size,
+        len(event_section) // _EVENT_RECORD.size,
+        len(dispatcher.function_types),
+        len(dispatcher.event_types),
+        len(strings),
+        string_offsets_offset,
+        string_data_offset,
+        string_data_offset + len(string_data),
+    )
+
+    with open(path, "wb") as index_file:
+        sections: list[bytes | bytearray] = [
+            header,
+            class_section,
+            function_section,
+            event_section,
+            *type_sections,
+            string_offsets,
+            string_data,
+            type_data,
+        ]
+        for section in sections:
+            index_file.write(section)
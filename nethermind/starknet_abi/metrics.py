@@ -0,0 +1,227 @@
+from dataclasses import dataclass, field
+
+# Latencies are bucketed by bit length, so bucket i holds latencies in [2**(i-1), 2**i) nanoseconds
+_LATENCY_BUCKETS = 48
+
+
+@dataclass(slots=True)
+class LatencyHistogram:
+    """
+    Histogram of decode latencies in nanoseconds, with power of two buckets.  Recording a latency is a single
+    list increment, and percentiles are accurate to within a factor of two.
+
+    .. doctest::
+
+        >>> from nethermind.starknet_abi.metrics import LatencyHistogram
+        >>> histogram = LatencyHistogram()
+        >>> for latency_ns in (900, 1_100, 1_500, 40_000):
+        ...     histogram.record(latency_ns)
+        >>> histogram.count, histogram.mean_ns, histogram.max_ns
+        (4, 10875.0, 40000)
+        >>> histogram.percentile_ns(0.5), histogram.percentile_ns(0.99)
+        (2048, 65536)
+    """
+
+    buckets: list[int] = field(default_factory=lambda: [0] * _LATENCY_BUCKETS)
+    count: int = 0
+    total_ns: int = 0
+    max_ns: int = 0
+
+    def record(self, latency_ns: int):
+        """Records a latency in nanoseconds"""
+        self.buckets[min(latency_ns.bit_length(), _LATENCY_BUCKETS - 1)] += 1
+        self.count += 1
+        self.total_ns += latency_ns
+        self.max_ns = max(self.max_ns, latency_ns)
+
+    def merge(self, other: "LatencyHistogram"):
+        """Adds the latencies of another histogram to the histogram"""
+        for bucket, bucket_count in enumerate(other.buckets):
+            self.buckets[bucket] += bucket_count
+        self.count += other.count
+        self.total_ns += other.total_ns
+        self.max_ns = max(self.max_ns, other.max_ns)
+
+    @property
+    def mean_ns(self) -> float:
+        """Mean latency in nanoseconds"""
+        return self.total_ns / self.count if self.count else 0.0
+
+    def percentile_ns(self, quantile: float) -> int:
+        """
+        Returns the upper bound of the bucket holding a latency quantile, in nanoseconds
+
+        :param quantile: Quantile between 0 and 1, like 0.99 for the 99th percentile
+        """
+        remaining = quantile * self.count
+        for bucket, bucket_count in enumerate(self.buckets):
+            remaining -= bucket_count
+            if remaining <= 0 and bucket_count:
+                return 1 << bucket
+        return 0
+
+    def copy(self) -> "LatencyHistogram":
+        """Returns a copy of the histogram"""
+        return LatencyHistogram(self.buckets.copy(), self.count, self.total_ns, self.max_ns)
+
+
+@dataclass(slots=True)
+class DecodeStats:
+    """
+    Decode statistics of a class, or of a selector of a class
+    """
+
+    calls: int = 0  # Successfully decoded calls or events
+    felts: int = 0  # Felts of calldata, results, keys and data consumed by successful decodes
+    errors: int = 0  # Calls or events raising a decoding error
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    def merge(self, other: "DecodeStats"):
+        """Adds the statistics of another DecodeStats"""
+        self.calls += other.calls
+        self.felts += other.felts
+        self.errors += other.errors
+        self.latency.merge(other.latency)
+
+    def copy(self) -> "DecodeStats":
+        """Returns a copy of the statistics"""
+        return DecodeStats(self.calls, self.felts, self.errors, self.latency.copy())
+
+
+@dataclass(slots=True)
+class MetricsSnapshot:
+    """
+    Point in time copy of DispatcherMetrics.  Class and selector ids are the last 8 bytes of class hashes and
+    selectors, like the ids of the DecodingDispatcher.
+    """
+
+    # (class_id, selector_id) -> statistics.  Event selector ids are the id of the first event key
+    selectors: dict[tuple[bytes, bytes], DecodeStats]
+    # class_id -> lookups of the class missing from the dispatcher
+    unknown_classes: dict[bytes, int]
+    # (class_id, selector_id) -> lookups of the selector missing from a known class
+    unknown_selectors: dict[tuple[bytes, bytes], int]
+    exceptions: dict[str, int]  # Exception type name -> count
+
+    def classes(self) -> dict[bytes, DecodeStats]:
+        """Returns the statistics of each class, merged from the statistics of its selectors"""
+        class_stats: dict[bytes, DecodeStats] = {}
+        for (class_id, _), selector_stats in self.selectors.items():
+            class_stats.setdefault(class_id, DecodeStats()).merge(selector_stats)
+        return class_stats
+
+    def top_selectors(self, count: int = 10) -> list[tuple[tuple[bytes, bytes], DecodeStats]]:
+        """
+        Returns the selectors with the highest total decode time
+
+        :param count: Number of selectors returned
+        """
+        return sorted(
+            self.selectors.items(), key=lambda item: item[1].latency.total_ns, reverse=True
+        )[:count]
+
+    @property
+    def class_hit_rate(self) -> float:
+        """Fraction of class lookups that found the class in the dispatcher"""
+        known = sum(stats.calls + stats.errors for stats in self.selectors.values())
+        known += sum(self.unknown_selectors.values())
+        total = known + sum(self.unknown_classes.values())
+        return known / total if total else 0.0
+
+    @property
+    def selector_hit_rate(self) -> float:
+        """Fraction of selector lookups in known classes that found the selector"""
+        known = sum(stats.calls + stats.errors for stats in self.selectors.values())
+        total = known + sum(self.unknown_selectors.values())
+        return known / total if total else 0.0
+
+
+class DispatcherMetrics:
+    """
+    Runtime metrics of a DecodingDispatcher, enabled with :meth:`DecodingDispatcher.enable_metrics`.  Records
+    call counts, felts consumed, and decode latency histograms for each class and selector, lookups of unknown
+    classes and selectors, and decoding exceptions by type.  Metrics are recorded by ``decode_function``,
+    ``decode_event``, their ``_at`` variants, ``decode_functions_batch`` and ``decode_events_batch``.
+
+    Counters are not locked, so counts recorded concurrently from several threads are approximate.
+
+    .. code-block:: python
+
+        metrics = dispatcher.enable_metrics()
+        ...
+        snapshot = metrics.snapshot()
+        for (class_id, selector_id), stats in snapshot.top_selectors(5):
+            print(class_id.hex(), selector_id.hex(), stats.calls, stats.latency.percentile_ns(0.99))
+        metrics.reset()
+    """
+
+    __slots__ = ("selectors", "unknown_classes", "unknown_selectors", "exceptions")
+
+    def __init__(self) -> None:
+        self.selectors: dict[tuple[bytes, bytes], DecodeStats] = {}
+        self.unknown_classes: dict[bytes, int] = {}
+        self.unknown_selectors: dict[tuple[bytes, bytes], int] = {}
+        self.exceptions: dict[str, int] = {}
+
+    def _selector_stats(self, class_id: bytes, selector_id: bytes) -> DecodeStats:
+        stats = self.selectors.get((class_id, selector_id))
+        if stats is None:
+            stats = self.selectors[(class_id, selector_id)] = DecodeStats()
+        return stats
+
+    def record_decode(self, class_id: bytes, selector_id: bytes, felts: int, latency_ns: int):
+        """
+        Records a successful decode
+
+        :param class_id: Last 8 bytes of the class hash
+        :param selector_id: Last 8 bytes of the function selector or first event key
+        :param felts: Number of felts consumed
+        :param latency_ns: Decode latency in nanoseconds
+        """
+        stats = self._selector_stats(class_id, selector_id)
+        stats.calls += 1
+        stats.felts += felts
+        stats.latency.record(latency_ns)
+
+    def record_error(self, class_id: bytes, selector_id: bytes, error: Exception):
+        """Records a decoding exception raised by a known class and selector"""
+        self._selector_stats(class_id, selector_id).errors += 1
+        error_type = type(error).__name__
+        self.exceptions[error_type] = self.exceptions.get(error_type, 0) + 1
+
+    def record_unknown_class(self, class_id: bytes):
+        """Records the lookup of a class missing from the dispatcher"""
+        self.unknown_classes[class_id] = self.unknown_classes.get(class_id, 0) + 1
+
+    def record_unknown_selector(self, class_id: bytes, selector_id: bytes):
+        """Records the lookup of a selector missing from a class"""
+        lookup_key = (class_id, selector_id)
+        self.unknown_selectors[lookup_key] = self.unknown_selectors.get(lookup_key, 0) + 1
+
+    def record_unresolved(self, class_id: bytes, selector_id: bytes, unresolved: Exception | None):
+        """
+        Records a call or event of a batch that could not be resolved.  None is an unknown class, a KeyError is an
+        unknown selector, and other exceptions are decoding errors
+        """
+        if unresolved is None:
+            self.record_unknown_class(class_id)
+        elif isinstance(unresolved, KeyError):
+            self.record_unknown_selector(class_id, selector_id)
+        else:
+            self.record_error(class_id, selector_id, unresolved)
+
+    def snapshot(self) -> MetricsSnapshot:
+        """Returns a copy of the current metrics"""
+        return MetricsSnapshot(
+            selectors={key: stats.copy() for key, stats in self.selectors.items()},
+            unknown_classes=self.unknown_classes.copy(),
+            unknown_selectors=self.unknown_selectors.copy(),
+            exceptions=self.exceptions.copy(),
+        )
+
+    def reset(self):
+        """Clears all metrics"""
+        self.selectors.clear()
+        self.unknown_classes.clear()
+        self.unknown_selectors.clear()
+        self.exceptions.clear()
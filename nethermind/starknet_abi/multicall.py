@@ -0,0 +1,147 @@
+from typing import Any, Iterable
+
+from nethermind.starknet_abi.abi_types import StarknetCoreType
+from nethermind.starknet_abi.core import StarknetAbi
+from nethermind.starknet_abi.encode import (
+    ParamsWriter,
+    compile_encoder,
+    compile_params_writer,
+)
+
+MulticallCall = tuple[Any, StarknetAbi, str, dict[str, Any]]
+"""
+Call of a multicall, as a tuple of the contract address, the StarknetAbi of the contract, the function name, and
+a dict of the function inputs.  Contract addresses can be ints, 0x prefixed hex strings, or big-endian bytes
+"""
+
+_encode_address = compile_encoder(StarknetCoreType.ContractAddress)
+
+
+class MulticallBuilder:
+    """
+    Encodes the calldata of Cairo 1 account ``__execute__`` calls, which wrap many calls as an
+    ``Array<Call{to: ContractAddress, selector: felt252, calldata: Span<felt252>}>``.
+
+    Function selectors and compiled parameter writers are cached on the builder, and shared by every call to a
+    function with the same name and input types.  Each call is written directly into a single calldata list,
+    and the calldata length of each call is patched in after its inputs are written, so no intermediate per-call
+    lists are built.  A builder can be reused for any number of multicalls.
+
+    .. doctest::
+
+        >>> from nethermind.starknet_abi.multicall import MulticallBuilder
+        >>> from nethermind.starknet_abi.core import StarknetAbi
+        >>> from nethermind.starknet_abi.decoding_types import AbiFunction
+        >>> from nethermind.starknet_abi.abi_types import AbiParameter, StarknetCoreType
+        >>> transfer = AbiFunction(
+        ...     "transfer",
+        ...     [AbiParameter("recipient", StarknetCoreType.ContractAddress), AbiParameter("amount", StarknetCoreType.U256)],
+        ...     [StarknetCoreType.Bool],
+        ... )
+        >>> erc20 = StarknetAbi("erc20", None, {"transfer": transfer}, {}, None, None, {})
+        >>> builder = MulticallBuilder()
+        >>> builder.add_call(0x49D3, erc20, "transfer", {"recipient": "0x0123", "amount": 10})
+        >>> calldata = builder.build()
+        >>> calldata[:2], hex(calldata[2]), calldata[3:]
+        ([1, 18899], '0x83afd3f4caedc6eebf44246fe54e38c95e3179a5ec9ea81740eca5b482d12e', [3, 291, 10, 0])
+    """
+
+    __slots__ = ("_selectors", "_writers", "_calldata")
+
+    def __init__(self) -> None:
+        # Function name -> selector
+        self._selectors: dict[str, int] = {}
+
+        # Function type_id -> compiled parameter writer
+        self._writers: dict[bytes, ParamsWriter] = {}
+
+        # Calldata of the pending multicall.  The first felt is the number of calls
+        self._calldata: list[int] = [0]
+
+    def __len__(self) -> int:
+        return self._calldata[0]
+
+    def _compile_call(self, abi: StarknetAbi, function_name: str) -> tuple[int, ParamsWriter]:
+        try:
+            function = abi.functions[function_name]
+        except KeyError:
+            raise KeyError(  # pylint: disable=raise-missing-from
+                f"Function {function_name} not found in ABI {abi.abi_name}"
+            )
+
+        selector = self._selectors.get(function_name)
+        if selector is None:
+            selector = self._selectors[function_name] = int.from_bytes(function.signature, "big")
+
+        function_type_id = function.type_id()
+        writer = self._writers.get(function_type_id)
+        if writer is None:
+            writer = self._writers[function_type_id] = compile_params_writer(function.inputs)
+
+        return selector, writer
+
+    def add_call(
+        self,
+        contract_address: Any,
+        abi: StarknetAbi,
+        function_name: str,
+        inputs: dict[str, Any],
+    ):
+        """
+        Appends a call to the pending multicall.  If the inputs cannot be encoded, the exception is raised and the
+        pending multicall is left unchanged.
+
+        :param contract_address: Address of the called contract, as an int, hex string, or big-endian bytes
+        :param abi: StarknetAbi of the called contract
+        :param function_name: Name of the called function.  Raises a KeyError if the function is not in the ABI
+        :param inputs: dict[function-param: value]
+        """
+        selector, writer = self._compile_call(abi, function_name)
+
+        calldata = self._calldata
+        call_start = len(calldata)
+        try:
+            _encode_address(contract_address, calldata)
+            calldata.append(selector)
+            calldata.append(0)  # Calldata length, patched once the inputs are written
+
+            inputs_start = len(calldata)
+            writer(inputs, calldata)
+            calldata[inputs_start - 1] = len(calldata) - inputs_start
+        except BaseException:
+            del calldata[call_start:]
+            raise
+
+        calldata[0] += 1
+
+    def build(self) -> list[int]:
+        """
+        Returns the ``__execute__`` calldata of the pending calls, and resets the builder for the next multicall
+
+        :return: calldata array
+        """
+        calldata, self._calldata = self._calldata, [0]
+        return calldata
+
+    def encode(self, calls: Iterable[MulticallCall]) -> list[int]:
+        """
+        Encodes the ``__execute__`` calldata of a sequence of calls in a single pass.  Calls added with
+        :meth:`add_call` and not yet built are included before the encoded calls.
+
+        :param calls: Iterable of (contract address, StarknetAbi, function name, inputs) tuples
+        :return: calldata array
+        """
+        for contract_address, abi, function_name, inputs in calls:
+            self.add_call(contract_address, abi, function_name, inputs)
+        return self.build()
+
+
+def encode_multicall(calls: Iterable[MulticallCall]) -> list[int]:
+    """
+    Encodes the ``__execute__`` calldata of a sequence of calls.  Use a :class:`MulticallBuilder` to reuse the
+    cached selectors and compiled writers when encoding many multicalls.
+
+    :param calls: Iterable of (contract address, StarknetAbi, function name, inputs) tuples
+    :return: calldata array
+    """
+    return MulticallBuilder().encode(calls)
@@ -0,0 +1,165 @@
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from multiprocessing.context import BaseContext
+from typing import Iterable, Iterator, Sequence
+
+from nethermind.starknet_abi.decoding_types import DecodedEvent, DecodedFunction
+from nethermind.starknet_abi.dispatch import DecodingDispatcher
+
+# (class_hash, function_selector, calldata, result)
+FunctionWork = tuple[bytes, bytes, Sequence[int], Sequence[int]]
+
+# (class_hash, keys, data)
+EventWork = tuple[bytes, Sequence[int], Sequence[int]]
+
+# Dispatcher rebuilt once in each worker process by _init_worker
+_worker_dispatcher: DecodingDispatcher | None = None
+
+
+def _init_worker(
+    class_ids: dict,
+    function_types: dict,
+    event_types: dict,
+):
+    """
+    Worker process initializer.  The dispatcher tables are sent to each worker once at startup, instead of being
+    pickled with every task
+    """
+    global _worker_dispatcher  # pylint: disable=global-statement
+
+    _worker_dispatcher = DecodingDispatcher()
+    _worker_dispatcher.class_ids = class_ids
+    _worker_dispatcher.function_types = function_types
+    _worker_dispatcher.event_types = event_types
+
+
+def _flatten(arrays: Iterable[Sequence[int]]) -> tuple[list[int], list[int]]:
+    flattened: list[int] = []
+    offsets = [0]
+    for array in arrays:
+        flattened.extend(array)
+        offsets.append(len(flattened))
+    return flattened, offsets
+
+
+def _decode_function_chunk(chunk: list[FunctionWork]) -> list[DecodedFunction | Exception | None]:
+    assert _worker_dispatcher is not None, "Worker process not initialized"
+
+    calldata, calldata_offsets = _flatten(work[2] for work in chunk)
+    results, result_offsets = _flatten(work[3] for work in chunk)
+
+    return _worker_dispatcher.decode_functions_batch(
+        calldata=calldata,
+        calldata_offsets=calldata_offsets,
+        results=results,
+        result_offsets=result_offsets,
+        function_selectors=[work[1] for work in chunk],
+        class_hashes=[work[0] for work in chunk],
+    )
+
+
+def _decode_event_chunk(chunk: list[EventWork]) -> list[DecodedEvent | Exception | None]:
+    assert _worker_dispatcher is not None, "Worker process not initialized"
+
+    keys, keys_offsets = _flatten(work[1] for work in chunk)
+    data, data_offsets = _flatten(work[2] for work in chunk)
+
+    return _worker_dispatcher.decode_events_batch(
+        data=data,
+        data_offsets=data_offsets,
+        keys=keys,
+        keys_offsets=keys_offsets,
+        class_hashes=[work[0] for work in chunk],
+    )
+
+
+class ParallelDecodingDispatcher:
+    """
+    Decodes functions and events across a pool of worker processes.  Decoding is pure python and CPU bound, so a
+    single interpreter can only use one core.
+
+    Each worker receives the class_ids, function_types and event_types tables of the DecodingDispatcher once at
+    startup.  Work items are grouped into chunks, decoded in the workers with the batch decoding API, and streamed
+    back in input order.  As with the batch decoders, items from unknown classes are returned as None, and decoding
+    errors are returned in place of the decoded result.
+
+    .. code-block:: python
+
+        with ParallelDecodingDispatcher(dispatcher, max_workers=32, chunk_size=2_000) as parallel:
+            for decoded in parallel.decode_functions(
+                (trace.class_hash, trace.selector, trace.calldata, trace.result) for trace in traces
+            ):
+                ...
+
+    :param dispatcher: DecodingDispatcher with all ABIs loaded
+    :param max_workers: Number of worker processes.  Defaults to the number of CPUs
+    :param chunk_size: Number of functions or events decoded in each task
+    :param mp_context: Optional multiprocessing context used to start the workers
+    """
+
+    def __init__(
+        self,
+        dispatcher: DecodingDispatcher,
+        max_workers: int | None = None,
+        chunk_size: int = 1_000,
+        mp_context: BaseContext | None = None,
+    ):
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer")
+
+        self.chunk_size = chunk_size
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=mp_context,
+            initializer=_init_worker,
+            initargs=(dispatcher.class_ids, dispatcher.function_types, dispatcher.event_types),
+        )
+        # Limits the number of chunks held in memory, so arbitrarily large iterables can be streamed
+        self._max_pending = 2 * self.max_workers
+
+    def __enter__(self) -> "ParallelDecodingDispatcher":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Shuts down the worker processes"""
+        self._executor.shutdown()
+
+    def _stream(self, chunk_decoder, work: Iterable) -> Iterator:
+        work_iter = iter(work)
+        pending: deque[Future] = deque()
+
+        while True:
+            while len(pending) < self._max_pending:
+                chunk = list(islice(work_iter, self.chunk_size))
+                if not chunk:
+                    break
+                pending.append(self._executor.submit(chunk_decoder, chunk))
+
+            if not pending:
+                return
+
+            yield from pending.popleft().result()
+
+    def decode_functions(
+        self, work: Iterable[FunctionWork]
+    ) -> Iterator[DecodedFunction | Exception | None]:
+        """
+        Decodes function calls in parallel, yielding results in input order.
+
+        :param work: iterable of (class_hash, function_selector, calldata, result) tuples
+        """
+        return self._stream(_decode_function_chunk, work)
+
+    def decode_events(self, work: Iterable[EventWork]) -> Iterator[DecodedEvent | Exception | None]:
+        """
+        Decodes events in parallel, yielding results in input order.
+
+        :param work: iterable of (class_hash, keys, data) tuples
+        """
+        return self._stream(_decode_event_chunk, work)
@@ -17,6 +17,8 @@ from nethermind.starknet_abi.abi_types import (
 )
 from nethermind.starknet_abi.decoding_types import AbiEvent, AbiFunction
 from nethermind.starknet_abi.exceptions import InvalidAbiError
+from nethermind.starknet_abi.intern import TypeInterner
+from nethermind.starknet_abi.utils import starknet_keccak
 
 
 def group_abi_by_type(abi_json: list[dict]) -> defaultdict[AbiMemberType, list[dict]]:
@@ -139,11 +141,13 @@ def topo_sort_type_defs(type_defs: list[dict]) -> list[dict]:
 
 def parse_enums_and_structs(
     abi_structs: list[dict],
+    interner: TypeInterner | None = None,
 ) -> dict[str, StarknetStruct | StarknetEnum]:
     """
     Parses an **ordered** array of ABI structs into a dictionary of StarknetStructs, mapping struct name to struct.
 
     :param abi_structs:
+    :param interner: Optional TypeInterner to share parsed types with
     """
 
     output_types: dict[str, StarknetStruct | StarknetEnum] = {}
@@ -165,33 +169,52 @@ def parse_enums_and_structs(
 
         match struct["type"]:
             case "struct":
-                output_types.update({type_name: _parse_struct(struct, output_types)})
+                output_types.update({type_name: _parse_struct(struct, output_types, interner)})
 
             case "enum":
-                output_types.update({type_name: _parse_enum(struct, output_types)})
+                output_types.update({type_name: _parse_enum(struct, output_types, interner)})
     return output_types
 
 
-def _parse_struct(abi_struct: dict, type_context: dict[str, StarknetStruct | StarknetEnum]):
-    return StarknetStruct(
+def _intern(starknet_type, interner: TypeInterner | None):
+    return starknet_type if interner is None else interner.intern_type(starknet_type)
+
+
+def _parameter(name: str, type_: StarknetType, interner: TypeInterner | None) -> AbiParameter:
+    parameter = AbiParameter(name=name, type=type_)
+    return parameter if interner is None else interner.intern_parameter(parameter)
+
+
+def _parse_struct(
+    abi_struct: dict,
+    type_context: dict[str, StarknetStruct | StarknetEnum],
+    interner: TypeInterner | None = None,
+):
+    struct = StarknetStruct(
         name=abi_struct["name"],
         members=[
-            AbiParameter(name=member["name"], type=_parse_type(member["type"], type_context))
+            _parameter(
+                member["name"], _parse_type(member["type"], type_context, interner), interner
+            )
             for member in abi_struct["members"]
         ],
     )
+    return _intern(struct, interner)
 
 
 def _parse_enum(
-    abi_enum: dict, type_context: dict[str, StarknetStruct | StarknetEnum]
+    abi_enum: dict,
+    type_context: dict[str, StarknetStruct | StarknetEnum],
+    interner: TypeInterner | None = None,
 ) -> StarknetEnum:
-    return StarknetEnum(
+    enum = StarknetEnum(
         name=abi_enum["name"],
         variants=[
-            (variant["name"], _parse_type(variant["type"], type_context))
+            (variant["name"], _parse_type(variant["type"], type_context, interner))
             for variant in abi_enum["variants"]
         ],
     )
+    return _intern(enum, interner)
 
 
 def _extract_tuple_types(tuple_abi_type: str) -> list[str | list[Any]]:
@@ -272,7 +295,9 @@ def _flatten_tuple_types(tuple_types: list[str | list]) -> set[str]:
 
 
 def _parse_tuple(
-    abi_type: str, custom_types: dict[str, StarknetStruct | StarknetEnum]
+    abi_type: str,
+    custom_types: dict[str, StarknetStruct | StarknetEnum],
+    interner: TypeInterner | None = None,
 ) -> StarknetTuple:
     """
     :param abi_type:  ABI type string
@@ -292,15 +317,15 @@ def _parse_tuple(
 
         for type_ in types:
             if isinstance(type_, str):
-                output.append(_parse_type(type_, custom_types))
+                output.append(_parse_type(type_, custom_types, interner))
             if isinstance(type_, list):
-                output.append(StarknetTuple(_parse_tuple_types(type_)))
+                output.append(_intern(StarknetTuple(_parse_tuple_types(type_)), interner))
 
         return output
 
     tuple_type_strings = _extract_tuple_types(abi_type)
 
-    return StarknetTuple(_parse_tuple_types(tuple_type_strings))
+    return _intern(StarknetTuple(_parse_tuple_types(tuple_type_strings)), interner)
 
 
 def extract_inner_type(abi_type: str) -> str:
@@ -320,13 +345,15 @@ def extract_inner_type(abi_type: str) -> str:
 
 
 def _parse_type(  # pylint: disable=too-many-return-statements
-    abi_type: str, custom_types: dict[str, StarknetStruct | StarknetEnum]
+    abi_type: str,
+    custom_types: dict[str, StarknetStruct | StarknetEnum],
+    interner: TypeInterner | None = None,
 ) -> StarknetType:
     if abi_type == "()":
         return StarknetCoreType.NoneType
 
     if abi_type.startswith("("):
-        return _parse_tuple(abi_type, custom_types)
+        return _parse_tuple(abi_type, custom_types, interner)
 
     match abi_type.split("::")[1:]:
         case ["integer", integer_type]:  # 'core::integer::<int_type>'
@@ -362,14 +389,17 @@ def _parse_type(  # pylint: disable=too-many-return-statements
 
         # Matches 'core::array::Array | Span::*'
         case ["array", "Array" | "Span", *_]:
-            return StarknetArray(_parse_type(extract_inner_type(abi_type), custom_types))
+            inner_type = _parse_type(extract_inner_type(abi_type), custom_types, interner)
+            return _intern(StarknetArray(inner_type), interner)
 
         # Matches 'core::option::Option::*'
         case ["option", "Option", *_]:
-            return StarknetOption(_parse_type(extract_inner_type(abi_type), custom_types))
+            inner_type = _parse_type(extract_inner_type(abi_type), custom_types, interner)
+            return _intern(StarknetOption(inner_type), interner)
 
         case ["zeroable", "NonZero", *_]:
-            return StarknetNonZero(_parse_type(extract_inner_type(abi_type), custom_types))
+            inner_type = _parse_type(extract_inner_type(abi_type), custom_types, interner)
+            return _intern(StarknetNonZero(inner_type), interner)
 
         case _:
             # If unknown type is defined in struct context, return struct
@@ -380,7 +410,9 @@ def _parse_type(  # pylint: disable=too-many-return-statements
             if abi_type == "felt":  # Only present in L1 Handler ABIs?
                 return StarknetCoreType.Felt
             if abi_type.endswith("*"):  # Old Syntax for Arrays
-                return StarknetArray(_parse_type(abi_type[:-1], custom_types))
+                return _intern(
+                    StarknetArray(_parse_type(abi_type[:-1], custom_types, interner)), interner
+                )
             if abi_type == "Uint256":  # Only present in L1 Handler ABIs?
                 return StarknetCoreType.U256
 
@@ -391,6 +423,7 @@ def parse_abi_parameters(
     names: list[str],
     types: list[str],
     custom_types: dict[str, StarknetStruct | StarknetEnum],
+    interner: TypeInterner | None = None,
 ):
     """
     Parses ABIs with wildcard syntax.  If felt* is detected, it is parsed as an array of Felt, and the felt_len
@@ -406,10 +439,7 @@ def parse_abi_parameters(
             ), f"Type {json_type_str} not preceded by a length parameter"
 
         output_parameters.append(
-            AbiParameter(
-                name=name,
-                type=_parse_type(json_type_str, custom_types),
-            )
+            _parameter(name, _parse_type(json_type_str, custom_types, interner), interner)
         )
 
     return output_parameters
@@ -418,6 +448,7 @@ def parse_abi_parameters(
 def parse_abi_types(
     types: list[str],
     custom_types: dict[str, StarknetStruct | StarknetEnum],
+    interner: TypeInterner | None = None,
 ):
     """
     Parses a list of ABI types into StarknetTypes while maintaining wildcard syntax definitions.
@@ -431,7 +462,7 @@ def parse_abi_types(
                 len_type == StarknetCoreType.Felt
             ), f"Type {json_type_str} not preceded by a Felt Length Param"
 
-        output_types.append(_parse_type(json_type_str, custom_types))
+        output_types.append(_parse_type(json_type_str, custom_types, interner))
 
     return output_types
 
@@ -439,23 +470,27 @@ def parse_abi_types(
 def parse_abi_function(
     abi_function: dict[str, Any],
     custom_types: dict[str, StarknetStruct | StarknetEnum],
+    interner: TypeInterner | None = None,
 ) -> AbiFunction:
     """
     Parses JSON Representation of a Function into an AbiFunction object.
 
     :param abi_function:
     :param custom_types:
+    :param interner: Optional TypeInterner to share parsed types with
     """
 
     parsed_inputs = parse_abi_parameters(
         names=[abi_input["name"] for abi_input in abi_function["inputs"]],
         types=[abi_input["type"] for abi_input in abi_function["inputs"]],
         custom_types=custom_types,
+        interner=interner,
     )
     parsed_outputs = (
         parse_abi_types(
             types=[abi_output["type"] for abi_output in abi_function["outputs"]],
             custom_types=custom_types,
+            interner=interner,
         )
         if "outputs" in abi_function  # Abi Constructors can not have outputs
         else []
@@ -471,12 +506,14 @@ def parse_abi_function(
 def parse_abi_event(
     abi_event: dict[str, Any],
     custom_types: dict[str, StarknetStruct | StarknetEnum],
+    interner: TypeInterner | None = None,
 ) -> AbiEvent | None:
     """
     Parses JSON Representation of an Event into an AbiEvent object.
 
     :param abi_event:
     :param custom_types:
+    :param interner: Optional TypeInterner to share parsed types with
     """
     if "kind" in abi_event:  # Version 2 Abi
         if abi_event["kind"] == "struct":
@@ -498,6 +535,7 @@ def parse_abi_event(
         types=[e["type"] for e in event_parameters],
         names=[e["name"] for e in event_parameters],
         custom_types=custom_types,
+        interner=interner,
     )
 
     event_kinds = {abi_input["name"]: abi_input["kind"] for abi_input in event_parameters}
@@ -516,6 +554,80 @@ def parse_abi_event(
     )
 
 
+def parse_event_selectors(
+    abi_events: list[dict[str, Any]],
+    struct_events: dict[str, AbiEvent],
+) -> dict[tuple[bytes, ...], AbiEvent]:
+    """
+    Builds the selector-chain index of the Version 2 event enums of an ABI.  Contract events are emitted through
+    the top level event enum, so the leading keys of an emitted event are the selectors of the nested variants
+    traversed to reach the event struct.  Flat variants do not add a selector.  See the notes at the bottom of this
+    module for the serialization of nested events.
+
+    Enum events that are not variants of another event enum are the roots of the index.  Events emitted directly
+    by a struct, without a selector, are not indexed.
+
+    .. doctest::
+
+        >>> from nethermind.starknet_abi.parse import parse_abi_event, parse_event_selectors
+        >>> from nethermind.starknet_abi.utils import starknet_keccak
+        >>> abi_events = [
+        ...     {"type": "event", "name": "erc20::Transfer", "kind": "struct", "members": [
+        ...         {"name": "value", "type": "core::felt252", "kind": "data"}
+        ...     ]},
+        ...     {"type": "event", "name": "erc20::Event", "kind": "enum", "variants": [
+        ...         {"name": "Transfer", "type": "erc20::Transfer", "kind": "nested"}
+        ...     ]},
+        ...     {"type": "event", "name": "token::Event", "kind": "enum", "variants": [
+        ...         {"name": "ERC20Event", "type": "erc20::Event", "kind": "nested"},
+        ...         {"name": "FlatEvent", "type": "erc20::Event", "kind": "flat"},
+        ...     ]},
+        ... ]
+        >>> struct_events = {"erc20::Transfer": parse_abi_event(abi_events[0], {})}
+        >>> selectors = parse_event_selectors(abi_events, struct_events)
+        >>> selectors[(starknet_keccak(b"ERC20Event"), starknet_keccak(b"Transfer"))].name
+        'Transfer'
+        >>> len(selectors)
+        2
+
+    :param abi_events: JSON event definitions of the ABI
+    :param struct_events: parsed struct events, keyed by their full event name
+    :return: mapping of selector chains to the event struct emitted with the selector chain
+    """
+    enum_variants = {
+        abi_event["name"]: abi_event["variants"]
+        for abi_event in abi_events
+        if abi_event.get("kind") == "enum"
+    }
+    nested_enums = {
+        variant["type"]
+        for variants in enum_variants.values()
+        for variant in variants
+        if variant["type"] in enum_variants
+    }
+
+    event_selectors: dict[tuple[bytes, ...], AbiEvent] = {}
+
+    def _index_enum(enum_name: str, selector_chain: tuple[bytes, ...], visited: frozenset[str]):
+        for variant in enum_variants[enum_name]:
+            variant_chain = (
+                selector_chain
+                if variant["kind"] == "flat"
+                else (*selector_chain, starknet_keccak(variant["name"].encode()))
+            )
+            if variant["type"] in enum_variants:
+                if variant["type"] in visited:
+                    raise InvalidAbiError(f"Event enum {variant['type']} is recursive")
+                _index_enum(variant["type"], variant_chain, visited | {variant["type"]})
+            elif variant["type"] in struct_events and variant_chain:
+                event_selectors[variant_chain] = struct_events[variant["type"]]
+
+    for root_enum in enum_variants.keys() - nested_enums:
+        _index_enum(root_enum, (), frozenset([root_enum]))
+
+    return event_selectors
+
+
 # ---- Notes ----
 # When the event is emitted, the serialization to keys and data happens as follows:
 
@@ -0,0 +1,193 @@
+import json
+from bisect import bisect_right
+from collections import OrderedDict
+from os import PathLike
+from typing import Callable, Iterable
+
+# (contract address, class hash, first block number of the class)
+ClassHistoryRecord = tuple[int, bytes, int]
+
+
+def _parse_address(contract_address: int | str | bytes) -> int:
+    if isinstance(contract_address, int):
+        return contract_address
+    if isinstance(contract_address, bytes):
+        return int.from_bytes(contract_address, "big")
+    return int(contract_address, 16)
+
+
+def _parse_class_hash(class_hash: bytes | str) -> bytes:
+    if isinstance(class_hash, bytes):
+        return class_hash.rjust(32, b"\x00")
+    return int(class_hash, 16).to_bytes(32, "big")
+
+
+class ClassHashResolver:
+    """
+    Resolves the class hash of a contract address at a block.  Deployments, proxy upgrades and ``replace_class``
+    change the class of a contract over time, so the class history of each address is stored as the sorted list
+    of blocks where the class changed, and each ``(address, block)`` lookup is answered by bisecting the history.
+    Lookups are cached in a bounded LRU, since events and calls of a block are often emitted by the same contracts.
+
+    Histories can be bulk loaded from a JSONL file with :meth:`load_file`, so addresses are resolved without an
+    external lookup per event.
+
+    .. doctest::
+
+        >>> from nethermind.starknet_abi.resolver import ClassHashResolver
+        >>> resolver = ClassHashResolver()
+        >>> resolver.add_class(0x49D3, b"\\x01" * 32, block_number=100)
+        >>> resolver.add_class(0x49D3, b"\\x02" * 32, block_number=5000)
+        >>> resolver.resolve(0x49D3, 99) is None
+        True
+        >>> resolver.resolve(0x49D3, 4999)[:2], resolver.resolve(0x49D3, 5000)[:2]
+        (b'\\x01\\x01', b'\\x02\\x02')
+
+    :param cache_size: Maximum number of ``(address, block)`` lookups held in the LRU
+    """
+
+    __slots__ = ("cache_size", "hits", "misses", "_histories", "_lookups")
+
+    def __init__(self, cache_size: int = 65536) -> None:
+        if cache_size < 1:
+            raise ValueError("cache_size must be a positive integer")
+
+        self.cache_size = cache_size
+        self.hits = 0
+        self.misses = 0
+
+        # Contract address -> (sorted first blocks of each class, class hashes)
+        self._histories: dict[int, tuple[list[int], list[bytes]]] = {}
+        self._lookups: OrderedDict[tuple[int, int], bytes | None] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._histories)
+
+    def add_class(
+        self,
+        contract_address: int | str | bytes,
+        class_hash: bytes | str,
+        block_number: int,
+    ):
+        """
+        Records the class of a contract from a block onwards, until the next class change of the contract.  If a
+        class change is already recorded at the block, it is replaced.
+
+        :param contract_address: Address of the contract, as an int, hex string, or big-endian bytes
+        :param class_hash: Class hash of the contract, as bytes or a hex string
+        :param block_number: First block with the class
+        """
+        self._insert(_parse_address(contract_address), _parse_class_hash(class_hash), block_number)
+        self._lookups.clear()
+
+    def add_classes(self, records: Iterable[ClassHistoryRecord]) -> int:
+        """
+        Bulk adds class history records, in any order.  Histories are sorted once after all records are added.
+
+        :param records: Iterable of (contract address, class hash, first block number of the class)
+        :return: number of records added
+        """
+        # Address -> {block: class_hash}, merged with the existing histories
+        changed: dict[int, dict[int, bytes]] = {}
+        record_count = 0
+        for contract_address, class_hash, block_number in records:
+            address_changes = changed.get(contract_address)
+            if address_changes is None:
+                history = self._histories.get(contract_address, ([], []))
+                address_changes = changed[contract_address] = dict(zip(*history))
+            address_changes[block_number] = class_hash
+            record_count += 1
+
+        for contract_address, address_changes in changed.items():
+            blocks = sorted(address_changes)
+            self._histories[contract_address] = (
+                blocks,
+                [address_changes[block] for block in blocks],
+            )
+
+        self._lookups.clear()
+        return record_count
+
+    def load_file(self, path: str | PathLike) -> int:
+        """
+        Bulk loads class history from a JSONL file, with one
+        ``{"contract_address": "0x...", "class_hash": "0x...", "block_number": 123}`` record per class change.
+        Records can be in any order.
+
+        :param path: JSONL file of class history records
+        :return: number of records loaded
+        """
+
+        def _iter_records() -> Iterable[ClassHistoryRecord]:
+            with open(path, "r", encoding="utf-8") as history_file:
+                for line in history_file:
+                    if line.strip():
+                        record = json.loads(line)
+                        yield (
+                            _parse_address(record["contract_address"]),
+                            _parse_class_hash(record["class_hash"]),
+                            int(record["block_number"]),
+                        )
+
+        return self.add_classes(_iter_records())
+
+    def _insert(self, contract_address: int, class_hash: bytes, block_number: int):
+        blocks, class_hashes = self._histories.setdefault(contract_address, ([], []))
+        index = bisect_right(blocks, block_number)
+        if index and blocks[index - 1] == block_number:
+            class_hashes[index - 1] = class_hash
+        else:
+            blocks.insert(index, block_number)
+            class_hashes.insert(index, class_hash)
+
+    def history(self, contract_address: int | str | bytes) -> list[tuple[int, bytes]]:
+        """
+        Returns the class history of a contract as a list of (first block, class hash), sorted by block
+
+        :param contract_address: Address of the contract
+        """
+        blocks, class_hashes = self._histories.get(_parse_address(contract_address), ([], []))
+        return list(zip(blocks, class_hashes))
+
+    def resolve(self, contract_address: int, block_number: int) -> bytes | None:
+        """
+        Returns the class hash of a contract at a block, or None if the contract has no class at the block
+
+        :param contract_address: Address of the contract as an int
+        :param block_number: Block number of the lookup
+        """
+        lookup_key = (contract_address, block_number)
+        try:
+            class_hash = self._lookups[lookup_key]
+            self._lookups.move_to_end(lookup_key)
+            self.hits += 1
+            return class_hash
+        except KeyError:
+            self.misses += 1
+
+        history = self._histories.get(contract_address)
+        if history is None:
+            class_hash = None
+        else:
+            index = bisect_right(history[0], block_number)
+            class_hash = history[1][index - 1] if index else None
+
+        self._lookups[lookup_key] = class_hash
+        if len(self._lookups) > self.cache_size:
+            self._lookups.popitem(last=False)
+        return class_hash
+
+    def at_block(self, block_number: int) -> Callable[[int], bytes | None]:
+        """
+        Returns a resolver of contract addresses at a block, which can be passed as the class_resolver of
+        :meth:`DecodingDispatcher.decode_user_operation`
+
+        :param block_number: Block number of the lookups
+        """
+        return lambda contract_address: self.resolve(contract_address, block_number)
+
+    def clear_cache(self):
+        """Clears the lookup LRU and statistics.  Class histories are not removed"""
+        self._lookups.clear()
+        self.hits = 0
+        self.misses = 0
@@ -0,0 +1,161 @@
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Iterable
+
+if TYPE_CHECKING:
+    from nethermind.starknet_abi.dispatch import ClassDispatcher, EventDispatchInfo
+
+
+@dataclass(slots=True)
+class SelectorCandidate:
+    """
+    Distinct decoder of a selector.  Every loaded class declaring the selector with the same types shares a
+    candidate, so a selector has one candidate per distinct function or event type, rather than one per class.
+    """
+
+    decoder_reference: bytes  # Result of type.type_id()
+    name: str
+
+    # Abi name shared by every class declaring the candidate, or None if the classes have different abi names
+    abi_name: str | None
+
+    # Selector ids of the keys following keys[0] for events emitted through nested event enums
+    nested_selectors: tuple[bytes, ...] = ()
+
+    class_count: int = 0  # Number of loaded classes declaring the candidate
+    matches: int = 0  # Number of times the candidate decoded a function or event
+
+    # Resolved types of the candidate, filled by the DecodingDispatcher on first use, and cleared when abi_name changes
+    resolved: Any = field(default=None, repr=False, compare=False)
+
+
+class SelectorIndex:
+    """
+    Global index of function and event selectors across every class loaded in a DecodingDispatcher.  Each
+    selector id maps to its distinct candidate decoders, ordered by the number of times each candidate has
+    matched, so calls and events can be decoded without their class hash, by trying the few candidate types of
+    the selector, rather than every class.
+
+    .. doctest::
+
+        >>> from nethermind.starknet_abi.dispatch import ClassDispatcher, FunctionDispatchInfo
+        >>> from nethermind.starknet_abi.selector_index import SelectorIndex
+        >>> index = SelectorIndex.from_classes([
+        ...     ClassDispatcher({b"transfer": FunctionDispatchInfo(b"type_a", "transfer")}, {}, "eth", b"1"),
+        ...     ClassDispatcher({b"transfer": FunctionDispatchInfo(b"type_a", "transfer")}, {}, "usdc", b"2"),
+        ...     ClassDispatcher({b"transfer": FunctionDispatchInfo(b"type_b", "transfer")}, {}, "nft", b"3"),
+        ... ])
+        >>> [(c.decoder_reference, c.abi_name, c.class_count) for c in index.function_candidates(b"transfer")]
+        [(b'type_a', None, 2), (b'type_b', 'nft', 1)]
+    """
+
+    __slots__ = ("functions", "events")
+
+    def __init__(self) -> None:
+        # Selector id (last 8 bytes of the selector) -> candidates, most matched first
+        self.functions: dict[bytes, list[SelectorCandidate]] = {}
+        self.events: dict[bytes, list[SelectorCandidate]] = {}
+
+    @classmethod
+    def from_classes(cls, class_dispatchers: Iterable["ClassDispatcher"]) -> "SelectorIndex":
+        """
+        Builds a SelectorIndex from the ClassDispatchers of a DecodingDispatcher
+
+        :param class_dispatchers: Iterable of ClassDispatchers
+        """
+        index = cls()
+        for class_dispatcher in class_dispatchers:
+            index.add_class(class_dispatcher)
+        return index
+
+    @staticmethod
+    def _add_candidate(
+        candidates: list[SelectorCandidate],
+        decoder_reference: bytes,
+        name: str,
+        abi_name: str | None,
+        nested_selectors: tuple[bytes, ...] = (),
+    ):
+        for candidate in candidates:
+            if (
+                candidate.decoder_reference == decoder_reference
+                and candidate.nested_selectors == nested_selectors
+            ):
+                break
+        else:
+            candidate = SelectorCandidate(decoder_reference, name, abi_name, nested_selectors)
+            candidates.append(candidate)
+
+        if candidate.abi_name != abi_name:
+            # The resolved types hold the abi_name, and are resolved again on next use
+            candidate.abi_name = None
+            candidate.resolved = None
+        candidate.class_count += 1
+
+    def _add_events(
+        self,
+        event_ids: dict[bytes, "EventDispatchInfo"],
+        abi_name: str | None,
+        selector_chain: tuple[bytes, ...] = (),
+    ):
+        for selector_id, event_dispatcher in event_ids.items():
+            event_chain = selector_chain + (selector_id,)
+            if event_dispatcher.decoder_reference is not None and event_dispatcher.event_name:
+                self._add_candidate(
+                    self.events.setdefault(event_chain[0], []),
+                    event_dispatcher.decoder_reference,
+                    event_dispatcher.event_name,
+                    abi_name,
+                    event_chain[1:],
+                )
+            if event_dispatcher.nested_events:
+                self._add_events(event_dispatcher.nested_events, abi_name, event_chain)
+
+    def add_class(self, class_dispatcher: "ClassDispatcher"):
+        """
+        Adds the function and event selectors of a class to the index.  Candidates already declared by other
+        classes are shared, and their class_count is incremented
+
+        :param class_dispatcher: ClassDispatcher of the class
+        """
+        for selector_id, function_dispatcher in class_dispatcher.function_ids.items():
+            self._add_candidate(
+                self.functions.setdefault(selector_id, []),
+                function_dispatcher.decoder_reference,
+                function_dispatcher.function_name,
+                class_dispatcher.abi_name,
+            )
+
+        self._add_events(class_dispatcher.event_ids, class_dispatcher.abi_name)
+
+    def function_candidates(self, function_selector: bytes) -> list[SelectorCandidate]:
+        """
+        Returns the candidates of a function selector, most matched first.  Accepts full selectors or 8 byte ids
+
+        :param function_selector: Function selector
+        """
+        return self.functions.get(function_selector[-8:], [])
+
+    def event_candidates(self, event_selector: bytes) -> list[SelectorCandidate]:
+        """
+        Returns the candidates of an event selector (the first key of an event), most matched first.  Accepts full
+        selectors or 8 byte ids
+
+        :param event_selector: Event selector
+        """
+        return self.events.get(event_selector[-8:], [])
+
+    @staticmethod
+    def record_match(candidates: list[SelectorCandidate], position: int):
+        """
+        Increments the matches of the candidate at a position, and moves it ahead of candidates with fewer
+        matches, so the most matched candidates are tried first
+
+        :param candidates: Candidates of a selector
+        :param position: Position of the matching candidate
+        """
+        candidate = candidates[position]
+        candidate.matches += 1
+        while position and candidates[position - 1].matches < candidate.matches:
+            candidates[position] = candidates[position - 1]
+            position -= 1
+        candidates[position] = candidate
@@ -0,0 +1,474 @@
+import argparse
+import asyncio
+import json
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from functools import partial
+from typing import Any, Sequence
+
+from nethermind.starknet_abi.decode import OutputFormat
+from nethermind.starknet_abi.decoding_types import DecodedEvent, DecodedFunction
+from nethermind.starknet_abi.dispatch import DecodingDispatcher
+
+
+@dataclass(slots=True)
+class ServiceStats:
+    """
+    Throughput and backpressure metrics of a DecodingService.  Returned as a snapshot by
+    :meth:`DecodingService.stats`
+    """
+
+    requests: int = 0  # Requests submitted to the service
+    completed: int = 0  # Requests with a result or exception
+    batches: int = 0  # Micro-batches decoded
+    queue_depth: int = 0  # Requests waiting to be batched
+    max_queue_depth: int = 0  # Highest queue depth observed
+    blocked_submits: int = 0  # Submits that waited for queue space
+    total_latency: float = 0.0  # Sum of the seconds between submitting and completing each request
+
+    @property
+    def mean_batch_size(self) -> float:
+        """Average number of requests per micro-batch"""
+        return self.completed / self.batches if self.batches else 0.0
+
+    @property
+    def mean_latency(self) -> float:
+        """Average seconds between submitting and completing a request"""
+        return self.total_latency / self.completed if self.completed else 0.0
+
+
+@dataclass(slots=True)
+class _FunctionRequest:
+    calldata: Sequence[int]
+    result: Sequence[int]
+    function_selector: bytes
+    class_hash: bytes
+    future: asyncio.Future
+    submitted: float
+
+
+@dataclass(slots=True)
+class _EventRequest:
+    data: Sequence[int]
+    keys: Sequence[int]
+    class_hash: bytes
+    future: asyncio.Future
+    submitted: float
+
+
+def _offsets(values: Sequence[Sequence[int]]) -> tuple[list[int], list[int]]:
+    flattened: list[int] = []
+    offsets = [0]
+    for value in values:
+        flattened.extend(value)
+        offsets.append(len(flattened))
+    return flattened, offsets
+
+
+class DecodingService:
+    """
+    asyncio front end over a DecodingDispatcher.  Decode requests are queued, and grouped into micro-batches that
+    are decoded in an executor, so decoding never blocks the event loop.  A batch is dispatched once it holds
+    ``max_batch_size`` requests, or once its first request has waited ``max_latency`` seconds.  Requests in a
+    batch are sorted by class and selector, and decoded with the dispatcher batch decoders, which resolve each
+    class and selector once per batch.
+
+    The queue holds at most ``max_queue_size`` requests.  Once full, submitting a request waits for queue space,
+    which applies backpressure to callers.  Queue depth and throughput are reported by :meth:`stats`.
+
+    .. code-block:: python
+
+        async with DecodingService(dispatcher, max_latency=0.002) as service:
+            decoded = await service.decode_function(calldata, result, selector, class_hash)
+
+    :param dispatcher: DecodingDispatcher used to decode requests
+    :param max_batch_size: Maximum number of requests in a micro-batch
+    :param max_latency: Maximum seconds the first request of a batch waits for the batch to fill
+    :param max_queue_size: Maximum number of queued requests before submits wait for queue space
+    :param executor: Executor decoding batches.  Defaults to a single worker thread owned by the service
+    :param output_format: Representation of decoded felts and addresses.  Defaults to hex strings
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        dispatcher: DecodingDispatcher,
+        max_batch_size: int = 256,
+        max_latency: float = 0.002,
+        max_queue_size: int = 10_000,
+        executor: Executor | None = None,
+        output_format: OutputFormat = OutputFormat.HEX,
+    ):
+        if max_batch_size < 1 or max_queue_size < 1:
+            raise ValueError("max_batch_size and max_queue_size must be positive integers")
+
+        self.dispatcher = dispatcher
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency
+        self.max_queue_size = max_queue_size
+        self.output_format = output_format
+
+        self._owns_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(1, thread_name_prefix="starknet-abi-decode")
+
+        self._stats = ServiceStats()
+        self._queue: asyncio.Queue | None = None
+        self._wakeup: asyncio.Event | None = None
+        self._batcher: asyncio.Task | None = None
+
+        # Requests pulled from the queue by the batcher, and not yet resolved
+        self._batch: list[_FunctionRequest | _EventRequest] = []
+
+    async def start(self):
+        """Starts the batching task.  Must be called from the event loop serving requests"""
+        if self._batcher is not None:
+            return
+        self._queue = asyncio.Queue(self.max_queue_size)
+        self._wakeup = asyncio.Event()
+        self._batcher = asyncio.create_task(self._run_batches())
+
+    async def stop(self):
+        """
+        Stops the batching task.  Queued requests, and requests in the batch being collected or decoded, are
+        cancelled, as are requests of submitters waiting for queue space
+        """
+        if self._batcher is None:
+            return
+
+        self._batcher.cancel()
+        try:
+            await self._batcher
+        except asyncio.CancelledError:
+            pass
+        self._batcher = None
+        self._cancel_batch()
+
+        assert self._queue is not None
+        queue, self._queue = self._queue, None
+
+        # Each request taken from a full queue releases a blocked submitter, which queues its request on the next
+        # iteration of the event loop, so the queue is drained until no submitter is left waiting
+        while not queue.empty():
+            while not queue.empty():
+                queue.get_nowait().future.cancel()
+            await asyncio.sleep(0)
+
+        if self._owns_executor:
+            self._executor.shutdown(wait=False)
+
+    async def __aenter__(self) -> "DecodingService":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.stop()
+
+    def stats(self) -> ServiceStats:
+        """Returns a snapshot of the service metrics"""
+        stats = ServiceStats(**asdict(self._stats))
+        stats.queue_depth = self._queue.qsize() if self._queue is not None else 0
+        return stats
+
+    def _cancel_batch(self):
+        for request in self._batch:
+            request.future.cancel()
+        self._batch = []
+
+    async def _submit(self, request: _FunctionRequest | _EventRequest):
+        queue = self._queue
+        if queue is None:
+            raise RuntimeError("DecodingService must be started before submitting requests")
+
+        self._stats.requests += 1
+        if queue.full():
+            self._stats.blocked_submits += 1
+        await queue.put(request)
+
+        self._stats.max_queue_depth = max(self._stats.max_queue_depth, queue.qsize())
+        assert self._wakeup is not None
+        self._wakeup.set()
+
+    async def submit_function(
+        self,
+        calldata: Sequence[int],
+        result: Sequence[int],
+        function_selector: bytes,
+        class_hash: bytes,
+    ) -> asyncio.Future:
+        """
+        Queues a function call for decoding, waiting for queue space if the queue is full.  Returns a future
+        resolving to the DecodedFunction, None if the class is not present in the dispatcher, or the exception
+        raised decoding the call
+
+        :param calldata: array of calldata as integers
+        :param result: array of the call result as integers
+        :param function_selector: function_selector of the trace or transaction
+        :param class_hash: class hash of the trace or transaction
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        await self._submit(
+            _FunctionRequest(calldata, result, function_selector, class_hash, future, loop.time())
+        )
+        return future
+
+    async def submit_event(
+        self,
+        data: Sequence[int],
+        keys: Sequence[int],
+        class_hash: bytes,
+    ) -> asyncio.Future:
+        """
+        Queues an event for decoding, waiting for queue space if the queue is full.  Returns a future resolving
+        to the DecodedEvent, None if the class is not present in the dispatcher, or the exception raised decoding
+        the event
+
+        :param data: event data as integers
+        :param keys: event keys as integers
+        :param class_hash: class hash of the contract emitting the event
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        await self._submit(_EventRequest(data, keys, class_hash, future, loop.time()))
+        return future
+
+    async def decode_function(
+        self,
+        calldata: Sequence[int],
+        result: Sequence[int],
+        function_selector: bytes,
+        class_hash: bytes,
+    ) -> DecodedFunction | None:
+        """Decodes a function call in the next micro-batch.  See :meth:`submit_function`"""
+        return await (await self.submit_function(calldata, result, function_selector, class_hash))
+
+    async def decode_event(
+        self,
+        data: Sequence[int],
+        keys: Sequence[int],
+        class_hash: bytes,
+    ) -> DecodedEvent | None:
+        """Decodes an event in the next micro-batch.  See :meth:`submit_event`"""
+        return await (await self.submit_event(data, keys, class_hash))
+
+    async def _next_batch(self) -> list[_FunctionRequest | _EventRequest]:
+        assert self._queue is not None and self._wakeup is not None
+        loop = asyncio.get_running_loop()
+
+        # The batch is kept on the service, so stop() can cancel requests taken from the queue
+        batch = self._batch = [await self._queue.get()]
+        deadline = batch[0].submitted + self.max_latency
+
+        while True:
+            while len(batch) < self.max_batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            remaining = deadline - loop.time()
+            if len(batch) >= self.max_batch_size or remaining <= 0:
+                return batch
+
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), remaining)
+            except asyncio.TimeoutError:
+                pass
+
+    def _decode_batch(  # pylint: disable=too-many-locals
+        self, batch: list[_FunctionRequest | _EventRequest]
+    ) -> list[Any]:
+        """Decodes a micro-batch in the executor, returning the result of each request in batch order"""
+        results: list[Any] = [None] * len(batch)
+
+        functions = sorted(
+            (
+                (index, request)
+                for index, request in enumerate(batch)
+                if isinstance(request, _FunctionRequest)
+            ),
+            key=lambda item: (item[1].class_hash[-8:], item[1].function_selector[-8:]),
+        )
+        if functions:
+            calldata, calldata_offsets = _offsets([request.calldata for _, request in functions])
+            results_data, result_offsets = _offsets([request.result for _, request in functions])
+            decoded_functions = self.dispatcher.decode_functions_batch(
+                calldata,
+                calldata_offsets,
+                results_data,
+                result_offsets,
+                [request.function_selector for _, request in functions],
+                [request.class_hash for _, request in functions],
+                self.output_format,
+            )
+            for (index, _), decoded_function in zip(functions, decoded_functions):
+                results[index] = decoded_function
+
+        events = sorted(
+            (
+                (index, request)
+                for index, request in enumerate(batch)
+                if isinstance(request, _EventRequest)
+            ),
+            key=lambda item: (item[1].class_hash[-8:], item[1].keys[:1]),
+        )
+        if events:
+            data, data_offsets = _offsets([request.data for _, request in events])
+            keys, keys_offsets = _offsets([request.keys for _, request in events])
+            decoded_events = self.dispatcher.decode_events_batch(
+                data,
+                data_offsets,
+                keys,
+                keys_offsets,
+                [request.class_hash for _, request in events],
+                self.output_format,
+            )
+            for (index, _), decoded_event in zip(events, decoded_events):
+                results[index] = decoded_event
+
+        return results
+
+    async def _run_batches(self):
+        loop = asyncio.get_running_loop()
+
+        try:
+            while True:
+                batch = await self._next_batch()
+                try:
+                    results = await loop.run_in_executor(self._executor, self._decode_batch, batch)
+                except Exception as batch_err:  # pylint: disable=broad-exception-caught
+                    results = [batch_err] * len(batch)
+                self._batch = []
+
+                completed_at = loop.time()
+                self._stats.batches += 1
+                for request, decoded in zip(batch, results):
+                    self._stats.completed += 1
+                    self._stats.total_latency += completed_at - request.submitted
+                    if request.future.done():  # Cancelled by the caller
+                        continue
+                    if isinstance(decoded, Exception):
+                        request.future.set_exception(decoded)
+                    else:
+                        request.future.set_result(decoded)
+        except asyncio.CancelledError:
+            # Requests of the batch being collected, or still decoding in the executor, are cancelled
+            self._cancel_batch()
+            raise
+
+
+def _parse_hash(value: str) -> bytes:
+    return int(value, 16).to_bytes(32, "big")
+
+
+def _write_response(writer: asyncio.StreamWriter, request_id: Any, future: asyncio.Future):
+    if future.cancelled():
+        response = {"id": request_id, "error": "cancelled"}
+    elif future.exception() is not None:
+        response = {"id": request_id, "error": repr(future.exception())}
+    else:
+        decoded = future.result()
+        response = {"id": request_id, "result": None if decoded is None else asdict(decoded)}
+    writer.write(json.dumps(response).encode() + b"\n")
+
+
+async def _handle_connection(
+    service: DecodingService, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+):
+    try:
+        while line := await reader.readline():
+            request_id = None
+            try:
+                request = json.loads(line)
+                request_id = request.get("id")
+                match request.get("type"):
+                    case "function":
+                        future = await service.submit_function(
+                            request["calldata"],
+                            request.get("result", []),
+                            _parse_hash(request["selector"]),
+                            _parse_hash(request["class_hash"]),
+                        )
+                    case "event":
+                        future = await service.submit_event(
+                            request["data"], request["keys"], _parse_hash(request["class_hash"])
+                        )
+                    case "stats":
+                        stats = service.stats()
+                        writer.write(
+                            json.dumps(
+                                {
+                                    "id": request_id,
+                                    "result": asdict(stats) | {"mean_latency": stats.mean_latency},
+                                }
+                            ).encode()
+                            + b"\n"
+                        )
+                        continue
+                    case request_type:
+                        raise ValueError(f"Unknown request type {request_type}")
+            except (ValueError, KeyError, TypeError, AttributeError) as request_err:
+                writer.write(
+                    json.dumps({"id": request_id, "error": repr(request_err)}).encode() + b"\n"
+                )
+                continue
+
+            # Responses are written as requests complete, and are matched to requests by id
+            future.add_done_callback(partial(_write_response, writer, request_id))
+            await writer.drain()
+    finally:
+        writer.close()
+
+
+async def serve(
+    service: DecodingService, host: str = "127.0.0.1", port: int = 8765
+) -> asyncio.AbstractServer:
+    """
+    Starts a JSON lines TCP server over a DecodingService.  Each line is a request, and responses are written as
+    each request completes, so clients can pipeline requests over one connection and match responses by ``id``.
+
+    * ``{"id": 1, "type": "function", "calldata": [...], "result": [...], "selector": "0x..", "class_hash": "0x.."}``
+    * ``{"id": 2, "type": "event", "data": [...], "keys": [...], "class_hash": "0x.."}``
+    * ``{"id": 3, "type": "stats"}``
+
+    Responses are ``{"id": 1, "result": {...}}``, with a null result if the class is unknown, or
+    ``{"id": 1, "error": "..."}``.  The server stops reading from a connection while the service queue is full.
+
+    :param service: started DecodingService
+    :param host: Interface to listen on
+    :param port: Port to listen on.  Port 0 selects a free port
+    :return: asyncio Server, which must be closed by the caller
+    """
+    return await asyncio.start_server(
+        lambda reader, writer: _handle_connection(service, reader, writer), host, port
+    )
+
+
+def main(argv: Sequence[str] | None = None):
+    """Runs the JSON lines decoding server over a dispatcher snapshot, for local load testing"""
+    parser = argparse.ArgumentParser(
+        description="Serve a DecodingDispatcher snapshot over JSON lines TCP"
+    )
+    parser.add_argument(
+        "snapshot", help="Dispatcher snapshot created with DecodingDispatcher.save()"
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--max-batch-size", type=int, default=256)
+    parser.add_argument("--max-latency-ms", type=float, default=2.0)
+    parser.add_argument("--max-queue-size", type=int, default=10_000)
+    args = parser.parse_args(argv)
+
+    async def _serve():
+        async with DecodingService(
+            DecodingDispatcher.load(args.snapshot),
+            max_batch_size=args.max_batch_size,
+            max_latency=args.max_latency_ms / 1000,
+            max_queue_size=args.max_queue_size,
+        ) as service:
+            server = await serve(service, args.host, args.port)
+            async with server:
+                await server.serve_forever()
+
+    asyncio.run(_serve())
+
+
+if __name__ == "__main__":
+    main()
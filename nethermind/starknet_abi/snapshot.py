@@ -0,0 +1,376 @@
+import marshal
+from os import PathLike
+
+from nethermind.starknet_abi.abi_types import (
+    AbiParameter,
+    StarknetArray,
+    StarknetCoreType,
+    StarknetEnum,
+    StarknetNonZero,
+    StarknetOption,
+    StarknetStruct,
+    StarknetTuple,
+    StarknetType,
+)
+from nethermind.starknet_abi.dispatch import (
+    ClassDispatcher,
+    DecodingDispatcher,
+    EventDispatchInfo,
+    FunctionDispatchInfo,
+)
+
+SNAPSHOT_MAGIC = b"SNABIDSP"
+SNAPSHOT_VERSION = 3
+
+# Type Node Kinds
+_CORE = 0
+_ARRAY = 1
+_OPTION = 2
+_NON_ZERO = 3
+_TUPLE = 4
+_STRUCT = 5
+_ENUM = 6
+
+_NO_STRING = -1
+
+
+class _SnapshotWriter:
+    """Builds the deduplicated string and type node tables for a snapshot"""
+
+    def __init__(self) -> None:
+        self.strings: list[str] = []
+        self.nodes: list[tuple[int, ...]] = []
+
+        self._string_ids: dict[str, int] = {}
+        self._node_ids: dict[tuple[int, ...], int] = {}
+        self._object_ids: dict[int, int] = {}  # id(StarknetType) -> node index
+        self._referenced: list[StarknetType] = (
+            []
+        )  # Keeps objects alive, so id() values are not reused
+
+    def string(self, value: str | None) -> int:
+        """Returns the string table index of the value"""
+        if value is None:
+            return _NO_STRING
+
+        string_id = self._string_ids.get(value)
+        if string_id is None:
+            string_id = self._string_ids[value] = len(self.strings)
+            self.strings.append(value)
+        return string_id
+
+    def type_node(self, starknet_type: StarknetType) -> int:
+        """
+        Returns the node table index of the type, adding the type and its children to the node table.  Identical
+        type trees are stored once, since the encoded node of a parent contains the indexes of its children
+        """
+        object_id = id(starknet_type)
+        if object_id in self._object_ids:
+            return self._object_ids[object_id]
+
+        node = self._encode_node(starknet_type)
+        node_id = self._node_ids.get(node)
+        if node_id is None:
+            node_id = self._node_ids[node] = len(self.nodes)
+            self.nodes.append(node)
+
+        self._object_ids[object_id] = node_id
+        self._referenced.append(starknet_type)
+        return node_id
+
+    def _encode_node(  # pylint: disable=too-many-return-statements
+        self, starknet_type: StarknetType
+    ) -> tuple[int, ...]:
+        if isinstance(starknet_type, StarknetCoreType):
+            return _CORE, starknet_type.value
+        if isinstance(starknet_type, StarknetArray):
+            return _ARRAY, self.type_node(starknet_type.inner_type)
+        if isinstance(starknet_type, StarknetOption):
+            return _OPTION, self.type_node(starknet_type.inner_type)
+        if isinstance(starknet_type, StarknetNonZero):
+            return _NON_ZERO, self.type_node(starknet_type.inner_type)
+        if isinstance(starknet_type, StarknetTuple):
+            return _TUPLE, *[self.type_node(member) for member in starknet_type.members]
+        if isinstance(starknet_type, StarknetStruct):
+            return _STRUCT, self.string(starknet_type.name), *self.parameters(starknet_type.members)
+        if isinstance(starknet_type, StarknetEnum):
+            variants: list[int] = []
+            for variant_name, variant_type in starknet_type.variants:
+                variants.extend((self.string(variant_name), self.type_node(variant_type)))
+            return _ENUM, self.string(starknet_type.name), *variants
+
+        raise TypeError(f"Cannot Snapshot Type: {starknet_type}")
+
+    def parameters(self, params) -> tuple[int, ...]:
+        """Encodes a sequence of AbiParameters as flattened (name, type_node) pairs"""
+        encoded: list[int] = []
+        for param in params:
+            encoded.extend((self.string(param.name), self.type_node(param.type)))
+        return tuple(encoded)
+
+    def named_types(self, types: dict[str, StarknetType]) -> tuple[int, ...]:
+        """Encodes a dict of names to StarknetTypes as flattened (name, type_node) pairs"""
+        encoded: list[int] = []
+        for name, starknet_type in types.items():
+            encoded.extend((self.string(name), self.type_node(starknet_type)))
+        return tuple(encoded)
+
+
+class _SnapshotReader:
+    """Rebuilds types from the string and type node tables, sharing identical objects"""
+
+    def __init__(self, strings: list[str], nodes: list[tuple[int, ...]]):
+        self.strings = strings
+        self.types: list[StarknetType] = []
+        self._parameters: dict[tuple[int, int], AbiParameter] = {}
+
+        core_types = {core_type.value: core_type for core_type in StarknetCoreType}
+        for node in nodes:
+            self.types.append(self._decode_node(node, core_types))
+
+    def _decode_node(  # pylint: disable=too-many-return-statements
+        self, node: tuple[int, ...], core_types: dict[int, StarknetCoreType]
+    ) -> StarknetType:
+        kind = node[0]
+        types = self.types
+
+        if kind == _CORE:
+            return core_types[node[1]]
+        if kind == _ARRAY:
+            return StarknetArray(types[node[1]])
+        if kind == _OPTION:
+            return StarknetOption(types[node[1]])
+        if kind == _NON_ZERO:
+            return StarknetNonZero(types[node[1]])
+        if kind == _TUPLE:
+            return StarknetTuple([types[member] for member in node[1:]])
+        if kind == _STRUCT:
+            return StarknetStruct(name=self.strings[node[1]], members=self.parameters(node[2:]))
+        if kind == _ENUM:
+            return StarknetEnum(
+                name=self.strings[node[1]],
+                variants=[
+                    (self.strings[node[index]], types[node[index + 1]])
+                    for index in range(2, len(node), 2)
+                ],
+            )
+
+        raise ValueError(f"Invalid type node kind {kind} in Dispatcher Snapshot")
+
+    def string(self, string_id: int) -> str | None:
+        """Returns the string for a string table index"""
+        return None if string_id == _NO_STRING else self.strings[string_id]
+
+    def parameters(self, encoded: tuple[int, ...]) -> list[AbiParameter]:
+        """Decodes flattened (name, type_node) pairs into AbiParameters, sharing identical parameters"""
+        params = []
+        for index in range(0, len(encoded), 2):
+            param_key = (encoded[index], encoded[index + 1])
+            param = self._parameters.get(param_key)
+            if param is None:
+                param = self._parameters[param_key] = AbiParameter(
+                    name=self.strings[param_key[0]], type=self.types[param_key[1]]
+                )
+            params.append(param)
+        return params
+
+    def named_types(self, encoded: tuple[int, ...]) -> dict[str, StarknetType]:
+        """Decodes flattened (name, type_node) pairs into a dict of names to StarknetTypes"""
+        return {
+            self.strings[encoded[index]]: self.types[encoded[index + 1]]
+            for index in range(0, len(encoded), 2)
+        }
+
+
+def dumps_dispatcher(dispatcher: DecodingDispatcher) -> bytes:
+    """
+    Serializes a DecodingDispatcher into a compact, versioned snapshot.
+
+    Pickling a dispatcher serializes every StarknetStruct and AbiParameter object separately, even when thousands
+    of classes share structurally identical types.  Snapshots store each distinct type tree once in a node table, and
+    each string once in a string table.  Type nodes are tuples of integers stored in dependency order, so a node only
+    references nodes with a lower index, and identical type trees are shared between functions after loading.
+
+    Snapshot Layout::
+
+        8 bytes     magic  b"SNABIDSP"
+        2 bytes     big-endian format version
+        2 bytes     big-endian marshal.version of the interpreter writing the snapshot
+        remaining   marshal encoded (strings, type_nodes, function_types, event_types, dispatch_tables, classes)
+
+    The marshal format can change between Python versions, so snapshots can only be loaded by interpreters with
+    the same marshal version, and should be rebuilt when upgrading Python.
+
+    .. warning::
+
+        Like pickles, snapshots should only be loaded from trusted sources.
+
+    :param dispatcher: DecodingDispatcher to serialize
+    :return: snapshot bytes
+    """
+    writer = _SnapshotWriter()
+
+    function_types = [
+        (
+            decoder_reference,
+            writer.parameters(inputs),
+            tuple(writer.type_node(output) for output in outputs),
+        )
+        for decoder_reference, (inputs, outputs) in dispatcher.function_types.items()
+    ]
+    event_types = [
+        (
+            decoder_reference,
+            tuple(writer.string(param) for param in parameters),
+            writer.named_types(keys),
+            writer.named_types(data),
+        )
+        for decoder_reference, (parameters, keys, data) in dispatcher.event_types.items()
+    ]
+    # Classes with identical ABIs have identical selector tables, which are stored once
+    dispatch_tables: list[tuple] = []
+    dispatch_table_ids: dict[tuple, int] = {}
+
+    def _dispatch_table(entries: tuple) -> int:
+        if entries not in dispatch_table_ids:
+            dispatch_table_ids[entries] = len(dispatch_tables)
+            dispatch_tables.append(entries)
+        return dispatch_table_ids[entries]
+
+    def _event_table(event_ids: dict[bytes, EventDispatchInfo]) -> int:
+        # Nested event selectors are stored as separate tables, referenced by their table id
+        return _dispatch_table(
+            tuple(
+                (
+                    selector,
+                    info.decoder_reference,
+                    writer.string(info.event_name),
+                    -1 if info.nested_events is None else _event_table(info.nested_events),
+                )
+                for selector, info in event_ids.items()
+            )
+        )
+
+    classes = [
+        (
+            class_dispatcher.class_hash,
+            writer.string(class_dispatcher.abi_name),
+            _dispatch_table(
+                tuple(
+                    (selector, info.decoder_reference, writer.string(info.function_name))
+                    for selector, info in class_dispatcher.function_ids.items()
+                )
+            ),
+            _event_table(class_dispatcher.event_ids),
+        )
+        for class_dispatcher in dispatcher.class_ids.values()
+    ]
+
+    tables = (writer.strings, writer.nodes, function_types, event_types, dispatch_tables, classes)
+    return (
+        SNAPSHOT_MAGIC
+        + SNAPSHOT_VERSION.to_bytes(2, "big")
+        + marshal.version.to_bytes(2, "big")
+        + marshal.dumps(tables)
+    )
+
+
+def loads_dispatcher(snapshot: bytes) -> DecodingDispatcher:  # pylint: disable=too-many-locals
+    """
+    Loads a DecodingDispatcher from snapshot bytes
+
+    :param snapshot: bytes produced by :func:`dumps_dispatcher`
+    :return: DecodingDispatcher
+    """
+    if snapshot[: len(SNAPSHOT_MAGIC)] != SNAPSHOT_MAGIC:
+        raise ValueError("Data is not a DecodingDispatcher Snapshot")
+
+    header_len = len(SNAPSHOT_MAGIC) + 4
+    version = int.from_bytes(snapshot[len(SNAPSHOT_MAGIC) : len(SNAPSHOT_MAGIC) + 2], "big")
+    if version != SNAPSHOT_VERSION:
+        raise ValueError(
+            f"Unsupported DecodingDispatcher Snapshot version {version}.  Expected {SNAPSHOT_VERSION}"
+        )
+
+    marshal_version = int.from_bytes(snapshot[len(SNAPSHOT_MAGIC) + 2 : header_len], "big")
+    if marshal_version != marshal.version:
+        raise ValueError(
+            f"DecodingDispatcher Snapshot was written with marshal version {marshal_version}, and cannot be loaded "
+            f"by this interpreter with marshal version {marshal.version}.  Rebuild the snapshot"
+        )
+
+    strings, nodes, function_types, event_types, dispatch_tables, classes = marshal.loads(
+        snapshot[header_len:]
+    )
+    reader = _SnapshotReader(strings, nodes)
+    types = reader.types
+
+    dispatcher = DecodingDispatcher()
+    dispatcher.function_types = {
+        decoder_reference: (reader.parameters(inputs), [types[output] for output in outputs])
+        for decoder_reference, inputs, outputs in function_types
+    }
+    dispatcher.event_types = {
+        decoder_reference: (
+            [strings[param] for param in parameters],
+            reader.named_types(keys),
+            reader.named_types(data),
+        )
+        for decoder_reference, parameters, keys, data in event_types
+    }
+
+    # Dispatch info objects are immutable, so each selector table is built once, and copied for each class
+    function_tables: dict[int, dict[bytes, FunctionDispatchInfo]] = {}
+    event_tables: dict[int, dict[bytes, EventDispatchInfo]] = {}
+
+    def _event_table(table_id: int) -> dict[bytes, EventDispatchInfo]:
+        if table_id not in event_tables:
+            event_tables[table_id] = {
+                selector: EventDispatchInfo(
+                    decoder_reference,
+                    reader.string(name_id),
+                    None if nested_table_id == -1 else _event_table(nested_table_id),
+                )
+                for selector, decoder_reference, name_id, nested_table_id in dispatch_tables[
+                    table_id
+                ]
+            }
+        return event_tables[table_id]
+
+    for class_hash, abi_name_id, function_table_id, event_table_id in classes:
+        if function_table_id not in function_tables:
+            function_tables[function_table_id] = {
+                selector: FunctionDispatchInfo(decoder_reference, strings[name_id])
+                for selector, decoder_reference, name_id in dispatch_tables[function_table_id]
+            }
+
+        dispatcher.class_ids[class_hash[-8:]] = ClassDispatcher(
+            function_ids=function_tables[function_table_id].copy(),
+            event_ids=_event_table(event_table_id).copy(),
+            abi_name=reader.string(abi_name_id),
+            class_hash=class_hash,
+        )
+
+    return dispatcher
+
+
+def save_dispatcher(dispatcher: DecodingDispatcher, path: str | PathLike):
+    """
+    Saves a DecodingDispatcher snapshot to a file
+
+    :param dispatcher: DecodingDispatcher to save
+    :param path: file path of the snapshot
+    """
+    with open(path, "wb") as snapshot_file:
+        snapshot_file.write(dumps_dispatcher(dispatcher))
+
+
+def load_dispatcher(path: str | PathLike) -> DecodingDispatcher:
+    """
+    Loads a DecodingDispatcher from a snapshot file
+
+    :param path: file path of the snapshot
+    :return: DecodingDispatcher
+    """
+    with open(path, "rb") as snapshot_file:
+        return loads_dispatcher(snapshot_file.read())
@@ -1,3 +1,5 @@
+import hashlib
+
 from Crypto.Hash import keccak
 
 STARK_FIELD = (2**251) + (17 * (2**192)) + 1
@@ -19,3 +21,23 @@ def starknet_keccak(data: bytes) -> bytes:
     k.update(data)
     masked = int.from_bytes(k.digest(), byteorder="big") & (2**250 - 1)  # 250 byte mask
     return masked.to_bytes(length=32, byteorder="big")
+
+
+def id_hash(id_str: str) -> bytes:
+    """
+    Returns an 8 byte hash of a type id_str().  Python's builtin hash() function is seeded with a random value at
+    interpreter startup, so it is not consistent across runs. Using a consistent hash allows a DecodingDispatcher to
+    be pickled and cached between uses
+
+    .. doctest ::
+
+        >>> from nethermind.starknet_abi.utils import id_hash
+        >>> id_hash("Function(a:U32,b:U32) -> (U64)").hex()
+        'f5f345f0f915bda4'
+
+    """
+
+    h = hashlib.md5()
+    h.update(id_str.encode())
+    # MD5 returns a 16byte digest.  We only need the last 8
+    return h.digest()[-8:]
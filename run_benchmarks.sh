@@ -80,6 +80,34 @@ for PY_VERSION in '310' '311' '312'; do
     --setup "from benchmarks.starknet_abi_base import bench_complex_decode; func = bench_complex_decode()" \
     --append benchmarks/$PY_VERSION-stark-abi.json \
     "func()"
+
+  echo "Running Benchmark for starknet-abi ---- Dispatcher Pickle Load"
+  $PY -m pyperf timeit \
+    --name dispatcher-pickle-load \
+    --setup "from benchmarks.dispatcher_snapshot import bench_pickle_load; func = bench_pickle_load()" \
+    --append benchmarks/$PY_VERSION-dispatcher-snapshot.json \
+    "func()"
+
+  echo "Running Benchmark for starknet-abi ---- Dispatcher Snapshot Load"
+  $PY -m pyperf timeit \
+    --name dispatcher-snapshot-load \
+    --setup "from benchmarks.dispatcher_snapshot import bench_snapshot_load; func = bench_snapshot_load()" \
+    --append benchmarks/$PY_VERSION-dispatcher-snapshot.json \
+    "func()"
+
+  echo "Running Benchmark for starknet-abi ---- Per-Call Transfer Decode"
+  $PY -m pyperf timeit \
+    --name per-call-transfer-decode \
+    --setup "from benchmarks.vectorized import bench_per_call_decode; func = bench_per_call_decode()" \
+    --append benchmarks/$PY_VERSION-vectorized.json \
+    "func()"
+
+  echo "Running Benchmark for starknet-abi ---- Vectorized Transfer Decode"
+  $PY -m pyperf timeit \
+    --name vectorized-transfer-decode \
+    --setup "from benchmarks.vectorized import bench_row_decode; func = bench_row_decode()" \
+    --append benchmarks/$PY_VERSION-vectorized.json \
+    "func()"
 done
 
 echo "# Benchmark Results" > benchmarks/results.md
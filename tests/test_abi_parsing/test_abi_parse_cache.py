@@ -0,0 +1,80 @@
+import copy
+
+from nethermind.starknet_abi.core import AbiParseCache, StarknetAbi
+from tests.utils import load_abi
+
+ETH_CLASS = bytes.fromhex("05ffbcfeb50d200a0677c48a129a11245a3fc519d1d98d76882d1c9a1b19c6ed")
+
+
+def test_cached_abis_share_parsed_types():
+    abi_json = load_abi("starknet_eth", 2)
+    cache = AbiParseCache()
+
+    parsed_abi = StarknetAbi.from_json(abi_json, ETH_CLASS, "starknet_eth", cache=cache)
+    assert parsed_abi == StarknetAbi.from_json(abi_json, ETH_CLASS, "starknet_eth")
+
+    # Key order within the JSON does not change the content hash
+    reordered_json = [
+        dict(reversed(list(abi_item.items()))) for abi_item in copy.deepcopy(abi_json)
+    ]
+    cached_abi = StarknetAbi.from_json(reordered_json, b"\x01" * 32, "eth_copy", cache=cache)
+
+    assert cache.hits == 1 and cache.misses == 1
+    assert cached_abi.class_hash == b"\x01" * 32 and cached_abi.abi_name == "eth_copy"
+    assert cached_abi.functions is parsed_abi.functions
+    assert cached_abi.events is parsed_abi.events
+
+
+def test_cache_lru_eviction():
+    cache = AbiParseCache(max_size=2)
+    abis = [
+        [{"type": "function", "name": f"function_{index}", "inputs": [], "outputs": []}]
+        for index in range(3)
+    ]
+
+    for abi_json in abis:
+        StarknetAbi.from_json(abi_json, cache=cache)
+    assert len(cache) == 2
+
+    # First ABI was evicted, and must be parsed again
+    StarknetAbi.from_json(abis[0], cache=cache)
+    assert cache.misses == 4
+    StarknetAbi.from_json(abis[2], cache=cache)
+    assert cache.hits == 1
+
+
+def test_cache_persisted_to_directory(tmp_path):
+    abi_json = load_abi("starknet_eth", 2)
+
+    StarknetAbi.from_json(abi_json, ETH_CLASS, cache=AbiParseCache(directory=tmp_path))
+    assert len(list(tmp_path.glob("*.abi"))) == 1
+
+    cache = AbiParseCache(directory=tmp_path)
+    loaded_abi = StarknetAbi.from_json(abi_json, ETH_CLASS, "starknet_eth", cache=cache)
+
+    assert cache.hits == 1 and cache.misses == 0
+    assert loaded_abi == StarknetAbi.from_json(abi_json, ETH_CLASS, "starknet_eth")
+
+
+def test_incompatible_persisted_abis_are_misses(tmp_path):
+    abi_json = load_abi("starknet_eth", 2)
+    content_hash = AbiParseCache.content_hash(abi_json)
+
+    # ABIs pickled by another release are not read
+    other_release = AbiParseCache(directory=tmp_path)
+    other_release.version = "0.0.1"
+    StarknetAbi.from_json(abi_json, ETH_CLASS, cache=other_release)
+    assert AbiParseCache(directory=tmp_path).get(content_hash) is None
+
+    # Pickles referencing removed modules or attributes are misses, and are overwritten
+    cache = AbiParseCache(directory=tmp_path)
+    for stale_pickle in (
+        b"cremoved_module\nStarknetAbi\n.",
+        b"cnethermind.starknet_abi.core\nRemovedType\n.",
+    ):
+        (tmp_path / f"{content_hash.hex()}-{cache.version}.abi").write_bytes(stale_pickle)
+        assert cache.get(content_hash) is None
+
+    StarknetAbi.from_json(abi_json, ETH_CLASS, cache=cache)
+    assert AbiParseCache(directory=tmp_path).get(content_hash) is not None
+    assert cache.misses == 3
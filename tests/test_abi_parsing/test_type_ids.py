@@ -0,0 +1,32 @@
+import hashlib
+import pickle
+
+from nethermind.starknet_abi.abi_types import (
+    AbiParameter,
+    StarknetArray,
+    StarknetCoreType,
+    StarknetStruct,
+)
+from nethermind.starknet_abi.core import StarknetAbi
+from tests.utils import load_abi
+
+
+def test_type_ids_match_id_str_hash():
+    parsed_abi = StarknetAbi.from_json(load_abi("starknet_eth", 2))
+
+    for abi_item in [*parsed_abi.functions.values(), *parsed_abi.events.values()]:
+        assert abi_item.type_id() == hashlib.md5(abi_item.id_str().encode()).digest()[-8:]
+        assert abi_item.type_id() is abi_item.type_id()
+
+
+def test_id_str_cached_bottom_up():
+    inner = StarknetStruct("Inner", [AbiParameter("value", StarknetCoreType.U128)])
+    outer = StarknetStruct("Outer", [AbiParameter("inners", StarknetArray(inner))])
+
+    assert outer.id_str() == "{inners:[{value:U128}]}"
+    assert outer.id_str() is outer.id_str()
+    assert outer.members[0].type.id_str() is outer.members[0].type.id_str()
+
+    # Cached id strings are not part of equality or the pickled state
+    assert outer == StarknetStruct("Outer", [AbiParameter("inners", StarknetArray(inner))])
+    assert pickle.loads(pickle.dumps(outer)).id_str() == outer.id_str()
@@ -0,0 +1,67 @@
+from nethermind.starknet_abi.abi_types import StarknetStruct
+from nethermind.starknet_abi.core import StarknetAbi
+from nethermind.starknet_abi.intern import TypeInterner
+from tests.utils import load_abi
+
+
+def test_interned_abi_matches_parsed_abi():
+    abi_json = load_abi("starknet_eth", 2)
+    interner = TypeInterner()
+
+    assert StarknetAbi.from_json(abi_json, interner=interner) == StarknetAbi.from_json(abi_json)
+    # Parameters like "account: ContractAddress" are repeated within a single ABI
+    assert interner.nodes_saved > 0
+
+
+def test_identical_types_shared_between_abis():
+    interner = TypeInterner()
+
+    eth_abi = StarknetAbi.from_json(load_abi("starknet_eth", 2), interner=interner)
+    unique_nodes = interner.unique_nodes
+
+    second_eth_abi = StarknetAbi.from_json(load_abi("starknet_eth", 2), interner=interner)
+    assert interner.unique_nodes == unique_nodes
+    assert interner.nodes_saved >= unique_nodes
+
+    for name, function in eth_abi.functions.items():
+        second_function = second_eth_abi.functions[name]
+        assert all(a is b for a, b in zip(function.inputs, second_function.inputs))
+        assert all(a is b for a, b in zip(function.outputs, second_function.outputs))
+
+    for name, event in eth_abi.events.items():
+        second_event = second_eth_abi.events[name]
+        assert all(event.data[key] is second_event.data[key] for key in event.data)
+
+
+def test_interning_is_structural():
+    interner = TypeInterner()
+
+    def _pair_abi(member_name: str):
+        return [
+            {
+                "type": "struct",
+                "name": "Pair",
+                "members": [
+                    {"name": member_name, "type": "core::integer::u128"},
+                    {"name": "b", "type": "core::array::Array::<core::felt252>"},
+                ],
+            },
+            {
+                "type": "function",
+                "name": "f",
+                "inputs": [{"name": "p", "type": "Pair"}],
+                "outputs": [],
+            },
+        ]
+
+    first = StarknetAbi.from_json(_pair_abi("a"), interner=interner).functions["f"].inputs[0].type
+    renamed = StarknetAbi.from_json(_pair_abi("c"), interner=interner).functions["f"].inputs[0].type
+
+    assert isinstance(first, StarknetStruct) and isinstance(renamed, StarknetStruct)
+    # Member names are part of the structure, but identical members are shared
+    assert first is not renamed
+    assert first.members[1] is renamed.members[1]
+    assert first.members[1].type is renamed.members[1].type
+
+    interner.clear()
+    assert interner.unique_nodes == 0 and interner.nodes_saved == 0
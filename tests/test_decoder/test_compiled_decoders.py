@@ -0,0 +1,90 @@
+import pickle
+
+import pytest
+
+from nethermind.starknet_abi.abi_types import (
+    AbiParameter,
+    StarknetArray,
+    StarknetCoreType,
+    StarknetEnum,
+    StarknetNonZero,
+    StarknetOption,
+    StarknetStruct,
+    StarknetTuple,
+)
+from nethermind.starknet_abi.core import StarknetAbi
+from nethermind.starknet_abi.decode import compile_decoder, decode_from_types
+from nethermind.starknet_abi.exceptions import InvalidCalldataError, TypeDecodeError
+from tests.utils import load_abi
+
+nested_struct = StarknetStruct(
+    name="Nested",
+    members=[
+        AbiParameter(
+            "values", StarknetArray(StarknetTuple([StarknetCoreType.U8, StarknetCoreType.I8]))
+        ),
+        AbiParameter("maybe", StarknetOption(StarknetNonZero(StarknetCoreType.U64))),
+        AbiParameter(
+            "status",
+            StarknetEnum(
+                "Status", [("Ok", StarknetCoreType.NoneType), ("Err", StarknetCoreType.Felt)]
+            ),
+        ),
+    ],
+)
+
+
+def test_compiled_decoder_is_cached_on_type():
+    decoder = compile_decoder(nested_struct)
+
+    assert compile_decoder(nested_struct) is decoder
+    assert decoder([1, 4, 5, 0, 9, 0], 0) == (
+        {"values": [(4, 5)], "maybe": 9, "status": {"Ok": ""}},
+        6,
+    )
+
+
+def test_compiled_decoder_shared_between_functions():
+    parsed_abi = StarknetAbi.from_json(load_abi("argent_account", 2))
+
+    execute = parsed_abi.functions["__execute__"]
+    execute.decode([1, 0x1234, 0x5678, 2, 7, 8])
+
+    # Both functions declare an Array<Call> input, which share the Call struct parsed from the ABI, and its decoder
+    execute_calls = execute.inputs[0].type
+    validate_calls = parsed_abi.functions["__validate__"].inputs[0].type
+    assert isinstance(execute_calls, StarknetArray) and isinstance(validate_calls, StarknetArray)
+
+    compiled = validate_calls.inner_type._decoder  # pylint: disable=protected-access
+    assert compiled is not None
+    assert compile_decoder(execute_calls.inner_type) is compiled
+    assert compile_decoder(validate_calls.inner_type) is compiled
+
+    # Decoders are cached per type object, so an equal struct parsed separately compiles its own decoder
+    other_abi = StarknetAbi.from_json(load_abi("argent_account", 2))
+    other_calls = other_abi.functions["__execute__"].inputs[0].type
+    assert other_calls == execute_calls
+    assert compile_decoder(other_calls.inner_type) is not compiled
+
+
+def test_cached_decoder_does_not_affect_pickle_or_equality():
+    struct_copy = pickle.loads(pickle.dumps(nested_struct))
+    compile_decoder(nested_struct)
+
+    assert struct_copy == nested_struct
+    assert pickle.loads(pickle.dumps(nested_struct)) == nested_struct
+    assert "_decoder" not in repr(nested_struct)
+
+
+@pytest.mark.parametrize(
+    ("calldata", "error", "message"),
+    [
+        ([1, 4], InvalidCalldataError, "Insufficient Calldata to decode StarknetStruct"),
+        ([1, 4, 5, 0, 0, 0], ValueError, "Zero Value Encoded in StarknetNonZero"),
+        ([1, 256, 5, 1, 0], TypeDecodeError, "Could not decode StarknetStruct"),
+        ([0, 1, 3], InvalidCalldataError, "Insufficient Calldata to decode StarknetStruct"),
+    ],
+)
+def test_compiled_decoder_errors(calldata, error, message):
+    with pytest.raises(error, match=message):
+        decode_from_types([nested_struct], calldata)
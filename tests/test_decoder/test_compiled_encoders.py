@@ -0,0 +1,173 @@
+import pickle
+
+import pytest
+
+from nethermind.starknet_abi.abi_types import (
+    AbiParameter,
+    StarknetArray,
+    StarknetCoreType,
+    StarknetEnum,
+    StarknetNonZero,
+    StarknetOption,
+    StarknetStruct,
+    StarknetTuple,
+)
+from nethermind.starknet_abi.core import StarknetAbi
+from nethermind.starknet_abi.decode import decode_from_params
+from nethermind.starknet_abi.decoding_types import AbiFunction
+from nethermind.starknet_abi.encode import (
+    compile_encoder,
+    compile_params_encoder,
+    encode_from_params,
+    encode_from_types,
+)
+from nethermind.starknet_abi.exceptions import TypeEncodeError
+from nethermind.starknet_abi.utils import STARK_FIELD
+from tests.utils import load_abi
+
+ORDER_STATUS = StarknetEnum(
+    "Status", [("Open", StarknetCoreType.NoneType), ("Filled", StarknetCoreType.U128)]
+)
+
+ORDER = StarknetStruct(
+    name="Order",
+    members=[
+        AbiParameter("maker", StarknetCoreType.ContractAddress),
+        AbiParameter("amount", StarknetCoreType.U256),
+        AbiParameter(
+            "fills", StarknetArray(StarknetTuple([StarknetCoreType.I8, StarknetCoreType.Bool]))
+        ),
+        AbiParameter("referrer", StarknetOption(StarknetNonZero(StarknetCoreType.U64))),
+        AbiParameter("status", ORDER_STATUS),
+    ],
+)
+
+ORDER_VALUE = {
+    "maker": "0x0123",
+    "amount": 2**128 + 7,
+    "fills": [(-1, True), (5, False)],
+    "referrer": 9,
+    "status": {"Filled": 40},
+}
+ORDER_CALLDATA = [0x123, 7, 1, 2, STARK_FIELD - 1, 1, 5, 0, 0, 9, 1, 40]
+
+
+def test_compiled_encoder_is_cached_on_type():
+    encoder = compile_encoder(ORDER)
+    assert compile_encoder(ORDER) is encoder
+
+    calldata = [1]
+    encoder(ORDER_VALUE, calldata)
+    assert calldata == [1] + ORDER_CALLDATA
+    assert encode_from_types([ORDER], [ORDER_VALUE]) == ORDER_CALLDATA
+
+
+def test_cached_encoder_does_not_affect_pickle():
+    compile_encoder(ORDER)
+    struct_copy = pickle.loads(pickle.dumps(ORDER))
+
+    assert struct_copy == ORDER
+    assert struct_copy._encoder is None  # pylint: disable=protected-access
+
+
+def test_function_encoder_cached():
+    place_order = AbiFunction("place_order", [AbiParameter("order", ORDER)], [])
+    calldata = place_order.encode({"order": ORDER_VALUE})
+    assert calldata == ORDER_CALLDATA
+
+    encoder = place_order._encoder  # pylint: disable=protected-access
+    assert encoder is not None
+    assert place_order.encode({"order": ORDER_VALUE}) == calldata
+    assert place_order._encoder is encoder  # pylint: disable=protected-access
+
+    # The compiled encoder is dropped when pickling, and compiled again on the next encode
+    function_copy = pickle.loads(pickle.dumps(place_order))
+    assert function_copy == place_order
+    assert function_copy._encoder is None  # pylint: disable=protected-access
+    assert function_copy.encode({"order": ORDER_VALUE}) == calldata
+
+
+def test_compiled_params_encoder():
+    params = [AbiParameter("order", ORDER), AbiParameter("deadline", StarknetCoreType.U64)]
+    encoder = compile_params_encoder(params)
+
+    calldata = encoder({"order": ORDER_VALUE, "deadline": 100})
+    assert calldata == ORDER_CALLDATA + [100]
+    assert encoder({"order": ORDER_VALUE, "deadline": 100}) is not calldata
+
+    with pytest.raises(ValueError, match="Missing Encode Value for Param: deadline"):
+        encoder({"order": ORDER_VALUE, "expiry": 100})
+    with pytest.raises(ValueError, match="Number of Encode Values '1' does not match"):
+        encoder({"order": ORDER_VALUE})
+
+
+@pytest.mark.parametrize("abi_name", ["starknet_eth", "argent_account", "lords_game"])
+def test_encoded_calldata_round_trips(abi_name):
+    parsed_abi = StarknetAbi.from_json(load_abi(abi_name))
+
+    for function in parsed_abi.functions.values():
+        calldata = [1] * function.min_calldata_len()
+        try:
+            decoded = decode_from_params(function.inputs, list(calldata))
+        except Exception:  # pylint: disable=broad-exception-caught
+            continue  # Placeholder calldata is not valid for every function
+
+        assert function.encode(decoded) == calldata
+        assert compile_params_encoder(function.inputs)(decoded) == calldata
+
+
+@pytest.mark.parametrize(
+    "starknet_type, value, error_message",
+    [
+        (StarknetCoreType.U8, 256, "Unsigned Integer 256 is out of range for StarknetCoreType.U8"),
+        (
+            StarknetCoreType.U32,
+            "1",
+            "Cannot Encode Non-Integer Value ''1'' to StarknetCoreType.U32",
+        ),
+        (StarknetCoreType.I8, -129, "Signed Integer -129 is out of range for StarknetCoreType.I8"),
+        (StarknetCoreType.U256, -1, "Integer -1 is out of range for StarknetCoreType.U256"),
+        (StarknetCoreType.Bool, 1, "Cannot Encode Non-Boolean Value '1' to StarknetCoreType.Bool"),
+        (StarknetCoreType.Felt, "123", "Hex Strings must be 0x Prefixed"),
+        (StarknetCoreType.Felt, b"\xff" * 32, "Does not Fit into Starknet Felt"),
+        (StarknetCoreType.Bytes31, 2**248, f"{2**248} Does not Fit into 31 Bytes"),
+        (StarknetArray(StarknetCoreType.U8), 5, "5 cannot be encoded into a StarknetArray"),
+        (ORDER, [], "\\[\\] cannot be encoded into a StarknetStruct"),
+        (ORDER_STATUS, {}, "Enum Value {} must have exactly one key-value pair"),
+        (
+            StarknetTuple([StarknetCoreType.U8]),
+            [1],
+            "\\[1\\] cannot be encoded into a StarknetTuple",
+        ),
+        (
+            StarknetNonZero(StarknetCoreType.U256),
+            0,
+            "Zero Value 0 Cannot encode to StarknetNonZero",
+        ),
+    ],
+)
+def test_encode_error_messages(starknet_type, value, error_message):
+    with pytest.raises(TypeEncodeError, match=error_message):
+        encode_from_types([starknet_type], [value])
+
+
+def test_nested_encode_errors_are_chained():
+    order = dict(ORDER_VALUE, fills=[(-1, True), (-200, False)])
+
+    with pytest.raises(
+        TypeEncodeError, match="Failed to Encode .* to StarknetStruct"
+    ) as struct_err:
+        encode_from_types([ORDER], [order])
+
+    array_err = struct_err.value.__cause__
+    assert str(array_err).startswith(
+        "Failed to Encode [(-1, True), (-200, False)] to StarknetArray"
+    )
+    tuple_err = array_err.__cause__
+    assert str(tuple_err).startswith("Failed to Encode (-200, False) to StarknetTuple")
+    assert str(tuple_err.__cause__) == "Signed Integer -200 is out of range for StarknetCoreType.I8"
+
+    with pytest.raises(ValueError, match="Enum Key Closed not found in Enum"):
+        encode_from_types([ORDER_STATUS], [{"Closed": 1}])
+    with pytest.raises(TypeError, match="Cannot Encode Python <class 'float'> Type"):
+        encode_from_params([AbiParameter("fee", StarknetCoreType.Felt)], {"fee": 1.5})
@@ -0,0 +1,90 @@
+import pytest
+
+from nethermind.starknet_abi.abi_types import (
+    AbiParameter,
+    StarknetArray,
+    StarknetCoreType,
+    StarknetStruct,
+)
+from nethermind.starknet_abi.decode import (
+    decode_from_params,
+    decode_from_params_at,
+    decode_from_types,
+    decode_from_types_at,
+)
+from nethermind.starknet_abi.exceptions import InvalidCalldataError, TypeDecodeError
+
+transfer_params = [
+    AbiParameter("recipient", StarknetCoreType.ContractAddress),
+    AbiParameter("amount", StarknetCoreType.U256),
+]
+
+
+def test_cursor_decoding_does_not_mutate_calldata():
+    calldata = [0x1234, 100, 0, 55]
+
+    decoded, end_offset = decode_from_params_at(transfer_params, calldata)
+
+    assert decoded == {
+        "recipient": "0x0000000000000000000000000000000000000000000000000000000000001234",
+        "amount": 100,
+    }
+    assert end_offset == 3
+    assert calldata == [0x1234, 100, 0, 55]
+
+
+@pytest.mark.parametrize("container", [list, tuple, lambda c: memoryview(bytes(c))])
+def test_cursor_decoding_sequence_types(container):
+    calldata = container([9, 3, 1, 2, 3, 1])
+
+    decoded, end_offset = decode_from_types_at(
+        [StarknetArray(StarknetCoreType.U8), StarknetCoreType.Bool], calldata, offset=1
+    )
+
+    assert decoded == [[1, 2, 3], True]
+    assert end_offset == 6
+
+
+def test_cursor_decoding_matches_mutating_decoders():
+    route = StarknetStruct(
+        name="Route",
+        members=[
+            AbiParameter("token", StarknetCoreType.ContractAddress),
+            AbiParameter("params", StarknetArray(StarknetCoreType.Felt)),
+        ],
+    )
+    types = [StarknetArray(route), StarknetCoreType.U128]
+    calldata = [2, 0x1, 2, 10, 11, 0x2, 0, 500]
+
+    decoded_at, end_offset = decode_from_types_at(types, calldata)
+
+    _calldata = calldata.copy()
+    assert decoded_at == decode_from_types(types, _calldata)
+    assert end_offset == len(calldata)
+    assert len(_calldata) == 0
+
+    _calldata = calldata + [1]
+    decode_from_params([AbiParameter("routes", types[0])], _calldata)
+    assert _calldata == [500, 1]
+
+
+def test_cursor_decoding_large_array():
+    calldata = [2_000] + list(range(2_000))
+
+    decoded, end_offset = decode_from_types_at([StarknetArray(StarknetCoreType.U32)], calldata)
+
+    assert decoded == [list(range(2_000))]
+    assert end_offset == 2_001
+
+
+def test_cursor_decoding_errors():
+    with pytest.raises(
+        InvalidCalldataError, match="Not Enough Calldata to decode StarknetCoreType.U256"
+    ):
+        decode_from_types_at([StarknetCoreType.U256], [1, 0, 1], offset=2)
+
+    with pytest.raises(InvalidCalldataError, match="Insufficient Calldata to decode StarknetArray"):
+        decode_from_types_at([StarknetArray(StarknetCoreType.U8)], [3, 1, 2])
+
+    with pytest.raises(TypeDecodeError, match="Could not decode StarknetArray"):
+        decode_from_types_at([StarknetArray(StarknetCoreType.Bool)], [2, 1, 2])
@@ -0,0 +1,176 @@
+import pytest
+
+from nethermind.starknet_abi.abi_types import (
+    AbiParameter,
+    StarknetArray,
+    StarknetCoreType,
+    StarknetEnum,
+    StarknetOption,
+    StarknetStruct,
+    StarknetTuple,
+)
+from nethermind.starknet_abi.core import StarknetAbi
+from nethermind.starknet_abi.decode import (
+    OutputFormat,
+    compile_skipper,
+    decode_from_params,
+    decode_from_params_at,
+)
+from nethermind.starknet_abi.decoding_types import AbiFunction
+from nethermind.starknet_abi.dispatch import DecodingDispatcher
+from nethermind.starknet_abi.exceptions import InvalidCalldataError, TypeDecodeError
+from nethermind.starknet_abi.lazy import (
+    LazyArray,
+    LazyEnum,
+    LazyStruct,
+    decode_function_lazy,
+    decode_lazy,
+)
+
+ROUTE = StarknetStruct(
+    name="Route",
+    members=[
+        AbiParameter("token_from", StarknetCoreType.ContractAddress),
+        AbiParameter("token_to", StarknetCoreType.ContractAddress),
+        AbiParameter("exchange", StarknetCoreType.ContractAddress),
+        AbiParameter("percent", StarknetCoreType.U128),
+        AbiParameter("additional_swap_params", StarknetArray(StarknetCoreType.Felt)),
+    ],
+)
+
+SWAP_STATUS = StarknetEnum(
+    "SwapStatus",
+    [
+        ("Filled", StarknetTuple([StarknetCoreType.U128, StarknetCoreType.Bool])),
+        ("Open", StarknetCoreType.NoneType),
+    ],
+)
+
+MULTI_ROUTE_SWAP = AbiFunction(
+    "multi_route_swap",
+    [
+        AbiParameter("token_from_address", StarknetCoreType.ContractAddress),
+        AbiParameter("token_from_amount", StarknetCoreType.U256),
+        AbiParameter("routes", StarknetArray(ROUTE)),
+        AbiParameter("status", SWAP_STATUS),
+        AbiParameter("referrer", StarknetOption(StarknetCoreType.ContractAddress)),
+        AbiParameter("token_to_address", StarknetCoreType.ContractAddress),
+    ],
+    [],
+)
+
+# fmt: off
+SWAP_CALLDATA = [
+    0x111, 1000, 0,
+    2,
+    0x111, 0x222, 0x999, 60, 2, 7, 8,
+    0x222, 0x333, 0x999, 40, 0,
+    0, 77, 1,
+    0, 0x444,
+    0x333,
+]
+# fmt: on
+
+
+def test_lazy_struct_matches_eager_decode():
+    lazy = decode_function_lazy(MULTI_ROUTE_SWAP, SWAP_CALLDATA)
+    expected = decode_from_params(MULTI_ROUTE_SWAP.inputs, list(SWAP_CALLDATA))
+
+    assert lazy == expected
+    assert lazy.to_dict() == expected
+    assert dict(lazy.items()).keys() == expected.keys()
+    assert lazy.end_offset == len(SWAP_CALLDATA)
+
+
+def test_lazy_struct_reads_selected_members():
+    lazy = decode_function_lazy(MULTI_ROUTE_SWAP, SWAP_CALLDATA, OutputFormat.INT)
+
+    # Inputs before the routes array have static offsets, and are read by direct indexing
+    assert lazy._member_offsets == (0, 1, 3, None, None, None)  # pylint: disable=protected-access
+    assert lazy["token_to_address"] == 0x333
+    assert lazy["token_from_address"] == 0x111
+
+    routes = lazy["routes"]
+    assert isinstance(routes, LazyArray)
+    assert len(routes) == 2
+    assert isinstance(routes[1], LazyStruct)
+    assert routes[1]["percent"] == 40
+    assert routes[0]["additional_swap_params"].to_list() == [7, 8]
+    assert routes[-1]["token_to"] == 0x333
+    assert [route["exchange"] for route in routes[:1]] == [0x999]
+
+    status = lazy["status"]
+    assert isinstance(status, LazyEnum)
+    assert status.variant == "Filled"
+    assert status == {"Filled": (77, True)}
+
+    # Values are memoized
+    assert lazy["routes"] is routes
+    assert routes[1] is routes[1]
+
+
+def test_lazy_views_only_decode_accessed_values():
+    # The second route has an invalid percent, which is only decoded when accessed
+    calldata = list(SWAP_CALLDATA)
+    calldata[14] = 2**128
+
+    lazy = LazyStruct(MULTI_ROUTE_SWAP.inputs, calldata)
+    assert lazy["token_to_address"] == f"0x{0x333:064x}"
+    assert lazy["routes"][0]["percent"] == 60
+
+    with pytest.raises(TypeDecodeError):
+        _ = lazy["routes"][1]["percent"]
+    with pytest.raises(TypeDecodeError):
+        lazy.to_dict()
+
+
+def test_lazy_view_errors():
+    lazy = decode_function_lazy(MULTI_ROUTE_SWAP, SWAP_CALLDATA)
+
+    with pytest.raises(KeyError):
+        _ = lazy["unknown"]
+    with pytest.raises(IndexError):
+        _ = lazy["routes"][2]
+    with pytest.raises(KeyError):
+        _ = lazy["status"]["Open"]
+
+    with pytest.raises(InvalidCalldataError):
+        _ = decode_function_lazy(MULTI_ROUTE_SWAP, SWAP_CALLDATA[:3])["routes"]
+    with pytest.raises(InvalidCalldataError):
+        decode_lazy(SWAP_STATUS, [5])
+
+
+@pytest.mark.parametrize(
+    "starknet_type, calldata",
+    [
+        (StarknetCoreType.U512, [1, 2, 3, 4]),
+        (StarknetArray(StarknetCoreType.U256), [2, 1, 0, 2, 0]),
+        (StarknetArray(StarknetArray(StarknetCoreType.U8)), [2, 1, 5, 2, 6, 7]),
+        (StarknetOption(ROUTE), [1]),
+        (StarknetOption(StarknetCoreType.U256), [0, 5, 0]),
+        (SWAP_STATUS, [0, 77, 1]),
+        (SWAP_STATUS, [1]),
+        (ROUTE, [1, 2, 3, 4, 1, 5]),
+    ],
+)
+def test_skippers_match_decoders(starknet_type, calldata):
+    params = [AbiParameter("value", starknet_type)]
+    _, end_offset = decode_from_params_at(params, calldata)
+    assert compile_skipper(starknet_type)(calldata, 0) == end_offset == len(calldata)
+
+
+def test_dispatcher_decode_function_lazy():
+    dispatcher = DecodingDispatcher()
+    dispatcher.add_abi(
+        StarknetAbi(
+            "avnu", b"\x01" * 32, {"multi_route_swap": MULTI_ROUTE_SWAP}, {}, None, None, {}
+        )
+    )
+
+    lazy = dispatcher.decode_function_lazy(SWAP_CALLDATA, MULTI_ROUTE_SWAP.signature, b"\x01" * 32)
+    assert lazy._member_offsets == (0, 1, 3, None, None, None)  # pylint: disable=protected-access
+    assert lazy["token_from_address"] == f"0x{0x111:064x}"
+    assert (
+        dispatcher.decode_function_lazy(SWAP_CALLDATA, MULTI_ROUTE_SWAP.signature, b"\x02" * 32)
+        is None
+    )
@@ -0,0 +1,75 @@
+import pytest
+
+from nethermind.starknet_abi.core import StarknetAbi
+from nethermind.starknet_abi.exceptions import TypeEncodeError
+from nethermind.starknet_abi.multicall import MulticallBuilder, encode_multicall
+from tests.utils import load_abi
+
+ETH_ADDRESS = 0x049D36570D4E46F48E99674BD3FCC84644DDD6B96F7C741B1562B82F9E004DC7
+
+
+@pytest.fixture(scope="module")
+def starknet_eth() -> StarknetAbi:
+    return StarknetAbi.from_json(load_abi("starknet_eth"), abi_name="starknet_eth")
+
+
+@pytest.fixture(scope="module")
+def execute_function():
+    return StarknetAbi.from_json(load_abi("argent_account")).functions["__execute__"]
+
+
+def test_multicall_matches_execute_encoding(starknet_eth, execute_function):
+    calls = [
+        (ETH_ADDRESS, starknet_eth, "approve", {"spender": "0x0123", "amount": 2**128 + 1}),
+        (hex(ETH_ADDRESS), starknet_eth, "transfer", {"recipient": 0x456, "amount": 500}),
+        (ETH_ADDRESS.to_bytes(32, "big"), starknet_eth, "decimals", {}),
+    ]
+    calldata = encode_multicall(calls)
+
+    expected_calls = [
+        {
+            "to": ETH_ADDRESS,
+            "selector": int.from_bytes(starknet_eth.functions[name].signature, "big"),
+            "calldata": starknet_eth.functions[name].encode(inputs),
+        }
+        for _, _, name, inputs in calls
+    ]
+    assert calldata == execute_function.encode({"calls": expected_calls})
+
+    decoded = execute_function.decode(calldata).inputs["calls"]
+    assert [call["calldata"] for call in decoded] == [
+        ["0x0123", "0x01", "0x01"],
+        ["0x0456", "0x01f4", "0x00"],
+        [],
+    ]
+
+
+def test_builder_is_reusable(starknet_eth):
+    builder = MulticallBuilder()
+    transfer = (ETH_ADDRESS, starknet_eth, "transfer", {"recipient": 1, "amount": 2})
+
+    builder.add_call(*transfer)
+    builder.add_call(*transfer)
+    assert len(builder) == 2
+
+    first = builder.build()
+    assert len(builder) == 0
+    assert builder.encode([transfer, transfer]) == first
+    assert builder.encode([]) == [0]
+
+
+def test_failed_call_leaves_multicall_unchanged(starknet_eth):
+    builder = MulticallBuilder()
+    builder.add_call(ETH_ADDRESS, starknet_eth, "transfer", {"recipient": 1, "amount": 2})
+
+    with pytest.raises(TypeEncodeError, match="Integer -5 is out of range"):
+        builder.add_call(ETH_ADDRESS, starknet_eth, "transfer", {"recipient": 1, "amount": -5})
+    with pytest.raises(TypeEncodeError, match="Does not Fit into Starknet Felt"):
+        builder.add_call(-1, starknet_eth, "transfer", {"recipient": 1, "amount": 2})
+    with pytest.raises(KeyError, match="Function mint not found in ABI starknet_eth"):
+        builder.add_call(ETH_ADDRESS, starknet_eth, "mint", {})
+
+    assert len(builder) == 1
+    assert builder.build() == encode_multicall(
+        [(ETH_ADDRESS, starknet_eth, "transfer", {"recipient": 1, "amount": 2})]
+    )
@@ -0,0 +1,217 @@
+import pickle
+
+import pytest
+
+from nethermind.starknet_abi.abi_types import (
+    AbiParameter,
+    StarknetArray,
+    StarknetCoreType,
+    StarknetEnum,
+    StarknetOption,
+    StarknetStruct,
+)
+from nethermind.starknet_abi.core import StarknetAbi
+from nethermind.starknet_abi.decode import (
+    OutputFormat,
+    compile_decoder,
+    decode_core_type,
+    decode_from_params,
+    decode_from_types,
+)
+from nethermind.starknet_abi.decoding_types import AbiEvent, AbiFunction
+from nethermind.starknet_abi.dispatch import DecodingDispatcher
+from nethermind.starknet_abi.exceptions import InvalidCalldataError, TypeDecodeError
+from nethermind.starknet_abi.utils import STARK_FIELD
+
+ETH_ADDRESS = 0x49D36570D4E46F48E99674BD3FCC84644DDD6B96F7C741B1562B82F9E004DC7
+CLASS_HASH = b"\x01" * 32
+
+TRANSFER = StarknetStruct(
+    name="Transfer",
+    members=[
+        AbiParameter("to", StarknetCoreType.ContractAddress),
+        AbiParameter("amount", StarknetCoreType.U256),
+        AbiParameter("memo", StarknetOption(StarknetCoreType.Felt)),
+    ],
+)
+
+
+@pytest.mark.parametrize(
+    "core_type, value, byte_width",
+    [
+        (StarknetCoreType.Felt, 256, 32),
+        (StarknetCoreType.ContractAddress, ETH_ADDRESS, 32),
+        (StarknetCoreType.ClassHash, ETH_ADDRESS, 32),
+        (StarknetCoreType.StorageAddress, 12345, 32),
+        (StarknetCoreType.EthAddress, 2**160 - 1, 20),
+        (StarknetCoreType.Bytes31, 2**248 - 1, 31),
+    ],
+)
+def test_core_output_formats(core_type, value, byte_width):
+    hex_value = decode_core_type(core_type, [value])
+    assert int(hex_value, 16) == value
+
+    assert decode_core_type(core_type, [value], OutputFormat.INT) == value
+    assert decode_core_type(core_type, [value], OutputFormat.BYTES) == value.to_bytes(
+        byte_width, "big"
+    )
+
+
+@pytest.mark.parametrize("output_format", [OutputFormat.INT, OutputFormat.BYTES])
+def test_output_format_errors_match_hex(output_format):
+    for core_type, calldata in [
+        (StarknetCoreType.Felt, [STARK_FIELD + 1]),
+        (StarknetCoreType.ContractAddress, [-1]),
+        (StarknetCoreType.EthAddress, [2**160]),
+    ]:
+        with pytest.raises(TypeDecodeError) as hex_err:
+            decode_core_type(core_type, list(calldata))
+        with pytest.raises(TypeDecodeError) as format_err:
+            decode_core_type(core_type, list(calldata), output_format)
+        assert str(format_err.value) == str(hex_err.value)
+
+    with pytest.raises(InvalidCalldataError, match="Not Enough Calldata to decode"):
+        decode_core_type(StarknetCoreType.ClassHash, [], output_format)
+
+
+def test_integer_types_ignore_output_format():
+    types = [
+        StarknetCoreType.U8,
+        StarknetCoreType.U256,
+        StarknetCoreType.I32,
+        StarknetCoreType.Bool,
+    ]
+    calldata = [5, 10, 1, STARK_FIELD - 3, 1]
+
+    expected = decode_from_types(types, list(calldata))
+    for output_format in OutputFormat:
+        assert decode_from_types(types, list(calldata), output_format) == expected
+
+
+def test_nested_types_output_formats():
+    params = [
+        AbiParameter("transfers", StarknetArray(TRANSFER)),
+        AbiParameter(
+            "status",
+            StarknetEnum(
+                "Status",
+                [("Paid", StarknetCoreType.ClassHash), ("Unpaid", StarknetCoreType.NoneType)],
+            ),
+        ),
+    ]
+    calldata = [2, ETH_ADDRESS, 100, 0, 0, 7, 16, 50, 0, 1, 0, 255]
+
+    assert decode_from_params(params, list(calldata), OutputFormat.INT) == {
+        "transfers": [
+            {"to": ETH_ADDRESS, "amount": 100, "memo": 7},
+            {"to": 16, "amount": 50, "memo": None},
+        ],
+        "status": {"Paid": 255},
+    }
+
+    decoded_bytes = decode_from_params(params, list(calldata), OutputFormat.BYTES)
+    assert decoded_bytes["transfers"][0]["to"] == ETH_ADDRESS.to_bytes(32, "big")
+    assert decoded_bytes["transfers"][0]["memo"] == (7).to_bytes(32, "big")
+    assert decoded_bytes["status"] == {"Paid": (255).to_bytes(32, "big")}
+
+    # HEX decoding is unchanged after compiling other formats
+    assert decode_from_params(params, list(calldata))["status"] == {"Paid": f"0x{255:064x}"}
+
+
+def test_format_decoders_cached_per_type():
+    array_type = StarknetArray(StarknetCoreType.ContractAddress)
+
+    int_decoder = compile_decoder(array_type, OutputFormat.INT)
+    assert compile_decoder(array_type, OutputFormat.INT) is int_decoder
+    assert compile_decoder(array_type, OutputFormat.BYTES) is not int_decoder
+    assert compile_decoder(array_type) is not int_decoder
+
+    # Cached decoders are dropped when pickling
+    unpickled = pickle.loads(pickle.dumps(array_type))
+    assert unpickled == array_type
+    assert compile_decoder(unpickled, OutputFormat.INT)([1, 5], 0) == ([5], 2)
+
+
+def test_function_and_event_output_formats():
+    transfer = AbiFunction(
+        "transfer",
+        [
+            AbiParameter("to", StarknetCoreType.ContractAddress),
+            AbiParameter("amount", StarknetCoreType.U128),
+        ],
+        [StarknetCoreType.Felt],
+    )
+    decoded = transfer.decode([ETH_ADDRESS, 100], [1], output_format=OutputFormat.INT)
+    assert decoded.inputs == {"to": ETH_ADDRESS, "amount": 100}
+    assert decoded.outputs == [1]
+
+    approval = AbiEvent(
+        "Approval",
+        ["owner", "spender"],
+        data={"spender": StarknetCoreType.ContractAddress},
+        keys={"owner": StarknetCoreType.ContractAddress},
+    )
+    decoded_event = approval.decode(
+        [2], [int.from_bytes(approval.signature, "big"), 1], OutputFormat.BYTES
+    )
+    assert decoded_event.data == {
+        "owner": (1).to_bytes(32, "big"),
+        "spender": (2).to_bytes(32, "big"),
+    }
+
+
+def test_dispatcher_output_formats():
+    transfer = AbiFunction("transfer", [AbiParameter("to", StarknetCoreType.ContractAddress)], [])
+    approval = AbiEvent(
+        "Approval", ["owner"], data={}, keys={"owner": StarknetCoreType.ContractAddress}
+    )
+    dispatcher = DecodingDispatcher()
+    dispatcher.add_abi(
+        StarknetAbi(
+            "token", CLASS_HASH, {"transfer": transfer}, {"Approval": approval}, None, None, {}
+        )
+    )
+    event_keys = [int.from_bytes(approval.signature, "big"), 9]
+
+    decoded_function = dispatcher.decode_function(
+        [5], [], transfer.signature, CLASS_HASH, OutputFormat.INT
+    )
+    assert decoded_function.inputs == {"to": 5}
+    decoded_event = dispatcher.decode_event([], event_keys, CLASS_HASH, OutputFormat.INT)
+    assert decoded_event.data == {"owner": 9}
+
+    decoded_batch = dispatcher.decode_functions_batch(
+        calldata=[5, 6],
+        calldata_offsets=[0, 1, 2],
+        results=[],
+        result_offsets=[0, 0, 0],
+        function_selectors=[transfer.signature] * 2,
+        class_hashes=[CLASS_HASH] * 2,
+        output_format=OutputFormat.BYTES,
+    )
+    assert [decoded.inputs["to"] for decoded in decoded_batch] == [
+        (5).to_bytes(32, "big"),
+        (6).to_bytes(32, "big"),
+    ]
+
+    decoded_events = dispatcher.decode_events_batch(
+        data=[],
+        data_offsets=[0, 0],
+        keys=event_keys,
+        keys_offsets=[0, 2],
+        class_hashes=[CLASS_HASH],
+        output_format=OutputFormat.INT,
+    )
+    assert decoded_events[0].data == {"owner": 9}
+
+    decoded_columns = dispatcher.decode_events_columnar(
+        data=[],
+        data_offsets=[0, 0],
+        keys=event_keys,
+        keys_offsets=[0, 2],
+        class_hashes=[CLASS_HASH],
+        output_format=OutputFormat.INT,
+    )
+    table = decoded_columns.tables[("token", "Approval")]
+    owners = table["owner"] if isinstance(table, dict) else table.column("owner").to_pylist()
+    assert owners in ([9], ["9"])
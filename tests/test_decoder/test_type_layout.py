@@ -0,0 +1,117 @@
+import pytest
+
+from nethermind.starknet_abi.abi_types import (
+    AbiParameter,
+    StarknetArray,
+    StarknetCoreType,
+    StarknetEnum,
+    StarknetNonZero,
+    StarknetOption,
+    StarknetStruct,
+    StarknetTuple,
+)
+from nethermind.starknet_abi.core import StarknetAbi
+from nethermind.starknet_abi.decode import compile_skipper
+from nethermind.starknet_abi.decoding_types import AbiFunction
+from nethermind.starknet_abi.dispatch import DecodingDispatcher
+from nethermind.starknet_abi.encode import encode_from_params
+from nethermind.starknet_abi.exceptions import InvalidCalldataError
+from nethermind.starknet_abi.layout import TypeLayout, params_layout, type_layout
+from tests.utils import load_abi
+
+ADDRESSES = StarknetStruct(
+    name="Addresses",
+    members=[
+        AbiParameter("a", StarknetCoreType.ContractAddress),
+        AbiParameter("b", StarknetCoreType.ContractAddress),
+        AbiParameter("c", StarknetCoreType.ContractAddress),
+    ],
+)
+
+
+@pytest.mark.parametrize(
+    "starknet_type, layout",
+    [
+        (StarknetCoreType.U256, TypeLayout(2, 2)),
+        (StarknetCoreType.NoneType, TypeLayout(0, 0)),
+        (ADDRESSES, TypeLayout(3, 3, (0, 1, 2))),
+        (StarknetNonZero(StarknetCoreType.U512), TypeLayout(4, 4)),
+        (StarknetArray(ADDRESSES), TypeLayout(None, 1)),
+        (StarknetOption(StarknetCoreType.U256), TypeLayout(None, 1)),
+        (StarknetOption(StarknetCoreType.NoneType), TypeLayout(1, 1)),
+        (
+            StarknetEnum("Fixed", [("A", StarknetCoreType.U128), ("B", StarknetCoreType.Felt)]),
+            TypeLayout(2, 2),
+        ),
+        (
+            StarknetEnum(
+                "Variable", [("A", StarknetCoreType.U256), ("B", StarknetCoreType.NoneType)]
+            ),
+            TypeLayout(None, 1),
+        ),
+        (
+            StarknetTuple([StarknetCoreType.U8, StarknetArray(StarknetCoreType.U8), ADDRESSES]),
+            TypeLayout(None, 5, (0, 1, None)),
+        ),
+    ],
+)
+def test_type_layouts(starknet_type, layout):
+    assert type_layout(starknet_type) == layout
+
+
+def test_layouts_cached_on_types():
+    struct_layout = type_layout(ADDRESSES)
+    assert type_layout(ADDRESSES) is struct_layout
+
+
+@pytest.mark.parametrize(
+    "abi_name", ["starknet_eth", "argent_account", "lords_game", "abi_types_compiled"]
+)
+def test_min_calldata_len_of_abi_functions(abi_name):
+    parsed_abi = StarknetAbi.from_json(load_abi(abi_name))
+
+    for function in parsed_abi.functions.values():
+        layout = params_layout(function.inputs)
+        assert function.min_calldata_len() == layout.min_width
+        if layout.is_fixed:
+            assert layout.width == layout.min_width
+            # Fixed width inputs are skipped with a constant jump
+            calldata = [0] * layout.width
+            end_offset = 0
+            for param in function.inputs:
+                end_offset = compile_skipper(param.type)(calldata, end_offset)
+            assert end_offset == layout.width
+
+
+def test_dispatcher_rejects_short_calldata():
+    swap = AbiFunction(
+        "swap",
+        [
+            AbiParameter("route", ADDRESSES),
+            AbiParameter("amount", StarknetCoreType.U256),
+            AbiParameter("hops", StarknetArray(StarknetCoreType.Felt)),
+        ],
+        [],
+    )
+    dispatcher = DecodingDispatcher()
+    dispatcher.add_abi(StarknetAbi("dex", b"\x01" * 32, {"swap": swap}, {}, None, None, {}))
+
+    assert swap.min_calldata_len() == 6
+    calldata = encode_from_params(
+        swap.inputs, {"route": {"a": 1, "b": 2, "c": 3}, "amount": 10, "hops": []}
+    )
+    assert (
+        dispatcher.decode_function(calldata, [], swap.signature, b"\x01" * 32).inputs["amount"]
+        == 10
+    )
+
+    with pytest.raises(InvalidCalldataError, match="shorter than the minimum length 6"):
+        dispatcher.decode_function(calldata[:5], [], swap.signature, b"\x01" * 32)
+
+    # The input layout is computed once per function type, and reused by every decode
+    layouts = dispatcher._input_layouts  # pylint: disable=protected-access
+    assert layouts == {swap.type_id(): params_layout(swap.inputs)}
+    input_layout = layouts[swap.type_id()]
+    dispatcher.decode_function(calldata, [], swap.signature, b"\x01" * 32)
+    assert dispatcher.decode_function_lazy(calldata, swap.signature, b"\x01" * 32)["amount"] == 10
+    assert layouts[swap.type_id()] is input_layout
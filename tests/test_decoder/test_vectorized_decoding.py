@@ -0,0 +1,158 @@
+import pytest
+
+from nethermind.starknet_abi.abi_types import (
+    AbiParameter,
+    StarknetArray,
+    StarknetCoreType,
+    StarknetNonZero,
+    StarknetStruct,
+    StarknetTuple,
+)
+from nethermind.starknet_abi.decode import decode_from_params_at
+from nethermind.starknet_abi.decoding_types import AbiEvent, AbiFunction
+from nethermind.starknet_abi.exceptions import InvalidCalldataError, TypeDecodeError
+from nethermind.starknet_abi.utils import STARK_FIELD
+
+pytest.importorskip("numpy")
+
+from nethermind.starknet_abi.vectorized import (  # pylint: disable=wrong-import-position
+    decode_event_rows,
+    decode_function_rows,
+    decode_param_rows,
+)
+
+POSITION = StarknetStruct(
+    name="Position",
+    members=[
+        AbiParameter("owner", StarknetCoreType.ContractAddress),
+        AbiParameter("liquidity", StarknetCoreType.U128),
+        AbiParameter("range", StarknetTuple([StarknetCoreType.I32, StarknetCoreType.I32])),
+    ],
+)
+
+MIXED_PARAMS = [
+    AbiParameter("position", POSITION),
+    AbiParameter("amount", StarknetCoreType.U256),
+    AbiParameter("active", StarknetCoreType.Bool),
+    AbiParameter("memo", StarknetCoreType.Felt),
+    AbiParameter("recipient", StarknetCoreType.EthAddress),
+    AbiParameter("nonce", StarknetNonZero(StarknetCoreType.U64)),
+    AbiParameter("label", StarknetCoreType.Bytes31),
+    AbiParameter("slot", StarknetCoreType.StorageAddress),
+]
+
+
+def _mixed_row(row: int) -> list[int]:
+    return [
+        0x49D36570D4E46F48E99674BD3FCC84644DDD6B96F7C741B1562B82F9E004DC7 + row,
+        2**127 + row,
+        row,
+        STARK_FIELD - row - 1,  # Negative i32
+        row * 1000,
+        2**128 - 1,
+        row % 2,
+        row * 17,
+        2**160 - 1 - row,
+        row + 1,
+        2**247 + row,
+        row * 31,
+    ]
+
+
+def test_row_decoding_matches_per_call_decoding():
+    rows = [_mixed_row(row) for row in range(50)]
+
+    columns = decode_param_rows(MIXED_PARAMS, rows)
+
+    assert list(columns) == [param.name for param in MIXED_PARAMS]
+    for row_index, row in enumerate(rows):
+        expected, _ = decode_from_params_at(MIXED_PARAMS, row)
+        assert {name: column[row_index] for name, column in columns.items()} == expected
+
+
+def test_decode_function_rows():
+    transfer = AbiFunction(
+        name="transfer",
+        inputs=[
+            AbiParameter("recipient", StarknetCoreType.ContractAddress),
+            AbiParameter("amount", StarknetCoreType.U256),
+        ],
+        outputs=[StarknetCoreType.Bool],
+    )
+
+    columns = decode_function_rows(transfer, [[1, 100, 0], [2, 200, 0], [3, 300, 1]])
+
+    assert columns["recipient"] == [f"0x{recipient:064x}" for recipient in (1, 2, 3)]
+    assert columns["amount"] == [100, 200, 300 + 2**128]
+
+
+def test_decode_event_rows():
+    transfer = AbiEvent(
+        name="Transfer",
+        parameters=["from", "to", "value"],
+        keys={"from": StarknetCoreType.U64, "to": StarknetCoreType.U64},
+        data={"value": StarknetCoreType.U256},
+    )
+
+    columns = decode_event_rows(
+        transfer, data_rows=[[10, 0], [20, 0]], keys_rows=[[0xABC, 1, 2], [0xABC, 3, 4]]
+    )
+
+    assert columns == {"from": [1, 3], "to": [2, 4], "value": [10, 20]}
+
+
+@pytest.mark.parametrize(
+    "param_type, value",
+    [
+        (StarknetCoreType.U8, 256),
+        (StarknetCoreType.U128, 2**128),
+        (StarknetCoreType.U256, 2**128),
+        (StarknetCoreType.Bool, 2),
+        (StarknetCoreType.I8, 200),
+        (StarknetCoreType.EthAddress, 2**160),
+        (StarknetCoreType.Felt, STARK_FIELD + 1),
+        (StarknetCoreType.ContractAddress, 2**256),
+    ],
+)
+def test_row_range_checks(param_type, value):
+    rows = [[0, 0], [value, 0], [0, 0]]
+
+    with pytest.raises(TypeDecodeError):
+        decode_param_rows(
+            [AbiParameter("value", param_type)],
+            [row[: 2 if param_type == StarknetCoreType.U256 else 1] for row in rows],
+        )
+
+
+@pytest.mark.parametrize(
+    "param_type, value, message",
+    [
+        (StarknetCoreType.U32, 2**32, "row 2 exceeds .*U32 Max Range"),
+        (StarknetCoreType.U32, -1, "row 2 is not a positive integer smaller than 2\\*\\*256"),
+        (StarknetCoreType.Felt, 2**256, "row 2 is not a positive integer smaller than 2\\*\\*256"),
+        (
+            StarknetCoreType.ContractAddress,
+            STARK_FIELD + 1,
+            "row 2 exceeds .*ContractAddress Max Range",
+        ),
+    ],
+)
+def test_row_range_check_reports_row(param_type, value, message):
+    # Rows of small felts are checked in a NumPy array, and rows holding wide felts with min and max
+    rows = [[1], [2**200 if param_type != StarknetCoreType.U32 else 1], [value], [3]]
+
+    with pytest.raises(TypeDecodeError, match=message):
+        decode_param_rows([AbiParameter("value", param_type)], rows)
+
+
+def test_invalid_rows():
+    params = [AbiParameter("a", StarknetCoreType.U32), AbiParameter("b", StarknetCoreType.U32)]
+
+    with pytest.raises(InvalidCalldataError, match="Row 1 has 3 felts"):
+        decode_param_rows(params, [[1, 2], [1, 2, 3]])
+
+    with pytest.raises(ValueError, match="Zero Value"):
+        decode_param_rows([AbiParameter("a", StarknetNonZero(StarknetCoreType.U32))], [[1], [0]])
+
+    with pytest.raises(TypeError, match="not fixed width"):
+        decode_param_rows([AbiParameter("a", StarknetArray(StarknetCoreType.U32))], [[0]])
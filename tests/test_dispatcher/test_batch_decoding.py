@@ -0,0 +1,108 @@
+import pytest
+
+from nethermind.starknet_abi.exceptions import InvalidCalldataError, TypeDecodeError
+from nethermind.starknet_abi.utils import starknet_keccak
+
+ETH_CLASS = bytes.fromhex("05ffbcfeb50d200a0677c48a129a11245a3fc519d1d98d76882d1c9a1b19c6ed")
+UNKNOWN_CLASS = bytes.fromhex("0123456789abcdef0123456789abcdef0123456789abcdef0123456789abcdef")
+
+RECIPIENT = 0x7916596FEAB669322F03B6DF4E71F7B158E291FD8D273C0E53759D5B7240B4A
+
+
+def test_decode_functions_batch(decoding_dispatcher):
+    calls = [
+        # (calldata, result, selector, class_hash)
+        ([RECIPIENT, 100, 0], [1], starknet_keccak(b"transfer"), ETH_CLASS),
+        ([RECIPIENT, 200, 0], [0], starknet_keccak(b"approve"), ETH_CLASS),
+        ([RECIPIENT, 100, 0], [1], starknet_keccak(b"transfer"), UNKNOWN_CLASS),
+        ([RECIPIENT, 300, 0, 1], [1], starknet_keccak(b"transfer"), ETH_CLASS),
+        ([RECIPIENT, 2**128, 0], [1], starknet_keccak(b"transfer"), ETH_CLASS),
+        ([], [], starknet_keccak(b"not_a_function"), ETH_CLASS),
+        ([RECIPIENT, 400, 0], [1], starknet_keccak(b"transfer"), ETH_CLASS),
+    ]
+
+    calldata, calldata_offsets, results, result_offsets = [], [0], [], [0]
+    for call_calldata, call_result, _, _ in calls:
+        calldata.extend(call_calldata)
+        calldata_offsets.append(len(calldata))
+        results.extend(call_result)
+        result_offsets.append(len(results))
+
+    decoded = decoding_dispatcher.decode_functions_batch(
+        calldata=calldata,
+        calldata_offsets=calldata_offsets,
+        results=results,
+        result_offsets=result_offsets,
+        function_selectors=[call[2] for call in calls],
+        class_hashes=[call[3] for call in calls],
+    )
+
+    assert len(decoded) == len(calls)
+    for index in (0, 1, 6):
+        call_calldata, call_result, selector, class_hash = calls[index]
+        assert decoded[index] == decoding_dispatcher.decode_function(
+            call_calldata, call_result, selector, class_hash
+        )
+
+    assert decoded[0].name == "transfer"
+    assert decoded[0].inputs["amount"] == 100
+    assert decoded[6].inputs["amount"] == 400
+    assert decoded[2] is None
+    assert isinstance(decoded[3], InvalidCalldataError)
+    assert isinstance(decoded[4], TypeDecodeError)
+    assert isinstance(decoded[5], KeyError)
+
+    # Calls are decoded in place, but return the same errors as decode_function
+    for index in (3, 4):
+        with pytest.raises(Exception) as decode_err:
+            decoding_dispatcher.decode_function(*calls[index])
+        assert str(decoded[index]) == str(decode_err.value)
+
+
+def test_decode_events_batch(decoding_dispatcher):
+    transfer_selector = int.from_bytes(starknet_keccak(b"Transfer"), "big")
+    events = [
+        # (data, keys, class_hash)
+        ([RECIPIENT, 0x1234, 5000, 0], [transfer_selector], ETH_CLASS),
+        ([RECIPIENT, 0x1234, 5000, 0], [transfer_selector], UNKNOWN_CLASS),
+        ([RECIPIENT, 0x1234], [transfer_selector], ETH_CLASS),
+        ([], [], ETH_CLASS),
+        ([0x1234, RECIPIENT, 7000, 0], [transfer_selector], ETH_CLASS),
+        ([], [], UNKNOWN_CLASS),
+        ([1], [2**256], ETH_CLASS),
+    ]
+
+    data, data_offsets, keys, keys_offsets = [], [0], [], [0]
+    for event_data, event_keys, _ in events:
+        data.extend(event_data)
+        data_offsets.append(len(data))
+        keys.extend(event_keys)
+        keys_offsets.append(len(keys))
+
+    decoded = decoding_dispatcher.decode_events_batch(
+        data=data,
+        data_offsets=data_offsets,
+        keys=keys,
+        keys_offsets=keys_offsets,
+        class_hashes=[event[2] for event in events],
+    )
+
+    assert decoded[0] == decoding_dispatcher.decode_event(*events[0])
+    assert decoded[0].data == {
+        "from": f"0x{RECIPIENT:064x}",
+        "to": f"0x{0x1234:064x}",
+        "value": 5000,
+    }
+    assert decoded[1] is None
+    assert isinstance(decoded[2], InvalidCalldataError)
+    assert isinstance(decoded[3], InvalidCalldataError)
+    assert decoded[4].data["value"] == 7000
+
+    # Events are decoded in place, but return the same errors as decode_event
+    with pytest.raises(InvalidCalldataError) as decode_err:
+        decoding_dispatcher.decode_event(*events[2])
+    assert str(decoded[2]) == str(decode_err.value)
+
+    # Empty keys of unknown classes are None, like decode_event, and oversized keys are unknown selectors
+    assert decoded[5] is None and decoding_dispatcher.decode_event(*events[5]) is None
+    assert isinstance(decoded[6], KeyError)
@@ -0,0 +1,57 @@
+import json
+
+from nethermind.starknet_abi.dispatch import DecodingDispatcher
+from nethermind.starknet_abi.loader import bulk_load_abis
+from nethermind.starknet_abi.utils import starknet_keccak
+from tests.utils import load_abi
+
+RECIPIENT = 0x7916596FEAB669322F03B6DF4E71F7B158E291FD8D273C0E53759D5B7240B4A
+
+
+def test_bulk_load_jsonl(tmp_path):
+    eth_abi = load_abi("starknet_eth", 2)
+    dump_path = tmp_path / "classes.jsonl"
+
+    with open(dump_path, "w") as dump_file:
+        for class_index in range(1, 41):
+            abi = (
+                eth_abi if class_index % 2 else json.dumps(eth_abi)
+            )  # ABIs can be JSON encoded strings
+            dump_file.write(json.dumps({"class_hash": hex(class_index), "abi": abi}) + "\n")
+        dump_file.write(json.dumps({"class_hash": "0x99", "abi": [{"type": "struct"}]}) + "\n")
+        dump_file.write("\n")
+
+    progress = []
+    dispatcher = DecodingDispatcher()
+    stats = bulk_load_abis(
+        dispatcher, dump_path, max_workers=2, chunk_size=8, progress_callback=progress.append
+    )
+
+    assert (stats.records, stats.unique_abis, stats.duplicate_abis, stats.failed) == (41, 1, 39, 1)
+    assert "0x99" in stats.errors[0]
+    assert progress[-1] is stats and stats.records_per_second > 0
+
+    assert len(dispatcher.class_ids) == 40
+    first, last = dispatcher.get_class((1).to_bytes(32, "big")), dispatcher.get_class(
+        (40).to_bytes(32, "big")
+    )
+    assert first.function_ids == last.function_ids and last.class_hash == (40).to_bytes(32, "big")
+
+    decoded = dispatcher.decode_function(
+        [RECIPIENT, 100, 0], [1], starknet_keccak(b"transfer"), (7).to_bytes(32, "big")
+    )
+    assert decoded.inputs == {"recipient": f"0x{RECIPIENT:064x}", "amount": 100}
+
+
+def test_bulk_load_directory(tmp_path):
+    (tmp_path / "0x0a.json").write_text(json.dumps(load_abi("starknet_eth", 2)))
+    (tmp_path / "0x0b.json").write_text(
+        json.dumps({"abi": load_abi("erc20_key_events", 2), "abi_name": "erc20"})
+    )
+
+    dispatcher = DecodingDispatcher()
+    stats = bulk_load_abis(dispatcher, tmp_path, max_workers=1)
+
+    assert (stats.records, stats.unique_abis, stats.failed) == (2, 2, 0)
+    assert dispatcher.get_class((0x0B).to_bytes(32, "big")).abi_name == "erc20"
+    assert dispatcher.get_class((0x0A).to_bytes(32, "big")).abi_name is None
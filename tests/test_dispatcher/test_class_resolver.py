@@ -0,0 +1,147 @@
+import json
+
+import pytest
+
+from nethermind.starknet_abi.core import StarknetAbi
+from nethermind.starknet_abi.dispatch import DecodingDispatcher
+from nethermind.starknet_abi.multicall import encode_multicall
+from nethermind.starknet_abi.resolver import ClassHashResolver
+from tests.utils import load_abi
+
+ETH_CLASS = b"\x01" * 32
+USDC_CLASS = b"\x02" * 32
+ACCOUNT_CLASS = b"\x03" * 32
+
+PROXY_ADDRESS = 0x123
+ACCOUNT_ADDRESS = 0x456
+
+
+@pytest.fixture(scope="module")
+def abis() -> dict[str, StarknetAbi]:
+    return {
+        "eth": StarknetAbi.from_json(load_abi("starknet_eth"), ETH_CLASS, "eth"),
+        "usdc": StarknetAbi.from_json(load_abi("starknet_usdc"), USDC_CLASS, "usdc"),
+        "account": StarknetAbi.from_json(load_abi("argent_account"), ACCOUNT_CLASS, "account"),
+    }
+
+
+@pytest.fixture(scope="module")
+def dispatcher(abis) -> DecodingDispatcher:
+    dispatcher = DecodingDispatcher()
+    for abi in abis.values():
+        dispatcher.add_abi(abi)
+    return dispatcher
+
+
+@pytest.fixture()
+def resolver() -> ClassHashResolver:
+    resolver = ClassHashResolver(cache_size=4)
+    resolver.add_class(PROXY_ADDRESS, ETH_CLASS, 100)
+    resolver.add_class(f"0x{PROXY_ADDRESS:064x}", USDC_CLASS, 200)  # replace_class upgrade
+    resolver.add_class(ACCOUNT_ADDRESS, ACCOUNT_CLASS, 50)
+    return resolver
+
+
+def test_resolve_block_ranges(resolver):
+    assert [resolver.resolve(PROXY_ADDRESS, block) for block in (0, 99, 100, 199, 200, 10**9)] == [
+        None,
+        None,
+        ETH_CLASS,
+        ETH_CLASS,
+        USDC_CLASS,
+        USDC_CLASS,
+    ]
+    assert resolver.resolve(0x999, 150) is None
+    assert resolver.history(PROXY_ADDRESS) == [(100, ETH_CLASS), (200, USDC_CLASS)]
+    assert len(resolver) == 2
+
+    # Replacing the class of an existing change, and inserting out of order
+    resolver.add_class(PROXY_ADDRESS, ACCOUNT_CLASS, 200)
+    resolver.add_class(PROXY_ADDRESS, USDC_CLASS, 150)
+    assert resolver.history(PROXY_ADDRESS) == [
+        (100, ETH_CLASS),
+        (150, USDC_CLASS),
+        (200, ACCOUNT_CLASS),
+    ]
+    assert resolver.resolve(PROXY_ADDRESS, 199) == USDC_CLASS
+
+
+def test_lookup_lru(resolver):
+    resolver.resolve(PROXY_ADDRESS, 150)
+    resolver.resolve(PROXY_ADDRESS, 150)
+    assert (resolver.hits, resolver.misses) == (1, 1)
+
+    for block in range(10):
+        resolver.resolve(ACCOUNT_ADDRESS, block)
+    resolver.resolve(PROXY_ADDRESS, 150)
+    assert (resolver.hits, resolver.misses) == (1, 12)
+
+    # Adding history invalidates cached lookups
+    resolver.resolve(PROXY_ADDRESS, 250)
+    resolver.add_class(PROXY_ADDRESS, ACCOUNT_CLASS, 250)
+    assert resolver.resolve(PROXY_ADDRESS, 250) == ACCOUNT_CLASS
+
+    resolver.clear_cache()
+    assert (resolver.hits, resolver.misses) == (0, 0)
+
+
+def test_bulk_load_file(tmp_path):
+    history_file = tmp_path / "class_history.jsonl"
+    records = [
+        {
+            "contract_address": hex(PROXY_ADDRESS),
+            "class_hash": "0x" + USDC_CLASS.hex(),
+            "block_number": 200,
+        },
+        {
+            "contract_address": hex(ACCOUNT_ADDRESS),
+            "class_hash": "0x" + ACCOUNT_CLASS.hex(),
+            "block_number": 50,
+        },
+        {"contract_address": hex(PROXY_ADDRESS), "class_hash": "0x0101", "block_number": 100},
+    ]
+    history_file.write_text("\n".join(json.dumps(record) for record in records) + "\n\n")
+
+    resolver = ClassHashResolver()
+    resolver.add_class(PROXY_ADDRESS, ETH_CLASS, 10)
+    assert resolver.load_file(history_file) == 3
+
+    assert resolver.history(PROXY_ADDRESS) == [
+        (10, ETH_CLASS),
+        (100, (0x0101).to_bytes(32, "big")),
+        (200, USDC_CLASS),
+    ]
+    assert resolver.resolve(ACCOUNT_ADDRESS, 50) == ACCOUNT_CLASS
+
+
+def test_decode_at_block(abis, dispatcher, resolver):
+    transfer_keys = [int.from_bytes(abis["eth"].events["Transfer"].signature, "big")]
+
+    before_upgrade = dispatcher.decode_event_at(
+        PROXY_ADDRESS, 150, transfer_keys, [1, 2, 3, 0], resolver
+    )
+    after_upgrade = dispatcher.decode_event_at(
+        PROXY_ADDRESS, 250, transfer_keys, [1, 2, 3, 0], resolver
+    )
+    assert (before_upgrade.abi_name, after_upgrade.abi_name) == ("eth", "usdc")
+    assert dispatcher.decode_event_at(PROXY_ADDRESS, 50, transfer_keys, [], resolver) is None
+
+    transfer = abis["eth"].functions["transfer"]
+    decoded = dispatcher.decode_function_at(
+        [1, 2, 0], [1], transfer.signature, PROXY_ADDRESS, 150, resolver
+    )
+    assert decoded.abi_name == "eth"
+    assert decoded.inputs["amount"] == 2
+
+    # Inner calls of user operations are resolved at the block of the transaction
+    execute = encode_multicall(
+        [(PROXY_ADDRESS, abis["eth"], "transfer", {"recipient": 1, "amount": 2})]
+    )
+    operation = dispatcher.decode_user_operation(
+        execute,
+        None,
+        abis["account"].functions["__execute__"].signature,
+        ACCOUNT_CLASS,
+        resolver.at_block(250),
+    )
+    assert operation.calls[0].function.abi_name == "usdc"
@@ -0,0 +1,284 @@
+import pytest
+
+from nethermind.starknet_abi import columnar
+from nethermind.starknet_abi.abi_types import (
+    AbiParameter,
+    StarknetArray,
+    StarknetCoreType,
+    StarknetEnum,
+    StarknetNonZero,
+    StarknetOption,
+    StarknetStruct,
+    StarknetTuple,
+)
+from nethermind.starknet_abi.columnar import ColumnarCollector
+from nethermind.starknet_abi.core import StarknetAbi
+from nethermind.starknet_abi.decoding_types import AbiFunction
+from nethermind.starknet_abi.dispatch import DecodingDispatcher
+from nethermind.starknet_abi.exceptions import TypeDecodeError
+from nethermind.starknet_abi.utils import starknet_keccak
+
+ETH_CLASS = bytes.fromhex("05ffbcfeb50d200a0677c48a129a11245a3fc519d1d98d76882d1c9a1b19c6ed")
+RECIPIENT = 0x7916596FEAB669322F03B6DF4E71F7B158E291FD8D273C0E53759D5B7240B4A
+
+
+@pytest.fixture()
+def list_columns(monkeypatch):
+    monkeypatch.setattr(columnar, "pa", None)
+
+
+def test_decode_functions_columnar(decoding_dispatcher, list_columns):
+    transfer = starknet_keccak(b"transfer")
+    approve = starknet_keccak(b"approve")
+
+    decoded = decoding_dispatcher.decode_functions_columnar(
+        calldata=[RECIPIENT, 100, 0, RECIPIENT, 200, 0, RECIPIENT, 300, 0, RECIPIENT, 2**200, 0],
+        calldata_offsets=[0, 3, 6, 9, 12],
+        results=[1, 1, 1, 1],
+        result_offsets=[0, 1, 2, 3, 4],
+        function_selectors=[transfer, approve, transfer, transfer],
+        class_hashes=[ETH_CLASS, ETH_CLASS, b"\x00" * 32, ETH_CLASS],
+    )
+
+    assert decoded.tables[("starknet_eth", "transfer")] == {
+        "_row_index": [0],
+        "recipient": [f"0x{RECIPIENT:064x}"],
+        "amount": [100],
+        "outputs.0": [True],
+    }
+    assert decoded.tables[("starknet_eth", "approve")]["amount"] == [200]
+    assert decoded.unknown_classes == [2]
+    assert list(decoded.errors) == [3]
+
+
+def test_decode_events_columnar(decoding_dispatcher, list_columns):
+    transfer = int.from_bytes(starknet_keccak(b"Transfer"), "big")
+
+    decoded = decoding_dispatcher.decode_events_columnar(
+        data=[RECIPIENT, RECIPIENT, 100, 0, RECIPIENT, RECIPIENT, 200, 0],
+        data_offsets=[0, 4, 8, 8],
+        keys=[transfer, transfer, 1234],
+        keys_offsets=[0, 1, 2, 3],
+        class_hashes=[ETH_CLASS] * 3,
+    )
+
+    expected = [
+        decoding_dispatcher.decode_event([RECIPIENT, RECIPIENT, amount, 0], [transfer], ETH_CLASS)
+        for amount in (100, 200)
+    ]
+    table = decoded.tables[("starknet_eth", "Transfer")]
+    assert table["_row_index"] == [0, 1]
+    for param in expected[0].data:
+        assert table[param] == [event.data[param] for event in expected]
+
+    assert isinstance(decoded.errors[2], KeyError)
+
+
+def test_wrapped_type_columns(list_columns):
+    order = AbiFunction(
+        "order",
+        [
+            AbiParameter("limit", StarknetOption(StarknetCoreType.U32)),
+            AbiParameter("nonce", StarknetNonZero(StarknetCoreType.U64)),
+            AbiParameter("pair", StarknetTuple([StarknetCoreType.U8, StarknetCoreType.Felt])),
+            AbiParameter(
+                "side",
+                StarknetEnum(
+                    "Side", [("Buy", StarknetCoreType.NoneType), ("Sell", StarknetCoreType.U16)]
+                ),
+            ),
+        ],
+        [StarknetOption(StarknetCoreType.U8)],
+    )
+    dispatcher = DecodingDispatcher()
+    dispatcher.add_abi(StarknetAbi("exchange", b"\x01" * 32, {"order": order}, {}, None, None, {}))
+
+    calls = [([0, 500, 7, 1, 2, 0], [1]), ([1, 8, 3, 4, 1, 9], [0, 6])]
+    decoded = dispatcher.decode_functions_columnar(
+        calldata=[felt for calldata, _ in calls for felt in calldata],
+        calldata_offsets=[0, 6, 12],
+        results=[felt for _, result in calls for felt in result],
+        result_offsets=[0, 1, 3],
+        function_selectors=[order.signature] * 2,
+        class_hashes=[b"\x01" * 32] * 2,
+    )
+
+    expected = [
+        dispatcher.decode_function(calldata, result, order.signature, b"\x01" * 32)
+        for calldata, result in calls
+    ]
+    table = decoded.tables[("exchange", "order")]
+    assert table["limit"] == [500, None]
+    assert table["side"] == [{"Buy": ""}, {"Sell": 9}]
+    for param in ("limit", "nonce", "pair", "side"):
+        assert table[param] == [function.inputs[param] for function in expected]
+    assert table["outputs.0"] == [None, 6]
+
+
+def test_struct_columns_are_flattened():
+    position = StarknetStruct(
+        "Position",
+        [
+            AbiParameter("owner", StarknetCoreType.U64),
+            AbiParameter(
+                "range",
+                StarknetStruct(
+                    "Range",
+                    [
+                        AbiParameter("low", StarknetCoreType.U8),
+                        AbiParameter("high", StarknetCoreType.U8),
+                    ],
+                ),
+            ),
+        ],
+    )
+    builder = ColumnarCollector().builder(
+        "pool",
+        "open",
+        object(),
+        lambda: [("position", position), ("amount", StarknetCoreType.U128)],
+    )
+    builder.append(4, [{"owner": 1, "range": {"low": 2, "high": 3}}, 500])
+
+    assert builder.to_columns() == {
+        "_row_index": [4],
+        "position.owner": [1],
+        "position.range.low": [2],
+        "position.range.high": [3],
+        "amount": [500],
+    }
+
+
+def test_struct_columns_written_in_place(list_columns, monkeypatch):
+    swap = AbiFunction(
+        "swap",
+        [
+            AbiParameter(
+                "route",
+                StarknetStruct(
+                    "Route",
+                    [
+                        AbiParameter("pool", StarknetCoreType.U64),
+                        AbiParameter("fees", StarknetArray(StarknetCoreType.U8)),
+                    ],
+                ),
+            ),
+            AbiParameter("amount", StarknetCoreType.U128),
+        ],
+        [StarknetArray(StarknetCoreType.U8)],
+    )
+    dispatcher = DecodingDispatcher()
+    dispatcher.add_abi(StarknetAbi("dex", b"\x01" * 32, {"swap": swap}, {}, None, None, {}))
+
+    # Only calls that cannot be written in place are decoded to values
+    fallback_spans = []
+    decode_values = DecodingDispatcher._decode_function_values  # pylint: disable=protected-access
+
+    def _decode_values(*args):
+        fallback_spans.append(args[5])
+        return decode_values(*args)
+
+    monkeypatch.setattr(DecodingDispatcher, "_decode_function_values", staticmethod(_decode_values))
+
+    # The second call fails after its route is written, and the last call has a legacy result without a length
+    calls = [
+        ([7, 2, 1, 2, 500], [1, 9]),
+        ([8, 1, 3, 2**128], [0]),
+        ([9, 0, 600], [1, 4, 5]),
+    ]
+    decoded = dispatcher.decode_functions_columnar(
+        calldata=[felt for calldata, _ in calls for felt in calldata],
+        calldata_offsets=[0, 5, 9, 12],
+        results=[felt for _, result in calls for felt in result],
+        result_offsets=[0, 2, 3, 6],
+        function_selectors=[swap.signature] * 3,
+        class_hashes=[b"\x01" * 32] * 3,
+    )
+
+    assert decoded.tables[("dex", "swap")] == {
+        "_row_index": [0, 2],
+        "route.pool": [7, 9],
+        "route.fees": [[1, 2], []],
+        "amount": [500, 600],
+        "outputs.0": [[9], [1, 4, 5]],
+    }
+    assert fallback_spans == [(5, 9), (9, 12)]
+    with pytest.raises(TypeDecodeError) as decode_err:
+        dispatcher.decode_function(*calls[1], swap.signature, b"\x01" * 32)
+    assert str(decoded.errors[1]) == str(decode_err.value)
+
+    # Groups without any decoded row are not returned
+    failed = dispatcher.decode_functions_columnar(
+        calldata=calls[1][0],
+        calldata_offsets=[0, 4],
+        results=calls[1][1],
+        result_offsets=[0, 1],
+        function_selectors=[swap.signature],
+        class_hashes=[b"\x01" * 32],
+    )
+    assert failed.tables == {} and list(failed.errors) == [0]
+
+
+def test_conflicting_group_types():
+    collector = ColumnarCollector()
+    collector.builder("abi", "event", object(), lambda: [("a", StarknetCoreType.U8)])
+    collector.builder("abi", "event", object(), lambda: [("a", StarknetCoreType.U8)])
+
+    with pytest.raises(ValueError, match="conflicting types"):
+        collector.builder("abi", "event", object(), lambda: [("a", StarknetCoreType.U16)])
+    with pytest.raises(ValueError, match="conflicting parameter names"):
+        collector.builder("abi", "event", object(), lambda: [("b", StarknetCoreType.U8)])
+
+
+def test_conflicting_parameter_names(list_columns):
+    # Classes without an abi name can declare the same function types with different input names
+    transfers = [
+        AbiFunction(
+            "transfer",
+            [
+                AbiParameter(recipient, StarknetCoreType.ContractAddress),
+                AbiParameter(amount, StarknetCoreType.U256),
+            ],
+            [],
+        )
+        for recipient, amount in (("recipient", "amount"), ("to", "value"))
+    ]
+    dispatcher = DecodingDispatcher()
+    for class_index, transfer in enumerate(transfers, start=1):
+        dispatcher.add_abi(
+            StarknetAbi(
+                None, class_index.to_bytes(32, "big"), {"transfer": transfer}, {}, None, None, {}
+            )
+        )
+
+    decoded = dispatcher.decode_functions_columnar(
+        calldata=[1, 100, 0, 2, 200, 0],
+        calldata_offsets=[0, 3, 6],
+        results=[],
+        result_offsets=[0, 0, 0],
+        function_selectors=[transfers[0].signature] * 2,
+        class_hashes=[(1).to_bytes(32, "big"), (2).to_bytes(32, "big")],
+    )
+
+    assert decoded.tables[(None, "transfer")]["amount"] == [100]
+    assert "value" not in decoded.tables[(None, "transfer")]
+    assert "conflicting parameter names" in str(decoded.errors[1])
+
+
+def test_arrow_record_batches(decoding_dispatcher):
+    pa = pytest.importorskip("pyarrow")
+    transfer = starknet_keccak(b"transfer")
+
+    decoded = decoding_dispatcher.decode_functions_columnar(
+        calldata=[RECIPIENT, 100, 0, RECIPIENT, 2**128 - 1, 1],
+        calldata_offsets=[0, 3, 6],
+        results=[1, 1],
+        result_offsets=[0, 1, 2],
+        function_selectors=[transfer, transfer],
+        class_hashes=[ETH_CLASS, ETH_CLASS],
+    )
+
+    batch = decoded.tables[("starknet_eth", "transfer")]
+    assert isinstance(batch, pa.RecordBatch)
+    assert batch.column("amount").to_pylist() == ["100", str(2**256 - 1)]
+    assert batch.column("outputs.0").to_pylist() == [True, True]
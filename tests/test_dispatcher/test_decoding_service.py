@@ -0,0 +1,149 @@
+import asyncio
+import json
+
+import pytest
+
+from nethermind.starknet_abi.core import StarknetAbi
+from nethermind.starknet_abi.dispatch import DecodingDispatcher
+from nethermind.starknet_abi.exceptions import InvalidCalldataError
+from nethermind.starknet_abi.service import DecodingService, serve
+from tests.utils import load_abi
+
+ETH_CLASS = b"\x01" * 32
+UNKNOWN_CLASS = b"\x09" * 32
+
+
+@pytest.fixture(scope="module")
+def eth() -> StarknetAbi:
+    return StarknetAbi.from_json(load_abi("starknet_eth"), ETH_CLASS, "eth")
+
+
+@pytest.fixture(scope="module")
+def dispatcher(eth) -> DecodingDispatcher:
+    dispatcher = DecodingDispatcher()
+    dispatcher.add_abi(eth)
+    return dispatcher
+
+
+def test_micro_batched_requests(eth, dispatcher):
+    transfer = eth.functions["transfer"]
+    transfer_key = int.from_bytes(eth.events["Transfer"].signature, "big")
+
+    async def _decode():
+        async with DecodingService(dispatcher, max_batch_size=8, max_latency=0.05) as service:
+            requests = [
+                service.decode_function([amount, amount, 0], [1], transfer.signature, ETH_CLASS)
+                for amount in range(10)
+            ]
+            requests.append(service.decode_event([1, 2, 3, 0], [transfer_key], ETH_CLASS))
+            requests.append(service.decode_function([1], [], transfer.signature, ETH_CLASS))
+            requests.append(service.decode_function([1], [], transfer.signature, UNKNOWN_CLASS))
+            return await asyncio.gather(*requests, return_exceptions=True), service.stats()
+
+    results, stats = asyncio.run(_decode())
+
+    assert [decoded.inputs["amount"] for decoded in results[:10]] == list(range(10))
+    assert results[0].outputs == [True]
+    assert results[10].name == "Transfer"
+    assert results[10].data["value"] == 3
+    assert isinstance(results[11], InvalidCalldataError)
+    assert results[12] is None
+
+    assert (stats.requests, stats.completed, stats.queue_depth) == (13, 13, 0)
+    assert stats.batches == 2
+    assert stats.mean_batch_size == 6.5
+    assert stats.mean_latency > 0
+
+
+def test_backpressure_and_stop(eth, dispatcher):
+    transfer = eth.functions["transfer"]
+
+    async def _fill_queue():
+        service = DecodingService(dispatcher, max_queue_size=2)
+        with pytest.raises(RuntimeError, match="must be started"):
+            await service.submit_function([1, 2, 0], [], transfer.signature, ETH_CLASS)
+
+        await service.start()
+        # Stop the batcher, so queued requests are never decoded
+        service._batcher.cancel()  # pylint: disable=protected-access
+
+        futures = [
+            await service.submit_function([1, 2, 0], [], transfer.signature, ETH_CLASS)
+            for _ in range(2)
+        ]
+        blocked = asyncio.create_task(
+            service.submit_function([1, 2, 0], [], transfer.signature, ETH_CLASS)
+        )
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+
+        stats = service.stats()
+        await service.stop()
+
+        # The blocked submitter is released, and its request is cancelled with the queued requests
+        futures.append(await blocked)
+        return futures, stats
+
+    futures, stats = asyncio.run(_fill_queue())
+    assert (stats.queue_depth, stats.max_queue_depth, stats.blocked_submits) == (2, 2, 1)
+    assert len(futures) == 3
+    assert all(future.cancelled() for future in futures)
+
+    with pytest.raises(ValueError, match="must be positive"):
+        DecodingService(dispatcher, max_batch_size=0)
+
+
+def test_stop_cancels_pending_batch(eth, dispatcher):
+    transfer = eth.functions["transfer"]
+
+    async def _stop_pending():
+        service = DecodingService(dispatcher, max_latency=5)
+        await service.start()
+        future = await service.submit_function([1, 2, 0], [1], transfer.signature, ETH_CLASS)
+
+        # The request is taken from the queue, and waits for the batch to fill
+        await asyncio.sleep(0.05)
+        assert service.stats().queue_depth == 0
+        await service.stop()
+        return future
+
+    assert asyncio.run(asyncio.wait_for(_stop_pending(), 1)).cancelled()
+
+
+def test_json_lines_server(eth, dispatcher):
+    transfer = eth.functions["transfer"]
+    requests = [
+        {
+            "id": 1,
+            "type": "function",
+            "calldata": [1, 2, 0],
+            "result": [1],
+            "selector": "0x" + transfer.signature.hex(),
+            "class_hash": "0x" + ETH_CLASS.hex(),
+        },
+        {"id": 2, "type": "function", "calldata": [1], "selector": "0x01", "class_hash": "0x09"},
+        {"id": 3, "type": "unknown"},
+        {"id": 4, "type": "stats"},
+    ]
+
+    async def _query():
+        async with DecodingService(dispatcher, max_latency=0.001) as service:
+            server = await serve(service, port=0)
+            port = server.sockets[0].getsockname()[1]
+
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(b"".join(json.dumps(request).encode() + b"\n" for request in requests))
+            await writer.drain()
+            responses = [json.loads(await reader.readline()) for _ in requests]
+
+            writer.close()
+            server.close()
+            await server.wait_closed()
+            return {response["id"]: response for response in responses}
+
+    responses = asyncio.run(_query())
+    assert responses[1]["result"]["inputs"] == {"recipient": f"0x{1:064x}", "amount": 2}
+    assert responses[1]["result"]["outputs"] == [True]
+    assert responses[2]["result"] is None
+    assert "Unknown request type" in responses[3]["error"]
+    assert responses[4]["result"]["requests"] >= 1
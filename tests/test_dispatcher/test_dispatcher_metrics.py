@@ -0,0 +1,128 @@
+import pickle
+
+import pytest
+
+from nethermind.starknet_abi.core import StarknetAbi
+from nethermind.starknet_abi.dispatch import DecodingDispatcher
+from nethermind.starknet_abi.exceptions import InvalidCalldataError
+from nethermind.starknet_abi.metrics import DispatcherMetrics, LatencyHistogram
+from tests.utils import load_abi
+
+ETH_CLASS = b"\x01" * 32
+UNKNOWN_CLASS = b"\x09" * 32
+
+
+@pytest.fixture(scope="module")
+def eth() -> StarknetAbi:
+    return StarknetAbi.from_json(load_abi("starknet_eth"), ETH_CLASS, "eth")
+
+
+@pytest.fixture()
+def dispatcher(eth) -> DecodingDispatcher:
+    dispatcher = DecodingDispatcher()
+    dispatcher.add_abi(eth)
+    return dispatcher
+
+
+def test_metrics_disabled_by_default(eth, dispatcher):
+    transfer = eth.functions["transfer"].signature
+    assert dispatcher.disable_metrics() is None
+
+    dispatcher.decode_function([1, 2, 0], [1], transfer, ETH_CLASS)
+    metrics = dispatcher.enable_metrics()
+    assert metrics.snapshot().selectors == {}
+    assert dispatcher.enable_metrics() is metrics
+
+    # Enabled metrics are pickled with the dispatcher
+    assert pickle.loads(pickle.dumps(dispatcher)).enable_metrics() is not metrics
+
+
+def test_function_and_event_metrics(eth, dispatcher):
+    transfer = eth.functions["transfer"].signature
+    transfer_key = int.from_bytes(eth.events["Transfer"].signature, "big")
+    metrics = dispatcher.enable_metrics()
+
+    for amount in range(3):
+        dispatcher.decode_function([1, amount, 0], [1], transfer, ETH_CLASS)
+    dispatcher.decode_event([1, 2, 3, 0], [transfer_key], ETH_CLASS)
+    assert dispatcher.decode_function([1, 2, 0], [1], transfer, UNKNOWN_CLASS) is None
+
+    with pytest.raises(InvalidCalldataError):
+        dispatcher.decode_function([1, 2], [1], transfer, ETH_CLASS)
+    with pytest.raises(KeyError):
+        dispatcher.decode_function([1], [], b"\x07" * 32, ETH_CLASS)
+    with pytest.raises(KeyError):
+        dispatcher.decode_event([], [7], ETH_CLASS)
+
+    snapshot = metrics.snapshot()
+    transfer_stats = snapshot.selectors[(ETH_CLASS[-8:], transfer[-8:])]
+    assert (transfer_stats.calls, transfer_stats.felts, transfer_stats.errors) == (3, 12, 1)
+    assert transfer_stats.latency.count == 3
+    assert transfer_stats.latency.percentile_ns(1.0) >= transfer_stats.latency.max_ns > 0
+
+    event_stats = snapshot.selectors[(ETH_CLASS[-8:], eth.events["Transfer"].signature[-8:])]
+    assert (event_stats.calls, event_stats.felts) == (1, 5)
+
+    assert snapshot.classes()[ETH_CLASS[-8:]].calls == 4
+    assert snapshot.top_selectors(1)[0][0][1] in (
+        transfer[-8:],
+        eth.events["Transfer"].signature[-8:],
+    )
+    assert snapshot.unknown_classes == {UNKNOWN_CLASS[-8:]: 1}
+    assert snapshot.unknown_selectors == {
+        (ETH_CLASS[-8:], b"\x07" * 8): 1,
+        (ETH_CLASS[-8:], (7).to_bytes(8, "big")): 1,
+    }
+    assert snapshot.exceptions == {"InvalidCalldataError": 1}
+    assert snapshot.class_hit_rate == pytest.approx(7 / 8)
+    assert snapshot.selector_hit_rate == pytest.approx(5 / 7)
+
+    # Snapshots are copies, and are not changed by reset
+    metrics.reset()
+    assert metrics.snapshot().selectors == {}
+    assert transfer_stats.calls == 3
+
+
+def test_batch_metrics(eth, dispatcher):
+    transfer = eth.functions["transfer"].signature
+    transfer_key = int.from_bytes(eth.events["Transfer"].signature, "big")
+    metrics = dispatcher.enable_metrics(DispatcherMetrics())
+
+    dispatcher.decode_functions_batch(
+        calldata=[1, 2, 0, 1, 2, 1, 2, 0],
+        calldata_offsets=[0, 3, 5, 8, 8],
+        results=[1, 1],
+        result_offsets=[0, 1, 1, 2, 2],
+        function_selectors=[transfer, transfer, transfer, b"\x07" * 32],
+        class_hashes=[ETH_CLASS, ETH_CLASS, UNKNOWN_CLASS, ETH_CLASS],
+    )
+    dispatcher.decode_events_batch(
+        data=[1, 2, 3, 0, 1],
+        data_offsets=[0, 4, 5, 5],
+        keys=[transfer_key, transfer_key],
+        keys_offsets=[0, 1, 2, 2],
+        class_hashes=[ETH_CLASS, ETH_CLASS, ETH_CLASS],
+    )
+
+    snapshot = dispatcher.disable_metrics().snapshot()
+    transfer_stats = snapshot.selectors[(ETH_CLASS[-8:], transfer[-8:])]
+    assert (transfer_stats.calls, transfer_stats.felts, transfer_stats.errors) == (1, 4, 1)
+
+    event_stats = snapshot.selectors[(ETH_CLASS[-8:], eth.events["Transfer"].signature[-8:])]
+    assert (event_stats.calls, event_stats.errors) == (1, 1)
+
+    assert snapshot.unknown_classes == {UNKNOWN_CLASS[-8:]: 1}
+    assert snapshot.unknown_selectors == {(ETH_CLASS[-8:], b"\x07" * 8): 1}
+    assert snapshot.exceptions == {"InvalidCalldataError": 3}
+
+
+def test_latency_histogram_merge():
+    histogram, other = LatencyHistogram(), LatencyHistogram()
+    histogram.record(100)
+    other.record(5_000)
+    other.record(0)
+
+    histogram.merge(other)
+    assert (histogram.count, histogram.total_ns, histogram.max_ns) == (3, 5_100, 5_000)
+    assert histogram.percentile_ns(0.0) == 1
+    assert LatencyHistogram().percentile_ns(0.5) == 0
@@ -0,0 +1,83 @@
+import marshal
+import pickle
+
+import pytest
+
+from nethermind.starknet_abi.core import StarknetAbi
+from nethermind.starknet_abi.dispatch import DecodingDispatcher
+from nethermind.starknet_abi.snapshot import (
+    SNAPSHOT_MAGIC,
+    dumps_dispatcher,
+    loads_dispatcher,
+)
+from nethermind.starknet_abi.utils import starknet_keccak
+from tests.utils import load_abi
+
+ETH_CLASS = bytes.fromhex("05ffbcfeb50d200a0677c48a129a11245a3fc519d1d98d76882d1c9a1b19c6ed")
+RECIPIENT = 0x7916596FEAB669322F03B6DF4E71F7B158E291FD8D273C0E53759D5B7240B4A
+
+
+def test_snapshot_round_trip(decoding_dispatcher, tmp_path):
+    snapshot_path = tmp_path / "dispatcher.snapshot"
+    decoding_dispatcher.save(snapshot_path)
+
+    loaded = DecodingDispatcher.load(snapshot_path)
+
+    assert loaded.class_ids == decoding_dispatcher.class_ids
+    assert loaded.function_types == decoding_dispatcher.function_types
+    assert loaded.event_types == decoding_dispatcher.event_types
+
+    transfer_selector = starknet_keccak(b"transfer")
+    assert loaded.decode_function(
+        [RECIPIENT, 100, 0], [1], transfer_selector, ETH_CLASS
+    ) == decoding_dispatcher.decode_function([RECIPIENT, 100, 0], [1], transfer_selector, ETH_CLASS)
+
+
+def test_snapshot_deduplicates_types():
+    dispatcher = DecodingDispatcher()
+    abi_json = load_abi("starknet_eth", 2)
+    for class_index in range(20):
+        dispatcher.add_abi(
+            StarknetAbi.from_json(abi_json, class_index.to_bytes(32, "big"), "starknet_eth")
+        )
+
+    snapshot = dumps_dispatcher(dispatcher)
+    assert len(snapshot) < len(pickle.dumps(dispatcher)) / 4
+
+    loaded = loads_dispatcher(snapshot)
+    assert loaded.class_ids == dispatcher.class_ids
+
+    # Identical type trees are shared after loading
+    u256_types = {
+        id(param.type)
+        for inputs, _ in loaded.function_types.values()
+        for param in inputs
+        if param.name == "amount"
+    }
+    assert len(u256_types) == 1
+
+    first, second = loaded.get_class((0).to_bytes(32, "big")), loaded.get_class(
+        (1).to_bytes(32, "big")
+    )
+    assert first.function_ids is not second.function_ids
+    assert first.function_ids.keys() == second.function_ids.keys()
+
+
+def test_invalid_snapshots(decoding_dispatcher):
+    snapshot = dumps_dispatcher(decoding_dispatcher)
+
+    with pytest.raises(ValueError, match="not a DecodingDispatcher Snapshot"):
+        loads_dispatcher(pickle.dumps(decoding_dispatcher))
+
+    with pytest.raises(ValueError, match="Unsupported DecodingDispatcher Snapshot version 255"):
+        loads_dispatcher(
+            SNAPSHOT_MAGIC + (255).to_bytes(2, "big") + snapshot[len(SNAPSHOT_MAGIC) + 2 :]
+        )
+
+    # Snapshots written by interpreters with another marshal format are rejected
+    with pytest.raises(ValueError, match=f"written with marshal version {marshal.version + 1}"):
+        loads_dispatcher(
+            snapshot[: len(SNAPSHOT_MAGIC) + 2]
+            + (marshal.version + 1).to_bytes(2, "big")
+            + snapshot[len(SNAPSHOT_MAGIC) + 4 :]
+        )
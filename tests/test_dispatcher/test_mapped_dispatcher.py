@@ -0,0 +1,85 @@
+import marshal
+
+import pytest
+
+from nethermind.starknet_abi.exceptions import ReadOnlyDispatcherError
+from nethermind.starknet_abi.mapped import MappedDecodingDispatcher, write_mapped_index
+from nethermind.starknet_abi.parallel import ParallelDecodingDispatcher
+from nethermind.starknet_abi.utils import starknet_keccak
+
+ETH_CLASS = bytes.fromhex("05ffbcfeb50d200a0677c48a129a11245a3fc519d1d98d76882d1c9a1b19c6ed")
+RECIPIENT = 0x7916596FEAB669322F03B6DF4E71F7B158E291FD8D273C0E53759D5B7240B4A
+
+
+@pytest.fixture()
+def mapped_dispatcher(decoding_dispatcher, tmp_path):
+    index_path = tmp_path / "dispatcher.index"
+    write_mapped_index(decoding_dispatcher, index_path)
+
+    with MappedDecodingDispatcher(index_path) as mapped:
+        yield mapped
+
+
+def test_mapped_index_matches_dispatcher(decoding_dispatcher, mapped_dispatcher):
+    assert len(mapped_dispatcher.class_ids) == len(decoding_dispatcher.class_ids)
+    for class_id, class_dispatcher in decoding_dispatcher.class_ids.items():
+        assert mapped_dispatcher.class_ids[class_id] == class_dispatcher
+
+    assert dict(mapped_dispatcher.function_types) == decoding_dispatcher.function_types
+    assert dict(mapped_dispatcher.event_types) == decoding_dispatcher.event_types
+
+    assert mapped_dispatcher.get_class(b"\x00" * 32) is None
+
+
+def test_mapped_lazy_materialization(decoding_dispatcher, mapped_dispatcher):
+    transfer_selector = starknet_keccak(b"transfer")
+
+    assert not mapped_dispatcher.class_ids.materialized
+    assert not mapped_dispatcher.function_types.materialized
+
+    decoded = mapped_dispatcher.decode_function(
+        [RECIPIENT, 100, 0], [1], transfer_selector, ETH_CLASS
+    )
+    assert decoded == decoding_dispatcher.decode_function(
+        [RECIPIENT, 100, 0], [1], transfer_selector, ETH_CLASS
+    )
+
+    assert list(mapped_dispatcher.class_ids.materialized) == [ETH_CLASS[-8:]]
+    assert len(mapped_dispatcher.function_types.materialized) == 1
+
+    transfer_event = int.from_bytes(starknet_keccak(b"Transfer"), "big")
+    assert mapped_dispatcher.decode_event(
+        [RECIPIENT, RECIPIENT, 100, 0], [transfer_event], ETH_CLASS
+    ) == decoding_dispatcher.decode_event(
+        [RECIPIENT, RECIPIENT, 100, 0], [transfer_event], ETH_CLASS
+    )
+
+    with pytest.raises(ReadOnlyDispatcherError, match="read-only"):
+        mapped_dispatcher.add_abi(None)
+
+
+def test_mapped_dispatcher_in_worker_processes(mapped_dispatcher):
+    transfer_selector = starknet_keccak(b"transfer")
+    work = [(ETH_CLASS, transfer_selector, [RECIPIENT, amount, 0], [1]) for amount in range(20)]
+
+    with ParallelDecodingDispatcher(mapped_dispatcher, max_workers=2, chunk_size=4) as parallel:
+        decoded = list(parallel.decode_functions(work))
+
+    assert [result.inputs["amount"] for result in decoded] == list(range(20))
+
+
+def test_invalid_mapped_index(decoding_dispatcher, tmp_path):
+    index_path = tmp_path / "invalid.index"
+    index_path.write_bytes(b"\x00" * 128)
+
+    with pytest.raises(ValueError, match="not a Mapped DecodingDispatcher Index"):
+        MappedDecodingDispatcher(index_path)
+
+    # Indexes written by interpreters with another marshal format are rejected
+    write_mapped_index(decoding_dispatcher, index_path)
+    index = bytearray(index_path.read_bytes())
+    index[10:12] = (marshal.version + 1).to_bytes(2, "big")
+    index_path.write_bytes(index)
+
+    with pytest.raises(ValueError, match=f"written with marshal version {marshal.version + 1}"):
+        MappedDecodingDispatcher(index_path)
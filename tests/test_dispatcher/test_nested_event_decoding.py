@@ -0,0 +1,145 @@
+import pytest
+
+from nethermind.starknet_abi.core import StarknetAbi
+from nethermind.starknet_abi.dispatch import DecodingDispatcher
+from nethermind.starknet_abi.mapped import MappedDecodingDispatcher, write_mapped_index
+from nethermind.starknet_abi.snapshot import dumps_dispatcher, loads_dispatcher
+from nethermind.starknet_abi.utils import starknet_keccak
+from tests.utils import load_abi
+
+CLASS_HASH = b"\x03" * 32
+
+# fmt: off
+NESTED_EVENT_ABI = [
+    {"type": "event", "name": "erc20::ERC20Component::Transfer", "kind": "struct", "members": [
+        {"name": "from", "type": "core::integer::u128", "kind": "key"},
+        {"name": "to", "type": "core::integer::u128", "kind": "key"},
+        {"name": "value", "type": "core::integer::u128", "kind": "data"},
+    ]},
+    {"type": "event", "name": "erc20::ERC20Component::Approval", "kind": "struct", "members": [
+        {"name": "owner", "type": "core::integer::u128", "kind": "key"},
+        {"name": "value", "type": "core::integer::u128", "kind": "data"},
+    ]},
+    {"type": "event", "name": "erc20::ERC20Component::Event", "kind": "enum", "variants": [
+        {"name": "Transfer", "type": "erc20::ERC20Component::Transfer", "kind": "nested"},
+        {"name": "Approval", "type": "erc20::ERC20Component::Approval", "kind": "nested"},
+    ]},
+    {"type": "event", "name": "ownable::OwnableComponent::OwnershipTransferred", "kind": "struct", "members": [
+        {"name": "new_owner", "type": "core::integer::u128", "kind": "data"},
+    ]},
+    {"type": "event", "name": "ownable::OwnableComponent::Event", "kind": "enum", "variants": [
+        {"name": "OwnershipTransferred", "type": "ownable::OwnableComponent::OwnershipTransferred", "kind": "nested"},
+    ]},
+    {"type": "event", "name": "token::Token::Minted", "kind": "struct", "members": [
+        {"name": "amount", "type": "core::integer::u128", "kind": "data"},
+    ]},
+    {"type": "event", "name": "token::Token::Event", "kind": "enum", "variants": [
+        {"name": "ERC20Event", "type": "erc20::ERC20Component::Event", "kind": "nested"},
+        {"name": "OwnableEvent", "type": "ownable::OwnableComponent::Event", "kind": "flat"},
+        {"name": "Minted", "type": "token::Token::Minted", "kind": "nested"},
+    ]},
+]
+# fmt: on
+
+
+def _selector(name: str) -> int:
+    return int.from_bytes(starknet_keccak(name.encode()), "big")
+
+
+@pytest.fixture()
+def nested_dispatcher() -> DecodingDispatcher:
+    dispatcher = DecodingDispatcher()
+    dispatcher.add_abi(StarknetAbi.from_json(NESTED_EVENT_ABI, CLASS_HASH, "token"))
+    return dispatcher
+
+
+def test_parse_event_selector_index():
+    parsed_abi = StarknetAbi.from_json(NESTED_EVENT_ABI)
+
+    assert {
+        tuple(int.from_bytes(selector, "big") for selector in chain): event.name
+        for chain, event in parsed_abi.event_selectors.items()
+    } == {
+        (_selector("ERC20Event"), _selector("Transfer")): "Transfer",
+        (_selector("ERC20Event"), _selector("Approval")): "Approval",
+        (_selector("OwnershipTransferred"),): "OwnershipTransferred",
+        (_selector("Minted"),): "Minted",
+    }
+
+
+def test_parse_flat_component_events():
+    parsed_abi = StarknetAbi.from_json(load_abi("erc20_key_events", 2))
+
+    transfer = parsed_abi.event_selectors[(starknet_keccak(b"Transfer"),)]
+    assert list(transfer.keys) == ["from", "to"]
+
+
+def test_decode_nested_event(nested_dispatcher):
+    decoded = nested_dispatcher.decode_event(
+        [100], [_selector("ERC20Event"), _selector("Transfer"), 1, 2], CLASS_HASH
+    )
+    assert decoded.name == "Transfer"
+    assert decoded.data == {"from": 1, "to": 2, "value": 100}
+
+    decoded = nested_dispatcher.decode_event(
+        [5], [_selector("ERC20Event"), _selector("Approval"), 3], CLASS_HASH
+    )
+    assert decoded.name == "Approval"
+    assert decoded.data == {"owner": 3, "value": 5}
+
+
+def test_decode_flat_and_struct_events(nested_dispatcher):
+    decoded = nested_dispatcher.decode_event([7], [_selector("OwnershipTransferred")], CLASS_HASH)
+    assert decoded.name == "OwnershipTransferred"
+    assert decoded.data == {"new_owner": 7}
+
+    decoded = nested_dispatcher.decode_event([9], [_selector("Minted")], CLASS_HASH)
+    assert decoded.data == {"amount": 9}
+
+
+def test_decode_unknown_nested_selector(nested_dispatcher):
+    with pytest.raises(KeyError):
+        nested_dispatcher.decode_event([], [_selector("ERC20Event")], CLASS_HASH)
+
+    with pytest.raises(KeyError):
+        nested_dispatcher.decode_event(
+            [], [_selector("ERC20Event"), _selector("Unknown")], CLASS_HASH
+        )
+
+
+def test_decode_nested_events_batch(nested_dispatcher):
+    event_keys = [
+        [_selector("ERC20Event"), _selector("Transfer"), 1, 2],
+        [_selector("ERC20Event"), _selector("Approval"), 3],
+        [_selector("ERC20Event"), _selector("Unknown")],
+        [_selector("Minted")],
+    ]
+    event_data = [[100], [5], [], [9]]
+
+    decoded = nested_dispatcher.decode_events_batch(
+        data=[value for data in event_data for value in data],
+        data_offsets=[0, 1, 2, 2, 3],
+        keys=[key for keys in event_keys for key in keys],
+        keys_offsets=[0, 4, 7, 9, 10],
+        class_hashes=[CLASS_HASH] * 4,
+    )
+
+    assert decoded[0] == nested_dispatcher.decode_event(event_data[0], event_keys[0], CLASS_HASH)
+    assert decoded[1].name == "Approval"
+    assert isinstance(decoded[2], KeyError)
+    assert decoded[3].data == {"amount": 9}
+
+
+def test_nested_events_serialization(nested_dispatcher, tmp_path):
+    event_keys = [_selector("ERC20Event"), _selector("Transfer"), 1, 2]
+    expected = nested_dispatcher.decode_event([100], event_keys, CLASS_HASH)
+
+    loaded = loads_dispatcher(dumps_dispatcher(nested_dispatcher))
+    assert loaded.class_ids == nested_dispatcher.class_ids
+    assert loaded.decode_event([100], event_keys, CLASS_HASH) == expected
+
+    index_path = tmp_path / "nested.index"
+    write_mapped_index(nested_dispatcher, index_path)
+    with MappedDecodingDispatcher(index_path) as mapped_dispatcher:
+        assert mapped_dispatcher.get_class(CLASS_HASH) == nested_dispatcher.get_class(CLASS_HASH)
+        assert mapped_dispatcher.decode_event([100], event_keys, CLASS_HASH) == expected
@@ -0,0 +1,41 @@
+import pytest
+
+from nethermind.starknet_abi.exceptions import TypeDecodeError
+from nethermind.starknet_abi.parallel import ParallelDecodingDispatcher
+from nethermind.starknet_abi.utils import starknet_keccak
+
+ETH_CLASS = bytes.fromhex("05ffbcfeb50d200a0677c48a129a11245a3fc519d1d98d76882d1c9a1b19c6ed")
+RECIPIENT = 0x7916596FEAB669322F03B6DF4E71F7B158E291FD8D273C0E53759D5B7240B4A
+
+
+@pytest.fixture(scope="module")
+def transfer_selector():
+    return starknet_keccak(b"transfer")
+
+
+def test_parallel_function_decoding(decoding_dispatcher, transfer_selector):
+    work = [(ETH_CLASS, transfer_selector, [RECIPIENT, amount, 0], [1]) for amount in range(250)]
+    work.append((ETH_CLASS, transfer_selector, [RECIPIENT, 2**128, 0], [1]))
+    work.append((b"\x00" * 32, transfer_selector, [RECIPIENT, 1, 0], [1]))
+
+    with ParallelDecodingDispatcher(decoding_dispatcher, max_workers=2, chunk_size=16) as parallel:
+        decoded = list(parallel.decode_functions(iter(work)))
+
+    assert len(decoded) == len(work)
+    assert [result.inputs["amount"] for result in decoded[:250]] == list(range(250))
+    assert decoded[0] == decoding_dispatcher.decode_function(
+        [RECIPIENT, 0, 0], [1], transfer_selector, ETH_CLASS
+    )
+    assert isinstance(decoded[250], TypeDecodeError)
+    assert decoded[251] is None
+
+
+def test_parallel_event_decoding(decoding_dispatcher):
+    transfer_key = int.from_bytes(starknet_keccak(b"Transfer"), "big")
+    work = [(ETH_CLASS, [transfer_key], [RECIPIENT, 0x1234, value, 0]) for value in range(40)]
+
+    with ParallelDecodingDispatcher(decoding_dispatcher, max_workers=2, chunk_size=7) as parallel:
+        decoded = list(parallel.decode_events(work))
+
+    assert [event.data["value"] for event in decoded] == list(range(40))
+    assert decoded[3] == decoding_dispatcher.decode_event(work[3][2], work[3][1], ETH_CLASS)
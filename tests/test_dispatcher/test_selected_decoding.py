@@ -0,0 +1,138 @@
+import pytest
+
+from nethermind.starknet_abi.abi_types import (
+    AbiParameter,
+    StarknetArray,
+    StarknetCoreType,
+)
+from nethermind.starknet_abi.core import StarknetAbi
+from nethermind.starknet_abi.decode import decode_selected_params_at
+from nethermind.starknet_abi.decoding_types import AbiEvent, AbiFunction
+from nethermind.starknet_abi.dispatch import DecodingDispatcher
+from nethermind.starknet_abi.exceptions import InvalidCalldataError
+
+CLASS_HASH = b"\x01" * 32
+
+MULTICALL = AbiFunction(
+    "execute",
+    [
+        AbiParameter("to", StarknetCoreType.ContractAddress),
+        AbiParameter("payload", StarknetArray(StarknetArray(StarknetCoreType.U8))),
+        AbiParameter("signature", StarknetArray(StarknetCoreType.Felt)),
+        AbiParameter("amount", StarknetCoreType.U256),
+    ],
+    [StarknetCoreType.Bool, StarknetCoreType.U32],
+)
+
+TRANSFER = AbiEvent(
+    "Transfer",
+    ["from", "to", "value", "memo"],
+    keys={"from": StarknetCoreType.U128, "to": StarknetCoreType.U128},
+    data={"value": StarknetCoreType.U256, "memo": StarknetArray(StarknetCoreType.Felt)},
+)
+
+# to, payload = [[1, 2], [3]], signature = [4, 5, 6], amount
+CALLDATA = [7, 2, 2, 1, 2, 1, 3, 3, 4, 5, 6, 500, 0]
+TRANSFER_KEYS = [int.from_bytes(TRANSFER.signature, "big"), 1, 2]
+TRANSFER_DATA = [100, 0, 2, 9, 9]
+
+
+@pytest.fixture()
+def dispatcher() -> DecodingDispatcher:
+    dispatcher = DecodingDispatcher()
+    dispatcher.add_abi(
+        StarknetAbi(
+            "wallet", CLASS_HASH, {"execute": MULTICALL}, {"Transfer": TRANSFER}, None, None, {}
+        )
+    )
+    return dispatcher
+
+
+def test_selected_params_skip_unselected():
+    decoded, end_offset = decode_selected_params_at(MULTICALL.inputs, ["amount"], CALLDATA)
+    assert decoded == {"amount": 500}
+    assert end_offset == len(CALLDATA)
+
+    decoded, _ = decode_selected_params_at(MULTICALL.inputs, ["to", "signature"], CALLDATA)
+    assert decoded == {"to": f"0x{7:064x}", "signature": ["0x04", "0x05", "0x06"]}
+
+    decoded, _ = decode_selected_params_at(MULTICALL.inputs, [], CALLDATA)
+    assert decoded == {}
+
+    # Skipped arrays must still fit in the calldata
+    with pytest.raises(InvalidCalldataError):
+        decode_selected_params_at(MULTICALL.inputs[:3], ["to"], CALLDATA[:9])
+
+
+def test_function_selection():
+    decoded = MULTICALL.decode(CALLDATA, [1, 5], selection={"calldata": ["amount"]})
+    assert decoded.inputs == {"amount": 500}
+    assert decoded.outputs is None
+
+    decoded = MULTICALL.decode(CALLDATA, [1, 5], selection={"calldata": [], "result": [1]})
+    assert decoded.inputs == {}
+    assert decoded.outputs == [5]
+
+
+def test_event_selection():
+    decoded = TRANSFER.decode(TRANSFER_DATA, TRANSFER_KEYS, selection={"keys": ["to"]})
+    assert decoded.data == {"to": 2}
+
+    decoded = TRANSFER.decode(
+        TRANSFER_DATA, TRANSFER_KEYS, selection={"keys": ["from", "to"], "data": ["value"]}
+    )
+    assert decoded.data == {"from": 1, "to": 2, "value": 100}
+
+    # Skipped parameters still consume the keys and data
+    with pytest.raises(InvalidCalldataError):
+        TRANSFER.decode(TRANSFER_DATA[:-1], TRANSFER_KEYS, selection={"keys": ["to"]})
+    with pytest.raises(InvalidCalldataError):
+        TRANSFER.decode(TRANSFER_DATA, TRANSFER_KEYS[:-1], selection={"data": ["value"]})
+    with pytest.raises(InvalidCalldataError):
+        TRANSFER.decode(TRANSFER_DATA, TRANSFER_KEYS + [3], selection={"data": ["value"]})
+
+
+def test_dispatcher_selection(dispatcher):
+    selection = {"calldata": ["amount"], "keys": ["from", "to"]}
+
+    decoded = dispatcher.decode_function(
+        CALLDATA, [1, 5], MULTICALL.signature, CLASS_HASH, selection=selection
+    )
+    assert decoded.inputs == {"amount": 500}
+    assert decoded.outputs is None
+
+    decoded_event = dispatcher.decode_event(
+        TRANSFER_DATA, TRANSFER_KEYS, CLASS_HASH, selection=selection
+    )
+    assert decoded_event.data == {"from": 1, "to": 2}
+
+    with pytest.raises(InvalidCalldataError):
+        dispatcher.decode_function(
+            CALLDATA + [0], [], MULTICALL.signature, CLASS_HASH, selection=selection
+        )
+
+
+def test_dispatcher_batch_selection(dispatcher):
+    decoded = dispatcher.decode_functions_batch(
+        calldata=CALLDATA * 2,
+        calldata_offsets=[0, len(CALLDATA), 2 * len(CALLDATA)],
+        results=[1, 5, 0, 6],
+        result_offsets=[0, 2, 4],
+        function_selectors=[MULTICALL.signature] * 2,
+        class_hashes=[CLASS_HASH] * 2,
+        selection={"calldata": ["to"], "result": [0, 1]},
+    )
+    assert [(call.inputs, call.outputs) for call in decoded] == [
+        ({"to": f"0x{7:064x}"}, [True, 5]),
+        ({"to": f"0x{7:064x}"}, [False, 6]),
+    ]
+
+    decoded_events = dispatcher.decode_events_batch(
+        data=TRANSFER_DATA,
+        data_offsets=[0, len(TRANSFER_DATA)],
+        keys=TRANSFER_KEYS,
+        keys_offsets=[0, len(TRANSFER_KEYS)],
+        class_hashes=[CLASS_HASH],
+        selection={"data": ["memo"]},
+    )
+    assert decoded_events[0].data == {"memo": ["0x09", "0x09"]}
@@ -0,0 +1,124 @@
+import pytest
+
+from nethermind.starknet_abi.core import StarknetAbi
+from nethermind.starknet_abi.dispatch import DecodingDispatcher
+from nethermind.starknet_abi.exceptions import InvalidCalldataError
+from nethermind.starknet_abi.mapped import MappedDecodingDispatcher, write_mapped_index
+from nethermind.starknet_abi.utils import starknet_keccak
+from tests.test_dispatcher.test_nested_event_decoding import NESTED_EVENT_ABI
+from tests.utils import load_abi
+
+TRANSFER = starknet_keccak(b"Transfer")
+TRANSFER_KEY = int.from_bytes(TRANSFER, "big")
+
+
+def _selector(name: str) -> int:
+    return int.from_bytes(starknet_keccak(name.encode()), "big")
+
+
+@pytest.fixture()
+def dispatcher() -> DecodingDispatcher:
+    dispatcher = DecodingDispatcher()
+    for abi_name, abi_version, class_hash in [
+        ("starknet_eth", 2, b"\x01" * 32),
+        ("starknet_usdc", 2, b"\x02" * 32),
+        ("erc20_compiled", 1, b"\x03" * 32),
+        ("erc20_key_events", 2, b"\x04" * 32),
+    ]:
+        dispatcher.add_abi(
+            StarknetAbi.from_json(load_abi(abi_name, abi_version), class_hash, abi_name)
+        )
+    return dispatcher
+
+
+def test_index_distinct_candidates(dispatcher):
+    index = dispatcher.selector_index()
+    transfer_candidates = index.function_candidates(starknet_keccak(b"transfer"))
+
+    # eth, usdc and erc20_key_events share the transfer type, erc20_compiled has no outputs
+    assert sorted(candidate.class_count for candidate in transfer_candidates) == [1, 3]
+    assert {candidate.abi_name for candidate in transfer_candidates} == {None, "erc20_compiled"}
+    assert len(index.event_candidates(TRANSFER)) == 2
+
+    # Classes added after the index is built are indexed
+    dispatcher.add_abi(StarknetAbi.from_json(NESTED_EVENT_ABI, b"\x05" * 32, "token"))
+    assert index is dispatcher.selector_index()
+    assert [
+        candidate.nested_selectors
+        for candidate in index.event_candidates(_selector("ERC20Event").to_bytes(32, "big"))
+    ] == [(TRANSFER[-8:],), (starknet_keccak(b"Approval")[-8:],)]
+
+
+def test_decode_function_by_selector(dispatcher):
+    transfer = starknet_keccak(b"transfer")
+
+    decoded = dispatcher.decode_function_by_selector([1, 2, 0], [1], transfer)
+    assert decoded.name == "transfer"
+    assert decoded.abi_name is None
+    assert decoded.inputs == {"recipient": f"0x{1:064x}", "amount": 2}
+    assert decoded.outputs == [True]
+
+    # Without a result, the inputs of the first matching type are decoded
+    assert dispatcher.decode_function_by_selector([1, 2, 0], None, transfer).outputs is None
+
+    # An empty result only matches functions without outputs.  Candidates are reordered by their matches
+    for _ in range(3):
+        assert dispatcher.decode_function_by_selector([1, 2, 0], [], transfer).outputs == []
+    candidates = dispatcher.selector_index().function_candidates(transfer)
+    assert [(candidate.abi_name, candidate.matches) for candidate in candidates] == [
+        ("erc20_compiled", 3),
+        (None, 2),
+    ]
+
+    with pytest.raises(InvalidCalldataError, match="does not match any of the 2 types"):
+        dispatcher.decode_function_by_selector([1, 2], None, transfer)
+    assert dispatcher.decode_function_by_selector([1], None, b"\x09" * 32) is None
+
+
+def test_candidate_abi_name_updated():
+    dispatcher = DecodingDispatcher()
+    dispatcher.add_abi(StarknetAbi.from_json(load_abi("starknet_eth"), b"\x01" * 32, "math"))
+    transfer = starknet_keccak(b"transfer")
+    assert dispatcher.decode_function_by_selector([1, 2, 0], [1], transfer).abi_name == "math"
+    assert dispatcher.decode_event_by_selector([1, 2, 3, 0], [TRANSFER_KEY]).abi_name == "math"
+
+    # The candidates are shared with a class of another abi name, so the resolved abi_name is cleared
+    dispatcher.add_abi(StarknetAbi.from_json(load_abi("starknet_usdc"), b"\x02" * 32, "other"))
+    assert dispatcher.decode_function_by_selector([1, 2, 0], [1], transfer).abi_name is None
+    assert dispatcher.decode_event_by_selector([1, 2, 3, 0], [TRANSFER_KEY]).abi_name is None
+
+
+def test_decode_event_by_selector(dispatcher):
+    data_transfer = dispatcher.decode_event_by_selector([1, 2, 3, 0], [TRANSFER_KEY])
+    assert data_transfer.abi_name is None
+    assert data_transfer.data == {"from": f"0x{1:064x}", "to": f"0x{2:064x}", "value": 3}
+
+    key_transfer = dispatcher.decode_event_by_selector([3, 0], [TRANSFER_KEY, 1, 2])
+    assert key_transfer.abi_name == "erc20_key_events"
+    assert key_transfer.data == data_transfer.data
+
+    with pytest.raises(InvalidCalldataError, match="do not match any"):
+        dispatcher.decode_event_by_selector([3], [TRANSFER_KEY])
+    with pytest.raises(InvalidCalldataError, match="at least 1 key"):
+        dispatcher.decode_event_by_selector([], [])
+    assert dispatcher.decode_event_by_selector([], [1]) is None
+
+
+def test_nested_events_by_selector(tmp_path):
+    dispatcher = DecodingDispatcher()
+    dispatcher.add_abi(StarknetAbi.from_json(NESTED_EVENT_ABI, b"\x05" * 32, "token"))
+    write_mapped_index(dispatcher, tmp_path / "token.index")
+
+    with MappedDecodingDispatcher(tmp_path / "token.index") as mapped_dispatcher:
+        for event_dispatcher in (dispatcher, mapped_dispatcher):
+            decoded = event_dispatcher.decode_event_by_selector(
+                [5], [_selector("ERC20Event"), _selector("Approval"), 3]
+            )
+            assert (decoded.abi_name, decoded.name, decoded.data) == (
+                "token",
+                "Approval",
+                {"owner": 3, "value": 5},
+            )
+            assert event_dispatcher.decode_event_by_selector([9], [_selector("Minted")]).data == {
+                "amount": 9
+            }
@@ -0,0 +1,206 @@
+import pytest
+
+from nethermind.starknet_abi.core import StarknetAbi
+from nethermind.starknet_abi.decoding_types import DecodedUserOperation
+from nethermind.starknet_abi.dispatch import DecodingDispatcher
+from nethermind.starknet_abi.exceptions import InvalidCalldataError
+from nethermind.starknet_abi.multicall import encode_multicall
+from tests.utils import load_abi
+
+ACCOUNT_CLASS = b"\x01" * 32
+LEGACY_ACCOUNT_CLASS = b"\x02" * 32
+ETH_CLASS = b"\x03" * 32
+
+ACCOUNT_ADDRESS = 0xACC
+ETH_ADDRESS = 0xE7
+UNKNOWN_ADDRESS = 0xDEAD
+
+
+@pytest.fixture(scope="module")
+def abis() -> dict[str, StarknetAbi]:
+    return {
+        "account": StarknetAbi.from_json(load_abi("argent_account"), ACCOUNT_CLASS, "account"),
+        "legacy_account": StarknetAbi.from_json(
+            load_abi("argent_v0", 1), LEGACY_ACCOUNT_CLASS, "legacy_account"
+        ),
+        "eth": StarknetAbi.from_json(load_abi("starknet_eth"), ETH_CLASS, "eth"),
+    }
+
+
+@pytest.fixture(scope="module")
+def dispatcher(abis) -> DecodingDispatcher:
+    dispatcher = DecodingDispatcher()
+    for abi in abis.values():
+        dispatcher.add_abi(abi)
+    return dispatcher
+
+
+class CountingResolver:
+    def __init__(self):
+        self.lookups: list[int] = []
+
+    def __call__(self, contract_address: int) -> bytes | None:
+        self.lookups.append(contract_address)
+        return {ACCOUNT_ADDRESS: ACCOUNT_CLASS, ETH_ADDRESS: ETH_CLASS}.get(contract_address)
+
+
+def _execute_selector(abis, abi_name="account") -> bytes:
+    return abis[abi_name].functions["__execute__"].signature
+
+
+def test_decode_account_inner_calls(abis, dispatcher):
+    eth = abis["eth"]
+    calldata = encode_multicall(
+        [
+            (ETH_ADDRESS, eth, "approve", {"spender": 0x123, "amount": 10}),
+            (ETH_ADDRESS, eth, "transfer", {"recipient": 0x456, "amount": 20}),
+            (UNKNOWN_ADDRESS, eth, "transfer", {"recipient": 0x456, "amount": 20}),
+        ]
+    )
+    # Results of each inner call as Array<Span<felt252>>
+    result = [3, 1, 1, 1, 1, 0]
+
+    decoded = dispatcher.decode_user_operation(
+        calldata, result, _execute_selector(abis), ACCOUNT_CLASS, CountingResolver()
+    )
+    assert isinstance(decoded, DecodedUserOperation)
+    assert decoded.function.name == "__execute__"
+    assert len(decoded.function.inputs["calls"]) == 3
+
+    approve, transfer, unknown = decoded.calls
+    assert approve.function.abi_name == "eth"
+    assert approve.function.inputs == {"spender": f"0x{0x123:064x}", "amount": 10}
+    assert approve.function.outputs == [True]
+    assert transfer.function.inputs == {"recipient": f"0x{0x456:064x}", "amount": 20}
+    assert transfer.calls is None
+    assert unknown is None
+
+
+def test_inner_calls_without_results(abis, dispatcher):
+    calldata = encode_multicall(
+        [(ETH_ADDRESS, abis["eth"], "transfer", {"recipient": 1, "amount": 2})]
+    )
+
+    for result in (None, []):
+        decoded = dispatcher.decode_user_operation(
+            calldata, result, _execute_selector(abis), ACCOUNT_CLASS, CountingResolver()
+        )
+        assert decoded.function.outputs is None
+        assert decoded.calls[0].function.outputs is None
+
+
+def test_inner_call_errors_are_returned_in_place(abis, dispatcher):
+    # transfer with truncated calldata, and an unknown selector on a known class
+    calldata = [
+        2,
+        ETH_ADDRESS,
+        0x0083AFD3F4CAEDC6EEBF44246FE54E38C95E3179A5EC9EA81740ECA5B482D12E,
+        1,
+        5,
+    ]
+    calldata += [ETH_ADDRESS, 0x1234, 0]
+
+    decoded = dispatcher.decode_user_operation(
+        calldata, None, _execute_selector(abis), ACCOUNT_CLASS, CountingResolver()
+    )
+    assert isinstance(decoded.calls[0], InvalidCalldataError)
+    assert isinstance(decoded.calls[1], KeyError)
+
+
+def test_nested_and_legacy_account_calls(abis, dispatcher):
+    eth = abis["eth"]
+    inner_execute = encode_multicall(
+        [(ETH_ADDRESS, eth, "transfer", {"recipient": 0x456, "amount": 20})]
+    )
+    legacy_selector = int.from_bytes(_execute_selector(abis, "legacy_account"), "big")
+    transfer_selector = int.from_bytes(eth.functions["transfer"].signature, "big")
+
+    # Legacy accounts pass a call array indexing into a shared calldata array
+    legacy_calldata = [
+        2,
+        ETH_ADDRESS, transfer_selector, 0, 3,
+        ACCOUNT_ADDRESS, int.from_bytes(_execute_selector(abis), "big"), 3, len(inner_execute),
+        3 + len(inner_execute),
+        0x789, 5, 0,
+        *inner_execute,
+    ]  # fmt: skip
+
+    resolver = CountingResolver()
+    decoded = dispatcher.decode_user_operation(
+        legacy_calldata,
+        None,
+        legacy_selector.to_bytes(32, "big"),
+        LEGACY_ACCOUNT_CLASS,
+        resolver,
+    )
+
+    legacy_transfer, nested_execute = decoded.calls
+    assert legacy_transfer.function.inputs == {"recipient": f"0x{0x789:064x}", "amount": 5}
+    assert nested_execute.function.name == "__execute__"
+    assert nested_execute.calls[0].function.inputs == {
+        "recipient": f"0x{0x456:064x}",
+        "amount": 20,
+    }
+    # Each contract address is only resolved once
+    assert resolver.lookups == [ETH_ADDRESS, ACCOUNT_ADDRESS]
+
+
+def test_nesting_depth_limit(abis, dispatcher):
+    execute_selector = int.from_bytes(_execute_selector(abis), "big")
+    calldata = encode_multicall(
+        [(ETH_ADDRESS, abis["eth"], "transfer", {"recipient": 0x456, "amount": 20})]
+    )
+    for _ in range(3000):
+        calldata = [1, ACCOUNT_ADDRESS, execute_selector, len(calldata), *calldata]
+
+    decoded = dispatcher.decode_user_operations_batch(
+        calldata=calldata,
+        calldata_offsets=[0, len(calldata)],
+        results=[],
+        result_offsets=[0, 0],
+        function_selectors=[_execute_selector(abis)],
+        class_hashes=[ACCOUNT_CLASS],
+        class_resolver=CountingResolver(),
+    )[0]
+
+    for _ in range(32):
+        decoded = decoded.calls[0]
+    assert decoded.function.name == "__execute__"
+    assert isinstance(decoded.calls[0], InvalidCalldataError)
+
+
+def test_user_operations_batch(abis, dispatcher):
+    eth = abis["eth"]
+    transfer = eth.functions["transfer"]
+    execute = encode_multicall(
+        [(ETH_ADDRESS, eth, "transfer", {"recipient": 0x456, "amount": 20})] * 2
+    )
+    transfer_calldata = transfer.encode({"recipient": 1, "amount": 2})
+
+    resolver = CountingResolver()
+    decoded = dispatcher.decode_user_operations_batch(
+        calldata=execute + execute + transfer_calldata,
+        calldata_offsets=[
+            0,
+            len(execute),
+            2 * len(execute),
+            2 * len(execute) + 3,
+            2 * len(execute) + 3,
+        ],
+        results=[1],
+        result_offsets=[0, 0, 0, 1, 1],
+        function_selectors=[_execute_selector(abis)] * 2 + [transfer.signature] * 2,
+        class_hashes=[ACCOUNT_CLASS, ACCOUNT_CLASS, ETH_CLASS, b"\x09" * 32],
+        class_resolver=resolver,
+    )
+
+    assert [len(operation.calls) for operation in decoded[:2]] == [2, 2]
+    assert decoded[2].function.outputs == [True]
+    assert decoded[2].calls is None
+    assert decoded[3] is None
+    assert resolver.lookups == [ETH_ADDRESS]
+
+    with pytest.raises(ValueError, match="Batch inputs must have one entry per call"):
+        dispatcher.decode_user_operations_batch(
+            [], [0], [], [0], [transfer.signature], [ETH_CLASS], resolver
+        )